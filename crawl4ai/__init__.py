@@ -17,6 +17,7 @@ from .async_logger import (
 from .proxy_strategy import (
     ProxyRotationStrategy,
     RoundRobinProxyStrategy,
+    HealthAwareProxyStrategy,
 )
 from .extraction_strategy import (
     ExtractionStrategy,
@@ -27,8 +28,9 @@ from .extraction_strategy import (
     JsonLxmlExtractionStrategy,
     RegexExtractionStrategy
 )
+from .schema_plan import SchemaPlan
 from .chunking_strategy import ChunkingStrategy, RegexChunking
-from .markdown_generation_strategy import DefaultMarkdownGenerator
+from .markdown_generation_strategy import DefaultMarkdownGenerator, LXMLMarkdownGenerator
 from .table_extraction import (
     TableExtractionStrategy,
     DefaultTableExtraction,
@@ -50,6 +52,8 @@ from .async_dispatcher import (
     RateLimiter,
     BaseDispatcher,
 )
+from .async_llm import AsyncLLMClient, get_llm_client, set_llm_client
+from .llm_cache import LLMResponseCache
 from .docker_client import Crawl4aiDockerClient
 from .hub import CrawlerHub
 from .browser_profiler import BrowserProfiler
@@ -159,9 +163,11 @@ __all__ = [
     "JsonXPathExtractionStrategy",
     "JsonLxmlExtractionStrategy",
     "RegexExtractionStrategy",
+    "SchemaPlan",
     "ChunkingStrategy",
     "RegexChunking",
     "DefaultMarkdownGenerator",
+    "LXMLMarkdownGenerator",
     "TableExtractionStrategy",
     "DefaultTableExtraction",
     "NoTableExtraction",
@@ -173,6 +179,10 @@ __all__ = [
     "MemoryAdaptiveDispatcher",
     "SemaphoreDispatcher",
     "RateLimiter",
+    "AsyncLLMClient",
+    "get_llm_client",
+    "set_llm_client",
+    "LLMResponseCache",
     "CrawlerMonitor",
     "LinkPreview",
     "DisplayMode",
@@ -180,6 +190,7 @@ __all__ = [
     "Crawl4aiDockerClient",
     "ProxyRotationStrategy",
     "RoundRobinProxyStrategy",
+    "HealthAwareProxyStrategy",
     "ProxyConfig",
     "start_colab_display_server",
     "setup_colab_environment",
@@ -14,20 +14,123 @@ import pickle
 import os
 import json
 import math
-from collections import defaultdict, Counter
+import itertools
+from collections import defaultdict, Counter, OrderedDict
+from array import array
 import re
 from pathlib import Path
 
 from crawl4ai.async_webcrawler import AsyncWebCrawler
 from crawl4ai.async_configs import CrawlerRunConfig, LinkPreviewConfig
 from crawl4ai.models import Link, CrawlResult
+from crawl4ai.content_store import ContentStore
 import numpy as np
 
+# Recently read knowledge-base payloads, keyed by (store base path, reference)
+_PAYLOAD_CACHE_SIZE = 32
+_payload_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+
+
+class _Markdown:
+    __slots__ = ("raw_markdown",)
+
+    def __init__(self, raw_markdown: str):
+        self.raw_markdown = raw_markdown
+
+
+class KnowledgeDocument:
+    """
+    Compact knowledge-base entry.
+
+    Keeps the url, metadata and success flag of a crawled page; its markdown
+    and links are held inline until the document is offloaded to a
+    ContentStore (as one JSON blob of the ``markdown`` content type), and are
+    read back from there on access.
+    """
+
+    __slots__ = ("url", "metadata", "success", "content_hash", "_store", "_payload")
+
+    def __init__(self, url: str, metadata: Optional[Dict] = None, success: bool = True,
+                 content_hash: Optional[str] = None, store: Optional[ContentStore] = None,
+                 payload: Optional[Dict[str, Any]] = None):
+        self.url = url
+        self.metadata = metadata or {}
+        self.success = success
+        self.content_hash = content_hash
+        self._store = store
+        self._payload = payload
+
+    @classmethod
+    def from_result(cls, result: Any, store: Optional[ContentStore] = None) -> "KnowledgeDocument":
+        """Keep what the adaptive crawler needs from a CrawlResult (or any look-alike)"""
+        if isinstance(result, cls):
+            if store is not None:
+                result.offload(store)
+            return result
+        markdown = getattr(result, "markdown", None)
+        if markdown is not None and hasattr(markdown, "raw_markdown"):
+            markdown = markdown.raw_markdown
+        links = getattr(result, "links", None) or {}
+        if hasattr(links, "model_dump"):
+            links = links.model_dump()
+        doc = cls(
+            url=getattr(result, "url", ""),
+            metadata=getattr(result, "metadata", None),
+            success=getattr(result, "success", True),
+            payload={"markdown": str(markdown) if markdown else "", "links": links},
+        )
+        if store is not None:
+            doc.offload(store)
+        return doc
+
+    def offload(self, store: ContentStore) -> None:
+        """Move the payload to `store`, keeping only its hash"""
+        if self._payload is not None:
+            self.content_hash = store.store_sync(
+                json.dumps(self._payload, ensure_ascii=False, sort_keys=True, default=str),
+                "markdown",
+            )
+            self._payload = None
+        self._store = store
+
+    def _get_payload(self) -> Dict[str, Any]:
+        if self._payload is not None:
+            return self._payload
+        key = (self._store.base_path, self.content_hash)
+        payload = _payload_cache.get(key)
+        if payload is None:
+            payload = json.loads(self._store.load_sync(self.content_hash, "markdown"))
+            _payload_cache[key] = payload
+            if len(_payload_cache) > _PAYLOAD_CACHE_SIZE:
+                _payload_cache.popitem(last=False)
+        else:
+            _payload_cache.move_to_end(key)
+        return payload
+
+    @property
+    def markdown(self) -> _Markdown:
+        return _Markdown(self._get_payload().get("markdown", ""))
+
+    @property
+    def links(self) -> Dict[str, Any]:
+        return self._get_payload().get("links", {})
+
+
+def _new_postings() -> Dict[str, array]:
+    return defaultdict(lambda: array("I"))
+
+
 @dataclass
 class CrawlState:
-    """Tracks the current state of adaptive crawling"""
+    """Tracks the current state of adaptive crawling
+
+    Knowledge-base entries are compact KnowledgeDocuments whose content can be
+    offloaded to a ContentStore, postings are arrays of document ids, and
+    ``checkpoint`` appends only what changed since the previous checkpoint to
+    a journal that ``load`` replays without re-reading any page content.
+    """
     crawled_urls: Set[str] = field(default_factory=set)
-    knowledge_base: List[CrawlResult] = field(default_factory=list)
+    knowledge_base: List[Any] = field(default_factory=list)
     pending_links: List[Link] = field(default_factory=list)
     query: str = ""
     metrics: Dict[str, float] = field(default_factory=dict)
@@ -35,8 +138,16 @@ class CrawlState:
     # Statistical tracking
     term_frequencies: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
     document_frequencies: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
-    documents_with_terms: Dict[str, Set[int]] = field(default_factory=lambda: defaultdict(set))
+    documents_with_terms: Dict[str, array] = field(default_factory=_new_postings)
     total_documents: int = 0
+    # Interned term ids, in first-seen order (used by checkpoints)
+    term_ids: Dict[str, int] = field(default_factory=dict)
+
+    # Incremental consistency: distinct terms per document, plus the running
+    # sum and count of pairwise Jaccard overlaps between non-empty documents
+    document_term_counts: List[int] = field(default_factory=list)
+    consistency_overlap_sum: float = 0.0
+    consistency_pairs: int = 0
     
     # History tracking for saturation
     new_terms_history: List[int] = field(default_factory=list)
@@ -49,9 +160,61 @@ class CrawlState:
     coverage_shape: Optional[Any] = None  # Alpha shape
     semantic_gaps: List[Tuple[List[float], float]] = field(default_factory=list)  # Serializable
     embedding_model: str = ""
-    
+
+    # Where knowledge-base content is offloaded, None keeps it in memory
+    content_store: Optional[ContentStore] = field(default=None, repr=False, compare=False)
+
+    JOURNAL_VERSION = 1
+    APPEND_ONLY = ("new_terms_history", "crawl_order", "document_term_counts")
+
+    def __post_init__(self):
+        self._journal_path: Optional[Path] = None
+        self._journal_mark: Dict[str, Any] = {}
+        self._indexed_log: Optional[List[List[int]]] = None
+        self._pending_hrefs: Set[str] = {link.href for link in self.pending_links}
+
+    # ───────────────────────── mutation helpers
+
+    def add_documents(self, results: List[Any]) -> List[KnowledgeDocument]:
+        """Append compact copies of crawl results to the knowledge base"""
+        docs = [KnowledgeDocument.from_result(r, self.content_store) for r in results if r]
+        self.knowledge_base.extend(docs)
+        return docs
+
+    def add_links(self, links: List[Link]) -> None:
+        """Queue links that are neither crawled nor already pending"""
+        if len(self._pending_hrefs) != len(self.pending_links):
+            # pending_links was replaced or edited directly
+            self._pending_hrefs = {link.href for link in self.pending_links}
+        for link in links:
+            if link.href in self.crawled_urls or link.href in self._pending_hrefs:
+                continue
+            self._pending_hrefs.add(link.href)
+            self.pending_links.append(link)
+
+    def discard_crawled_links(self) -> None:
+        self.pending_links = [l for l in self.pending_links if l.href not in self.crawled_urls]
+        self._pending_hrefs = {l.href for l in self.pending_links}
+
+    def index_document(self, terms: List[str]) -> None:
+        """Add one document's tokens to the term statistics as document ``total_documents``"""
+        doc_id = self.total_documents
+        entry = [doc_id]
+        for term, count in Counter(terms).items():
+            term_id = self.term_ids.get(term)
+            if term_id is None:
+                term_id = self.term_ids[term] = len(self.term_ids)
+            self.term_frequencies[term] += count
+            self.document_frequencies[term] += 1
+            self.documents_with_terms[term].append(doc_id)
+            entry += (term_id, count)
+        if self._indexed_log is not None:
+            self._indexed_log.append(entry)
+
+    # ───────────────────────── persistence
+
     def save(self, path: Union[str, Path]):
-        """Save state to disk for persistence"""
+        """Save a full state snapshot to disk (see ``checkpoint`` for incremental saves)"""
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
         
@@ -66,6 +229,9 @@ class CrawlState:
             'document_frequencies': dict(self.document_frequencies),
             'documents_with_terms': {k: list(v) for k, v in self.documents_with_terms.items()},
             'total_documents': self.total_documents,
+            'document_term_counts': self.document_term_counts,
+            'consistency_overlap_sum': self.consistency_overlap_sum,
+            'consistency_pairs': self.consistency_pairs,
             'new_terms_history': self.new_terms_history,
             'crawl_order': self.crawl_order,
             # Embedding-specific fields (convert numpy arrays to lists for JSON)
@@ -81,21 +247,40 @@ class CrawlState:
     
     @classmethod
     def load(cls, path: Union[str, Path]) -> 'CrawlState':
-        """Load state from disk"""
+        """Load state from a ``save`` snapshot or a ``checkpoint`` journal"""
         path = Path(path)
+        with open(path, 'r') as f:
+            first_line = f.readline()
+        try:
+            header = json.loads(first_line)
+        except json.JSONDecodeError:
+            header = None
+        if isinstance(header, dict) and 'crawl_state_journal' in header:
+            return cls._load_journal(path, header)
+
         with open(path, 'r') as f:
             state_dict = json.load(f)
         
         state = cls()
         state.crawled_urls = set(state_dict['crawled_urls'])
-        state.knowledge_base = [cls._dict_to_crawl_result(d) for d in state_dict['knowledge_base']]
+        state.knowledge_base = [
+            KnowledgeDocument.from_result(cls._dict_to_crawl_result(d)) for d in state_dict['knowledge_base']
+        ]
         state.pending_links = [Link(**link_dict) for link_dict in state_dict['pending_links']]
+        state._pending_hrefs = {link.href for link in state.pending_links}
         state.query = state_dict['query']
         state.metrics = state_dict['metrics']
         state.term_frequencies = defaultdict(int, state_dict['term_frequencies'])
         state.document_frequencies = defaultdict(int, state_dict['document_frequencies'])
-        state.documents_with_terms = defaultdict(set, {k: set(v) for k, v in state_dict['documents_with_terms'].items()})
+        state.documents_with_terms = _new_postings()
+        for term, doc_ids in state_dict['documents_with_terms'].items():
+            state.documents_with_terms[term] = array("I", doc_ids)
+        state.term_ids = {term: i for i, term in enumerate(state.term_frequencies)}
         state.total_documents = state_dict['total_documents']
+        # Missing in older saves; StatisticalStrategy rebuilds them on demand
+        state.document_term_counts = state_dict.get('document_term_counts', [])
+        state.consistency_overlap_sum = state_dict.get('consistency_overlap_sum', 0.0)
+        state.consistency_pairs = state_dict.get('consistency_pairs', 0)
         state.new_terms_history = state_dict['new_terms_history']
         state.crawl_order = state_dict['crawl_order']
         
@@ -108,6 +293,182 @@ class CrawlState:
         state.embedding_model = state_dict.get('embedding_model', '')
         
         return state
+
+    @staticmethod
+    def default_content_dir(path: Union[str, Path]) -> Path:
+        """Content store used for a journal at `path`"""
+        path = Path(path)
+        return path.with_name(path.name + ".content")
+
+    def checkpoint(self, path: Union[str, Path]) -> None:
+        """Append the changes since the previous checkpoint to the journal at `path`
+
+        The first checkpoint to a path in a session (or one after changes a
+        delta cannot express) rewrites the journal with a compact base record;
+        later ones append a delta record of new documents, links, URLs, term
+        postings and scalars. Knowledge-base content goes to the content store
+        (created next to the journal if the state has none), so the journal
+        only references it by hash.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self.content_store is None:
+            self.content_store = ContentStore(str(self.default_content_dir(path)))
+
+        mark = self._journal_mark
+        rewrite = (
+            self._journal_path != path
+            or not path.exists()
+            or self._indexed_log is None
+            or len(self.knowledge_base) < mark['docs']
+            or len(self.term_ids) < mark['terms']
+            or any(len(getattr(self, name)) < mark[name] for name in self.APPEND_ONLY)
+            or self._embedding_rows() < mark['kb_embeddings']
+        )
+        record = self._journal_record(base=rewrite)
+        line = json.dumps(record, separators=(",", ":"), default=str) + "\n"
+
+        if rewrite:
+            header = {
+                'crawl_state_journal': self.JOURNAL_VERSION,
+                'content_dir': os.path.relpath(self.content_store.base_path, path.parent),
+            }
+            tmp = path.with_name(path.name + ".tmp")
+            with open(tmp, 'w') as f:
+                f.write(json.dumps(header) + "\n")
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        else:
+            with open(path, 'a') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+        self._journal_path = path
+        self._mark_saved()
+
+    def _embedding_rows(self) -> int:
+        return len(self.kb_embeddings) if self.kb_embeddings is not None else 0
+
+    def _mark_saved(self) -> None:
+        self._journal_mark = {
+            'docs': len(self.knowledge_base),
+            'terms': len(self.term_ids),
+            'crawled': set(self.crawled_urls),
+            'links': {link.href for link in self.pending_links},
+            'kb_embeddings': self._embedding_rows(),
+            'query_embeddings': self.query_embeddings,
+            **{name: len(getattr(self, name)) for name in self.APPEND_ONLY},
+        }
+        self._indexed_log = []
+
+    def _journal_record(self, base: bool) -> Dict[str, Any]:
+        mark = {} if base else self._journal_mark
+        start_docs = mark.get('docs', 0)
+        # Anything appended to the list directly is compacted (and offloaded) here
+        for i in range(start_docs, len(self.knowledge_base)):
+            self.knowledge_base[i] = KnowledgeDocument.from_result(self.knowledge_base[i], self.content_store)
+
+        record: Dict[str, Any] = {
+            'base': base,
+            'docs': [
+                {'url': d.url, 'hash': d.content_hash, 'metadata': d.metadata, 'success': d.success}
+                for d in self.knowledge_base[start_docs:]
+            ],
+            'crawled': sorted(self.crawled_urls - mark.get('crawled', set())),
+            'links': [
+                link.model_dump() for link in self.pending_links
+                if link.href not in mark.get('links', ())
+            ],
+            'scalars': {
+                'query': self.query,
+                'metrics': self.metrics,
+                'total_documents': self.total_documents,
+                'consistency_overlap_sum': self.consistency_overlap_sum,
+                'consistency_pairs': self.consistency_pairs,
+                'expanded_queries': self.expanded_queries,
+                'semantic_gaps': self.semantic_gaps,
+                'embedding_model': self.embedding_model,
+            },
+        }
+        for name in self.APPEND_ONLY:
+            record[name] = getattr(self, name)[mark.get(name, 0):]
+
+        if base:
+            # Whole term tables, by interned id
+            terms = list(self.term_ids)
+            record['terms'] = terms
+            record['term_stats'] = [
+                [self.term_frequencies.get(t, 0), self.document_frequencies.get(t, 0),
+                 self.documents_with_terms[t].tolist() if t in self.documents_with_terms else []]
+                for t in terms
+            ]
+        else:
+            record['terms'] = list(itertools.islice(self.term_ids, mark['terms'], None))
+            record['indexed'] = self._indexed_log
+
+        if self.kb_embeddings is not None:
+            record['kb_embeddings'] = self.kb_embeddings[mark.get('kb_embeddings', 0):].tolist()
+        if self.query_embeddings is not None and (base or self.query_embeddings is not mark.get('query_embeddings')):
+            record['query_embeddings'] = self.query_embeddings.tolist()
+        return record
+
+    @classmethod
+    def _load_journal(cls, path: Path, header: Dict[str, Any]) -> 'CrawlState':
+        state = cls()
+        store = ContentStore(str(path.parent / header['content_dir']))
+        state.content_store = store
+        links: Dict[str, Link] = {}
+        terms: List[str] = []
+        embeddings: List[Any] = []
+
+        with open(path, 'r') as f:
+            next(f)  # header
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # torn final write: resume from the last complete checkpoint
+                state.knowledge_base.extend(
+                    KnowledgeDocument(d['url'], d.get('metadata'), d.get('success', True), d['hash'], store)
+                    for d in record['docs']
+                )
+                state.crawled_urls.update(record['crawled'])
+                for link_dict in record['links']:
+                    links.setdefault(link_dict['href'], Link(**link_dict))
+                for name in cls.APPEND_ONLY:
+                    getattr(state, name).extend(record[name])
+                for key, value in record['scalars'].items():
+                    setattr(state, key, value)
+
+                terms.extend(record['terms'])
+                if record['base']:
+                    for term, (tf, df, doc_ids) in zip(terms, record['term_stats']):
+                        state.term_frequencies[term] = tf
+                        state.document_frequencies[term] = df
+                        if doc_ids:
+                            state.documents_with_terms[term] = array("I", doc_ids)
+                for entry in record.get('indexed', ()):
+                    doc_id = entry[0]
+                    for i in range(1, len(entry), 2):
+                        term = terms[entry[i]]
+                        state.term_frequencies[term] += entry[i + 1]
+                        state.document_frequencies[term] += 1
+                        state.documents_with_terms[term].append(doc_id)
+
+                embeddings.extend(record.get('kb_embeddings', ()))
+                if 'query_embeddings' in record:
+                    state.query_embeddings = np.array(record['query_embeddings'])
+
+        state.term_ids = {term: i for i, term in enumerate(terms)}
+        state.kb_embeddings = np.array(embeddings) if embeddings else None
+        state.pending_links = [link for href, link in links.items() if href not in state.crawled_urls]
+        state._pending_hrefs = {link.href for link in state.pending_links}
+        state._journal_path = path
+        state._mark_saved()
+        return state
     
     @staticmethod
     def _crawl_result_to_dict(cr: CrawlResult) -> Dict:
@@ -345,31 +706,59 @@ class StatisticalStrategy(CrawlStrategy):
         return min(1.0, math.sqrt(coverage))
     
     def _calculate_consistency(self, state: CrawlState) -> float:
-        """Information overlap between pages - high overlap suggests coherent topic coverage"""
+        """Information overlap between pages - high overlap suggests coherent topic coverage
+
+        Average pairwise Jaccard similarity of the documents' term sets. The
+        sum is maintained by update_state, so this is O(1) per call.
+        """
         if len(state.knowledge_base) < 2:
             return 1.0  # Single or no documents are perfectly consistent
-            
-        # Calculate pairwise term overlap
-        overlaps = []
-        
-        for i in range(len(state.knowledge_base)):
-            for j in range(i + 1, len(state.knowledge_base)):
-                # Get terms from both documents
-                terms_i = set(self._get_document_terms(state.knowledge_base[i]))
-                terms_j = set(self._get_document_terms(state.knowledge_base[j]))
-                
-                if terms_i and terms_j:
-                    # Jaccard similarity
-                    overlap = len(terms_i & terms_j) / len(terms_i | terms_j)
-                    overlaps.append(overlap)
-        
-        if overlaps:
+
+        if len(state.document_term_counts) != len(state.knowledge_base):
+            # State from an older save, or documents added behind our back
+            self._rebuild_consistency(state)
+
+        if state.consistency_pairs:
             # Average overlap as consistency measure
-            consistency = sum(overlaps) / len(overlaps)
-        else:
-            consistency = 0.0
-            
-        return consistency
+            return state.consistency_overlap_sum / state.consistency_pairs
+        return 0.0
+
+    def _add_consistency_document(self, state: CrawlState, term_set: Set[str],
+                                  postings: Dict[str, array]) -> None:
+        """Fold the Jaccard overlaps of a new document with all earlier ones into state.
+
+        `postings` maps each term to the ids of the earlier documents that
+        contain it; intersection sizes are counted through it rather than by
+        intersecting the new document with every earlier one.
+        """
+        sizes = state.document_term_counts
+        if term_set and sizes:
+            views = [np.asarray(postings[term]) for term in term_set if term in postings]
+            views = [v for v in views if len(v)]
+            if views:
+                # bincount over the concatenated (copied) ids; the views must
+                # go before any posting array is appended to again
+                shared = np.bincount(np.concatenate(views), minlength=len(sizes))
+                del views
+                doc_ids = np.flatnonzero(shared)
+                inter = shared[doc_ids].astype(np.float64)
+                union = len(term_set) + np.asarray(sizes, dtype=np.float64)[doc_ids] - inter
+                state.consistency_overlap_sum += float((inter / union).sum())
+            # Pairs with an empty document are not counted
+            state.consistency_pairs += len(sizes) - sizes.count(0)
+        sizes.append(len(term_set))
+
+    def _rebuild_consistency(self, state: CrawlState) -> None:
+        """Recompute the consistency accumulators from the knowledge base"""
+        state.document_term_counts = []
+        state.consistency_overlap_sum = 0.0
+        state.consistency_pairs = 0
+        postings: Dict[str, array] = defaultdict(lambda: array("I"))
+        for doc_id, result in enumerate(state.knowledge_base):
+            term_set = set(self._get_document_terms(result))
+            self._add_consistency_document(state, term_set, postings)
+            for term in term_set:
+                postings[term].append(doc_id)
     
     def _calculate_saturation(self, state: CrawlState) -> float:
         """Diminishing returns indicator - are we still discovering new information?"""
@@ -391,14 +780,17 @@ class StatisticalStrategy(CrawlStrategy):
     async def rank_links(self, state: CrawlState, config: AdaptiveConfig) -> List[Tuple[Link, float]]:
         """Rank links by expected information gain"""
         scored_links = []
-        
+
+        # Computed once for all pending links instead of once per link
+        query_terms = set(self._tokenize(state.query.lower())) if state.query else set()
+
         for link in state.pending_links:
             # Skip already crawled URLs
             if link.href in state.crawled_urls:
                 continue
                 
             # Calculate component scores
-            relevance = self._calculate_relevance(link, state)
+            relevance = self._calculate_relevance(link, state, query_terms)
             novelty = self._calculate_novelty(link, state)
             authority = 1.0
             # authority = self._calculate_authority(link)
@@ -415,7 +807,8 @@ class StatisticalStrategy(CrawlStrategy):
         
         return scored_links
     
-    def _calculate_relevance(self, link: Link, state: CrawlState) -> float:
+    def _calculate_relevance(self, link: Link, state: CrawlState,
+                             query_terms: Optional[Set[str]] = None) -> float:
         """BM25 relevance score between link preview and query"""
         if not state.query or not link:
             return 0.0
@@ -438,7 +831,8 @@ class StatisticalStrategy(CrawlStrategy):
             return link.contextual_score
             
         # Otherwise, calculate simple term overlap
-        query_terms = set(self._tokenize(state.query.lower()))
+        if query_terms is None:
+            query_terms = set(self._tokenize(state.query.lower()))
         link_terms = set(self._tokenize(link_text))
         
         if not query_terms:
@@ -465,11 +859,12 @@ class StatisticalStrategy(CrawlStrategy):
         if not link_terms:
             return 0.5  # Unknown novelty
             
-        # Calculate what percentage of link terms are new
-        existing_terms = set(state.term_frequencies.keys())
-        new_terms = link_terms - existing_terms
+        # Calculate what percentage of link terms are new; look them up in
+        # the term table directly rather than copying its keys per link
+        existing_terms = state.term_frequencies
+        new_terms = sum(1 for term in link_terms if term not in existing_terms)
         
-        novelty = len(new_terms) / len(link_terms) if link_terms else 0.0
+        novelty = new_terms / len(link_terms) if link_terms else 0.0
         
         return novelty
     
@@ -548,19 +943,15 @@ class StatisticalStrategy(CrawlStrategy):
                 
                 
             terms = self._tokenize(content.lower())
+            term_set = set(terms)
             
-            # Update term frequencies
-            term_set = set()
-            for term in terms:
-                state.term_frequencies[term] += 1
-                term_set.add(term)
-            
-            # Update document frequencies
-            doc_id = state.total_documents
-            for term in term_set:
-                if term not in state.documents_with_terms[term]:
-                    state.document_frequencies[term] += 1
-                    state.documents_with_terms[term].add(doc_id)
+            # Overlap with earlier documents, before this one joins the postings.
+            # Out of sync (older save): _calculate_consistency rebuilds instead
+            if len(state.document_term_counts) == state.total_documents:
+                self._add_consistency_document(state, term_set, state.documents_with_terms)
+
+            # Update term and document frequencies
+            state.index_document(terms)
             
             # Track new terms discovered
             new_term_count = len(state.term_frequencies)
@@ -1280,6 +1671,9 @@ class AdaptiveCrawler:
                 query=query,
                 metrics={}
             )
+        if self.config.save_state and self.config.state_path and self.state.content_store is None:
+            # Keep page content on disk next to the journal instead of in memory
+            self.state.content_store = ContentStore(str(CrawlState.default_content_dir(self.config.state_path)))
         
         # Create crawler if needed
         if not self.crawler:
@@ -1304,7 +1698,7 @@ class AdaptiveCrawler:
             if start_url not in self.state.crawled_urls:
                 result = await self._crawl_with_preview(start_url, query)
                 if result and hasattr(result, 'success') and result.success:
-                    self.state.knowledge_base.append(result)
+                    self.state.add_documents([result])
                     self.state.crawled_urls.add(start_url)
                     # Extract links from result - handle both dict and Links object formats
                     if hasattr(result, 'links') and result.links:
@@ -1312,10 +1706,10 @@ class AdaptiveCrawler:
                             # Extract internal and external links from dict
                             internal_links = [Link(**link) for link in result.links.get('internal', [])]
                             external_links = [Link(**link) for link in result.links.get('external', [])]
-                            self.state.pending_links.extend(internal_links + external_links)
+                            self.state.add_links(internal_links + external_links)
                         else:
                             # Handle Links object
-                            self.state.pending_links.extend(result.links.internal + result.links.external)
+                            self.state.add_links(result.links.internal + result.links.external)
                     
                     # Update state
                     await self.strategy.update_state(self.state, [result])
@@ -1353,7 +1747,7 @@ class AdaptiveCrawler:
                 
                 if new_results:
                     # Update knowledge base
-                    self.state.knowledge_base.extend(new_results)
+                    self.state.add_documents(new_results)
                     
                     # Update crawled URLs and pending links
                     for result, (link, _) in zip(new_results, to_crawl):
@@ -1372,18 +1766,17 @@ class AdaptiveCrawler:
                                     new_links = result.links.internal + result.links.external
                                 
                                 # Add new links to pending
-                                for new_link in new_links:
-                                    if new_link.href not in self.state.crawled_urls:
-                                        self.state.pending_links.append(new_link)
+                                self.state.add_links(new_links)
+                    self.state.discard_crawled_links()
                     
                     # Update state with new results
                     await self.strategy.update_state(self.state, new_results)
                 
                 depth += 1
                 
-                # Save state if configured
+                # Checkpoint state if configured (appends only what changed)
                 if self.config.save_state and self.config.state_path:
-                    self.state.save(self.config.state_path)
+                    self.state.checkpoint(self.config.state_path)
             
             # Final confidence calculation
             learning_score = await self.strategy.calculate_confidence(self.state)
@@ -1398,9 +1791,9 @@ class AdaptiveCrawler:
             self.state.metrics['pages_crawled'] = len(self.state.crawled_urls)
             self.state.metrics['depth_reached'] = depth
             
-            # Final save
+            # Final checkpoint
             if self.config.save_state and self.config.state_path:
-                self.state.save(self.config.state_path)
+                self.state.checkpoint(self.config.state_path)
             
             return self.state
             
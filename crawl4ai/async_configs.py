@@ -9,6 +9,10 @@ from .config import (
     PROVIDER_MODELS_PREFIXES,
     SCREENSHOT_HEIGHT_TRESHOLD,
     PAGE_TIMEOUT,
+    PAGE_POOL_SIZE,
+    PAGE_POOL_MAX_USES,
+    CONTEXT_CACHE_SIZE,
+    CONTEXT_IDLE_TTL,
     IMAGE_SCORE_THRESHOLD,
     SOCIAL_MEDIA_DOMAINS,
 )
@@ -29,6 +33,7 @@ from typing import Union, List, Callable
 import inspect
 from typing import Any, Dict, Optional
 from enum import Enum
+from datetime import datetime
 
 # Type alias for URL matching
 UrlMatcher = Union[str, Callable[[str], bool], List[Union[str, Callable[[str], bool]]]]
@@ -393,6 +398,16 @@ class BrowserConfig:
                            Default: [].
         enable_stealth (bool): If True, applies playwright-stealth to bypass basic bot detection.
                               Cannot be used with use_undetected browser mode. Default: False.
+        page_pool_size (int): Warm pages kept per browser context for crawls without a session_id;
+                              pages are reset between crawls instead of being closed. 0 disables
+                              the pool: each crawl gets a new page, closed afterwards. Default: 0.
+        page_pool_max_uses (int): Crawls a pooled page serves before it is replaced by a fresh one.
+                                  Default: 50.
+        context_cache_size (int): Browser contexts (one per distinct proxy, locale, user agent, ...)
+                                  kept open at once. The least recently used one is closed once its
+                                  pages are done. 0 keeps every context until close(). Default: 8.
+        context_idle_ttl (float): Seconds a context may go unused before it is closed. 0 disables
+                                  the expiry. Default: 300.
     """
 
     def __init__(
@@ -434,6 +449,10 @@ class BrowserConfig:
         debugging_port: int = 9222,
         host: str = "localhost",
         enable_stealth: bool = False,
+        page_pool_size: int = PAGE_POOL_SIZE,
+        page_pool_max_uses: int = PAGE_POOL_MAX_USES,
+        context_cache_size: int = CONTEXT_CACHE_SIZE,
+        context_idle_ttl: float = CONTEXT_IDLE_TTL,
     ):
         self.browser_type = browser_type
         self.headless = headless 
@@ -479,6 +498,10 @@ class BrowserConfig:
         self.debugging_port = debugging_port
         self.host = host
         self.enable_stealth = enable_stealth
+        self.page_pool_size = page_pool_size
+        self.page_pool_max_uses = page_pool_max_uses
+        self.context_cache_size = context_cache_size
+        self.context_idle_ttl = context_idle_ttl
 
         fa_user_agenr_generator = ValidUAGenerator()
         if self.user_agent_mode == "random":
@@ -554,6 +577,10 @@ class BrowserConfig:
             debugging_port=kwargs.get("debugging_port", 9222),
             host=kwargs.get("host", "localhost"),
             enable_stealth=kwargs.get("enable_stealth", False),
+            page_pool_size=kwargs.get("page_pool_size", PAGE_POOL_SIZE),
+            page_pool_max_uses=kwargs.get("page_pool_max_uses", PAGE_POOL_MAX_USES),
+            context_cache_size=kwargs.get("context_cache_size", CONTEXT_CACHE_SIZE),
+            context_idle_ttl=kwargs.get("context_idle_ttl", CONTEXT_IDLE_TTL),
         )
 
     def to_dict(self):
@@ -589,6 +616,10 @@ class BrowserConfig:
             "debugging_port": self.debugging_port,
             "host": self.host,
             "enable_stealth": self.enable_stealth,
+            "page_pool_size": self.page_pool_size,
+            "page_pool_max_uses": self.page_pool_max_uses,
+            "context_cache_size": self.context_cache_size,
+            "context_idle_ttl": self.context_idle_ttl,
         }
 
                 
@@ -918,6 +949,11 @@ class CrawlerRunConfig():
                                Default: False.
         shared_data (dict or None): Shared data to be passed between hooks.
                                      Default: None.
+        cache_max_age (float or None): Maximum age in seconds of a cached page before it is
+                                       considered stale and refetched. Default: None (no limit).
+        respect_cache_headers (bool): Honor Cache-Control/Expires of the cached response when
+                                      deciding freshness, and skip caching `no-store` responses.
+                                      Default: False.
 
         # Page Navigation and Timing Parameters
         wait_until (str): The condition to wait for when navigating, e.g. "domcontentloaded".
@@ -1078,6 +1114,8 @@ class CrawlerRunConfig():
         no_cache_read: bool = False,
         no_cache_write: bool = False,
         shared_data: dict = None,
+        cache_max_age: Optional[float] = None,
+        respect_cache_headers: bool = False,
         # Page Navigation and Timing Parameters
         wait_until: str = "domcontentloaded",
         page_timeout: int = PAGE_TIMEOUT,
@@ -1190,6 +1228,8 @@ class CrawlerRunConfig():
         self.no_cache_read = no_cache_read
         self.no_cache_write = no_cache_write
         self.shared_data = shared_data
+        self.cache_max_age = cache_max_age
+        self.respect_cache_headers = respect_cache_headers
 
         # Page Navigation and Timing Parameters
         self.wait_until = wait_until
@@ -1466,6 +1506,8 @@ class CrawlerRunConfig():
             no_cache_read=kwargs.get("no_cache_read", False),
             no_cache_write=kwargs.get("no_cache_write", False),
             shared_data=kwargs.get("shared_data", None),
+            cache_max_age=kwargs.get("cache_max_age"),
+            respect_cache_headers=kwargs.get("respect_cache_headers", False),
             # Page Navigation and Timing Parameters
             wait_until=kwargs.get("wait_until", "domcontentloaded"),
             page_timeout=kwargs.get("page_timeout", 60000),
@@ -1585,6 +1627,8 @@ class CrawlerRunConfig():
             "no_cache_read": self.no_cache_read,
             "no_cache_write": self.no_cache_write,
             "shared_data": self.shared_data,
+            "cache_max_age": self.cache_max_age,
+            "respect_cache_headers": self.respect_cache_headers,
             "wait_until": self.wait_until,
             "page_timeout": self.page_timeout,
             "wait_for": self.wait_for,
@@ -1680,8 +1724,17 @@ class LLMConfig:
         presence_penalty: Optional[float] = None,
         stop: Optional[List[str]] = None,
         n: Optional[int] = None,    
+        tokens_per_minute: Optional[int] = None,
+        cache_mode: Optional[CacheMode] = None,
     ):
-        """Configuaration class for LLM provider and API token."""
+        """Configuaration class for LLM provider and API token.
+
+        tokens_per_minute caps this provider's token throughput across the
+        process (see ``AsyncLLMClient``); None leaves it unlimited.
+        cache_mode controls the shared LLM response cache (see
+        ``LLMResponseCache``): ENABLED answers prompts seen before without
+        calling the provider, None or BYPASS never use the cache.
+        """
         self.provider = provider
         if api_token and not api_token.startswith("env:"):
             self.api_token = api_token
@@ -1708,6 +1761,8 @@ class LLMConfig:
         self.presence_penalty = presence_penalty
         self.stop = stop
         self.n = n
+        self.tokens_per_minute = tokens_per_minute
+        self.cache_mode = cache_mode
 
     @staticmethod
     def from_kwargs(kwargs: dict) -> "LLMConfig":
@@ -1721,7 +1776,9 @@ class LLMConfig:
             frequency_penalty=kwargs.get("frequency_penalty"),
             presence_penalty=kwargs.get("presence_penalty"),
             stop=kwargs.get("stop"),
-            n=kwargs.get("n")
+            n=kwargs.get("n"),
+            tokens_per_minute=kwargs.get("tokens_per_minute"),
+            cache_mode=kwargs.get("cache_mode"),
         )
 
     def to_dict(self):
@@ -1735,7 +1792,9 @@ class LLMConfig:
             "frequency_penalty": self.frequency_penalty,
             "presence_penalty": self.presence_penalty,
             "stop": self.stop,
-            "n": self.n
+            "n": self.n,
+            "tokens_per_minute": self.tokens_per_minute,
+            "cache_mode": self.cache_mode,
         }
 
     def clone(self, **kwargs):
@@ -1772,6 +1831,7 @@ class SeedingConfig:
         score_threshold: Optional[float] = None,
         scoring_method: str = "bm25",
         filter_nonsense_urls: bool = True,
+        modified_since: Optional[Union[str, float, datetime]] = None,
     ):
         """
         Initialize URL seeding configuration.
@@ -1789,7 +1849,8 @@ class SeedingConfig:
                      Default: -1
             concurrency: Maximum concurrent requests for live checks/head extraction. 
                         Default: 1000
-            hits_per_sec: Rate limit in requests per second to avoid overwhelming servers. 
+            hits_per_sec: Rate limit in requests per second per host for live checks and
+                         head extraction (token bucket). Cached results are not limited.
                          Default: 5
             force: If True, bypasses the AsyncUrlSeeder's internal .jsonl cache and 
                   re-fetches URLs. Default: False
@@ -1807,6 +1868,11 @@ class SeedingConfig:
                           Future: "semantic". Default: "bm25"
             filter_nonsense_urls: Filter out utility URLs like robots.txt, sitemap.xml, 
                                  ads.txt, favicon.ico, etc. Default: True
+            modified_since: Only yield sitemap URLs whose <lastmod> is newer than this.
+                           Accepts a datetime, an ISO 8601 string, epoch seconds, or
+                           "last_run" for the start of the previous sitemap seeding of
+                           the same domain. URLs without a lastmod are always kept.
+                           Default: None (no filtering)
         """
         self.source = source
         self.pattern = pattern
@@ -1823,6 +1889,7 @@ class SeedingConfig:
         self.score_threshold = score_threshold
         self.scoring_method = scoring_method
         self.filter_nonsense_urls = filter_nonsense_urls
+        self.modified_since = modified_since
 
     # Add to_dict, from_kwargs, and clone methods for consistency
     def to_dict(self) -> Dict[str, Any]:
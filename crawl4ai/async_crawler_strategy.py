@@ -1047,12 +1047,13 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             raise e
 
         finally:
-            # If no session_id is given we should close the page
+            # If no session_id is given we should close (or return) the page
+            pooled = self.browser_manager.is_pooled(page)
             all_contexts = page.context.browser.contexts
             total_pages = sum(len(context.pages) for context in all_contexts)                
             if config.session_id:
                 pass
-            elif total_pages <= 1 and (self.browser_config.use_managed_browser or self.browser_config.headless):
+            elif not pooled and total_pages <= 1 and (self.browser_config.use_managed_browser or self.browser_config.headless):
                 pass
             else:
                 # Detach listeners before closing to prevent potential errors during close
@@ -1069,8 +1070,11 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                     # Clean up console capture
                     await self.adapter.cleanup_console_capture(page, handle_console, handle_error)
                 
-                # Close the page
-                await page.close()
+                # Hand a pooled page back for reuse, close any other
+                if pooled:
+                    await self.browser_manager.release_page(page)
+                else:
+                    await page.close()
 
     # async def _handle_full_page_scan(self, page: Page, scroll_delay: float = 0.1):
     async def _handle_full_page_scan(self, page: Page, scroll_delay: float = 0.1, max_scroll_steps: Optional[int] = None):
@@ -2162,6 +2166,8 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
     DEFAULT_MAX_CONNECTIONS: Final[int] = min(32, (os.cpu_count() or 1) * 4)
     DEFAULT_DNS_CACHE_TTL: Final[int] = 300
     VALID_SCHEMES: Final = frozenset({'http', 'https', 'file', 'raw'})
+    # crawl() accepts cache_validators and answers 304s with not_modified
+    supports_conditional_requests: Final[bool] = True
 
     _BASE_HEADERS: Final = MappingProxyType({
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -2289,7 +2295,8 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
     async def _handle_http(
         self, 
         url: str, 
-        config: CrawlerRunConfig
+        config: CrawlerRunConfig,
+        cache_validators: Optional[Dict[str, str]] = None
     ) -> AsyncCrawlResponse:
         async with self._session_context() as session:
             timeout = ClientTimeout(
@@ -2302,6 +2309,11 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
             if self.browser_config.headers:
                 headers.update(self.browser_config.headers)
 
+            # Conditional request: the server may answer 304 for unchanged pages
+            conditional = bool(cache_validators) and self.browser_config.method == "GET"
+            if conditional:
+                headers.update(cache_validators)
+
             request_kwargs = {
                 'timeout': timeout,
                 'allow_redirects': self.browser_config.follow_redirects,
@@ -2319,6 +2331,17 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
 
             try:
                 async with session.request(self.browser_config.method, url, **request_kwargs) as response:
+                    if conditional and response.status == 304:
+                        result = AsyncCrawlResponse(
+                            html="",
+                            response_headers=dict(response.headers),
+                            status_code=response.status,
+                            redirected_url=str(response.url),
+                            not_modified=True
+                        )
+                        await self.hooks['after_request'](result)
+                        return result
+
                     content = memoryview(await response.read())
                     
                     if not (200 <= response.status < 300):
@@ -2381,7 +2404,9 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
             elif scheme == 'raw':
                 return await self._handle_raw(parsed.path)
             else:  # http or https
-                return await self._handle_http(url, config)
+                return await self._handle_http(
+                    url, config, cache_validators=kwargs.get('cache_validators')
+                )
                 
         except Exception as e:
             if self.logger:
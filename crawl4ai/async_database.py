@@ -1,15 +1,20 @@
 import os
+import time
+import threading
 from pathlib import Path
 import aiosqlite
 import asyncio
-from typing import Optional, Dict
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Optional, Dict, List, Set
 from contextlib import asynccontextmanager
 import json  
 from .models import CrawlResult, MarkdownGenerationResult, StringCompatibleMarkdown
-import aiofiles
 from .async_logger import AsyncLogger
+from .content_store import ContentStore
+from .cache_context import parse_cache_headers
 
-from .utils import ensure_content_dirs, generate_content_hash
+from .utils import ensure_content_dirs
 from .utils import VersionManager
 from .utils import get_error_context, create_box_message
 
@@ -19,17 +24,187 @@ base_directory = DB_PATH = os.path.join(
 os.makedirs(DB_PATH, exist_ok=True)
 DB_PATH = os.path.join(base_directory, "crawl4ai.db")
 
+# Freshness / eviction bookkeeping columns and their SQLite types
+CACHE_META_COLUMNS = {
+    "cached_at": "REAL",
+    "last_accessed": "REAL",
+    "expires_at": "REAL",
+    "etag": "TEXT",
+    "last_modified": "TEXT",
+    "content_size": "INTEGER DEFAULT 0",
+    "hit_count": "INTEGER DEFAULT 0",
+}
+
+CACHE_UPSERT_COLUMNS = (
+    "url", "html", "cleaned_html", "markdown",
+    "extracted_content", "success", "media", "links", "metadata",
+    "screenshot", "response_headers", "downloaded_files",
+    "cached_at", "last_accessed", "expires_at", "etag", "last_modified",
+    "content_size",
+)
+
+CACHE_UPSERT_SQL = """
+    INSERT INTO crawled_data (
+        url, html, cleaned_html, markdown,
+        extracted_content, success, media, links, metadata,
+        screenshot, response_headers, downloaded_files,
+        cached_at, last_accessed, expires_at, etag, last_modified, content_size
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(url) DO UPDATE SET
+        html = excluded.html,
+        cleaned_html = excluded.cleaned_html,
+        markdown = excluded.markdown,
+        extracted_content = excluded.extracted_content,
+        success = excluded.success,
+        media = excluded.media,
+        links = excluded.links,
+        metadata = excluded.metadata,
+        screenshot = excluded.screenshot,
+        response_headers = excluded.response_headers,
+        downloaded_files = excluded.downloaded_files,
+        cached_at = excluded.cached_at,
+        last_accessed = excluded.last_accessed,
+        expires_at = excluded.expires_at,
+        etag = excluded.etag,
+        last_modified = excluded.last_modified,
+        content_size = excluded.content_size
+"""
+
+CACHE_TOUCH_SQL = """
+    UPDATE crawled_data
+    SET last_accessed = ?, hit_count = COALESCE(hit_count, 0) + 1
+    WHERE url = ?
+"""
+
+CACHE_STATS_SQL = """
+    INSERT INTO cache_stats (name, value) VALUES (?, ?)
+    ON CONFLICT(name) DO UPDATE SET value = value + excluded.value
+"""
+
+# crawled_data column -> content type of the blob it references
+CONTENT_COLUMNS = {
+    "html": "html",
+    "cleaned_html": "cleaned",
+    "markdown": "markdown",
+    "extracted_content": "extracted",
+    "screenshot": "screenshot",
+}
+
+
+@dataclass
+class CacheWriteStats:
+    """Counters for the write-behind queue of AsyncDatabaseManager."""
+
+    peak_pending_writes: int = 0
+    writes_queued: int = 0
+    writes_coalesced: int = 0
+    batches_committed: int = 0
+    rows_committed: int = 0
+    failed_batches: int = 0
+    last_commit_latency: float = 0.0
+    total_commit_latency: float = 0.0
+
+    @property
+    def avg_commit_latency(self) -> float:
+        if not self.batches_committed:
+            return 0.0
+        return self.total_commit_latency / self.batches_committed
+
+
+@dataclass
+class CacheEntry:
+    """A cached CrawlResult together with its freshness metadata."""
+
+    result: CrawlResult
+    cached_at: Optional[float] = None
+    expires_at: Optional[float] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(
+        self,
+        max_age: Optional[float] = None,
+        respect_headers: bool = False,
+        now: Optional[float] = None,
+    ) -> bool:
+        """
+        Whether the entry can be served without refetching.
+
+        Args:
+            max_age: Maximum age in seconds; entries of unknown age are stale.
+            respect_headers: Also honor the expiry derived from the response's
+                Cache-Control/Expires headers.
+            now: Reference time, defaults to the current time.
+        """
+        now = now or time.time()
+        if max_age is not None:
+            if self.cached_at is None or now - self.cached_at > max_age:
+                return False
+        if respect_headers and self.expires_at is not None:
+            return now < self.expires_at
+        return True
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers revalidating this entry, empty without validators"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
 
 class AsyncDatabaseManager:
-    def __init__(self, pool_size: int = 10, max_retries: int = 3):
-        self.db_path = DB_PATH
-        self.content_paths = ensure_content_dirs(os.path.dirname(DB_PATH))
+    """
+    SQLite-backed crawl cache.
+
+    Connections are long-lived: a single writer connection plus up to
+    ``pool_size`` reader connections, all in WAL mode so readers never block
+    the writer. ``acache_url`` does not hit the database directly; rows are
+    queued in a write-behind buffer (coalesced per URL) and committed in
+    batches by a background flusher. Pending rows are flushed on ``flush()``,
+    ``cleanup()`` and when the owning event loop shuts down.
+
+    Page content lives outside SQLite in a compressed ``ContentStore``; rows
+    only keep references. Cached results load ``html``, ``cleaned_html`` and
+    ``screenshot`` from disk on first access.
+
+    Every row records when it was cached and last served, its HTTP validators
+    and a header-derived expiry (see ``CacheEntry.is_fresh``). With
+    ``max_cache_size`` (logical bytes) or ``max_cache_entries`` set, least
+    recently used rows are evicted and orphaned content files removed.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        max_retries: int = 3,
+        db_path: Optional[str] = None,
+        write_behind: bool = True,
+        write_batch_size: int = 200,
+        write_flush_interval: float = 0.05,
+        max_pending_writes: int = 2000,
+        compression: str = "auto",
+        pack_threshold: int = 0,
+        max_cache_size: Optional[int] = None,
+        max_cache_entries: Optional[int] = None,
+        evict_check_interval: float = 60.0,
+    ):
+        self.db_path = db_path or DB_PATH
+        self.content_paths = ensure_content_dirs(os.path.dirname(self.db_path))
+        self.content_store = ContentStore(
+            os.path.dirname(self.db_path),
+            compression=compression,
+            pack_threshold=pack_threshold,
+        )
         self.pool_size = pool_size
         self.max_retries = max_retries
-        self.connection_pool: Dict[int, aiosqlite.Connection] = {}
-        self.pool_lock = asyncio.Lock()
+        self.write_behind = write_behind
+        self.write_batch_size = write_batch_size
+        self.write_flush_interval = write_flush_interval
+        self.max_pending_writes = max_pending_writes
         self.init_lock = asyncio.Lock()
-        self.connection_semaphore = asyncio.Semaphore(pool_size)
         self._initialized = False
         self.version_manager = VersionManager()
         self.logger = AsyncLogger(
@@ -38,6 +213,35 @@ class AsyncDatabaseManager:
             tag_width=10,
         )
 
+        # Pool state, bound to the event loop that first used it (see _ensure_pool)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._readers: List[aiosqlite.Connection] = []
+        self._reader_count = 0
+        self._writer: Optional[aiosqlite.Connection] = None
+        self.pool_lock: Optional[asyncio.Lock] = None
+        self.connection_semaphore: Optional[asyncio.Semaphore] = None
+        self._writer_lock: Optional[asyncio.Lock] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._write_event: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+
+        # url -> row parameters; re-caching a pending url replaces its row
+        self._pending_writes: "OrderedDict[str, tuple]" = OrderedDict()
+        self.write_stats = CacheWriteStats()
+
+        # Hit/miss accounting; url -> access time of pending LRU updates
+        self.hits = 0
+        self.misses = 0
+        self._pending_touches: Dict[str, float] = {}
+        self._unpersisted_hits = 0
+        self._unpersisted_misses = 0
+
+        # Size-bounded eviction, checked after flushes
+        self.max_cache_size = max_cache_size
+        self.max_cache_entries = max_cache_entries
+        self.evict_check_interval = evict_check_interval
+        self._last_evict_check = 0.0
+
     async def initialize(self):
         """Initialize the database and connection pool"""
         try:
@@ -60,15 +264,17 @@ class AsyncDatabaseManager:
                     if not result:
                         raise Exception("crawled_data table was not created")
 
+            # Cheap when nothing is missing; keeps older caches usable
+            await self.update_db_schema()
+
             # If version changed or fresh install, run updates
             if needs_update:
                 self.logger.info("New version detected, running updates", tag="INIT")
-                await self.update_db_schema()
                 from .migrations import (
                     run_migration,
                 )  # Import here to avoid circular imports
 
-                await run_migration()
+                await run_migration(self.db_path)
                 self.version_manager.update_version()  # Update stored version after successful migration
                 self.logger.success(
                     "Version update completed successfully", tag="COMPLETE"
@@ -91,127 +297,212 @@ class AsyncDatabaseManager:
             raise
 
     async def cleanup(self):
-        """Cleanup connections when shutting down"""
-        async with self.pool_lock:
-            for conn in self.connection_pool.values():
+        """Flush pending writes and close all pooled connections"""
+        await self._ensure_pool()
+        await self.flush()
+        flusher, self._flusher = self._flusher, None
+        if flusher and not flusher.done():
+            flusher.cancel()
+            await asyncio.gather(flusher, return_exceptions=True)
+        await self._close_connections()
+        # Next use rebuilds the pool
+        self._loop = None
+
+    def get_stats(self) -> Dict[str, float]:
+        """Return write-queue depth and commit latency metrics"""
+        stats = asdict(self.write_stats)
+        stats["pending_writes"] = len(self._pending_writes)
+        stats["avg_commit_latency"] = self.write_stats.avg_commit_latency
+        stats["open_readers"] = self._reader_count
+        stats["hits"] = self.hits
+        stats["misses"] = self.misses
+        lookups = self.hits + self.misses
+        stats["hit_rate"] = self.hits / lookups if lookups else 0.0
+        return stats
+
+    async def _ensure_initialized(self):
+        if self._initialized:
+            return
+        async with self.init_lock:
+            if self._initialized:
+                return
+            try:
+                await self.initialize()
+                self._initialized = True
+            except Exception as e:
+                import sys
+
+                error_context = get_error_context(sys.exc_info())
+                self.logger.error(
+                    message="Database initialization failed:\n{error}\n\nContext:\n{context}\n\nTraceback:\n{traceback}",
+                    tag="ERROR",
+                    force_verbose=True,
+                    params={
+                        "error": str(e),
+                        "context": error_context["code_context"],
+                        "traceback": error_context["full_traceback"],
+                    },
+                )
+                raise
+
+    async def _ensure_pool(self):
+        """Bind pool primitives to the running loop, dropping any stale pool"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        # Connections and locks from a previous (likely closed) loop cannot be
+        # reused; pending writes are plain data and survive the switch.
+        stale = self._readers + ([self._writer] if self._writer else [])
+        self._loop = loop
+        self._readers = []
+        self._reader_count = 0
+        self._writer = None
+        self.pool_lock = asyncio.Lock()
+        self.connection_semaphore = asyncio.Semaphore(self.pool_size)
+        self._writer_lock = asyncio.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._write_event = asyncio.Event()
+        self._flusher = asyncio.create_task(self._flush_loop())
+        for conn in stale:
+            try:
+                await conn.close()
+            except Exception:
+                pass
+
+    async def _open_connection(self) -> aiosqlite.Connection:
+        conn = aiosqlite.connect(self.db_path, timeout=30.0)
+        # Pooled connections live until cleanup(); their worker thread must not
+        # keep the interpreter from exiting when that never happens.
+        # (aiosqlite < 0.21 connections are threads, later ones own one.)
+        worker = conn if isinstance(conn, threading.Thread) else getattr(conn, "_thread", None)
+        if worker is not None:
+            worker.daemon = True
+        conn = await conn
+        await conn.execute("PRAGMA journal_mode = WAL")
+        await conn.execute("PRAGMA synchronous = NORMAL")
+        await conn.execute("PRAGMA busy_timeout = 5000")
+        return conn
+
+    async def _verify_schema(self, conn: aiosqlite.Connection):
+        """Check crawled_data has every expected column (once per pool)"""
+        async with conn.execute("PRAGMA table_info(crawled_data)") as cursor:
+            columns = await cursor.fetchall()
+            column_names = [col[1] for col in columns]
+            expected_columns = {
+                "url",
+                "html",
+                "cleaned_html",
+                "markdown",
+                "extracted_content",
+                "success",
+                "media",
+                "links",
+                "metadata",
+                "screenshot",
+                "response_headers",
+                "downloaded_files",
+            }
+            missing_columns = expected_columns - set(column_names)
+            if missing_columns:
+                raise ValueError(f"Database missing columns: {missing_columns}")
+
+    async def _close_connections(self):
+        connections = self._readers + ([self._writer] if self._writer else [])
+        self._readers = []
+        self._reader_count = 0
+        self._writer = None
+        for conn in connections:
+            try:
                 await conn.close()
-            self.connection_pool.clear()
+            except Exception:
+                pass
+
+    def _log_connection_error(self, e: Exception):
+        import sys
+
+        error_context = get_error_context(sys.exc_info())
+        error_message = (
+            f"Unexpected error in db get_connection at line {error_context['line_no']} "
+            f"in {error_context['function']} ({error_context['filename']}):\n"
+            f"Error: {str(e)}\n\n"
+            f"Code context:\n{error_context['code_context']}"
+        )
+        self.logger.error(
+            message="{error}",
+            tag="ERROR",
+            params={"error": str(error_message)},
+            boxes=["error"],
+        )
 
     @asynccontextmanager
-    async def get_connection(self):
-        """Connection pool manager with enhanced error handling"""
-        if not self._initialized:
-            async with self.init_lock:
-                if not self._initialized:
-                    try:
-                        await self.initialize()
-                        self._initialized = True
-                    except Exception as e:
-                        import sys
-
-                        error_context = get_error_context(sys.exc_info())
-                        self.logger.error(
-                            message="Database initialization failed:\n{error}\n\nContext:\n{context}\n\nTraceback:\n{traceback}",
-                            tag="ERROR",
-                            force_verbose=True,
-                            params={
-                                "error": str(e),
-                                "context": error_context["code_context"],
-                                "traceback": error_context["full_traceback"],
-                            },
-                        )
-                        raise
+    async def get_connection(self, write: bool = False):
+        """
+        Borrow a pooled connection.
 
-        await self.connection_semaphore.acquire()
-        task_id = id(asyncio.current_task())
+        Readers come from a pool of at most ``pool_size`` connections; with
+        ``write=True`` the single writer connection is yielded under a lock so
+        that writes are serialized. Connections that raise are discarded
+        instead of being returned to the pool.
+        """
+        await self._ensure_initialized()
+        await self._ensure_pool()
+
+        if write:
+            async with self._writer_lock:
+                try:
+                    if self._writer is None:
+                        self._writer = await self._open_connection()
+                        await self._verify_schema(self._writer)
+                    yield self._writer
+                except Exception as e:
+                    self._log_connection_error(e)
+                    if self._writer is not None:
+                        writer, self._writer = self._writer, None
+                        try:
+                            await writer.close()
+                        except Exception:
+                            pass
+                    raise
+            return
 
+        await self.connection_semaphore.acquire()
+        conn = None
         try:
             async with self.pool_lock:
-                if task_id not in self.connection_pool:
-                    try:
-                        conn = await aiosqlite.connect(self.db_path, timeout=30.0)
-                        await conn.execute("PRAGMA journal_mode = WAL")
-                        await conn.execute("PRAGMA busy_timeout = 5000")
-
-                        # Verify database structure
-                        async with conn.execute(
-                            "PRAGMA table_info(crawled_data)"
-                        ) as cursor:
-                            columns = await cursor.fetchall()
-                            column_names = [col[1] for col in columns]
-                            expected_columns = {
-                                "url",
-                                "html",
-                                "cleaned_html",
-                                "markdown",
-                                "extracted_content",
-                                "success",
-                                "media",
-                                "links",
-                                "metadata",
-                                "screenshot",
-                                "response_headers",
-                                "downloaded_files",
-                            }
-                            missing_columns = expected_columns - set(column_names)
-                            if missing_columns:
-                                raise ValueError(
-                                    f"Database missing columns: {missing_columns}"
-                                )
-
-                        self.connection_pool[task_id] = conn
-                    except Exception as e:
-                        import sys
-
-                        error_context = get_error_context(sys.exc_info())
-                        error_message = (
-                            f"Unexpected error in db get_connection at line {error_context['line_no']} "
-                            f"in {error_context['function']} ({error_context['filename']}):\n"
-                            f"Error: {str(e)}\n\n"
-                            f"Code context:\n{error_context['code_context']}"
-                        )
-                        self.logger.error(
-                            message="{error}",
-                            tag="ERROR",
-                            params={"error": str(error_message)},
-                            boxes=["error"],
-                        )
-
-                        raise
-
-            yield self.connection_pool[task_id]
-
-        except Exception as e:
-            import sys
-
-            error_context = get_error_context(sys.exc_info())
-            error_message = (
-                f"Unexpected error in db get_connection at line {error_context['line_no']} "
-                f"in {error_context['function']} ({error_context['filename']}):\n"
-                f"Error: {str(e)}\n\n"
-                f"Code context:\n{error_context['code_context']}"
-            )
-            self.logger.error(
-                message="{error}",
-                tag="ERROR",
-                params={"error": str(error_message)},
-                boxes=["error"],
-            )
+                if self._readers:
+                    conn = self._readers.pop()
+            if conn is None:
+                conn = await self._open_connection()
+                async with self.pool_lock:
+                    self._reader_count += 1
+            yield conn
+        except BaseException as e:
+            if isinstance(e, Exception):
+                self._log_connection_error(e)
+            if conn is not None:
+                try:
+                    await conn.close()
+                except Exception:
+                    pass
+                async with self.pool_lock:
+                    self._reader_count -= 1
+                conn = None
             raise
-        finally:
+        else:
             async with self.pool_lock:
-                if task_id in self.connection_pool:
-                    await self.connection_pool[task_id].close()
-                    del self.connection_pool[task_id]
+                self._readers.append(conn)
+        finally:
             self.connection_semaphore.release()
 
-    async def execute_with_retry(self, operation, *args):
+    async def execute_with_retry(self, operation, *args, write: bool = False):
         """Execute database operations with retry logic"""
         for attempt in range(self.max_retries):
             try:
-                async with self.get_connection() as db:
+                async with self.get_connection(write=write) as db:
                     result = await operation(db, *args)
-                    await db.commit()
+                    if write:
+                        await db.commit()
                     return result
             except Exception as e:
                 if attempt == self.max_retries - 1:
@@ -224,6 +515,109 @@ class AsyncDatabaseManager:
                     raise
                 await asyncio.sleep(1 * (attempt + 1))  # Exponential backoff
 
+    async def _flush_loop(self):
+        """Background task committing queued writes in batches"""
+        try:
+            while True:
+                await self._write_event.wait()
+                self._write_event.clear()
+                # Give concurrent acache_url calls a moment to join the batch
+                if self.write_flush_interval:
+                    await asyncio.sleep(self.write_flush_interval)
+                await self.flush()
+        except asyncio.CancelledError:
+            # Loop is shutting down (or cleanup() was called): persist what is
+            # queued and release connections bound to this loop.
+            if self._loop is asyncio.get_running_loop():
+                try:
+                    await self.flush()
+                finally:
+                    await self._close_connections()
+            raise
+
+    async def flush(self):
+        """Commit every pending cache write and access-statistics update"""
+        if not (
+            self._pending_writes
+            or self._pending_touches
+            or self._unpersisted_hits
+            or self._unpersisted_misses
+        ):
+            return
+        await self._ensure_pool()
+        async with self._flush_lock:
+            while self._pending_writes:
+                batch = []
+                while self._pending_writes and len(batch) < self.write_batch_size:
+                    batch.append(self._pending_writes.popitem(last=False))
+
+                async def _cache(db):
+                    await db.executemany(CACHE_UPSERT_SQL, [row for _, row in batch])
+
+                t1 = time.perf_counter()
+                try:
+                    await self.execute_with_retry(_cache, write=True)
+                except Exception as e:
+                    self.write_stats.failed_batches += 1
+                    self.logger.error(
+                        message="Error caching {count} URLs: {error}",
+                        tag="ERROR",
+                        force_verbose=True,
+                        params={"count": len(batch), "error": str(e)},
+                    )
+                    # Queue the batch again for the next flush, unless a
+                    # newer write for the same URL arrived meanwhile
+                    for url, row in reversed(batch):
+                        if url not in self._pending_writes:
+                            self._pending_writes[url] = row
+                            self._pending_writes.move_to_end(url, last=False)
+                    break
+                latency = time.perf_counter() - t1
+                self.write_stats.batches_committed += 1
+                self.write_stats.rows_committed += len(batch)
+                self.write_stats.last_commit_latency = latency
+                self.write_stats.total_commit_latency += latency
+
+            await self._persist_access_stats()
+        await self._maybe_evict()
+
+    async def _persist_access_stats(self):
+        touches = [(t, url) for url, t in self._pending_touches.items()]
+        counters = [("hits", self._unpersisted_hits), ("misses", self._unpersisted_misses)]
+        self._pending_touches = {}
+        self._unpersisted_hits = self._unpersisted_misses = 0
+        if not touches and not any(value for _, value in counters):
+            return
+
+        async def _touch(db):
+            if touches:
+                await db.executemany(CACHE_TOUCH_SQL, touches)
+            await db.executemany(CACHE_STATS_SQL, counters)
+
+        try:
+            await self.execute_with_retry(_touch, write=True)
+        except Exception as e:
+            self.logger.error(
+                message="Error recording cache access statistics: {error}",
+                tag="ERROR",
+                params={"error": str(e)},
+            )
+
+    def record_access(self, url: str, hit: bool):
+        """
+        Account a cache lookup. Hits refresh the entry's LRU position; both
+        are persisted on the next flush.
+        """
+        if hit:
+            self.hits += 1
+            self._unpersisted_hits += 1
+            self._pending_touches[url] = time.time()
+        else:
+            self.misses += 1
+            self._unpersisted_misses += 1
+        if self._write_event is not None and self._loop is asyncio.get_running_loop():
+            self._write_event.set()
+
     async def ainit_db(self):
         """Initialize database schema"""
         async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
@@ -241,7 +635,22 @@ class AsyncDatabaseManager:
                     metadata TEXT DEFAULT "{}",
                     screenshot TEXT DEFAULT "",
                     response_headers TEXT DEFAULT "{}",
-                    downloaded_files TEXT DEFAULT "{}"  -- New column added
+                    downloaded_files TEXT DEFAULT "{}",  -- New column added
+                    cached_at REAL,
+                    last_accessed REAL,
+                    expires_at REAL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content_size INTEGER DEFAULT 0,
+                    hit_count INTEGER DEFAULT 0
+                )
+            """
+            )
+            await db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_stats (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER DEFAULT 0
                 )
             """
             )
@@ -262,11 +671,20 @@ class AsyncDatabaseManager:
                 "screenshot",
                 "response_headers",
                 "downloaded_files",
+                *CACHE_META_COLUMNS,
             ]
 
             for column in new_columns:
                 if column not in column_names:
                     await self.aalter_db_add_column(column, db)
+            await db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_crawled_data_last_accessed "
+                "ON crawled_data (last_accessed)"
+            )
+            await db.execute(
+                "CREATE TABLE IF NOT EXISTS cache_stats "
+                "(name TEXT PRIMARY KEY, value INTEGER DEFAULT 0)"
+            )
             await db.commit()
 
     async def aalter_db_add_column(self, new_column: str, db):
@@ -275,6 +693,10 @@ class AsyncDatabaseManager:
             await db.execute(
                 f'ALTER TABLE crawled_data ADD COLUMN {new_column} TEXT DEFAULT "{{}}"'
             )
+        elif new_column in CACHE_META_COLUMNS:
+            await db.execute(
+                f"ALTER TABLE crawled_data ADD COLUMN {new_column} {CACHE_META_COLUMNS[new_column]}"
+            )
         else:
             await db.execute(
                 f'ALTER TABLE crawled_data ADD COLUMN {new_column} TEXT DEFAULT ""'
@@ -285,8 +707,105 @@ class AsyncDatabaseManager:
             params={"column": new_column},
         )
 
-    async def aget_cached_url(self, url: str) -> Optional[CrawlResult]:
-        """Retrieve cached URL data as CrawlResult"""
+    async def _row_to_result(self, row_dict: Dict) -> CrawlResult:
+        """Build a CrawlResult from a crawled_data row, loading content files"""
+        # Heavy fields are read from disk only when accessed
+        lazy_refs = {
+            "html": (row_dict["html"], "html"),
+            "cleaned_html": (row_dict["cleaned_html"], "cleaned"),
+            "screenshot": (row_dict["screenshot"], "screenshot"),
+        }
+        for field in lazy_refs:
+            row_dict[field] = ""
+
+        # Load the rest from files using stored references, in parallel
+        content_fields = {
+            "markdown": "markdown",
+            "extracted_content": "extracted",
+        }
+        loaded = await asyncio.gather(
+            *[
+                self._load_content(row_dict[field], content_type)
+                for field, content_type in content_fields.items()
+            ]
+        )
+        for field, content in zip(content_fields, loaded):
+            row_dict[field] = content or ""
+
+        # Parse JSON fields
+        json_fields = [
+            "media",
+            "links",
+            "metadata",
+            "response_headers",
+            "markdown",
+        ]
+        for field in json_fields:
+            try:
+                row_dict[field] = (
+                    json.loads(row_dict[field]) if row_dict[field] else {}
+                )
+            except json.JSONDecodeError:
+                # Very UGLY, never mention it to me please
+                if field == "markdown" and isinstance(row_dict[field], str):
+                    row_dict[field] = MarkdownGenerationResult(
+                        raw_markdown=row_dict[field] or "",
+                        markdown_with_citations="",
+                        references_markdown="",
+                        fit_markdown="",
+                        fit_html="",
+                    )
+                else:
+                    row_dict[field] = {}
+
+        if isinstance(row_dict["markdown"], Dict):
+            if row_dict["markdown"].get("raw_markdown"):
+                row_dict["markdown"] = row_dict["markdown"]["raw_markdown"]
+
+        # Parse downloaded_files
+        try:
+            row_dict["downloaded_files"] = (
+                json.loads(row_dict["downloaded_files"])
+                if row_dict["downloaded_files"]
+                else []
+            )
+        except json.JSONDecodeError:
+            row_dict["downloaded_files"] = []
+
+        # Remove any fields not in CrawlResult model
+        valid_fields = CrawlResult.__annotations__.keys()
+        filtered_dict = {k: v for k, v in row_dict.items() if k in valid_fields}
+        filtered_dict["markdown"] = row_dict["markdown"]
+        result = CrawlResult(**filtered_dict)
+        for field, (ref, content_type) in lazy_refs.items():
+            if ref:
+                result.set_lazy_field(
+                    field,
+                    lambda ref=ref, content_type=content_type: self._load_content_sync(
+                        ref, content_type
+                    )
+                    or "",
+                    # A row can outlive its blob (deleted or collected content)
+                    exists=lambda ref=ref, content_type=content_type: self.content_store.exists(
+                        ref, content_type
+                    ),
+                )
+        return result
+
+    async def _entry_from_row(self, row_dict: Dict) -> CacheEntry:
+        meta = {
+            "cached_at": row_dict.get("cached_at"),
+            "expires_at": row_dict.get("expires_at"),
+            "etag": row_dict.get("etag"),
+            "last_modified": row_dict.get("last_modified"),
+        }
+        return CacheEntry(result=await self._row_to_result(row_dict), **meta)
+
+    async def aget_cache_entry(self, url: str) -> Optional[CacheEntry]:
+        """Retrieve a cached URL together with its freshness metadata"""
+        # Read-your-writes: make sure a queued row for this url is committed
+        if url in self._pending_writes:
+            await self.flush()
 
         async def _get(db):
             async with db.execute(
@@ -299,76 +818,13 @@ class AsyncDatabaseManager:
                 # Get column names
                 columns = [description[0] for description in cursor.description]
                 # Create dict from row data
-                row_dict = dict(zip(columns, row))
-
-                # Load content from files using stored hashes
-                content_fields = {
-                    "html": row_dict["html"],
-                    "cleaned_html": row_dict["cleaned_html"],
-                    "markdown": row_dict["markdown"],
-                    "extracted_content": row_dict["extracted_content"],
-                    "screenshot": row_dict["screenshot"],
-                    "screenshots": row_dict["screenshot"],
-                }
-
-                for field, hash_value in content_fields.items():
-                    if hash_value:
-                        content = await self._load_content(
-                            hash_value,
-                            field.split("_")[0],  # Get content type from field name
-                        )
-                        row_dict[field] = content or ""
-                    else:
-                        row_dict[field] = ""
-
-                # Parse JSON fields
-                json_fields = [
-                    "media",
-                    "links",
-                    "metadata",
-                    "response_headers",
-                    "markdown",
-                ]
-                for field in json_fields:
-                    try:
-                        row_dict[field] = (
-                            json.loads(row_dict[field]) if row_dict[field] else {}
-                        )
-                    except json.JSONDecodeError:
-                        # Very UGLY, never mention it to me please
-                        if field == "markdown" and isinstance(row_dict[field], str):
-                            row_dict[field] = MarkdownGenerationResult(
-                                raw_markdown=row_dict[field] or "",
-                                markdown_with_citations="",
-                                references_markdown="",
-                                fit_markdown="",
-                                fit_html="",
-                            )
-                        else:
-                            row_dict[field] = {}
-
-                if isinstance(row_dict["markdown"], Dict):
-                    if row_dict["markdown"].get("raw_markdown"):
-                        row_dict["markdown"] = row_dict["markdown"]["raw_markdown"]
-
-                # Parse downloaded_files
-                try:
-                    row_dict["downloaded_files"] = (
-                        json.loads(row_dict["downloaded_files"])
-                        if row_dict["downloaded_files"]
-                        else []
-                    )
-                except json.JSONDecodeError:
-                    row_dict["downloaded_files"] = []
-
-                # Remove any fields not in CrawlResult model
-                valid_fields = CrawlResult.__annotations__.keys()
-                filtered_dict = {k: v for k, v in row_dict.items() if k in valid_fields}
-                filtered_dict["markdown"] = row_dict["markdown"]
-                return CrawlResult(**filtered_dict)
+                return dict(zip(columns, row))
 
         try:
-            return await self.execute_with_retry(_get)
+            row_dict = await self.execute_with_retry(_get)
+            if row_dict is None:
+                return None
+            return await self._entry_from_row(row_dict)
         except Exception as e:
             self.logger.error(
                 message="Error retrieving cached URL: {error}",
@@ -378,8 +834,103 @@ class AsyncDatabaseManager:
             )
             return None
 
-    async def acache_url(self, result: CrawlResult):
-        """Cache CrawlResult data"""
+    async def aget_cached_url(
+        self,
+        url: str,
+        max_age: Optional[float] = None,
+        respect_headers: bool = False,
+    ) -> Optional[CrawlResult]:
+        """Retrieve cached URL data as CrawlResult, None if missing or stale"""
+        entry = await self.aget_cache_entry(url)
+        if entry is None or not entry.is_fresh(max_age, respect_headers):
+            return None
+        return entry.result
+
+    async def aget_cache_entries(
+        self, urls: List[str], chunk_size: int = 500
+    ) -> Dict[str, CacheEntry]:
+        """
+        Retrieve many cache entries at once.
+
+        Rows are fetched with one ``SELECT ... WHERE url IN (...)`` per chunk and
+        their content files are loaded concurrently.
+
+        Args:
+            urls: URLs to look up; duplicates are ignored.
+            chunk_size: Maximum number of URLs bound into a single query.
+
+        Returns:
+            Dict[str, CacheEntry]: Entries keyed by URL. URLs that are not
+            cached (or fail to load) are absent.
+        """
+        urls = list(dict.fromkeys(urls))
+        if any(url in self._pending_writes for url in urls):
+            await self.flush()
+
+        async def _get_many(db, chunk):
+            placeholders = ",".join("?" * len(chunk))
+            async with db.execute(
+                f"SELECT * FROM crawled_data WHERE url IN ({placeholders})", chunk
+            ) as cursor:
+                rows = await cursor.fetchall()
+                columns = [description[0] for description in cursor.description]
+                return [dict(zip(columns, row)) for row in rows]
+
+        cached: Dict[str, CacheEntry] = {}
+        for i in range(0, len(urls), chunk_size):
+            chunk = urls[i : i + chunk_size]
+            try:
+                rows = await self.execute_with_retry(_get_many, chunk)
+            except Exception as e:
+                self.logger.error(
+                    message="Error retrieving cached URLs: {error}",
+                    tag="ERROR",
+                    force_verbose=True,
+                    params={"error": str(e)},
+                )
+                continue
+
+            entries = await asyncio.gather(
+                *[self._entry_from_row(row) for row in rows], return_exceptions=True
+            )
+            for entry in entries:
+                if isinstance(entry, CacheEntry):
+                    cached[entry.result.url] = entry
+        return cached
+
+    async def aget_cached_urls(
+        self,
+        urls: List[str],
+        chunk_size: int = 500,
+        max_age: Optional[float] = None,
+        respect_headers: bool = False,
+    ) -> Dict[str, CrawlResult]:
+        """
+        Retrieve many cached URLs at once, see ``aget_cache_entries``.
+
+        Returns:
+            Dict[str, CrawlResult]: Fresh cached results keyed by URL.
+        """
+        entries = await self.aget_cache_entries(urls, chunk_size)
+        return {
+            url: entry.result
+            for url, entry in entries.items()
+            if entry.is_fresh(max_age, respect_headers)
+        }
+
+    async def acache_url(self, result: CrawlResult, respect_headers: bool = False):
+        """
+        Cache CrawlResult data.
+
+        Args:
+            result: The result to store.
+            respect_headers: Skip responses sent with ``Cache-Control: no-store``.
+        """
+        now = time.time()
+        cache_info = parse_cache_headers(result.response_headers, now)
+        if respect_headers and cache_info["no_store"]:
+            return
+
         # Store content files and get hashes
         content_map = {
             "html": (result.html, "html"),
@@ -425,49 +976,93 @@ class AsyncDatabaseManager:
         for field, (content, content_type) in content_map.items():
             content_hashes[field] = await self._store_content(content, content_type)
 
-        async def _cache(db):
+        row = (
+            result.url,
+            content_hashes["html"],
+            content_hashes["cleaned_html"],
+            content_hashes["markdown"],
+            content_hashes["extracted_content"],
+            result.success,
+            json.dumps(result.media),
+            json.dumps(result.links),
+            json.dumps(result.metadata or {}),
+            content_hashes["screenshot"],
+            json.dumps(result.response_headers or {}),
+            json.dumps(result.downloaded_files or []),
+            now,
+            now,
+            cache_info["expires_at"],
+            cache_info["etag"],
+            cache_info["last_modified"],
+            # Logical (uncompressed) size, used for size-bounded eviction
+            sum(len(content or "") for content, _ in content_map.values()),
+        )
+
+        if not self.write_behind:
+            async def _cache(db):
+                await db.execute(CACHE_UPSERT_SQL, row)
+
+            try:
+                await self.execute_with_retry(_cache, write=True)
+            except Exception as e:
+                self.logger.error(
+                    message="Error caching URL: {error}",
+                    tag="ERROR",
+                    force_verbose=True,
+                    params={"error": str(e)},
+                )
+            return
+
+        await self._ensure_pool()
+        if result.url in self._pending_writes:
+            self.write_stats.writes_coalesced += 1
+            del self._pending_writes[result.url]
+        self._pending_writes[result.url] = row
+        self.write_stats.writes_queued += 1
+        self.write_stats.peak_pending_writes = max(
+            self.write_stats.peak_pending_writes, len(self._pending_writes)
+        )
+
+        # Backpressure: writers wait for the flush once the buffer is full
+        if len(self._pending_writes) >= self.max_pending_writes:
+            await self.flush()
+        else:
+            self._write_event.set()
+
+    async def arevalidate(self, url: str, response_headers: Optional[Dict] = None):
+        """
+        Mark an entry as fresh again after the server confirmed it unchanged
+        (304 Not Modified). Validators and expiry are refreshed from the 304
+        response; content stays untouched.
+        """
+        now = time.time()
+        cache_info = parse_cache_headers(response_headers, now)
+
+        async def _revalidate(db):
             await db.execute(
                 """
-                INSERT INTO crawled_data (
-                    url, html, cleaned_html, markdown,
-                    extracted_content, success, media, links, metadata,
-                    screenshot, response_headers, downloaded_files
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(url) DO UPDATE SET
-                    html = excluded.html,
-                    cleaned_html = excluded.cleaned_html,
-                    markdown = excluded.markdown,
-                    extracted_content = excluded.extracted_content,
-                    success = excluded.success,
-                    media = excluded.media,
-                    links = excluded.links,
-                    metadata = excluded.metadata,
-                    screenshot = excluded.screenshot,
-                    response_headers = excluded.response_headers,
-                    downloaded_files = excluded.downloaded_files
+                UPDATE crawled_data
+                SET cached_at = ?, last_accessed = ?, expires_at = ?,
+                    etag = COALESCE(?, etag),
+                    last_modified = COALESCE(?, last_modified),
+                    hit_count = COALESCE(hit_count, 0) + 1
+                WHERE url = ?
             """,
                 (
-                    result.url,
-                    content_hashes["html"],
-                    content_hashes["cleaned_html"],
-                    content_hashes["markdown"],
-                    content_hashes["extracted_content"],
-                    result.success,
-                    json.dumps(result.media),
-                    json.dumps(result.links),
-                    json.dumps(result.metadata or {}),
-                    content_hashes["screenshot"],
-                    json.dumps(result.response_headers or {}),
-                    json.dumps(result.downloaded_files or []),
+                    now,
+                    now,
+                    cache_info["expires_at"],
+                    cache_info["etag"],
+                    cache_info["last_modified"],
+                    url,
                 ),
             )
 
         try:
-            await self.execute_with_retry(_cache)
+            await self.execute_with_retry(_revalidate, write=True)
         except Exception as e:
             self.logger.error(
-                message="Error caching URL: {error}",
+                message="Error revalidating cached URL: {error}",
                 tag="ERROR",
                 force_verbose=True,
                 params={"error": str(e)},
@@ -475,6 +1070,7 @@ class AsyncDatabaseManager:
 
     async def aget_total_count(self) -> int:
         """Get total number of cached URLs"""
+        await self.flush()
 
         async def _count(db):
             async with db.execute("SELECT COUNT(*) FROM crawled_data") as cursor:
@@ -497,9 +1093,13 @@ class AsyncDatabaseManager:
 
         async def _clear(db):
             await db.execute("DELETE FROM crawled_data")
+            await db.execute("DELETE FROM cache_stats")
 
         try:
-            await self.execute_with_retry(_clear)
+            self._pending_writes.clear()
+            self._pending_touches.clear()
+            self._unpersisted_hits = self._unpersisted_misses = 0
+            await self.execute_with_retry(_clear, write=True)
         except Exception as e:
             self.logger.error(
                 message="Error clearing database: {error}",
@@ -515,7 +1115,9 @@ class AsyncDatabaseManager:
             await db.execute("DROP TABLE IF EXISTS crawled_data")
 
         try:
-            await self.execute_with_retry(_flush)
+            self._pending_writes.clear()
+            self._pending_touches.clear()
+            await self.execute_with_retry(_flush, write=True)
         except Exception as e:
             self.logger.error(
                 message="Error flushing database: {error}",
@@ -524,41 +1126,248 @@ class AsyncDatabaseManager:
                 params={"error": str(e)},
             )
 
-    async def _store_content(self, content: str, content_type: str) -> str:
-        """Store content in filesystem and return hash"""
-        if not content:
-            return ""
+    async def aevict(
+        self,
+        max_size: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        max_age: Optional[float] = None,
+        gc: bool = True,
+        chunk_size: int = 500,
+    ) -> Dict[str, int]:
+        """
+        Evict cache entries, then optionally remove orphaned content files.
+
+        Entries older than ``max_age`` go first, then least recently used ones
+        until at most ``max_entries`` remain and the logical (uncompressed)
+        content size is at most ``max_size`` bytes.
+
+        Args:
+            max_size: Size bound in bytes; rows cached before size tracking count as 0.
+            max_entries: Maximum number of rows to keep.
+            max_age: Maximum age in seconds; rows of unknown age are removed.
+            gc: Run ``agc_content`` afterwards.
+            chunk_size: Rows deleted per statement.
+
+        Returns:
+            dict: ``expired``, ``evicted`` and, with gc, ``files_removed`` and
+            ``bytes_freed``.
+        """
+        await self.flush()
+        stats = {"expired": 0, "evicted": 0}
+
+        async def _delete(db, urls):
+            for i in range(0, len(urls), chunk_size):
+                chunk = urls[i : i + chunk_size]
+                placeholders = ",".join("?" * len(chunk))
+                await db.execute(
+                    f"DELETE FROM crawled_data WHERE url IN ({placeholders})", chunk
+                )
+            for url in urls:
+                self._pending_touches.pop(url, None)
+
+        async def _evict(db):
+            if max_age is not None:
+                async with db.execute(
+                    "SELECT url FROM crawled_data WHERE cached_at IS NULL OR cached_at < ?",
+                    (time.time() - max_age,),
+                ) as cursor:
+                    expired = [row[0] for row in await cursor.fetchall()]
+                await _delete(db, expired)
+                stats["expired"] = len(expired)
 
-        content_hash = generate_content_hash(content)
-        file_path = os.path.join(self.content_paths[content_type], content_hash)
+            if max_entries is None and max_size is None:
+                return
+            async with db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(content_size), 0) FROM crawled_data"
+            ) as cursor:
+                count, size = await cursor.fetchone()
+
+            victims = []
+            async with db.execute(
+                "SELECT url, COALESCE(content_size, 0) FROM crawled_data "
+                "ORDER BY last_accessed ASC"
+            ) as cursor:
+                while (max_entries is not None and count > max_entries) or (
+                    max_size is not None and size > max_size
+                ):
+                    rows = await cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    for url, content_size in rows:
+                        if not (
+                            (max_entries is not None and count > max_entries)
+                            or (max_size is not None and size > max_size)
+                        ):
+                            break
+                        victims.append(url)
+                        count -= 1
+                        size -= content_size
+            await _delete(db, victims)
+            stats["evicted"] = len(victims)
+
+        try:
+            await self.execute_with_retry(_evict, write=True)
+        except Exception as e:
+            self.logger.error(
+                message="Error evicting cache entries: {error}",
+                tag="ERROR",
+                force_verbose=True,
+                params={"error": str(e)},
+            )
+            return stats
+
+        if gc:
+            stats.update(await self.agc_content())
+        return stats
+
+    async def agc_content(self, grace_period: float = 3600.0) -> Dict[str, int]:
+        """
+        Delete content files no longer referenced by any cached row.
 
-        # Only write if file doesn't exist
-        if not os.path.exists(file_path):
-            async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
-                await f.write(content)
+        Args:
+            grace_period: Files younger than this many seconds are kept.
 
-        return content_hash
+        Returns:
+            dict: ``files_removed`` and ``bytes_freed``.
+        """
+        await self.flush()
+        columns = ", ".join(CONTENT_COLUMNS)
+
+        async def _refs(db):
+            live: Dict[str, Set[str]] = {t: set() for t in CONTENT_COLUMNS.values()}
+            async with db.execute(f"SELECT {columns} FROM crawled_data") as cursor:
+                async for row in cursor:
+                    for content_type, ref in zip(CONTENT_COLUMNS.values(), row):
+                        if ref:
+                            live[content_type].add(ref)
+            return live
+
+        try:
+            live = await self.execute_with_retry(_refs)
+        except Exception as e:
+            self.logger.error(
+                message="Error collecting content references: {error}",
+                tag="ERROR",
+                force_verbose=True,
+                params={"error": str(e)},
+            )
+            return {"files_removed": 0, "bytes_freed": 0}
+
+        # Queued rows are not in the table yet but their blobs are live
+        ref_index = {name: i for i, name in enumerate(CACHE_UPSERT_COLUMNS)}
+        for row in list(self._pending_writes.values()):
+            for column, content_type in CONTENT_COLUMNS.items():
+                if row[ref_index[column]]:
+                    live[content_type].add(row[ref_index[column]])
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.content_store.collect_garbage, live, grace_period
+        )
+
+    async def _maybe_evict(self):
+        """Enforce max_cache_size/max_cache_entries, at most every evict_check_interval"""
+        if self.max_cache_size is None and self.max_cache_entries is None:
+            return
+        now = time.monotonic()
+        if now - self._last_evict_check < self.evict_check_interval:
+            return
+        self._last_evict_check = now
+
+        async def _totals(db):
+            async with db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(content_size), 0) FROM crawled_data"
+            ) as cursor:
+                return await cursor.fetchone()
+
+        try:
+            count, size = await self.execute_with_retry(_totals)
+        except Exception:
+            return
+        if (self.max_cache_entries is not None and count > self.max_cache_entries) or (
+            self.max_cache_size is not None and size > self.max_cache_size
+        ):
+            await self.aevict(
+                max_size=self.max_cache_size, max_entries=self.max_cache_entries
+            )
+
+    async def aget_cache_stats(self) -> Dict:
+        """
+        Summarize the cache: entry count, logical size, expired entries, age
+        range and persisted hit/miss counters.
+        """
+        await self.flush()
+
+        async def _stats(db):
+            async with db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(content_size), 0), "
+                "MIN(cached_at), MAX(cached_at), "
+                "SUM(CASE WHEN expires_at IS NOT NULL AND expires_at < ? THEN 1 ELSE 0 END) "
+                "FROM crawled_data",
+                (time.time(),),
+            ) as cursor:
+                count, size, oldest, newest, expired = await cursor.fetchone()
+            async with db.execute("SELECT name, value FROM cache_stats") as cursor:
+                counters = dict(await cursor.fetchall())
+            return {
+                "entries": count,
+                "content_size": size,
+                "expired_entries": expired or 0,
+                "oldest_entry": oldest,
+                "newest_entry": newest,
+                "hits": counters.get("hits", 0),
+                "misses": counters.get("misses", 0),
+            }
+
+        try:
+            stats = await self.execute_with_retry(_stats)
+        except Exception as e:
+            self.logger.error(
+                message="Error reading cache statistics: {error}",
+                tag="ERROR",
+                force_verbose=True,
+                params={"error": str(e)},
+            )
+            return {}
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    async def _store_content(self, content: str, content_type: str) -> str:
+        """Store content in the content store and return its reference"""
+        return await self.content_store.store(content, content_type)
 
     async def _load_content(
         self, content_hash: str, content_type: str
     ) -> Optional[str]:
-        """Load content from filesystem by hash"""
+        """Load content from the content store by reference"""
         if not content_hash:
             return None
 
-        file_path = os.path.join(self.content_paths[content_type], content_hash)
         try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                return await f.read()
-        except:
-            self.logger.error(
-                message="Failed to load content: {file_path}",
-                tag="ERROR",
-                force_verbose=True,
-                params={"file_path": file_path},
-            )
+            return await self.content_store.load(content_hash, content_type)
+        except Exception:
+            self._log_load_error(content_hash, content_type)
             return None
 
+    def _load_content_sync(self, content_hash: str, content_type: str) -> Optional[str]:
+        """Blocking variant of _load_content, used by lazy CrawlResult fields"""
+        try:
+            return self.content_store.load_sync(content_hash, content_type)
+        except Exception:
+            self._log_load_error(content_hash, content_type)
+            return None
+
+    def _log_load_error(self, content_hash: str, content_type: str):
+        self.logger.error(
+            message="Failed to load content: {file_path}",
+            tag="ERROR",
+            force_verbose=True,
+            params={
+                "file_path": os.path.join(self.content_paths[content_type], content_hash)
+            },
+        )
+
 
 # Create a singleton instance
 async_db_manager = AsyncDatabaseManager()
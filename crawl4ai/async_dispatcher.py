@@ -1,4 +1,4 @@
-from typing import Dict, Optional, List, Tuple, Union
+from typing import AsyncIterable, Dict, Iterable, Optional, List, Tuple, Union
 from .async_configs import CrawlerRunConfig
 from .models import (
     CrawlResult,
@@ -14,6 +14,8 @@ from .types import AsyncWebCrawler
 from collections.abc import AsyncGenerator
 
 import time
+import heapq
+import itertools
 import psutil
 import asyncio
 import uuid
@@ -26,35 +28,119 @@ from .utils import get_true_memory_usage_percent
 
 
 class RateLimiter:
+    """
+    Per-domain politeness: an adaptive delay between requests (backing off on
+    rate-limit status codes), plus optionally a token bucket of
+    ``requests_per_second`` with ``burst`` capacity and a cap of
+    ``max_concurrent_per_domain`` requests in flight.
+
+    ``wait_if_needed`` blocks until a request may start and takes a domain
+    slot; callers give it back with ``release``. Dispatchers can use
+    ``is_ready`` to prefer work for domains that would not block.
+    """
+
     def __init__(
         self,
         base_delay: Tuple[float, float] = (1.0, 3.0),
         max_delay: float = 60.0,
         max_retries: int = 3,
         rate_limit_codes: List[int] = None,
+        max_concurrent_per_domain: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        burst: int = 1,
     ):
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.max_retries = max_retries
         self.rate_limit_codes = rate_limit_codes or [429, 503]
+        self.max_concurrent_per_domain = max_concurrent_per_domain
+        self.requests_per_second = requests_per_second
+        self.burst = max(1, burst)
         self.domains: Dict[str, DomainState] = {}
+        self._domain_slots: Dict[str, asyncio.Semaphore] = {}
 
     def get_domain(self, url: str) -> str:
         return urlparse(url).netloc
 
-    async def wait_if_needed(self, url: str) -> None:
-        domain = self.get_domain(url)
+    def _get_state(self, domain: str) -> DomainState:
         state = self.domains.get(domain)
+        if not state:
+            state = self.domains[domain] = DomainState()
+        return state
 
+    def _refill(self, state: DomainState, now: float) -> None:
+        if state.tokens is None:
+            state.tokens = float(self.burst)
+        else:
+            elapsed = max(0.0, now - state.last_refill)
+            state.tokens = min(
+                float(self.burst), state.tokens + elapsed * self.requests_per_second
+            )
+        state.last_refill = now
+
+    def ready_in(self, url: str, reserved: int = 0, now: Optional[float] = None) -> float:
+        """
+        Seconds until a request to this URL's domain could start without
+        waiting, ignoring the concurrency cap. ``reserved`` counts requests
+        already promised to the domain but not started yet.
+        """
+        now = time.time() if now is None else now
+        state = self.domains.get(self.get_domain(url))
         if not state:
-            self.domains[domain] = DomainState()
-            state = self.domains[domain]
+            return 0.0
 
-        now = time.time()
+        wait = 0.0
         if state.last_request_time:
-            wait_time = max(0, state.current_delay - (now - state.last_request_time))
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
+            wait = state.current_delay - (now - state.last_request_time)
+            if reserved and state.current_delay:
+                wait = max(wait, state.current_delay)
+        if self.requests_per_second:
+            self._refill(state, now)
+            missing = 1 + reserved - state.tokens
+            if missing > 0:
+                wait = max(wait, missing / self.requests_per_second)
+        return max(0.0, wait)
+
+    def is_ready(self, url: str, reserved: int = 0, now: Optional[float] = None) -> bool:
+        """Whether a request to the URL's domain could start right now"""
+        if self.max_concurrent_per_domain:
+            state = self.domains.get(self.get_domain(url))
+            in_flight = state.in_flight if state else 0
+            if in_flight + reserved >= self.max_concurrent_per_domain:
+                return False
+        return self.ready_in(url, reserved, now) <= 0
+
+    async def wait_if_needed(self, url: str) -> None:
+        domain = self.get_domain(url)
+        state = self._get_state(domain)
+
+        if self.max_concurrent_per_domain:
+            slots = self._domain_slots.get(domain)
+            if slots is None:
+                slots = self._domain_slots[domain] = asyncio.Semaphore(
+                    self.max_concurrent_per_domain
+                )
+            await slots.acquire()
+        state.in_flight += 1
+
+        try:
+            now = time.time()
+            if state.last_request_time:
+                wait_time = max(0, state.current_delay - (now - state.last_request_time))
+                if wait_time > 0:
+                    await asyncio.sleep(wait_time)
+
+            if self.requests_per_second:
+                # Token bucket; re-check after sleeping, others may have won
+                while True:
+                    self._refill(state, time.time())
+                    if state.tokens >= 1:
+                        state.tokens -= 1
+                        break
+                    await asyncio.sleep((1 - state.tokens) / self.requests_per_second)
+        except BaseException:
+            self.release(url)
+            raise
 
         # Random delay within base range if no current delay
         if state.current_delay == 0:
@@ -62,6 +148,17 @@ class RateLimiter:
 
         state.last_request_time = time.time()
 
+    def release(self, url: str) -> None:
+        """Give back the domain slot taken by ``wait_if_needed``"""
+        domain = self.get_domain(url)
+        state = self.domains.get(domain)
+        if not state or state.in_flight <= 0:
+            return
+        state.in_flight -= 1
+        slots = self._domain_slots.get(domain)
+        if slots is not None:
+            slots.release()
+
     def update_delay(self, url: str, status_code: int) -> bool:
         domain = self.get_domain(url)
         state = self.domains[domain]
@@ -86,6 +183,142 @@ class RateLimiter:
 
 
 
+class UrlSource:
+    """
+    Pulls URLs on demand from a list, a sync iterable or an async iterable,
+    so dispatchers only hold a bounded window of an arbitrarily large input.
+
+    A producer that is still running but has nothing to hand out yet (such
+    as a deep crawl frontier waiting on in-flight pages) yields ``None``; the
+    current batch ends there without marking the source exhausted.
+    """
+
+    def __init__(self, urls: Union[Iterable[str], AsyncIterable[str]]):
+        if hasattr(urls, "__aiter__"):
+            self._aiter = urls.__aiter__()
+            self._iter = None
+        else:
+            self._aiter = None
+            self._iter = iter(urls)
+        self.exhausted = False
+        self.pulled = 0
+
+    async def take(self, count: int) -> List[str]:
+        """
+        Return up to ``count`` more URLs. Fewer means the input ran out
+        (``exhausted`` is set) or the producer has nothing ready yet.
+        """
+        batch = []
+        while len(batch) < count and not self.exhausted:
+            try:
+                if self._aiter is not None:
+                    url = await self._aiter.__anext__()
+                else:
+                    url = next(self._iter)
+            except (StopIteration, StopAsyncIteration):
+                self.exhausted = True
+                break
+            if url is None:
+                break
+            batch.append(url)
+        self.pulled += len(batch)
+        return batch
+
+
+class AgingTaskQueue:
+    """
+    Priority queue for dispatcher tasks whose priorities age with time.
+
+    A task's score is its static priority (the retry count) until it has
+    waited longer than ``fairness_timeout``; from then on it is ``-wait_time``,
+    which puts it ahead of every fresh task, oldest first. Because tasks age
+    in enqueue-time order, the score never has to be recomputed: the queue
+    keeps one heap ordered by (static priority, insertion order) and one by
+    enqueue time. ``get_nowait`` serves the oldest task if it has aged, else
+    the best fresh one, discarding entries already served from the other
+    heap. ``put``/``get`` are O(log n) and ``stats`` is O(1).
+
+    Items use the same shape as the previous ``asyncio.PriorityQueue``:
+    ``(priority, (url, task_id, retry_count, enqueue_time))``.
+    """
+
+    def __init__(self, fairness_timeout: float = 600.0):
+        self.fairness_timeout = fairness_timeout
+        self._by_priority: List[Tuple[float, int]] = []
+        self._by_time: List[Tuple[float, int]] = []
+        self._entries: Dict[int, Tuple[float, Tuple]] = {}
+        self._counter = itertools.count()
+        # Sum of enqueue times relative to _base, for the average wait
+        self._base: Optional[float] = None
+        self._time_sum = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def qsize(self) -> int:
+        return len(self._entries)
+
+    def empty(self) -> bool:
+        return not self._entries
+
+    def put_nowait(self, item: Tuple[float, Tuple]) -> None:
+        priority, payload = item
+        enqueue_time = payload[3]
+        seq = next(self._counter)
+        self._entries[seq] = (priority, payload)
+        heapq.heappush(self._by_priority, (priority, seq))
+        heapq.heappush(self._by_time, (enqueue_time, seq))
+        if self._base is None:
+            self._base = enqueue_time
+        self._time_sum += enqueue_time - self._base
+
+    async def put(self, item: Tuple[float, Tuple]) -> None:
+        self.put_nowait(item)
+
+    def _prune(self, heap: List[Tuple[float, int]]) -> None:
+        while heap and heap[0][1] not in self._entries:
+            heapq.heappop(heap)
+
+    def get_nowait(self, now: Optional[float] = None) -> Tuple[float, Tuple]:
+        """Pop the task with the lowest current score, see class docstring"""
+        if not self._entries:
+            raise asyncio.QueueEmpty()
+        now = time.time() if now is None else now
+
+        self._prune(self._by_time)
+        enqueue_time, seq = self._by_time[0]
+        wait_time = now - enqueue_time
+        if wait_time > self.fairness_timeout:
+            heapq.heappop(self._by_time)
+            score = -wait_time
+        else:
+            self._prune(self._by_priority)
+            score, seq = heapq.heappop(self._by_priority)
+
+        _, payload = self._entries.pop(seq)
+        self._time_sum -= payload[3] - self._base
+        if not self._entries:
+            # Reset so stale entries and float drift do not accumulate
+            self._by_priority.clear()
+            self._by_time.clear()
+            self._base, self._time_sum = None, 0.0
+        return score, payload
+
+    async def get(self) -> Tuple[float, Tuple]:
+        return self.get_nowait()
+
+    def stats(self, now: Optional[float] = None) -> Tuple[int, float, float]:
+        """Return (queued tasks, highest wait time, average wait time)"""
+        if not self._entries:
+            return 0, 0.0, 0.0
+        now = time.time() if now is None else now
+        self._prune(self._by_time)
+        count = len(self._entries)
+        highest_wait = now - self._by_time[0][0]
+        avg_wait = now - (self._base + self._time_sum / count)
+        return count, highest_wait, avg_wait
+
+
 class BaseDispatcher(ABC):
     def __init__(
         self,
@@ -137,7 +370,7 @@ class BaseDispatcher(ABC):
     @abstractmethod
     async def run_urls(
         self,
-        urls: List[str],
+        urls: Union[Iterable[str], AsyncIterable[str]],
         crawler: AsyncWebCrawler,  # noqa: F821
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
         monitor: Optional[CrawlerMonitor] = None,
@@ -157,6 +390,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         memory_wait_timeout: Optional[float] = 600.0,
         rate_limiter: Optional[RateLimiter] = None,
         monitor: Optional[CrawlerMonitor] = None,
+        url_lookahead: Optional[int] = None,
     ):
         super().__init__(rate_limiter, monitor)
         self.memory_threshold_percent = memory_threshold_percent
@@ -166,8 +400,12 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         self.max_session_permit = max_session_permit
         self.fairness_timeout = fairness_timeout
         self.memory_wait_timeout = memory_wait_timeout
+        # Queued (not yet running) URLs pulled ahead from the input
+        self.url_lookahead = max(url_lookahead or 2 * max_session_permit, max_session_permit)
         self.result_queue = asyncio.Queue()
-        self.task_queue = asyncio.PriorityQueue()  # Priority queue for better management
+        self.task_queue = AgingTaskQueue(fairness_timeout)  # Aging-aware priority queue
+        self._deferred = 0  # Tasks skipped for throttled domains on the last pass
+        self._throttle_wait = check_interval / 2
         self.memory_pressure_mode = False  # Flag to indicate when we're in memory pressure mode
         self.current_memory_percent = 0.0  # Track current memory usage
         self._high_memory_start_time: Optional[float] = None
@@ -225,6 +463,85 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         # Standard priority based on retries
         return retry_count
     
+    async def _fill_queue(self, source: UrlSource):
+        """
+        Top the task queue up to url_lookahead entries from the input. Tasks
+        deferred for throttled domains widen the window (up to twice its
+        size) so other domains still get work.
+        """
+        window = self.url_lookahead + min(self._deferred, self.url_lookahead)
+        needed = window - self.task_queue.qsize()
+        if needed <= 0 or source.exhausted:
+            return
+        for url in await source.take(needed):
+            task_id = str(uuid.uuid4())
+            if self.monitor:
+                self.monitor.add_task(task_id, url)
+            # Add to queue with initial priority 0, retry count 0, and current time
+            await self.task_queue.put((0, (url, task_id, 0, time.time())))
+
+    def _start_ready_tasks(
+        self,
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+        active_tasks: List[asyncio.Task],
+    ) -> None:
+        """
+        Start queued tasks in priority order until all session permits are in
+        use. With a rate limiter, tasks whose domain is throttled (token
+        bucket, delay or per-domain concurrency) are skipped and requeued, so
+        ready work from other domains goes first.
+        """
+        slots = self.max_session_permit - len(active_tasks)
+        deferred = []
+        reserved: Dict[str, int] = {}
+        throttled = set()
+        self._throttle_wait = self.check_interval / 2
+        while slots > 0 and len(deferred) < self.url_lookahead:
+            try:
+                # Use get_nowait() to immediately get tasks without blocking
+                priority, payload = self.task_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                # No more tasks in queue, exit the loop
+                break
+            url, task_id, retry_count, enqueue_time = payload
+
+            if self.rate_limiter:
+                domain = self.rate_limiter.get_domain(url)
+                if domain in throttled or not self.rate_limiter.is_ready(
+                    url, reserved.get(domain, 0)
+                ):
+                    if domain not in throttled:
+                        throttled.add(domain)
+                        self._throttle_wait = min(
+                            self._throttle_wait,
+                            self.rate_limiter.ready_in(url, reserved.get(domain, 0)) or 0.05,
+                        )
+                    deferred.append(payload)
+                    continue
+                reserved[domain] = reserved.get(domain, 0) + 1
+
+            # Create and start the task
+            task = asyncio.create_task(
+                self.crawl_url(url, config, task_id, retry_count)
+            )
+            active_tasks.append(task)
+
+            # Update waiting time in monitor
+            if self.monitor:
+                wait_time = time.time() - enqueue_time
+                self.monitor.update_task(
+                    task_id,
+                    wait_time=wait_time,
+                    status=CrawlStatus.IN_PROGRESS
+                )
+
+            slots -= 1
+
+        # Skipped tasks keep their enqueue time, and so their aging
+        for payload in deferred:
+            self.task_queue.put_nowait((payload[2], payload))
+        self._deferred = len(deferred)
+
     async def crawl_url(
         self,
         url: str,
@@ -270,6 +587,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         # Get starting memory for accurate measurement
         process = psutil.Process()
         start_memory = process.memory_info().rss / (1024 * 1024)
+        domain_slot = False
         
         try:
             if self.monitor:
@@ -284,6 +602,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             
             if self.rate_limiter:
                 await self.rate_limiter.wait_if_needed(url)
+                domain_slot = True
                 
             # Check if we're in critical memory state
             if self.current_memory_percent >= self.critical_threshold_percent:
@@ -358,6 +677,8 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                     retry_count=retry_count
                 )
             self.concurrent_sessions -= 1
+            if domain_slot:
+                self.rate_limiter.release(url)
             
         return CrawlerTaskResult(
             task_id=task_id,
@@ -373,7 +694,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         
     async def run_urls(
         self,
-        urls: List[str],
+        urls: Union[Iterable[str], AsyncIterable[str]],
         crawler: AsyncWebCrawler,
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
     ) -> List[CrawlerTaskResult]:
@@ -388,18 +709,14 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         results = []
 
         try:
-            # Initialize task queue
-            for url in urls:
-                task_id = str(uuid.uuid4())
-                if self.monitor:
-                    self.monitor.add_task(task_id, url)
-                # Add to queue with initial priority 0, retry count 0, and current time
-                await self.task_queue.put((0, (url, task_id, 0, time.time())))
+            # URLs are pulled into the task queue as slots free up
+            source = UrlSource(urls)
+            await self._fill_queue(source)
 
             active_tasks = []
 
-            # Process until both queues are empty
-            while not self.task_queue.empty() or active_tasks:
+            # Process until the input and both queues are empty
+            while not source.exhausted or not self.task_queue.empty() or active_tasks:
                 if memory_monitor.done():
                     exc = memory_monitor.exception()
                     if exc:
@@ -409,32 +726,8 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
 
                 # If memory pressure is low, greedily fill all available slots
                 if not self.memory_pressure_mode:
-                    slots = self.max_session_permit - len(active_tasks)
-                    while slots > 0:
-                        try:
-                            # Use get_nowait() to immediately get tasks without blocking
-                            priority, (url, task_id, retry_count, enqueue_time) = self.task_queue.get_nowait()
-                            
-                            # Create and start the task
-                            task = asyncio.create_task(
-                                self.crawl_url(url, config, task_id, retry_count)
-                            )
-                            active_tasks.append(task)
-                            
-                            # Update waiting time in monitor
-                            if self.monitor:
-                                wait_time = time.time() - enqueue_time
-                                self.monitor.update_task(
-                                    task_id, 
-                                    wait_time=wait_time,
-                                    status=CrawlStatus.IN_PROGRESS
-                                )
-                            
-                            slots -= 1
-                            
-                        except asyncio.QueueEmpty:
-                            # No more tasks in queue, exit the loop
-                            break
+                    await self._fill_queue(source)
+                    self._start_ready_tasks(config, active_tasks)
                         
                 # Wait for completion even if queue is starved
                 if active_tasks:
@@ -451,7 +744,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                     active_tasks = list(pending)
                 else:
                     # If no active tasks but still waiting, sleep briefly
-                    await asyncio.sleep(self.check_interval / 2)
+                    await asyncio.sleep(min(self.check_interval / 2, self._throttle_wait))
                     
                 # Update priorities for waiting tasks if needed
                 await self._update_queue_priorities()
@@ -469,67 +762,21 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                 self.monitor.stop()
                 
     async def _update_queue_priorities(self):
-        """Periodically update priorities of items in the queue to prevent starvation"""
-        # Skip if queue is empty
-        if self.task_queue.empty():
-            return
-            
-        # Use a drain-and-refill approach to update all priorities
-        temp_items = []
-        
-        # Drain the queue (with a safety timeout to prevent blocking)
-        try:
-            drain_start = time.time()
-            while not self.task_queue.empty() and time.time() - drain_start < 5.0:  # 5 second safety timeout
-                try:
-                    # Get item from queue with timeout
-                    priority, (url, task_id, retry_count, enqueue_time) = await asyncio.wait_for(
-                        self.task_queue.get(), timeout=0.1
-                    )
-                    
-                    # Calculate new priority based on current wait time
-                    current_time = time.time()
-                    wait_time = current_time - enqueue_time
-                    new_priority = self._get_priority_score(wait_time, retry_count)
-                    
-                    # Store with updated priority
-                    temp_items.append((new_priority, (url, task_id, retry_count, enqueue_time)))
-                    
-                    # Update monitoring stats for this task
-                    if self.monitor and task_id in self.monitor.stats:
-                        self.monitor.update_task(task_id, wait_time=wait_time)
-                        
-                except asyncio.TimeoutError:
-                    # Queue might be empty or very slow
-                    break
-        except Exception as e:
-            # If anything goes wrong, make sure we refill the queue with what we've got
-            self.monitor.update_memory_status(f"QUEUE_ERROR: {str(e)}")
-        
-        # Calculate queue statistics
-        if temp_items and self.monitor:
-            total_queued = len(temp_items)
-            wait_times = [item[1][3] for item in temp_items]
-            highest_wait_time = time.time() - min(wait_times) if wait_times else 0
-            avg_wait_time = sum(time.time() - t for t in wait_times) / len(wait_times) if wait_times else 0
-            
-            # Update queue statistics in monitor
+        """
+        Publish queue statistics to the monitor. Aging itself is handled by
+        AgingTaskQueue when tasks are dequeued, so this is O(1) per tick.
+        """
+        if self.monitor and not self.task_queue.empty():
+            total_queued, highest_wait_time, avg_wait_time = self.task_queue.stats()
             self.monitor.update_queue_statistics(
                 total_queued=total_queued,
                 highest_wait_time=highest_wait_time,
                 avg_wait_time=avg_wait_time
             )
-        
-        # Sort by priority (lowest number = highest priority)
-        temp_items.sort(key=lambda x: x[0])
-        
-        # Refill the queue with updated priorities
-        for item in temp_items:
-            await self.task_queue.put(item)
                 
     async def run_urls_stream(
         self,
-        urls: List[str],
+        urls: Union[Iterable[str], AsyncIterable[str]],
         crawler: AsyncWebCrawler,
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
     ) -> AsyncGenerator[CrawlerTaskResult, None]:
@@ -542,19 +789,14 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             self.monitor.start()
             
         try:
-            # Initialize task queue
-            for url in urls:
-                task_id = str(uuid.uuid4())
-                if self.monitor:
-                    self.monitor.add_task(task_id, url)
-                # Add to queue with initial priority 0, retry count 0, and current time
-                await self.task_queue.put((0, (url, task_id, 0, time.time())))
+            # URLs are pulled into the task queue as slots free up
+            source = UrlSource(urls)
+            await self._fill_queue(source)
                 
             active_tasks = []
-            completed_count = 0
-            total_urls = len(urls)
 
-            while completed_count < total_urls:
+            # Requeued tasks go back to the queue, so this covers them too
+            while not source.exhausted or not self.task_queue.empty() or active_tasks:
                 if memory_monitor.done():
                     exc = memory_monitor.exception()
                     if exc:
@@ -563,32 +805,8 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                         raise exc
                 # If memory pressure is low, greedily fill all available slots
                 if not self.memory_pressure_mode:
-                    slots = self.max_session_permit - len(active_tasks)
-                    while slots > 0:
-                        try:
-                            # Use get_nowait() to immediately get tasks without blocking
-                            priority, (url, task_id, retry_count, enqueue_time) = self.task_queue.get_nowait()
-                            
-                            # Create and start the task
-                            task = asyncio.create_task(
-                                self.crawl_url(url, config, task_id, retry_count)
-                            )
-                            active_tasks.append(task)
-                            
-                            # Update waiting time in monitor
-                            if self.monitor:
-                                wait_time = time.time() - enqueue_time
-                                self.monitor.update_task(
-                                    task_id, 
-                                    wait_time=wait_time,
-                                    status=CrawlStatus.IN_PROGRESS
-                                )
-                            
-                            slots -= 1
-                            
-                        except asyncio.QueueEmpty:
-                            # No more tasks in queue, exit the loop
-                            break
+                    await self._fill_queue(source)
+                    self._start_ready_tasks(config, active_tasks)
                         
                 # Process completed tasks and yield results
                 if active_tasks:
@@ -599,16 +817,15 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                     for completed_task in done:
                         result = await completed_task
                         
-                        # Only count as completed if it wasn't requeued
+                        # Requeued tasks are still in the queue, not done yet
                         if "requeued" not in result.error_message:
-                            completed_count += 1
                             yield result
                         
                     # Update active tasks list
                     active_tasks = list(pending)
                 else:
                     # If no active tasks but still waiting, sleep briefly
-                    await asyncio.sleep(self.check_interval / 2)
+                    await asyncio.sleep(min(self.check_interval / 2, self._throttle_wait))
                 
                 # Update priorities for waiting tasks if needed
                 await self._update_queue_priorities()
@@ -627,10 +844,13 @@ class SemaphoreDispatcher(BaseDispatcher):
         max_session_permit: int = 20,
         rate_limiter: Optional[RateLimiter] = None,
         monitor: Optional[CrawlerMonitor] = None,
+        url_lookahead: Optional[int] = None,
     ):
         super().__init__(rate_limiter, monitor)
         self.semaphore_count = semaphore_count
         self.max_session_permit = max_session_permit
+        # Tasks created ahead of a free semaphore slot
+        self.url_lookahead = url_lookahead or 2 * semaphore_count
 
     async def crawl_url(
         self,
@@ -673,6 +893,7 @@ class SemaphoreDispatcher(BaseDispatcher):
                 error_message=error_message
             )
 
+        domain_slot = False
         try:
             if self.monitor:
                 self.monitor.update_task(
@@ -681,6 +902,7 @@ class SemaphoreDispatcher(BaseDispatcher):
 
             if self.rate_limiter:
                 await self.rate_limiter.wait_if_needed(url)
+                domain_slot = True
 
             async with semaphore:
                 process = psutil.Process()
@@ -731,6 +953,8 @@ class SemaphoreDispatcher(BaseDispatcher):
                     peak_memory=peak_memory,
                     error_message=error_message,
                 )
+            if domain_slot:
+                self.rate_limiter.release(url)
 
         return CrawlerTaskResult(
             task_id=task_id,
@@ -746,7 +970,7 @@ class SemaphoreDispatcher(BaseDispatcher):
     async def run_urls(
         self,
         crawler: AsyncWebCrawler,  # noqa: F821
-        urls: List[str],
+        urls: Union[Iterable[str], AsyncIterable[str]],
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
     ) -> List[CrawlerTaskResult]:
         self.crawler = crawler
@@ -755,18 +979,36 @@ class SemaphoreDispatcher(BaseDispatcher):
 
         try:
             semaphore = asyncio.Semaphore(self.semaphore_count)
-            tasks = []
-
-            for url in urls:
-                task_id = str(uuid.uuid4())
-                if self.monitor:
-                    self.monitor.add_task(task_id, url)
-                task = asyncio.create_task(
-                    self.crawl_url(url, config, task_id, semaphore)
-                )
-                tasks.append(task)
-
-            return await asyncio.gather(*tasks, return_exceptions=True)
+            source = UrlSource(urls)
+            # Running task -> position of its result, in input order
+            tasks: Dict[asyncio.Task, int] = {}
+            results = []
+
+            while not source.exhausted or tasks:
+                room = self.semaphore_count + self.url_lookahead - len(tasks)
+                for url in await source.take(room):
+                    task_id = str(uuid.uuid4())
+                    if self.monitor:
+                        self.monitor.add_task(task_id, url)
+                    task = asyncio.create_task(
+                        self.crawl_url(url, config, task_id, semaphore)
+                    )
+                    tasks[task] = len(results)
+                    results.append(None)
+                if not tasks:
+                    # The producer has nothing ready yet
+                    await asyncio.sleep(0.1)
+                    continue
+
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = tasks.pop(task)
+                    # Same contract as gather(return_exceptions=True)
+                    try:
+                        results[index] = task.result()
+                    except BaseException as e:
+                        results[index] = e
+            return results
         finally:
             if self.monitor:
                 self.monitor.stop()
\ No newline at end of file
@@ -0,0 +1,387 @@
+import os
+import time
+import random
+import asyncio
+import threading
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Dict, Optional
+
+from .cache_context import CacheMode
+from .llm_cache import LLMResponseCache
+from .config import (
+    LLM_MAX_CONCURRENCY,
+    LLM_MAX_ATTEMPTS,
+    LLM_BACKOFF_BASE_DELAY,
+    LLM_BACKOFF_MAX_DELAY,
+)
+
+
+@dataclass
+class LLMStats:
+    requests: int = 0
+    completed: int = 0
+    failed: int = 0
+    retries: int = 0
+    peak_in_flight: int = 0
+    total_tokens: int = 0
+    # Time requests spent waiting for a slot or for their token budget
+    total_wait_time: float = 0.0
+
+
+class TokenBudget:
+    """
+    Tokens-per-minute bucket for one provider.
+
+    Requests reserve their estimated size before they are sent and settle
+    the difference with the reported usage afterwards, so the bucket may go
+    into debt that later requests wait off. Waiters are served in order.
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        self.set_rate(tokens_per_minute)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def set_rate(self, tokens_per_minute: int):
+        if tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be positive")
+        self.capacity = float(tokens_per_minute)
+        self.rate = tokens_per_minute / 60.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: int) -> int:
+        """Wait until `tokens` (at most one minute's worth) are available and take them"""
+        tokens = min(tokens, self.capacity)
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._refill()
+            while self.tokens < tokens:
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= tokens
+        return tokens
+
+    def settle(self, reserved: int, used: int):
+        """Correct a reservation with the tokens a request actually used"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + reserved - used)
+
+
+class AsyncLLMClient:
+    """
+    Async LLM completion layer shared by the LLM strategies.
+
+    Every request runs on one background event loop owned by the client, so
+    the concurrency limit and the per-provider token budgets hold for the
+    whole process, whichever thread or event loop the request comes from:
+
+    - ``await acomplete(...)`` from async code never blocks the caller's loop.
+    - ``complete(...)`` / ``run_sync(...)`` serve synchronous callers (worker
+      threads, scripts) and block only the calling thread.
+
+    Rate-limit errors are retried with exponential backoff and jitter, using
+    ``asyncio.sleep`` and outside the concurrency slot. Requests made with a
+    ``cache_mode`` go through the shared ``LLMResponseCache`` first.
+
+    Args:
+        max_concurrency: Requests in flight at once, across all providers.
+        tokens_per_minute: Optional ``{provider: tokens}`` budgets. Budgets can
+            also be set later with ``set_token_budget`` or per request.
+        max_attempts: Attempts per request when rate limited.
+        base_delay: First backoff delay in seconds, doubled on each retry.
+        max_delay: Upper bound for a single backoff delay.
+        response_cache: Store for requests made with a ``cache_mode``,
+            defaults to an ``LLMResponseCache`` in the crawl4ai home folder.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        tokens_per_minute: Optional[Dict[str, int]] = None,
+        max_attempts: int = LLM_MAX_ATTEMPTS,
+        base_delay: float = LLM_BACKOFF_BASE_DELAY,
+        max_delay: float = LLM_BACKOFF_MAX_DELAY,
+        response_cache: Optional[LLMResponseCache] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stats = LLMStats()
+
+        self._budgets: Dict[str, TokenBudget] = {}
+        for provider, tpm in (tokens_per_minute or {}).items():
+            self.set_token_budget(provider, tpm)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+        self._response_cache = response_cache
+        # cache key -> future of the response data, for requests in flight
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    # ───────────────────────── configuration
+
+    def set_token_budget(self, provider: str, tokens_per_minute: Optional[int]):
+        """Limit `provider` to `tokens_per_minute`, or remove its limit with None"""
+        if not tokens_per_minute:
+            self._budgets.pop(provider, None)
+        elif provider in self._budgets:
+            self._budgets[provider].set_rate(tokens_per_minute)
+        else:
+            self._budgets[provider] = TokenBudget(tokens_per_minute)
+
+    @staticmethod
+    def estimate_tokens(prompt: str, extra_args: Optional[Dict] = None) -> int:
+        """Rough request size for budgeting: ~4 characters per prompt token plus max_tokens"""
+        return len(prompt) // 4 + int((extra_args or {}).get("max_tokens") or 0)
+
+    def get_stats(self) -> Dict[str, float]:
+        stats = asdict(self.stats)
+        stats["in_flight"] = self._in_flight
+        return stats
+
+    # ───────────────────────── event loop
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            # A forked child does not inherit the loop thread
+            if self._loop is None or self._pid != os.getpid() or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="crawl4ai-llm", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread, self._pid = loop, thread, os.getpid()
+                self._semaphore = None
+                self._pending = {}
+                for budget in self._budgets.values():
+                    budget._lock = None
+            return self._loop
+
+    def _on_loop(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    async def run(self, coro: Awaitable) -> Any:
+        """Await `coro` on the client loop from any event loop"""
+        loop = self._ensure_loop()
+        if self._on_loop():
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    def run_sync(self, coro: Awaitable) -> Any:
+        """Run `coro` on the client loop and block the calling thread for its result"""
+        loop = self._ensure_loop()
+        if self._on_loop():
+            coro.close()
+            raise RuntimeError("run_sync() called from the LLM client loop; await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def close(self):
+        """Stop the background loop; the next request starts a new one"""
+        with self._start_lock:
+            if self._loop is not None and self._thread.is_alive():
+                try:
+                    asyncio.run_coroutine_threadsafe(_cancel_tasks(), self._loop).result(timeout=5)
+                except Exception:
+                    pass
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join(timeout=5)
+                if not self._thread.is_alive():
+                    self._loop.close()
+            self._loop = self._thread = None
+            self._semaphore = None
+
+    # ───────────────────────── completions
+
+    async def acomplete(
+        self,
+        provider: str,
+        prompt: str,
+        api_token: Optional[str] = None,
+        json_response: bool = False,
+        base_url: Optional[str] = None,
+        extra_args: Optional[Dict] = None,
+        tokens_per_minute: Optional[int] = None,
+        cache_mode: Optional[CacheMode] = None,
+    ):
+        """Send one chat completion and return the litellm response
+
+        With a ``cache_mode`` that reads (ENABLED, READ_ONLY), a prompt
+        answered before is served from ``response_cache`` without calling
+        the provider; its usage then reports zero tokens. Modes that write
+        (ENABLED, WRITE_ONLY) store fresh responses.
+
+        Raises litellm's ``RateLimitError`` once ``max_attempts`` are used up,
+        and any other error immediately.
+        """
+        return await self.run(self._complete(
+            provider, prompt, api_token, json_response, base_url, extra_args,
+            tokens_per_minute, cache_mode,
+        ))
+
+    def complete(self, provider: str, prompt: str, api_token: Optional[str] = None,
+                 json_response: bool = False, base_url: Optional[str] = None,
+                 extra_args: Optional[Dict] = None, tokens_per_minute: Optional[int] = None,
+                 cache_mode: Optional[CacheMode] = None):
+        """Blocking ``acomplete`` for synchronous callers"""
+        return self.run_sync(self._complete(
+            provider, prompt, api_token, json_response, base_url, extra_args,
+            tokens_per_minute, cache_mode,
+        ))
+
+    @property
+    def response_cache(self) -> LLMResponseCache:
+        """Cache used by requests with a ``cache_mode``, created on first use"""
+        if self._response_cache is None:
+            self._response_cache = LLMResponseCache()
+        return self._response_cache
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        retry_after = None
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if headers:
+            try:
+                retry_after = float(headers.get("retry-after"))
+            except (TypeError, ValueError):
+                pass
+        delay = self.base_delay * (2 ** attempt)
+        # Full jitter keeps concurrent retries from arriving together
+        delay = random.uniform(delay / 2, delay)
+        return min(self.max_delay, max(delay, retry_after or 0))
+
+    async def _complete(self, provider, prompt, api_token, json_response, base_url,
+                        extra_args, tokens_per_minute, cache_mode=None):
+        read = cache_mode in (CacheMode.ENABLED, CacheMode.READ_ONLY)
+        write = cache_mode in (CacheMode.ENABLED, CacheMode.WRITE_ONLY)
+        if not (read or write):
+            return await self._request(provider, prompt, api_token, json_response, base_url,
+                                       extra_args, tokens_per_minute)
+
+        from litellm import ModelResponse, Usage
+
+        cache = self.response_cache
+        key = cache.make_key(provider, prompt, json_response, extra_args)
+        if read:
+            pending = self._pending.get(key)
+            if pending is not None:
+                # The same chunk is already being asked for
+                data = await asyncio.shield(pending)
+            else:
+                data = await asyncio.to_thread(cache.get, key)
+            if data is not None:
+                response = ModelResponse(**data)
+                response.usage = Usage(prompt_tokens=0, completion_tokens=0, total_tokens=0)
+                return response
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            response = await self._request(provider, prompt, api_token, json_response, base_url,
+                                           extra_args, tokens_per_minute)
+            data = response.model_dump()
+            if write:
+                await asyncio.to_thread(cache.set, key, provider, data)
+            future.set_result(data)
+            return response
+        except BaseException:
+            future.set_result(None)
+            raise
+        finally:
+            self._pending.pop(key, None)
+
+    async def _request(self, provider, prompt, api_token, json_response, base_url,
+                       extra_args, tokens_per_minute):
+        from litellm import acompletion
+        from litellm.exceptions import RateLimitError
+
+        if tokens_per_minute:
+            self.set_token_budget(provider, tokens_per_minute)
+        args = {"temperature": 0.01, "api_key": api_token, "base_url": base_url,
+                # retries happen here, without holding a slot
+                "max_retries": 0}
+        if json_response:
+            args["response_format"] = {"type": "json_object"}
+        if extra_args:
+            args.update(extra_args)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        estimate = self.estimate_tokens(prompt, extra_args)
+        self.stats.requests += 1
+
+        for attempt in range(self.max_attempts):
+            t0 = time.perf_counter()
+            budget = self._budgets.get(provider)
+            reserved = await budget.acquire(estimate) if budget else 0
+            async with self._semaphore:
+                self.stats.total_wait_time += time.perf_counter() - t0
+                self._in_flight += 1
+                self.stats.peak_in_flight = max(self.stats.peak_in_flight, self._in_flight)
+                try:
+                    response = await acompletion(
+                        model=provider,
+                        messages=[{"role": "user", "content": prompt}],
+                        **args,
+                    )
+                except RateLimitError as e:
+                    # The provider counted it; keep the reservation
+                    if attempt == self.max_attempts - 1:
+                        self.stats.failed += 1
+                        raise
+                    delay = self._backoff(attempt, e)
+                except BaseException:
+                    if budget:
+                        budget.settle(reserved, 0)
+                    self.stats.failed += 1
+                    raise
+                else:
+                    usage = getattr(response, "usage", None)
+                    used = getattr(usage, "total_tokens", None) or estimate
+                    if budget:
+                        budget.settle(reserved, used)
+                    self.stats.total_tokens += used
+                    self.stats.completed += 1
+                    return response
+                finally:
+                    self._in_flight -= 1
+            self.stats.retries += 1
+            await asyncio.sleep(delay)
+
+
+async def _cancel_tasks():
+    # Requests in flight and tasks litellm left on the loop
+    tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_default_client: Optional[AsyncLLMClient] = None
+_default_lock = threading.Lock()
+
+
+def get_llm_client() -> AsyncLLMClient:
+    """The process-wide client used by the LLM strategies"""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = AsyncLLMClient()
+        return _default_client
+
+
+def set_llm_client(client: AsyncLLMClient) -> Optional[AsyncLLMClient]:
+    """Replace the process-wide client (e.g. with other limits) and return the previous one"""
+    global _default_client
+    with _default_lock:
+        previous, _default_client = _default_client, client
+    return previous
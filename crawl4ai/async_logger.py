@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from functools import partial
+from typing import Optional, Dict, Any, List, Callable, Tuple
 import os
+import json
+import time
+import queue
+import atexit
+import threading
 from datetime import datetime
 from urllib.parse import unquote
 from rich.console import Console
@@ -46,6 +52,90 @@ class LogColor(str, Enum):
         return self.value
 
 
+class _LogWriter:
+    """
+    One background thread writing log output for every logger in the process.
+
+    Loggers submit a callable; the thread calls it, so formatting happens off
+    the caller's thread too, and appends the ``(path, text)`` it returns to
+    that file. Files stay open and are flushed whenever the queue runs dry.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self._queue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._files: Dict[str, Any] = {}
+
+    def submit(self, job: Callable[[], Optional[Tuple[str, str]]]):
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="crawl4ai-log-writer", daemon=True)
+                    self._thread.start()
+        self._queue.put(job)
+
+    def _run(self):
+        while True:
+            jobs = [self._queue.get()]
+            try:
+                while len(jobs) < 1000:
+                    jobs.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            waiters = []
+            for job in jobs:
+                if isinstance(job, threading.Event):
+                    waiters.append(job)
+                    continue
+                try:
+                    output = job()
+                    if output:
+                        self._file(output[0]).write(output[1])
+                except Exception:
+                    pass  # a broken log line must not stop the writer
+            for f in self._files.values():
+                try:
+                    f.flush()
+                except OSError:
+                    pass
+            for waiter in waiters:
+                waiter.set()
+
+    def _file(self, path: str):
+        f = self._files.get(path)
+        if f is None:
+            f = self._files[path] = open(path, "a", encoding="utf-8")
+        return f
+
+    def flush(self, timeout: Optional[float] = 5.0):
+        """Wait until everything submitted so far is written"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self):
+        self.flush()
+        for f in list(self._files.values()):
+            try:
+                f.close()
+            except OSError:
+                pass
+        self._files.clear()
+
+
+_writer = _LogWriter()
+atexit.register(_writer.close)
+if hasattr(os, "register_at_fork"):
+    # A forked child gets the queue but not the thread
+    os.register_at_fork(after_in_child=_writer._reset)
+
+
 class AsyncLoggerBase(ABC):
     @abstractmethod
     def debug(self, message: str, tag: str = "DEBUG", **kwargs):
@@ -80,6 +170,14 @@ class AsyncLogger(AsyncLoggerBase):
     """
     Asynchronous logger with support for colored console output and file logging.
     Supports templated messages with colored components.
+
+    File output is formatted and written by a background thread, as plain
+    text or, with ``json_lines``, one JSON object per line. Console output
+    is printed by the caller, in order with the program's own output,
+    unless ``background_console`` hands it to the writer thread as well. A
+    message nobody would see (below ``log_level``, or no console and no
+    file) is dropped before any formatting. ``flush()`` waits for pending
+    output.
     """
 
     DEFAULT_ICONS = {
@@ -118,6 +216,8 @@ class AsyncLogger(AsyncLoggerBase):
         icons: Optional[Dict[str, str]] = None,
         colors: Optional[Dict[LogLevel, LogColor]] = None,
         verbose: bool = True,
+        json_lines: bool = False,
+        background_console: bool = False,
     ):
         """
         Initialize the logger.
@@ -129,6 +229,8 @@ class AsyncLogger(AsyncLoggerBase):
             icons: Custom icons for different tags
             colors: Custom colors for different log levels
             verbose: Whether to output to console
+            json_lines: Write the log file as JSON lines (time, level, tag, message, params)
+            background_console: Print to the console from the writer thread too
         """
         self.log_file = log_file
         self.log_level = log_level
@@ -136,6 +238,8 @@ class AsyncLogger(AsyncLoggerBase):
         self.icons = icons or self.DEFAULT_ICONS
         self.colors = colors or self.DEFAULT_COLORS
         self.verbose = verbose
+        self.json_lines = json_lines
+        self.background_console = background_console
         self.console = Console()
 
         # Create log file directory if needed
@@ -161,13 +265,48 @@ class AsyncLogger(AsyncLoggerBase):
     def _write_to_file(self, message: str):
         """Write a message to the log file if configured."""
         if self.log_file:
-            text = Text.from_markup(message)
-            plain_text = text.plain
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(f"[{timestamp}] {plain_text}\n")
+            _writer.submit(partial(self._file_line, message, time.time()))
+
+    def _file_line(self, log_line: str, timestamp: float) -> Tuple[str, str]:
+        """Plain text log file line for a console line (runs on the writer thread)"""
+        plain_text = Text.from_markup(log_line).plain
+        stamp = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        return self.log_file, f"[{stamp}] {plain_text}\n"
+
+    def _json_line(self, level: LogLevel, message: str, tag: str, params: Optional[Dict[str, Any]],
+                   timestamp: float) -> Tuple[str, str]:
+        """JSON lines log file line (runs on the writer thread)"""
+        try:
+            text = message.format(**params) if params else message
+        except (KeyError, IndexError, ValueError):
+            text = message
+        record = {
+            "time": datetime.fromtimestamp(timestamp).isoformat(timespec="milliseconds"),
+            "level": str(level),
+            "tag": tag,
+            "message": text,
+        }
+        if params:
+            record["params"] = params
+        return self.log_file, json.dumps(record, default=str, ensure_ascii=False) + "\n"
+
+    def _emit(self, args: tuple, timestamp: float, console: bool, log_line: Optional[str] = None):
+        """Writer thread side of _log: format what the caller did not, print, return the file line"""
+        if log_line is None and (console or not self.json_lines):
+            log_line = self._format_line(*args)
+        if console:
+            self.console.print(log_line)
+        if not self.log_file:
+            return None
+        if self.json_lines:
+            return self._json_line(args[0], args[1], args[2], args[3], timestamp)
+        return self._file_line(log_line, timestamp)
 
-    def _log(
+    def flush(self, timeout: Optional[float] = 5.0):
+        """Wait until pending log output is written."""
+        _writer.flush(timeout)
+
+    def _format_line(
         self,
         level: LogLevel,
         message: str,
@@ -176,23 +315,8 @@ class AsyncLogger(AsyncLoggerBase):
         colors: Optional[Dict[str, LogColor]] = None,
         boxes: Optional[List[str]] = None,
         base_color: Optional[LogColor] = None,
-        **kwargs,
-    ):
-        """
-        Core logging method that handles message formatting and output.
-
-        Args:
-            level: Log level for this message
-            message: Message template string
-            tag: Tag for the message
-            params: Parameters to format into the message
-            colors: Color overrides for specific parameters
-            boxes: Box overrides for specific parameters
-            base_color: Base color for the entire message
-        """
-        if level.value < self.log_level.value:
-            return
-
+    ) -> str:
+        """Render a message as a rich markup console line."""
         # avoid conflict with rich formatting
         parsed_message = message.replace("[", "[[").replace("]", "]]")
         if params:
@@ -220,14 +344,51 @@ class AsyncLogger(AsyncLoggerBase):
 
         # Construct the full log line
         color: LogColor = base_color or self.colors[level]
-        log_line = f"[{color}]{self._format_tag(tag)} {self._get_icon(tag)} {formatted_message} [/{color}]"
+        return f"[{color}]{self._format_tag(tag)} {self._get_icon(tag)} {formatted_message} [/{color}]"
+
+    def _wants(self, level: LogLevel, force_verbose: bool = False) -> bool:
+        """Whether a message at `level` would reach the console or the log file."""
+        return level.value >= self.log_level.value and bool(
+            self.verbose or force_verbose or self.log_file
+        )
 
-        # Output to console if verbose
-        if self.verbose or kwargs.get("force_verbose", False):
+    def _log(
+        self,
+        level: LogLevel,
+        message: str,
+        tag: str,
+        params: Optional[Dict[str, Any]] = None,
+        colors: Optional[Dict[str, LogColor]] = None,
+        boxes: Optional[List[str]] = None,
+        base_color: Optional[LogColor] = None,
+        **kwargs,
+    ):
+        """
+        Core logging method that handles message formatting and output.
+
+        Args:
+            level: Log level for this message
+            message: Message template string
+            tag: Tag for the message
+            params: Parameters to format into the message
+            colors: Color overrides for specific parameters
+            boxes: Box overrides for specific parameters
+            base_color: Base color for the entire message
+        """
+        console = bool(self.verbose or kwargs.get("force_verbose", False))
+        if level.value < self.log_level.value or not (console or self.log_file):
+            return  # nobody would see it: skip formatting entirely
+
+        args = (level, message, tag, params, colors, boxes, base_color)
+        log_line = None
+        if console and not self.background_console:
+            log_line = self._format_line(*args)
             self.console.print(log_line)
+            console = False
 
-        # Write to file if configured
-        self._write_to_file(log_line)
+        # The log file (and a background console) is written by the writer thread
+        if console or self.log_file:
+            _writer.submit(partial(self._emit, args, time.time(), console, log_line))
 
     def debug(self, message: str, tag: str = "DEBUG", **kwargs):
         """Log a debug message."""
@@ -283,10 +444,13 @@ class AsyncLogger(AsyncLoggerBase):
             tag: Tag for the message
             url_length: Maximum length for URL in log
         """
+        level = LogLevel.SUCCESS if success else LogLevel.ERROR
+        if not self._wants(level):
+            return
         decoded_url = unquote(url)
         readable_url = self._shorten(decoded_url, url_length)
         self._log(
-            level=LogLevel.SUCCESS if success else LogLevel.ERROR,
+            level=level,
             message="{url} | {status} | ⏱: {timing:.2f}s",
             tag=tag,
             params={
@@ -312,6 +476,8 @@ class AsyncLogger(AsyncLoggerBase):
             tag: Tag for the message
             url_length: Maximum length for URL in log
         """
+        if not self._wants(LogLevel.ERROR):
+            return
         decoded_url = unquote(url)
         readable_url = self._shorten(decoded_url, url_length)
         self._log(
@@ -337,10 +503,14 @@ class AsyncFileLogger(AsyncLoggerBase):
         os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
 
     def _write_to_file(self, level: str, message: str, tag: str):
-        """Write a message to the log file."""
+        """Queue a message for the log file."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        with open(self.log_file, "a", encoding="utf-8") as f:
-            f.write(f"[{timestamp}] [{level}] [{tag}] {message}\n")
+        line = f"[{timestamp}] [{level}] [{tag}] {message}\n"
+        _writer.submit(lambda: (self.log_file, line))
+
+    def flush(self, timeout: Optional[float] = 5.0):
+        """Wait until pending log lines are written."""
+        _writer.flush(timeout)
 
     def debug(self, message: str, tag: str = "DEBUG", **kwargs):
         """Log a debug message to file."""
@@ -5,11 +5,13 @@ Fast async URL discovery for Crawl4AI
 Features
 --------
 * Common-Crawl streaming via httpx.AsyncClient (HTTP/2, keep-alive)
-* robots.txt → sitemap chain (.gz + nested indexes) via async httpx
+* robots.txt → sitemap chain (.gz + nested indexes) via async httpx, parsed
+  incrementally while it downloads, with lastmod-based incremental seeding
 * Per-domain CDX result cache on disk (~/.crawl4ai/<index>_<domain>_<hash>.jsonl)
 * Optional HEAD-only liveness check
 * Optional partial <head> download + meta parsing
-* Global hits-per-second rate-limit via asyncio.Semaphore
+* Per-host hits-per-second token bucket (RateLimiter)
+* Head / live-check results in one SQLite store with TTL and batched writes
 * Concurrency in the thousands — fine on a single event-loop
 """
 
@@ -23,9 +25,13 @@ import json
 import os
 import pathlib
 import re
+import sqlite3
 import time
-from datetime import timedelta
+import zlib
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from contextlib import asynccontextmanager, closing
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 from urllib.parse import quote, urljoin
 
@@ -53,6 +59,7 @@ except ImportError:
 # You might need to adjust this import based on your exact file structure
 # Import AsyncLogger for default if needed
 from .async_logger import AsyncLoggerBase, AsyncLogger
+from .async_dispatcher import RateLimiter
 
 # Import SeedingConfig for type hints
 from typing import TYPE_CHECKING
@@ -75,6 +82,11 @@ _title_rx = re.compile(r'<title>(.*?)</title>', re.I | re.S)
 _link_rx = re.compile(
     r'<link\s+[^>]*rel=["\']?([^"\' >]+)[^>]*href=["\']?([^"\' >]+)', re.I)
 
+SITEMAP_FIELDS = ("lastmod", "changefreq", "priority")
+SITEMAP_CONCURRENCY = 10  # sub-sitemaps of one index fetched at a time
+PREFETCH_BATCH = 500  # URLs per bulk cache lookup
+_XML_ERRORS = (ET.ParseError, etree.XMLSyntaxError) if LXML else (ET.ParseError,)
+
 # ────────────────────────────────────────────────────────────────────────── helpers
 
 
@@ -86,6 +98,134 @@ def _match(url: str, pattern: str) -> bool:
             or (canon.startswith("www.") and fnmatch.fnmatch(canon[4:], pattern)))
 
 
+def _parse_lastmod(value: Any) -> Optional[float]:
+    """W3C datetime / ISO 8601 string, datetime or epoch → epoch seconds (None if invalid)."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        text = str(value).strip()
+        if text[-1:] in ("Z", "z"):
+            text = text[:-1] + "+00:00"
+        try:
+            dt = datetime.fromisoformat(text)
+        except ValueError:
+            for fmt in ("%Y-%m", "%Y"):  # coarser W3C forms
+                try:
+                    dt = datetime.strptime(text, fmt)
+                    break
+                except ValueError:
+                    pass
+            else:
+                return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _local_name(tag: Any) -> str:
+    # comments / PIs have non-string tags under lxml
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _cached_sitemap_record(line: str) -> Optional[Dict[str, Any]]:
+    line = line.strip()
+    if not line:
+        return None
+    if line.startswith("{"):
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            return None
+    # caches written before sitemap metadata was kept hold bare URLs
+    return {"url": line, "lastmod": None, "changefreq": None, "priority": None}
+
+
+class _SitemapStream:
+    """
+    Incremental sitemap parser.
+
+    Feed it the body chunk by chunk (gzip is detected from the magic bytes and
+    inflated on the fly) and it returns the ("url" | "sitemap", record) pairs
+    completed so far. Finished entries are dropped from the tree, so memory
+    stays flat however many URLs the sitemap lists.
+    """
+
+    def __init__(self):
+        if LXML:
+            self._parser = etree.XMLPullParser(
+                events=("start", "end"), recover=True, resolve_entities=False, huge_tree=True)
+        else:
+            self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._inflate = None
+        self._sniffed = False
+        self._pending = b""
+        self._root = None
+        self._depth = 0
+
+    def feed(self, chunk: bytes) -> List[tuple]:
+        if not self._sniffed:
+            self._pending += chunk
+            if len(self._pending) < 2:
+                return []
+            chunk, self._pending, self._sniffed = self._pending, b"", True
+            if chunk[:2] == b"\x1f\x8b":
+                self._inflate = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if self._inflate is not None:
+            chunk = self._inflate.decompress(chunk)
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> List[tuple]:
+        if self._pending:
+            self._parser.feed(self._pending)
+        if self._inflate is not None:
+            self._parser.feed(self._inflate.flush())
+        try:
+            self._parser.close()
+        except _XML_ERRORS:
+            if self._root is None:  # not XML at all
+                raise
+        return self._drain()
+
+    def _drain(self) -> List[tuple]:
+        records = []
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+                self._depth += 1
+                continue
+            self._depth -= 1
+            if self._depth != 1:  # only direct children of <urlset>/<sitemapindex>
+                continue
+            kind = _local_name(elem.tag)
+            if kind in ("url", "sitemap"):
+                fields = {}
+                for child in elem:
+                    name = _local_name(child.tag)
+                    if name not in fields:
+                        fields[name] = (child.text or "").strip()
+                loc = fields.get("loc")
+                if loc:
+                    try:
+                        priority = float(fields["priority"]) if fields.get("priority") else None
+                    except ValueError:
+                        priority = None
+                    records.append((kind, {
+                        "url": loc,
+                        "lastmod": fields.get("lastmod") or None,
+                        "changefreq": fields.get("changefreq") or None,
+                        "priority": priority,
+                    }))
+            elem.clear()
+            self._root.remove(elem)
+        return records
+
+
 def _parse_head(src: str) -> Dict[str, Any]:
     if LXML:
         try:
@@ -158,6 +298,113 @@ def _parse_head(src: str) -> Dict[str, Any]:
         info["lang"] = lang_match.group(1)
     return info
 
+class SeederCacheStore:
+    """
+    Head / live-check results of AsyncUrlSeeder in a single SQLite file.
+
+    Entries are keyed by (kind, url) and ignored once older than ``ttl``
+    seconds. Writes are buffered and committed ``BATCH_SIZE`` at a time (call
+    ``flush`` at the end of a run), and ``prefetch`` loads a whole batch of
+    URLs in one indexed query so that ``get`` usually needs no I/O. Seeders
+    with the same cache root share the store.
+    """
+
+    BATCH_SIZE = 500
+    MAX_PARAMS = 500  # stay well below SQLite's host-parameter limit
+
+    def __init__(self, path: Union[str, Path], ttl: float):
+        self.path = str(path)
+        self.ttl = ttl
+        # (kind, url) -> (data, write time), not yet committed
+        self._pending: Dict[tuple, tuple] = {}
+        # (kind, url) -> entry, or None for a known miss
+        self._prefetched: Dict[tuple, Optional[Dict[str, Any]]] = {}
+        self._init_db()
+
+    def _init_db(self):
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS seeder_cache (
+                    kind TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    fetch_time REAL NOT NULL,
+                    PRIMARY KEY (kind, url)
+                ) WITHOUT ROWID
+            """)
+
+    def _select(self, kind: str, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        fresh_after = time.time() - self.ttl
+        found: Dict[str, Dict[str, Any]] = {}
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            for i in range(0, len(urls), self.MAX_PARAMS):
+                chunk = urls[i:i + self.MAX_PARAMS]
+                rows = conn.execute(
+                    "SELECT url, data FROM seeder_cache WHERE kind = ? AND fetch_time > ? "
+                    f"AND url IN ({','.join('?' * len(chunk))})",
+                    (kind, fresh_after, *chunk),
+                )
+                for url, data in rows:
+                    try:
+                        found[url] = json.loads(data)
+                    except json.JSONDecodeError:
+                        pass
+        return found
+
+    def _write(self, rows: List[tuple]) -> None:
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO seeder_cache (kind, url, data, fetch_time) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    async def get_many(self, kind: str, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fresh entries for those of `urls` that have one."""
+        found = {}
+        missing = []
+        for url in urls:
+            pending = self._pending.get((kind, url))
+            if pending:
+                found[url] = pending[0]
+            else:
+                missing.append(url)
+        if missing:
+            try:
+                found.update(await asyncio.to_thread(self._select, kind, missing))
+            except sqlite3.Error:
+                pass  # a cache problem only costs a refetch
+        return found
+
+    async def prefetch(self, kind: str, urls: List[str]) -> None:
+        found = await self.get_many(kind, urls)
+        for url in urls:
+            self._prefetched[(kind, url)] = found.get(url)
+
+    async def get(self, kind: str, url: str) -> Optional[Dict[str, Any]]:
+        key = (kind, url)
+        if key in self._prefetched:
+            return self._prefetched.pop(key)
+        return (await self.get_many(kind, [url])).get(url)
+
+    async def set(self, kind: str, url: str, data: Dict[str, Any]) -> None:
+        self._pending[(kind, url)] = (data, time.time())
+        if len(self._pending) >= self.BATCH_SIZE:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Commit buffered writes and forget unused prefetched lookups."""
+        self._prefetched.clear()
+        if not self._pending:
+            return
+        rows = [(kind, url, json.dumps(data, separators=(",", ":")), ts)
+                for (kind, url), (data, ts) in self._pending.items()]
+        self._pending = {}
+        try:
+            await asyncio.to_thread(self._write, rows)
+        except sqlite3.Error:
+            pass
+
 # ────────────────────────────────────────────────────────────────────────── class
 
 
@@ -169,11 +416,12 @@ class AsyncUrlSeeder:
     Public coroutines
     -----------------
     await seed.urls(...)
-        returns List[Dict[str,Any]]  (url, status, head_data)
+        returns List[Dict[str,Any]]  (url, status, head_data, plus
+        lastmod/changefreq/priority for sitemap URLs)
     await seed.many_urls(...)
         returns Dict[str, List[Dict[str,Any]]]
     await seed.close()
-        closes the HTTP client if owned by seeder
+        flushes the head cache and closes the HTTP client if owned by seeder
     
     Usage examples
     --------------
@@ -220,13 +468,16 @@ class AsyncUrlSeeder:
 
         # defer – grabbing the index inside an active loop blows up
         self.index_id: Optional[str] = None
-        self._rate_sem: Optional[asyncio.Semaphore] = None
+        # per-host token bucket, set up from SeedingConfig.hits_per_sec
+        self._rate_limiter: Optional[RateLimiter] = None
+        self._hits_per_sec: Optional[float] = None
 
-        # ───────── cache dirs ─────────
+        # ───────── head / live cache ─────────
         self.cache_root = Path(os.path.expanduser(
             cache_root or "~/.cache/url_seeder"))
-        (self.cache_root / "live").mkdir(parents=True, exist_ok=True)
-        (self.cache_root / "head").mkdir(exist_ok=True)
+        self.cache_root.mkdir(parents=True, exist_ok=True)
+        self._cache = SeederCacheStore(
+            self.cache_root / "seeder_cache.db", self.ttl.total_seconds())
 
     def _log(self, level: str, message: str, tag: str = "URL_SEED", **kwargs: Any):
         """Helper to log messages using the provided logger, if available."""
@@ -239,29 +490,60 @@ class AsyncUrlSeeder:
             #     print(f"[{tag}] {level.upper()}: {message.format(**kwargs)}")
 
     # ───────── cache helpers ─────────
-    def _cache_path(self, kind: str, url: str) -> Path:
-        h = hashlib.sha1(url.encode()).hexdigest()
-        return self.cache_root / kind / f"{h}.json"
-
     async def _cache_get(self, kind: str, url: str) -> Optional[Dict[str, Any]]:
-        p = self._cache_path(kind, url)
-        if not p.exists():
-            return None
-        if time.time()-p.stat().st_mtime > self.ttl.total_seconds():
-            return None
-        try:
-            async with aiofiles.open(p, "r") as f:
-                return json.loads(await f.read())
-        except Exception:
-            return None
+        return await self._cache.get(kind, url)
 
     async def _cache_set(self, kind: str, url: str, data: Dict[str, Any]) -> None:
+        await self._cache.set(kind, url, data)
+
+    def _setup_rate_limit(self, hits_per_sec: Optional[float]) -> None:
+        if hits_per_sec is not None and hits_per_sec <= 0:
+            self._log(
+                "warning", "hits_per_sec must be positive. Disabling rate limiting.", tag="URL_SEED")
+            hits_per_sec = None
+        # a true rate per host, no extra politeness delay on top
+        self._hits_per_sec = hits_per_sec
+        self._rate_limiter = RateLimiter(
+            base_delay=(0, 0), requests_per_second=hits_per_sec) if hits_per_sec else None
+
+    # ───────── incremental seeding ─────────
+    def _last_run_path(self, domain: str) -> Path:
+        host = re.sub(r'^https?://', '', domain).rstrip('/')
+        return self.cache_dir / f"sitemap_{re.sub('[/?#:]+', '_', host)}_last_run.txt"
+
+    def _save_last_run(self, domain: str, started: float) -> None:
         try:
-            async with aiofiles.open(self._cache_path(kind, url), "w") as f:
-                await f.write(json.dumps(data, separators=(",", ":")))
-        except Exception:
+            self._last_run_path(domain).write_text(repr(started))
+        except OSError:
             pass
 
+    def _resolve_modified_since(self, domain: str, value: Any) -> Optional[float]:
+        """SeedingConfig.modified_since → epoch seconds (None = no cut-off)."""
+        if value is None:
+            return None
+        if value == "last_run":
+            try:
+                return float(self._last_run_path(domain).read_text().strip())
+            except (OSError, ValueError):
+                return None  # first run: everything is new
+        since = _parse_lastmod(value)
+        if since is None:
+            raise ValueError(f"Invalid modified_since value: {value!r}")
+        return since
+
+    @asynccontextmanager
+    async def _host_slot(self, url: str):
+        """Wait for the host's token bucket before a network check."""
+        limiter = self._rate_limiter
+        if limiter is None:
+            yield
+            return
+        await limiter.wait_if_needed(url)
+        try:
+            yield
+        finally:
+            limiter.release(url)
+
     # ─────────────────────────────── discovery entry
 
     async def urls(self,
@@ -311,30 +593,26 @@ class AsyncUrlSeeder:
                 raise ValueError(
                     f"Invalid source '{s}'. Valid sources are: {', '.join(valid_sources)}")
 
-        if hits_per_sec:
-            if hits_per_sec <= 0:
-                self._log(
-                    "warning", "hits_per_sec must be positive. Disabling rate limiting.", tag="URL_SEED")
-                self._rate_sem = None
-            else:
-                self._rate_sem = asyncio.Semaphore(hits_per_sec)
-        else:
-            self._rate_sem = None  # Ensure it's None if no rate limiting
+        self._setup_rate_limit(hits_per_sec)
+
+        # lastmod cut-off for sitemap URLs (incremental seeding)
+        since = self._resolve_modified_since(domain, config.modified_since)
+        run_started = time.time()
 
         self._log("info", "Starting URL seeding for {domain} with source={source}",
                   params={"domain": domain, "source": source}, tag="URL_SEED")
 
-        # choose stream
+        # choose stream: (url, sitemap metadata or None)
         async def gen():
             if "sitemap" in sources:
                 self._log("debug", "Fetching from sitemaps...", tag="URL_SEED")
-                async for u in self._from_sitemaps(domain, pattern, force):
-                    yield u
+                async for rec in self._from_sitemaps(domain, pattern, force, since):
+                    yield rec["url"], {k: rec.get(k) for k in SITEMAP_FIELDS}
             if "cc" in sources:
                 self._log("debug", "Fetching from Common Crawl...",
                           tag="URL_SEED")
                 async for u in self._from_cc(domain, pattern, force):
-                    yield u
+                    yield u, None
 
         # Use bounded queue to prevent RAM spikes with large domains
         queue_size = min(10000, max(1000, concurrency * 100))  # Dynamic size based on concurrency
@@ -343,10 +621,22 @@ class AsyncUrlSeeder:
         stop_event = asyncio.Event()
         seen: set[str] = set()
         filter_nonsense = config.filter_nonsense_urls  # Extract this for passing to workers
+        cache_kind = "head" if extract_head else "live"
+
+        async def enqueue(batch: List[tuple]):
+            # one indexed cache lookup per batch instead of one per URL
+            if not force:
+                await self._cache.prefetch(cache_kind, [u for u, _ in batch])
+            for item in batch:
+                if stop_event.is_set():
+                    break
+                await queue.put(item)  # Will block if queue is full, providing backpressure
+            batch.clear()
 
         async def producer():
+            batch: List[tuple] = []
             try:
-                async for u in gen():
+                async for u, meta in gen():
                     if u in seen:
                         self._log("debug", "Skipping duplicate URL: {url}",
                                   params={"url": u}, tag="URL_SEED")
@@ -356,7 +646,12 @@ class AsyncUrlSeeder:
                             "info", "Producer stopping due to max_urls limit.", tag="URL_SEED")
                         break
                     seen.add(u)
-                    await queue.put(u)  # Will block if queue is full, providing backpressure
+                    batch.append((u, meta))
+                    # don't hold URLs back while the workers are idle
+                    if len(batch) >= PREFETCH_BATCH or queue.empty():
+                        await enqueue(batch)
+                if batch and not stop_event.is_set():
+                    await enqueue(batch)
             except Exception as e:
                 self._log("error", "Producer encountered an error: {error}", params={
                           "error": str(e)}, tag="URL_SEED")
@@ -371,7 +666,7 @@ class AsyncUrlSeeder:
                     break
                 try:
                     # Increased timeout slightly
-                    url = await asyncio.wait_for(queue.get(), 5)
+                    url, meta = await asyncio.wait_for(queue.get(), 5)
                 except asyncio.TimeoutError:
                     continue  # Keep checking queue and producer_done status
                 except Exception as e:
@@ -400,15 +695,10 @@ class AsyncUrlSeeder:
                             break
                     break
 
-                if self._rate_sem:  # global QPS control
-                    async with self._rate_sem:
-                        await self._validate(url, res_list, live_check, extract_head,
-                                             head_timeout, verbose, query, score_threshold, scoring_method,
-                                             filter_nonsense)
-                else:
-                    await self._validate(url, res_list, live_check, extract_head,
-                                         head_timeout, verbose, query, score_threshold, scoring_method,
-                                         filter_nonsense)
+                # network checks are rate limited per host inside _validate
+                await self._validate(url, res_list, live_check, extract_head,
+                                     head_timeout, verbose, query, score_threshold, scoring_method,
+                                     filter_nonsense, meta)
                 queue.task_done()  # Mark task as done for queue.join() if ever used
 
         # launch
@@ -420,6 +710,11 @@ class AsyncUrlSeeder:
         # Wait for all workers to finish
         await asyncio.gather(prod_task, *workers)
         await queue.join()  # Ensure all queued items are processed
+        await self._cache.flush()
+
+        # a run cut short by max_urls has not seen every change yet
+        if "sitemap" in sources and not stop_event.is_set():
+            self._save_last_run(domain, run_started)
 
         self._log("info", "Finished URL seeding for {domain}. Total URLs: {count}",
                   params={"domain": domain, "count": len(results)}, tag="URL_SEED")
@@ -529,14 +824,7 @@ class AsyncUrlSeeder:
                   params={"count": len(urls)}, tag="URL_SEED")
         
         # Setup rate limiting if specified in config
-        if config.hits_per_sec:
-            if config.hits_per_sec <= 0:
-                self._log("warning", "hits_per_sec must be positive. Disabling rate limiting.", tag="URL_SEED")
-                self._rate_sem = None
-            else:
-                self._rate_sem = asyncio.Semaphore(config.hits_per_sec)
-        else:
-            self._rate_sem = None
+        self._setup_rate_limit(config.hits_per_sec)
         
         # Use bounded queue to prevent memory issues with large URL lists
         queue_size = min(10000, max(1000, concurrency * 100))
@@ -551,6 +839,7 @@ class AsyncUrlSeeder:
         async def producer():
             """Producer to feed URLs into the queue."""
             try:
+                batch: List[str] = []
                 for url in urls:
                     if url in seen:
                         self._log("debug", "Skipping duplicate URL: {url}",
@@ -559,9 +848,20 @@ class AsyncUrlSeeder:
                     if stop_event.is_set():
                         break
                     seen.add(url)
-                    await queue.put(url)
+                    batch.append(url)
+                    if len(batch) >= PREFETCH_BATCH:
+                        await enqueue(batch)
+                await enqueue(batch)
             finally:
                 producer_done.set()
+
+        async def enqueue(batch: List[str]):
+            # one indexed cache lookup per batch instead of one per URL
+            if batch and not config.force:
+                await self._cache.prefetch("head", batch)
+            for url in batch:
+                await queue.put(url)
+            batch.clear()
         
         async def worker(res_list: List[Dict[str, Any]]):
             """Worker to process URLs from the queue."""
@@ -621,7 +921,61 @@ class AsyncUrlSeeder:
         
         # Wait for workers to finish canceling
         await asyncio.gather(*worker_tasks, return_exceptions=True)
+        await self._cache.flush()
         
+        results = await self.rank_head_results(results, config)
+        
+        self._log("info", "Completed head extraction for {count} URLs, {success} successful",
+                  params={
+                      "count": len(urls),
+                      "success": len([r for r in results if r.get("status") == "valid"])
+                  }, tag="URL_SEED")
+        
+        return results
+
+    async def fetch_heads(
+        self,
+        urls: List[str],
+        concurrency: int = 10,
+        timeout: int = 5,
+        hits_per_sec: Optional[float] = None,
+        filter_nonsense: bool = True,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Head entries (url, status, head_data) keyed by the requested URL.
+
+        Same head cache, per-host rate limit and failure entries as
+        extract_head_for_urls, but unscored and keyed by the URL asked for
+        (an entry's "url" is where redirects ended), so callers can merge or
+        reuse them per URL. URLs filtered out as nonsense map to None.
+        """
+        urls = list(dict.fromkeys(urls))
+        if hits_per_sec != self._hits_per_sec:
+            self._setup_rate_limit(hits_per_sec)
+        if urls:
+            await self._cache.prefetch("head", urls)
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        entries: Dict[str, Optional[Dict[str, Any]]] = {}
+
+        async def fetch(url: str):
+            found: List[Dict[str, Any]] = []
+            async with semaphore:
+                try:
+                    await self._validate(url, found, live=False, extract=True, timeout=timeout,
+                                         verbose=False, filter_nonsense=filter_nonsense)
+                except Exception as e:
+                    self._log("error", "Failed to process URL {url}: {error}",
+                              params={"url": url, "error": str(e)}, tag="URL_SEED")
+                    found.append({"url": url, "status": "failed", "head_data": {}, "error": str(e)})
+            entries[url] = found[0] if found else None
+
+        await asyncio.gather(*(fetch(url) for url in urls))
+        await self._cache.flush()
+        return entries
+
+    async def rank_head_results(self, results: List[Dict[str, Any]], config: "SeedingConfig") -> List[Dict[str, Any]]:
+        """Score head results against config.query, drop those under config.score_threshold, best first"""
         # Apply BM25 scoring if query is provided
         if config.query and config.scoring_method == "bm25":
             results = await self._apply_bm25_scoring(results, config)
@@ -634,12 +988,6 @@ class AsyncUrlSeeder:
         if any("relevance_score" in r for r in results):
             results.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
         
-        self._log("info", "Completed head extraction for {count} URLs, {success} successful",
-                  params={
-                      "count": len(urls),
-                      "success": len([r for r in results if r.get("status") == "valid"])
-                  }, tag="URL_SEED")
-        
         return results
 
     async def _apply_bm25_scoring(self, results: List[Dict[str, Any]], config: "SeedingConfig") -> List[Dict[str, Any]]:
@@ -762,11 +1110,13 @@ class AsyncUrlSeeder:
                 raise
 
     # ─────────────────────────────── Sitemaps
-    async def _from_sitemaps(self, domain: str, pattern: str, force: bool = False):
+    async def _from_sitemaps(self, domain: str, pattern: str, force: bool = False,
+                             since: Optional[float] = None):
         """
         1. Probe default sitemap locations.
         2. If none exist, parse robots.txt for alternative sitemap URLs.
-        3. Yield only URLs that match `pattern`.
+        3. Yield sitemap records (url, lastmod, changefreq, priority) whose
+           URL matches `pattern` and, with `since`, whose lastmod is newer.
         """
 
        # ── cache file (same logic as _from_cc)
@@ -775,16 +1125,33 @@ class AsyncUrlSeeder:
         digest = hashlib.md5(pattern.encode()).hexdigest()[:8]
         path = self.cache_dir / f"sitemap_{host}_{digest}.jsonl"
 
-        if path.exists() and not force:
+        # an incremental run needs the live lastmods and only sees part of
+        # the sitemap, so it neither reads nor writes the full cache
+        use_cache = since is None
+
+        if path.exists() and not force and use_cache:
             self._log("info", "Loading sitemap URLs for {d} from cache: {p}",
                       params={"d": host, "p": str(path)}, tag="URL_SEED")
             async with aiofiles.open(path, "r") as fp:
                 async for line in fp:
-                    url = line.strip()
-                    if _match(url, pattern):
-                        yield url
+                    rec = _cached_sitemap_record(line)
+                    if rec and _match(rec["url"], pattern):
+                        yield rec
             return
 
+        async def emit(sitemaps: List[str]):
+            fp = await aiofiles.open(path, "w") if use_cache else None
+            try:
+                for sm in sitemaps:
+                    async for rec in self._iter_sitemap(sm, since):
+                        if fp:
+                            await fp.write(json.dumps(rec, separators=(",", ":")) + "\n")
+                        if _match(rec["url"], pattern):
+                            yield rec
+            finally:
+                if fp:
+                    await fp.close()
+
         # 1️⃣ direct sitemap probe
         # strip any scheme so we can handle https → http fallback
         host = re.sub(r'^https?://', '', domain).rstrip('/')
@@ -797,11 +1164,8 @@ class AsyncUrlSeeder:
                 if sm:
                     self._log("info", "Found sitemap at {url}", params={
                               "url": sm}, tag="URL_SEED")
-                    async with aiofiles.open(path, "w") as fp:
-                        async for u in self._iter_sitemap(sm):
-                            await fp.write(u + "\n")
-                            if _match(u, pattern):
-                                yield u
+                    async for rec in emit([sm]):
+                        yield rec
                     return
 
         # 2️⃣ robots.txt fallback
@@ -820,17 +1184,40 @@ class AsyncUrlSeeder:
             return
 
         if sitemap_lines:
-            async with aiofiles.open(path, "w") as fp:
-                for sm in sitemap_lines:
-                    async for u in self._iter_sitemap(sm):
-                        await fp.write(u + "\n")
-                        if _match(u, pattern):
-                            yield u
-
-    async def _iter_sitemap(self, url: str):
+            async for rec in emit(sitemap_lines):
+                yield rec
+
+    async def _iter_sitemap(self, url: str, since: Optional[float] = None):
+        """
+        Stream the records of a sitemap, following sub-sitemaps of an index.
+
+        The body is inflated and parsed while it downloads, so a sitemap is
+        never held in memory whole. With `since` (epoch seconds), URLs and
+        sub-sitemaps whose lastmod is not newer are skipped; entries without
+        a lastmod are always kept.
+        """
+        stream = _SitemapStream()
+
+        async def parsed(response: httpx.Response):
+            async for chunk in response.aiter_bytes():
+                for item in stream.feed(chunk):
+                    yield item
+            for item in stream.close():
+                yield item
+
+        sub_sitemaps: List[str] = []
         try:
-            r = await self.client.get(url, timeout=15, follow_redirects=True)
-            r.raise_for_status()
+            async with self.client.stream("GET", url, timeout=15, follow_redirects=True) as r:
+                r.raise_for_status()
+                async for kind, rec in parsed(r):
+                    if since is not None:
+                        ts = _parse_lastmod(rec["lastmod"])
+                        if ts is not None and ts <= since:
+                            continue
+                    if kind == "sitemap":
+                        sub_sitemaps.append(rec["url"])
+                    else:
+                        yield rec
         except httpx.HTTPStatusError as e:
             self._log("warning", "Failed to fetch sitemap {url}: HTTP {status_code}",
                       params={"url": url, "status_code": e.response.status_code}, tag="URL_SEED")
@@ -839,79 +1226,16 @@ class AsyncUrlSeeder:
             self._log("warning", "Network error fetching sitemap {url}: {error}",
                       params={"url": url, "error": str(e)}, tag="URL_SEED")
             return
+        except (*_XML_ERRORS, zlib.error) as e:
+            self._log("error", "Parsing error for sitemap {url}: {error}",
+                      params={"url": url, "error": str(e)}, tag="URL_SEED")
+            return
         except Exception as e:
             self._log("error", "Unexpected error fetching sitemap {url}: {error}",
                       params={"url": url, "error": str(e)}, tag="URL_SEED")
             return
 
-        data = gzip.decompress(r.content) if url.endswith(".gz") else r.content
-
-        # Detect if this is a sitemap index by checking for <sitemapindex> or presence of <sitemap> elements
-        is_sitemap_index = False
-        sub_sitemaps = []
-        regular_urls = []
-
-        # Use lxml for XML parsing if available, as it's generally more robust
-        if LXML:
-            try:
-                # Use XML parser for sitemaps, not HTML parser
-                parser = etree.XMLParser(recover=True)
-                root = etree.fromstring(data, parser=parser)
-
-                # Define namespace for sitemap
-                ns = {'s': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
-
-                # Check for sitemap index entries
-                sitemap_locs = root.xpath('//s:sitemap/s:loc', namespaces=ns)
-                if sitemap_locs:
-                    is_sitemap_index = True
-                    for sitemap_elem in sitemap_locs:
-                        loc = sitemap_elem.text.strip() if sitemap_elem.text else ""
-                        if loc:
-                            sub_sitemaps.append(loc)
-
-                # If not a sitemap index, get regular URLs
-                if not is_sitemap_index:
-                    for loc_elem in root.xpath('//s:url/s:loc', namespaces=ns):
-                        loc = loc_elem.text.strip() if loc_elem.text else ""
-                        if loc:
-                            regular_urls.append(loc)
-            except Exception as e:
-                self._log("error", "LXML parsing error for sitemap {url}: {error}",
-                          params={"url": url, "error": str(e)}, tag="URL_SEED")
-                return
-        else:  # Fallback to xml.etree.ElementTree
-            import xml.etree.ElementTree as ET
-            try:
-                # Parse the XML
-                root = ET.fromstring(data)
-                # Remove namespace from tags for easier processing
-                for elem in root.iter():
-                    if '}' in elem.tag:
-                        elem.tag = elem.tag.split('}')[1]
-
-                # Check for sitemap index entries
-                sitemaps = root.findall('.//sitemap')
-                if sitemaps:
-                    is_sitemap_index = True
-                    for sitemap in sitemaps:
-                        loc_elem = sitemap.find('loc')
-                        if loc_elem is not None and loc_elem.text:
-                            sub_sitemaps.append(loc_elem.text.strip())
-
-                # If not a sitemap index, get regular URLs
-                if not is_sitemap_index:
-                    for url_elem in root.findall('.//url'):
-                        loc_elem = url_elem.find('loc')
-                        if loc_elem is not None and loc_elem.text:
-                            regular_urls.append(loc_elem.text.strip())
-            except Exception as e:
-                self._log("error", "ElementTree parsing error for sitemap {url}: {error}",
-                          params={"url": url, "error": str(e)}, tag="URL_SEED")
-                return
-
-        # Process based on type
-        if is_sitemap_index and sub_sitemaps:
+        if sub_sitemaps:
             self._log("info", "Processing sitemap index with {count} sub-sitemaps in parallel",
                       params={"count": len(sub_sitemaps)}, tag="URL_SEED")
 
@@ -921,45 +1245,50 @@ class AsyncUrlSeeder:
             result_queue = asyncio.Queue(maxsize=queue_size)
             completed_count = 0
             total_sitemaps = len(sub_sitemaps)
+            # each index level gets its own slots, so nested indexes cannot starve
+            fetch_sem = asyncio.Semaphore(SITEMAP_CONCURRENCY)
 
             async def process_subsitemap(sitemap_url: str):
                 try:
-                    self._log(
-                        "debug", "Processing sub-sitemap: {url}", params={"url": sitemap_url}, tag="URL_SEED")
-                    # Recursively process sub-sitemap
-                    async for u in self._iter_sitemap(sitemap_url):
-                        await result_queue.put(u)  # Will block if queue is full
+                    async with fetch_sem:
+                        self._log(
+                            "debug", "Processing sub-sitemap: {url}", params={"url": sitemap_url}, tag="URL_SEED")
+                        # Recursively process sub-sitemap
+                        async for rec in self._iter_sitemap(sitemap_url, since):
+                            await result_queue.put(rec)  # Will block if queue is full
+                except asyncio.CancelledError:
+                    return  # the consumer went away, nobody waits for a sentinel
                 except Exception as e:
                     self._log("error", "Error processing sub-sitemap {url}: {error}",
                               params={"url": sitemap_url, "error": str(e)}, tag="URL_SEED")
-                finally:
-                    # Put sentinel to signal completion
-                    await result_queue.put(None)
+                # Put sentinel to signal completion
+                await result_queue.put(None)
 
             # Start all tasks
             tasks = [asyncio.create_task(process_subsitemap(sm))
                      for sm in sub_sitemaps]
 
             # Yield results as they come in
-            while completed_count < total_sitemaps:
-                item = await result_queue.get()
-                if item is None:
-                    completed_count += 1
-                else:
-                    yield item
-
-            # Ensure all tasks are done
-            await asyncio.gather(*tasks, return_exceptions=True)
-        else:
-            # Regular sitemap - yield URLs directly
-            for u in regular_urls:
-                yield u
+            try:
+                while completed_count < total_sitemaps:
+                    item = await result_queue.get()
+                    if item is None:
+                        completed_count += 1
+                    else:
+                        yield item
+            finally:
+                # the consumer may stop early (max_urls); don't leave fetches behind
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
 
     # ─────────────────────────────── validate helpers
     async def _validate(self, url: str, res_list: List[Dict[str, Any]], live: bool,
                         extract: bool, timeout: int, verbose: bool, query: Optional[str] = None,
                         score_threshold: Optional[float] = None, scoring_method: str = "bm25",
-                        filter_nonsense: bool = True):
+                        filter_nonsense: bool = True, extra: Optional[Dict[str, Any]] = None):
+        # `extra` holds per-run fields (sitemap lastmod/changefreq/priority)
+        # that are merged into the entry but kept out of the head/live cache.
         # Local verbose parameter for this function is used to decide if intermediate logs should be printed
         # The main logger's verbose status should be controlled by the caller.
         
@@ -975,13 +1304,14 @@ class AsyncUrlSeeder:
         if not (hasattr(self, 'force') and self.force):
             cached = await self._cache_get(cache_kind, url)
             if cached:
-                res_list.append(cached)
+                res_list.append({**cached, **extra} if extra else cached)
                 return
 
         if extract:
             self._log("debug", "Fetching head for {url}", params={
                       "url": url}, tag="URL_SEED")
-            ok, html, final = await self._fetch_head(url, timeout)
+            async with self._host_slot(url):
+                ok, html, final = await self._fetch_head(url, timeout)
             status = "valid" if ok else "not_valid"
             self._log("info" if ok else "warning", "HEAD {status} for {final_url}",
                       params={"status": status.upper(), "final_url": final or url}, tag="URL_SEED")
@@ -996,7 +1326,8 @@ class AsyncUrlSeeder:
         elif live:
             self._log("debug", "Performing live check for {url}", params={
                       "url": url}, tag="URL_SEED")
-            ok = await self._resolve_head(url)
+            async with self._host_slot(url):
+                ok = await self._resolve_head(url)
             status = "valid" if ok else "not_valid"
             self._log("info" if ok else "warning", "LIVE CHECK {status} for {url}",
                       params={"status": status.upper(), "url": url}, tag="URL_SEED")
@@ -1008,6 +1339,8 @@ class AsyncUrlSeeder:
         # Add entry to results (scoring will be done later)
         if live or extract:
             await self._cache_set(cache_kind, url, entry)
+        if extra:
+            entry.update(extra)
         res_list.append(entry)
 
     async def _head_ok(self, url: str, timeout: int) -> bool:
@@ -1425,7 +1758,8 @@ class AsyncUrlSeeder:
 
     # ─────────────────────────────── cleanup methods
     async def close(self):
-        """Close the HTTP client if we own it."""
+        """Commit pending cache writes and close the HTTP client if we own it."""
+        await self._cache.flush()
         if self._owns_client and self.client:
             await self.client.aclose()
             self._log("debug", "Closed HTTP client", tag="URL_SEED")
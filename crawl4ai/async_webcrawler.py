@@ -3,9 +3,14 @@ import os
 import sys
 import time
 from pathlib import Path
-from typing import Optional, List
+from typing import AsyncIterable, Iterable, Optional, List, Dict, Tuple, Union
 import json
+import copy
+import uuid
 import asyncio
+from contextvars import ContextVar
+from functools import partial
+from collections import deque
 
 # from contextlib import nullcontext, asynccontextmanager
 from contextlib import asynccontextmanager
@@ -17,12 +22,12 @@ from .models import (
     CrawlResultContainer,
     RunManyReturn
 )
-from .async_database import async_db_manager
+from .async_database import async_db_manager, CacheEntry
 from .chunking_strategy import *  # noqa: F403
 from .chunking_strategy import IdentityChunking
 from .content_filter_strategy import *  # noqa: F403
 from .extraction_strategy import *  # noqa: F403
-from .extraction_strategy import NoExtractionStrategy
+from .extraction_strategy import NoExtractionStrategy, JsonElementExtractionStrategy
 from .async_crawler_strategy import (
     AsyncCrawlerStrategy,
     AsyncPlaywrightCrawlerStrategy,
@@ -39,6 +44,9 @@ from .async_configs import BrowserConfig, CrawlerRunConfig, ProxyConfig, Seeding
 from .async_dispatcher import *  # noqa: F403
 from .async_dispatcher import BaseDispatcher, MemoryAdaptiveDispatcher, RateLimiter
 from .async_url_seeder import AsyncUrlSeeder
+from .link_preview import LinkPreview
+from .processing_pool import ProcessingPool
+from .html_document import HTMLDocument, fit_html_for
 
 from .utils import (
     sanitize_input_encode,
@@ -46,9 +54,281 @@ from .utils import (
     fast_format_html,
     get_error_context,
     RobotsParser,
-    preprocess_html_for_schema,
 )
 
+# Cache entries arun_many already looked up for the URLs it hands to the
+# dispatcher (None for a known miss), so arun does not query them again.
+_prefetched_entries: ContextVar[Optional[Dict[str, Optional[CacheEntry]]]] = ContextVar(
+    "prefetched_cache_entries", default=None
+)
+
+
+def process_html(
+    url: str,
+    html: str,
+    extracted_content: str,
+    config: CrawlerRunConfig,
+    screenshot_data: str,
+    pdf_data: str,
+    logger: Optional[AsyncLoggerBase] = None,
+    defer_extraction: bool = False,
+    defer_link_preview: bool = False,
+    **kwargs,
+) -> dict:
+    """
+    Scrape, generate markdown and run extraction for one page.
+
+    Pure CPU work without event loop access, so it can run in a worker
+    thread or process (see ``ProcessingPool``).
+
+    With ``defer_extraction``, an extraction strategy with its own ``arun``
+    (LLM extraction) is not run here: the chunked input is returned under
+    ``"extraction_sections"`` for the caller to await on its event loop.
+    Likewise ``defer_link_preview`` leaves link head extraction to the caller.
+
+    Returns:
+        dict: Keyword arguments for the resulting ``CrawlResult``.
+    """
+    cleaned_html = ""
+    try:
+        _url = url if not kwargs.get("is_raw_html", False) else "Raw HTML"
+        t1 = time.perf_counter()
+
+        # Get scraping strategy and ensure it has a logger
+        scraping_strategy = config.scraping_strategy
+        if not scraping_strategy.logger and logger:
+            scraping_strategy.logger = logger
+
+        # Process HTML content
+        params = config.__dict__.copy()
+        params.pop("url", None)
+        # add keys from kwargs to params that doesn't exist in params
+        params.update({k: v for k, v in kwargs.items()
+                      if k not in params.keys()})
+        if defer_link_preview:
+            params["link_preview_config"] = None
+
+        # Parse the page once; scraping may take the tree over unless a
+        # later stage still needs it unmodified
+        markdown_generator: Optional[MarkdownGenerationStrategy] = (
+            config.markdown_generator or DefaultMarkdownGenerator()
+        )
+        selected_html_source = getattr(markdown_generator, 'content_source', 'cleaned_html')
+        extraction_format = (
+            config.extraction_strategy.input_format
+            if not bool(extracted_content)
+            and config.extraction_strategy
+            and not isinstance(config.extraction_strategy, NoExtractionStrategy)
+            else None
+        )
+        html_document = HTMLDocument(html, retain=extraction_format == "html")
+        params["html_document"] = html_document
+
+        ################################
+        # Scraping Strategy Execution  #
+        ################################
+        result: ScrapingResult = scraping_strategy.scrap(
+            url, html, **params)
+
+        if result is None:
+            raise ValueError(
+                f"Process HTML, Failed to extract content from the website: {url}"
+            )
+
+    except InvalidCSSSelectorError as e:
+        raise ValueError(str(e))
+    except Exception as e:
+        raise ValueError(
+            f"Process HTML, Failed to extract content from the website: {url}, error: {str(e)}"
+        )
+
+    # Extract results - handle both dict and ScrapingResult
+    if isinstance(result, dict):
+        cleaned_html = sanitize_input_encode(
+            result.get("cleaned_html", ""))
+        media = result.get("media", {})
+        tables = media.pop("tables", []) if isinstance(media, dict) else []
+        links = result.get("links", {})
+        metadata = result.get("metadata", {})
+    else:
+        cleaned_html = sanitize_input_encode(result.cleaned_html)
+        # media = result.media.model_dump()
+        # tables = media.pop("tables", [])
+        # links = result.links.model_dump()
+        media = result.media.model_dump() if hasattr(result.media, 'model_dump') else result.media
+        tables = media.pop("tables", []) if isinstance(media, dict) else []
+        links = result.links.model_dump() if hasattr(result.links, 'model_dump') else result.links
+        metadata = result.metadata
+
+    ################################
+    # Generate Markdown            #
+    ################################
+
+    # --- SELECT HTML SOURCE BASED ON CONTENT_SOURCE ---
+    # Define the source selection logic using dict dispatch
+    html_source_selector = {
+        "raw_html": lambda: html,  # The original raw HTML
+        "cleaned_html": lambda: cleaned_html,  # The HTML after scraping strategy
+        "fit_html": lambda: html_document.fit_html,  # The HTML after preprocessing for schema
+    }
+
+    markdown_input_html = cleaned_html  # Default to cleaned_html
+
+    try:
+        # Get the appropriate lambda function, default to returning cleaned_html if key not found
+        source_lambda = html_source_selector.get(selected_html_source, lambda: cleaned_html)
+        # Execute the lambda to get the selected HTML
+        markdown_input_html = source_lambda()
+
+        # Log which source is being used (optional, but helpful for debugging)
+        # if self.logger and verbose:
+        #     actual_source_used = selected_html_source if selected_html_source in html_source_selector else 'cleaned_html (default)'
+        #     self.logger.debug(f"Using '{actual_source_used}' as source for Markdown generation for {url}", tag="MARKDOWN_SRC")
+
+    except Exception as e:
+        # Handle potential errors, especially from preprocess_html_for_schema
+        if logger:
+            logger.warning(
+                f"Error getting/processing '{selected_html_source}' for markdown source: {e}. Falling back to cleaned_html.",
+                tag="MARKDOWN_SRC"
+            )
+        # Ensure markdown_input_html is still the default cleaned_html in case of error
+        markdown_input_html = cleaned_html
+    # --- END: HTML SOURCE SELECTION ---
+
+    # Uncomment if by default we want to use PruningContentFilter
+    # if not config.content_filter and not markdown_generator.content_filter:
+    #     markdown_generator.content_filter = PruningContentFilter()
+
+    markdown_result: MarkdownGenerationResult = (
+        markdown_generator.generate_markdown(
+            input_html=markdown_input_html,
+            base_url=params.get("redirected_url", url)
+            # html2text_options=kwargs.get('html2text', {})
+        )
+    )
+
+    # Log processing completion
+    if logger:
+        logger.url_status(
+            url=_url,
+            success=True,
+            timing=int((time.perf_counter() - t1) * 1000) / 1000,
+            tag="SCRAPE"
+        )
+    # self.logger.info(
+    #     message="{url:.50}... | Time: {timing}s",
+    #     tag="SCRAPE",
+    #     params={"url": _url, "timing": int((time.perf_counter() - t1) * 1000) / 1000},
+    # )
+
+    ################################
+    # Structured Content Extraction           #
+    ################################
+    extraction_sections = None
+    if (
+        not bool(extracted_content)
+        and config.extraction_strategy
+        and not isinstance(config.extraction_strategy, NoExtractionStrategy)
+    ):
+        t1 = time.perf_counter()
+        # Choose content based on input_format
+        content_format = config.extraction_strategy.input_format
+        if content_format == "fit_markdown" and not markdown_result.fit_markdown:
+
+            if logger:
+                logger.url_status(
+                        url=_url,
+                        success=bool(html),
+                        timing=time.perf_counter() - t1,
+                        tag="EXTRACT",
+                    )
+            content_format = "markdown"
+
+        content = {
+            "markdown": lambda: markdown_result.raw_markdown,
+            "html": lambda: html,
+            "fit_html": lambda: html_document.fit_html,
+            "cleaned_html": lambda: cleaned_html,
+            "fit_markdown": lambda: markdown_result.fit_markdown,
+        }.get(content_format, lambda: markdown_result.raw_markdown)()
+
+        # Use IdentityChunking for HTML input, otherwise use provided chunking strategy
+        chunking = (
+            IdentityChunking()
+            if content_format in ["html", "cleaned_html", "fit_html"]
+            else config.chunking_strategy
+        )
+        sections = chunking.chunk(content)
+        if defer_extraction and config.extraction_strategy.has_async_run:
+            # I/O bound: awaited by the crawler rather than run in this worker
+            extraction_sections = sections
+        elif content_format == "html" and isinstance(
+            config.extraction_strategy, JsonElementExtractionStrategy
+        ):
+            # Schema strategies can query the already parsed page
+            extracted_content = config.extraction_strategy.run(
+                url, sections, html_document=html_document
+            )
+        else:
+            extracted_content = config.extraction_strategy.run(url, sections)
+        if extraction_sections is None:
+            extracted_content = json.dumps(
+                extracted_content, indent=4, default=str, ensure_ascii=False
+            )
+
+        # Log extraction completion
+        if logger and extraction_sections is None:
+            logger.url_status(
+                        url=_url,
+                        success=bool(html),
+                        timing=time.perf_counter() - t1,
+                        tag="EXTRACT",
+                    )
+
+    # Apply HTML formatting if requested
+    if config.prettiify:
+        cleaned_html = fast_format_html(cleaned_html)
+
+    # Fields of the complete crawl result
+    fields = dict(
+        url=url,
+        html=html,
+        # Only filled in when a stage asked for it, otherwise the result
+        # computes it on first access
+        fit_html=html_document.fit_html if html_document.has_fit_html else None,
+        cleaned_html=cleaned_html,
+        markdown=markdown_result,
+        media=media,
+        tables=tables,                       # NEW
+        links=links,
+        metadata=metadata,
+        screenshot=screenshot_data,
+        pdf=pdf_data,
+        extracted_content=extracted_content,
+        success=True,
+        error_message="",
+    )
+    if extraction_sections is not None:
+        fields["extraction_sections"] = extraction_sections
+    return fields
+
+
+def process_html_in_worker(
+    url: str,
+    html: str,
+    extracted_content: str,
+    config_data: dict,
+    screenshot_data: str,
+    pdf_data: str,
+    kwargs: dict,
+) -> dict:
+    """Process pool entry point; the config travels in its serialized form"""
+    config = CrawlerRunConfig.load(config_data)
+    return process_html(
+        url, html, extracted_content, config, screenshot_data, pdf_data, **kwargs
+    )
+
 
 class AsyncWebCrawler:
     """
@@ -115,6 +395,7 @@ class AsyncWebCrawler:
             os.getenv("CRAWL4_AI_BASE_DIRECTORY", Path.home())),
         thread_safe: bool = False,
         logger: AsyncLoggerBase = None,
+        processing_pool: Optional[ProcessingPool] = None,
         **kwargs,
     ):
         """
@@ -125,6 +406,8 @@ class AsyncWebCrawler:
             config: Configuration object for browser settings. Default BrowserConfig()
             base_directory: Base directory for storing cache
             thread_safe: Whether to use thread-safe operations
+            processing_pool: Where scraping, markdown generation and extraction run.
+                Default: a thread pool sized to the CPU count
             **kwargs: Additional arguments for backwards compatibility
         """
         # Handle browser configuration
@@ -151,6 +434,10 @@ class AsyncWebCrawler:
         # Thread safety setup
         self._lock = asyncio.Lock() if thread_safe else None
 
+        # CPU-bound page processing runs off the event loop
+        self._owns_processing_pool = processing_pool is None
+        self.processing_pool = processing_pool or ProcessingPool()
+
         # Initialize directories
         self.crawl4ai_folder = os.path.join(base_directory, ".crawl4ai")
         os.makedirs(self.crawl4ai_folder, exist_ok=True)
@@ -166,6 +453,8 @@ class AsyncWebCrawler:
         self.arun = self._deep_handler(self.arun)
         
         self.url_seeder: Optional[AsyncUrlSeeder] = None
+        # Link head extraction for every page of this crawler, on one HTTP client
+        self.link_preview: Optional[LinkPreview] = None
 
     async def start(self):
         """
@@ -187,8 +476,22 @@ class AsyncWebCrawler:
         This method will:
         1. Clean up browser resources
         2. Close any open pages and contexts
+        3. Flush cache writes still queued in the database manager
+        4. Shut down the processing pool it created
+        5. Close the robots.txt and link preview HTTP sessions
+        6. Wait for queued log output to be written
         """
         await self.crawler_strategy.__aexit__(None, None, None)
+        await async_db_manager.flush()
+        await self.robots_parser.close()
+        if self.link_preview:
+            await self.link_preview.close()
+            self.link_preview = None
+        if self._owns_processing_pool:
+            self.processing_pool.shutdown(wait=False)
+        flush_logs = getattr(self.logger, "flush", None)
+        if flush_logs:
+            await asyncio.to_thread(flush_logs)
 
     async def __aenter__(self):
         return await self.start()
@@ -257,6 +560,7 @@ class AsyncWebCrawler:
 
                 # Initialize processing variables
                 async_response: AsyncCrawlResponse = None
+                cache_entry = None
                 cached_result: CrawlResult = None
                 screenshot_data = None
                 pdf_data = None
@@ -265,10 +569,21 @@ class AsyncWebCrawler:
 
                 # Try to get cached result if appropriate
                 if cache_context.should_read():
-                    cached_result = await async_db_manager.aget_cached_url(url)
+                    prefetched = _prefetched_entries.get()
+                    if prefetched is not None and url in prefetched:
+                        cache_entry = prefetched.pop(url)
+                    else:
+                        cache_entry = await async_db_manager.aget_cache_entry(url)
+                    if cache_entry and cache_entry.is_fresh(
+                        config.cache_max_age, config.respect_cache_headers
+                    ):
+                        cached_result = cache_entry.result
+                    async_db_manager.record_access(url, hit=cached_result is not None)
 
                 if cached_result:
-                    html = sanitize_input_encode(cached_result.html)
+                    # Heavy cached fields (html, screenshot) stay on disk until
+                    # something reads them; only check that they exist.
+                    html = cached_result.has_content("html")
                     extracted_content = sanitize_input_encode(
                         cached_result.extracted_content or ""
                     )
@@ -278,15 +593,19 @@ class AsyncWebCrawler:
                         else extracted_content
                     )
                     # If screenshot is requested but its not in cache, then set cache_result to None
-                    screenshot_data = cached_result.screenshot
                     pdf_data = cached_result.pdf
                     # if config.screenshot and not screenshot or config.pdf and not pdf:
-                    if config.screenshot and not screenshot_data:
+                    if config.screenshot and not cached_result.has_content("screenshot"):
                         cached_result = None
 
                     if config.pdf and not pdf_data:
                         cached_result = None
 
+                    # Missing content (e.g. a collected blob) is a miss, so
+                    # the fresh crawl replaces the row
+                    if not html:
+                        cached_result = None
+
                     self.logger.url_status(
                         url=cache_context.display_url,
                         success=bool(html),
@@ -294,20 +613,26 @@ class AsyncWebCrawler:
                         tag="FETCH",
                     )
 
-                # Update proxy configuration from rotation strategy if available
-                if config and config.proxy_rotation_strategy:
-                    next_proxy: ProxyConfig = await config.proxy_rotation_strategy.get_next_proxy()
+                # Fetch fresh content if needed
+                if not cached_result or not html:
+                    # Update proxy configuration from rotation strategy if available
+                    proxy_strategy = config.proxy_rotation_strategy
+                    next_proxy: Optional[ProxyConfig] = None
+                    if proxy_strategy:
+                        get_proxy_for_url = getattr(proxy_strategy, "get_proxy_for_url", None)
+                        next_proxy = await (
+                            get_proxy_for_url(url) if get_proxy_for_url else proxy_strategy.get_next_proxy()
+                        )
                     if next_proxy:
                         self.logger.info(
                             message="Switch proxy: {proxy}",
                             tag="PROXY",
                             params={"proxy": next_proxy.server}
                         )
+                        # A copy: concurrent crawls share the config, each keeps its own proxy
+                        config = copy.copy(config)
                         config.proxy_config = next_proxy
-                        # config = config.clone(proxy_config=next_proxy)
 
-                # Fetch fresh content if needed
-                if not cached_result or not html:
                     t1 = time.perf_counter()
 
                     if config.user_agent:
@@ -330,13 +655,61 @@ class AsyncWebCrawler:
                                 },
                             )
 
+                    # A stale entry with validators can be revalidated instead
+                    # of refetched, if the strategy supports conditional requests
+                    crawl_kwargs = {}
+                    if (
+                        cache_entry
+                        and getattr(self.crawler_strategy, "supports_conditional_requests", False)
+                        and not config.screenshot
+                        and not config.pdf
+                        and cache_entry.result.has_content("html")
+                    ):
+                        validators = cache_entry.conditional_headers()
+                        if validators:
+                            crawl_kwargs["cache_validators"] = validators
+
                     ##############################
                     # Call CrawlerStrategy.crawl #
                     ##############################
-                    async_response = await self.crawler_strategy.crawl(
-                        url,
-                        config=config,  # Pass the entire config object
-                    )
+                    try:
+                        async_response = await self.crawler_strategy.crawl(
+                            url,
+                            config=config,  # Pass the entire config object
+                            **crawl_kwargs,
+                        )
+                    except Exception as e:
+                        if next_proxy:
+                            self._report_proxy_result(
+                                proxy_strategy, next_proxy,
+                                latency=time.perf_counter() - t1, error=str(e),
+                            )
+                        raise
+
+                    if crawl_kwargs and async_response.not_modified:
+                        # Unchanged upstream: skip processing, serve the cache
+                        if cache_context.should_write():
+                            await async_db_manager.arevalidate(
+                                url, async_response.response_headers
+                            )
+                        if next_proxy:
+                            self._report_proxy_result(
+                                proxy_strategy, next_proxy,
+                                status_code=304,
+                                latency=time.perf_counter() - t1,
+                            )
+                        cached_result = cache_entry.result
+                        cached_result.revalidated = True
+                        cached_result.success = True
+                        cached_result.session_id = getattr(config, "session_id", None)
+                        cached_result.redirected_url = cached_result.redirected_url or url
+                        self.logger.url_status(
+                            url=cache_context.display_url,
+                            success=True,
+                            timing=time.perf_counter() - start_time,
+                            tag="COMPLETE",
+                        )
+                        return CrawlResultContainer(cached_result)
 
                     html = sanitize_input_encode(async_response.html)
                     screenshot_data = async_response.screenshot
@@ -350,6 +723,13 @@ class AsyncWebCrawler:
                         timing=t2 - t1,
                         tag="FETCH",
                     )
+                    if next_proxy:
+                        self._report_proxy_result(
+                            proxy_strategy, next_proxy,
+                            status_code=async_response.status_code if html else None,
+                            latency=t2 - t1,
+                            html=html,
+                        )
 
                     ###############################################################
                     # Process the HTML content, Call CrawlerStrategy.process_html #
@@ -391,7 +771,9 @@ class AsyncWebCrawler:
 
                     # Update cache if appropriate
                     if cache_context.should_write() and not bool(cached_result):
-                        await async_db_manager.acache_url(crawl_result)
+                        await async_db_manager.acache_url(
+                            crawl_result, respect_headers=config.respect_cache_headers
+                        )
 
                     return CrawlResultContainer(crawl_result)
 
@@ -430,6 +812,13 @@ class AsyncWebCrawler:
                     )
                 )
 
+    @staticmethod
+    def _report_proxy_result(proxy_strategy, proxy: ProxyConfig, **outcome):
+        """Tell a proxy strategy that scores proxies how a crawl through `proxy` went"""
+        report_result = getattr(proxy_strategy, "report_result", None)
+        if report_result is not None:
+            report_result(proxy, **outcome)
+
     async def aprocess_html(
         self,
         url: str,
@@ -454,205 +843,94 @@ class AsyncWebCrawler:
             verbose: Whether to enable verbose logging
             **kwargs: Additional parameters for backwards compatibility
 
+        The work itself (``process_html``) runs in ``self.processing_pool``,
+        except for extraction strategies with their own ``arun`` (LLM
+        extraction): those are awaited here, so a page waiting on an LLM
+        holds neither a processing worker nor the event loop. Link previews
+        (``config.link_preview_config``) are fetched here too, see
+        ``apreview_links``.
+
         Returns:
             CrawlResult: Processed result containing extracted and formatted content
         """
-        cleaned_html = ""
-        try:
-            _url = url if not kwargs.get("is_raw_html", False) else "Raw HTML"
-            t1 = time.perf_counter()
-
-            # Get scraping strategy and ensure it has a logger
-            scraping_strategy = config.scraping_strategy
-            if not scraping_strategy.logger:
-                scraping_strategy.logger = self.logger
-
-            # Process HTML content
-            params = config.__dict__.copy()
-            params.pop("url", None)
-            # add keys from kwargs to params that doesn't exist in params
-            params.update({k: v for k, v in kwargs.items()
-                          if k not in params.keys()})
-
-            ################################
-            # Scraping Strategy Execution  #
-            ################################
-            result: ScrapingResult = scraping_strategy.scrap(
-                url, html, **params)
-
-            if result is None:
-                raise ValueError(
-                    f"Process HTML, Failed to extract content from the website: {url}"
-                )
-
-        except InvalidCSSSelectorError as e:
-            raise ValueError(str(e))
-        except Exception as e:
-            raise ValueError(
-                f"Process HTML, Failed to extract content from the website: {url}, error: {str(e)}"
+        if self.processing_pool.is_process_pool:
+            # Strategies travel as their serialized config, loggers stay here
+            kwargs = {k: v for k, v in kwargs.items() if k in ("is_raw_html", "redirected_url")}
+            kwargs["defer_extraction"] = True
+            kwargs["defer_link_preview"] = True
+            fields = await self.processing_pool.run(
+                process_html_in_worker,
+                url,
+                html,
+                extracted_content,
+                config.dump(),
+                screenshot_data,
+                pdf_data,
+                kwargs,
             )
-
-        # Extract results - handle both dict and ScrapingResult
-        if isinstance(result, dict):
-            cleaned_html = sanitize_input_encode(
-                result.get("cleaned_html", ""))
-            media = result.get("media", {})
-            tables = media.pop("tables", []) if isinstance(media, dict) else []
-            links = result.get("links", {})
-            metadata = result.get("metadata", {})
         else:
-            cleaned_html = sanitize_input_encode(result.cleaned_html)
-            # media = result.media.model_dump()
-            # tables = media.pop("tables", [])
-            # links = result.links.model_dump()
-            media = result.media.model_dump() if hasattr(result.media, 'model_dump') else result.media
-            tables = media.pop("tables", []) if isinstance(media, dict) else []
-            links = result.links.model_dump() if hasattr(result.links, 'model_dump') else result.links
-            metadata = result.metadata
-
-        fit_html = preprocess_html_for_schema(html_content=html, text_threshold= 500, max_size= 300_000)
-
-        ################################
-        # Generate Markdown            #
-        ################################
-        markdown_generator: Optional[MarkdownGenerationStrategy] = (
-            config.markdown_generator or DefaultMarkdownGenerator()
-        )
-
-        # --- SELECT HTML SOURCE BASED ON CONTENT_SOURCE ---
-        # Get the desired source from the generator config, default to 'cleaned_html'
-        selected_html_source = getattr(markdown_generator, 'content_source', 'cleaned_html')
-
-        # Define the source selection logic using dict dispatch
-        html_source_selector = {
-            "raw_html": lambda: html,  # The original raw HTML
-            "cleaned_html": lambda: cleaned_html,  # The HTML after scraping strategy
-            "fit_html": lambda: fit_html,  # The HTML after preprocessing for schema
-        }
-
-        markdown_input_html = cleaned_html  # Default to cleaned_html
-
-        try:
-            # Get the appropriate lambda function, default to returning cleaned_html if key not found
-            source_lambda = html_source_selector.get(selected_html_source, lambda: cleaned_html)
-            # Execute the lambda to get the selected HTML
-            markdown_input_html = source_lambda()
-
-            # Log which source is being used (optional, but helpful for debugging)
-            # if self.logger and verbose:
-            #     actual_source_used = selected_html_source if selected_html_source in html_source_selector else 'cleaned_html (default)'
-            #     self.logger.debug(f"Using '{actual_source_used}' as source for Markdown generation for {url}", tag="MARKDOWN_SRC")
-
-        except Exception as e:
-            # Handle potential errors, especially from preprocess_html_for_schema
-            if self.logger:
-                self.logger.warning(
-                    f"Error getting/processing '{selected_html_source}' for markdown source: {e}. Falling back to cleaned_html.",
-                    tag="MARKDOWN_SRC"
+            fields = await self.processing_pool.run(
+                partial(
+                    process_html,
+                    url,
+                    html,
+                    extracted_content,
+                    config,
+                    screenshot_data,
+                    pdf_data,
+                    logger=self.logger,
+                    defer_extraction=True,
+                    defer_link_preview=True,
+                    **kwargs,
                 )
-            # Ensure markdown_input_html is still the default cleaned_html in case of error
-            markdown_input_html = cleaned_html
-        # --- END: HTML SOURCE SELECTION ---
-
-        # Uncomment if by default we want to use PruningContentFilter
-        # if not config.content_filter and not markdown_generator.content_filter:
-        #     markdown_generator.content_filter = PruningContentFilter()
-
-        markdown_result: MarkdownGenerationResult = (
-            markdown_generator.generate_markdown(
-                input_html=markdown_input_html,
-                base_url=params.get("redirected_url", url)
-                # html2text_options=kwargs.get('html2text', {})
             )
-        )
 
-        # Log processing completion
-        self.logger.url_status(
-            url=_url,
-            success=True,
-            timing=int((time.perf_counter() - t1) * 1000) / 1000,
-            tag="SCRAPE"
-        )
-        # self.logger.info(
-        #     message="{url:.50}... | Time: {timing}s",
-        #     tag="SCRAPE",
-        #     params={"url": _url, "timing": int((time.perf_counter() - t1) * 1000) / 1000},
-        # )
+        if config.link_preview_config is not None and fields.get("links"):
+            fields["links"] = await self.apreview_links(fields["links"], config)
 
-        ################################
-        # Structured Content Extraction           #
-        ################################
-        if (
-            not bool(extracted_content)
-            and config.extraction_strategy
-            and not isinstance(config.extraction_strategy, NoExtractionStrategy)
-        ):
+        sections = fields.pop("extraction_sections", None)
+        if sections is not None:
             t1 = time.perf_counter()
-            # Choose content based on input_format
-            content_format = config.extraction_strategy.input_format
-            if content_format == "fit_markdown" and not markdown_result.fit_markdown:
-
-                self.logger.url_status(
-                        url=_url,
-                        success=bool(html),
-                        timing=time.perf_counter() - t1,
-                        tag="EXTRACT",
-                    )
-                content_format = "markdown"
-
-            content = {
-                "markdown": markdown_result.raw_markdown,
-                "html": html,
-                "fit_html": fit_html,
-                "cleaned_html": cleaned_html,
-                "fit_markdown": markdown_result.fit_markdown,
-            }.get(content_format, markdown_result.raw_markdown)
-
-            # Use IdentityChunking for HTML input, otherwise use provided chunking strategy
-            chunking = (
-                IdentityChunking()
-                if content_format in ["html", "cleaned_html", "fit_html"]
-                else config.chunking_strategy
+            extracted = await config.extraction_strategy.arun(url, sections)
+            fields["extracted_content"] = json.dumps(
+                extracted, indent=4, default=str, ensure_ascii=False
             )
-            sections = chunking.chunk(content)
-            extracted_content = config.extraction_strategy.run(url, sections)
-            extracted_content = json.dumps(
-                extracted_content, indent=4, default=str, ensure_ascii=False
+            self.logger.url_status(
+                url=url if not kwargs.get("is_raw_html", False) else "Raw HTML",
+                success=bool(html),
+                timing=time.perf_counter() - t1,
+                tag="EXTRACT",
             )
+        result = CrawlResult(**fields)
+        if result.fit_html is None and html:
+            result.set_lazy_field("fit_html", partial(fit_html_for, html))
+        return result
 
-            # Log extraction completion
-            self.logger.url_status(
-                        url=_url,
-                        success=bool(html),
-                        timing=time.perf_counter() - t1,
-                        tag="EXTRACT",
-                    )
+    async def apreview_links(self, links: dict, config: CrawlerRunConfig) -> dict:
+        """
+        Attach link head data to a page's links.
 
-        # Apply HTML formatting if requested
-        if config.prettiify:
-            cleaned_html = fast_format_html(cleaned_html)
-
-        # Return complete crawl result
-        return CrawlResult(
-            url=url,
-            html=html,
-            fit_html=fit_html,
-            cleaned_html=cleaned_html,
-            markdown=markdown_result,
-            media=media,
-            tables=tables,                       # NEW
-            links=links,
-            metadata=metadata,
-            screenshot=screenshot_data,
-            pdf=pdf_data,
-            extracted_content=extracted_content,
-            success=True,
-            error_message="",
-        )
+        All pages of the crawler share one ``LinkPreview``: one HTTP client,
+        and a head is fetched once however many pages link to it.
+
+        Returns:
+            dict: The links with head data, or unchanged if extraction failed.
+        """
+        if self.link_preview is None:
+            self.link_preview = LinkPreview(self.logger)
+        try:
+            return await self.link_preview.preview_links(links, config)
+        except Exception as e:
+            self.logger.error(
+                message="Error during link head extraction: {error}",
+                tag="LINK_EXTRACT",
+                params={"error": str(e)},
+            )
+            return links
 
     async def arun_many(
         self,
-        urls: List[str],
+        urls: Union[List[str], Iterable[str], AsyncIterable[str]],
         config: Optional[Union[CrawlerRunConfig, List[CrawlerRunConfig]]] = None,
         dispatcher: Optional[BaseDispatcher] = None,
         # Legacy parameters maintained for backwards compatibility
@@ -673,7 +951,10 @@ class AsyncWebCrawler:
         Runs the crawler for multiple URLs concurrently using a configurable dispatcher strategy.
 
         Args:
-        urls: List of URLs to crawl
+        urls: URLs to crawl. A list, or any sync/async iterable; iterables are
+            consumed lazily by the dispatcher, a few slots ahead of the crawl,
+            so they may be unbounded (their cache hits are served by arun
+            instead of the bulk prefetch)
         config: Configuration object(s) controlling crawl behavior. Can be:
             - Single CrawlerRunConfig: Used for all URLs
             - List[CrawlerRunConfig]: Configs with url_matcher for URL-specific settings
@@ -682,7 +963,9 @@ class AsyncWebCrawler:
 
         Returns:
         Union[List[CrawlResult], AsyncGenerator[CrawlResult, None]]:
-            Either a list of all results or an async generator yielding results
+            Either a list of all results or an async generator yielding results.
+            With a list or tuple of URLs, a batch keeps cache hits in input order
+            among the crawled results; a stream yields cache hits first.
 
         Examples:
 
@@ -724,6 +1007,17 @@ class AsyncWebCrawler:
                 ),
             )
 
+        # Serve cache hits in bulk so they never occupy a dispatcher slot.
+        # Lazy inputs are left to the dispatcher so they are never materialized.
+        # Hits are kept by input index so batch results stay in input order.
+        input_urls = urls
+        if isinstance(urls, (list, tuple)):
+            cached_results, urls, prefetched = await self._aprefetch_cached(
+                urls, config, dispatcher
+            )
+        else:
+            cached_results, prefetched = {}, None
+
         def transform_result(task_result):
             return (
                 setattr(
@@ -750,15 +1044,148 @@ class AsyncWebCrawler:
         if stream:
 
             async def result_transformer():
-                async for task_result in dispatcher.run_urls_stream(
-                    crawler=self, urls=urls, config=config
-                ):
-                    yield transform_result(task_result)
+                for cached_result in cached_results.values():
+                    yield cached_result
+                if isinstance(urls, list) and not urls:
+                    return
+                # Runs in the consumer's context: restore it between batches
+                previous = _prefetched_entries.get()
+                _prefetched_entries.set(prefetched)
+                try:
+                    async for task_result in dispatcher.run_urls_stream(
+                        crawler=self, urls=urls, config=config
+                    ):
+                        yield transform_result(task_result)
+                finally:
+                    _prefetched_entries.set(previous)
 
             return result_transformer()
         else:
-            _results = await dispatcher.run_urls(crawler=self, urls=urls, config=config)
-            return [transform_result(res) for res in _results]
+            if isinstance(urls, list) and not urls:
+                return list(cached_results.values())
+            token = _prefetched_entries.set(prefetched)
+            try:
+                _results = await dispatcher.run_urls(crawler=self, urls=urls, config=config)
+            finally:
+                _prefetched_entries.reset(token)
+            if not cached_results:
+                return [transform_result(res) for res in _results]
+            return self._merge_in_input_order(
+                input_urls, cached_results, [(res.url, transform_result(res)) for res in _results]
+            )
+
+    @staticmethod
+    def _merge_in_input_order(
+        urls: List[str],
+        cached_results: Dict[int, CrawlResult],
+        crawled: List[Tuple[str, CrawlResult]],
+    ) -> List[CrawlResult]:
+        """
+        Put cache hits and crawled results back in the order of `urls`.
+
+        Hits carry their input index. Crawled results take the first free
+        position of their URL, whatever order the dispatcher finished them in.
+        """
+        results: List[Optional[CrawlResult]] = [None] * len(urls)
+        for index, result in cached_results.items():
+            results[index] = result
+        free: Dict[str, deque] = {}
+        for index, url in enumerate(urls):
+            if results[index] is None:
+                free.setdefault(url, deque()).append(index)
+        unplaced = []
+        for url, result in crawled:
+            slots = free.get(url)
+            if slots:
+                results[slots.popleft()] = result
+            else:
+                unplaced.append(result)
+        # Anything the dispatcher reported under another URL fills the gaps
+        for index, result in enumerate(results):
+            if result is None and unplaced:
+                results[index] = unplaced.pop(0)
+        return [result for result in results if result is not None] + unplaced
+
+    async def _aprefetch_cached(
+        self,
+        urls: List[str],
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+        dispatcher: BaseDispatcher,
+    ) -> Tuple[Dict[int, CrawlResult], List[str], Dict[str, Optional[CacheEntry]]]:
+        """
+        Look up every cacheable URL of an arun_many batch in one bulk query.
+
+        Applies the same rules as arun's cache path (cache mode, freshness,
+        missing screenshot/pdf forces a refetch) and skips deep-crawl configs,
+        which must go through arun. Misses are accounted by arun itself.
+
+        Returns:
+            Tuple of (cached results ready to return keyed by their index in
+            `urls`, URLs left to crawl, the entries looked up for those URLs
+            with None for a miss, which arun uses instead of querying again).
+        """
+        candidates = {}
+        for url in urls:
+            selected_config = dispatcher.select_config(url, config)
+            if selected_config is None or selected_config.deep_crawl_strategy:
+                continue
+            cache_mode = selected_config.cache_mode or CacheMode.ENABLED
+            if CacheContext(url, cache_mode).should_read():
+                candidates[url] = selected_config
+
+        if not candidates:
+            return {}, list(urls), {}
+
+        cached = await async_db_manager.aget_cache_entries(list(candidates))
+
+        cached_results: Dict[int, CrawlResult] = {}
+        remaining: List[str] = []
+        prefetched: Dict[str, Optional[CacheEntry]] = {}
+        now = time.time()
+        for index, url in enumerate(urls):
+            selected_config = candidates.get(url)
+            cache_entry = cached.get(url)
+            cached_result = (
+                cache_entry.result
+                if cache_entry
+                and cache_entry.is_fresh(
+                    selected_config.cache_max_age, selected_config.respect_cache_headers
+                )
+                else None
+            )
+            if (
+                cached_result is None
+                or not cached_result.has_content("html")
+                or (selected_config.screenshot and not cached_result.has_content("screenshot"))
+                or (selected_config.pdf and not cached_result.pdf)
+            ):
+                remaining.append(url)
+                if selected_config is not None:
+                    prefetched[url] = cache_entry
+                continue
+
+            async_db_manager.record_access(url, hit=True)
+            # Each occurrence gets its own copy, as arun would return
+            result = cached_result.model_copy()
+            result.success = True
+            result.session_id = getattr(selected_config, "session_id", None)
+            result.redirected_url = result.redirected_url or url
+            result.dispatch_result = DispatchResult(
+                task_id=str(uuid.uuid4()),
+                memory_usage=0.0,
+                peak_memory=0.0,
+                start_time=now,
+                end_time=now,
+            )
+            cached_results[index] = result
+
+        if cached_results:
+            self.logger.info(
+                message="Served {count} of {total} URLs from cache",
+                tag="FETCH",
+                params={"count": len(cached_results), "total": len(urls)},
+            )
+        return cached_results, remaining, prefetched
 
     async def aseed_urls(
         self,
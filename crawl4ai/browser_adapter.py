@@ -284,6 +284,8 @@ class UndetectedAdapter(BrowserAdapter):
         # For undetected browser, we don't have event listeners to remove
         # but we should retrieve any final messages
         final_messages = await self.retrieve_console_messages(page)
+        # A pooled page loses its init scripts when it is reset
+        self._console_script_injected.pop(page, None)
         return final_messages
     
     def get_imports(self) -> tuple:
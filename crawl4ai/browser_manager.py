@@ -1,6 +1,8 @@
 import asyncio
 import time
-from typing import List, Optional
+from collections import OrderedDict, deque
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional
 import os
 import sys
 import shutil
@@ -12,7 +14,13 @@ import shlex
 from playwright.async_api import BrowserContext
 import hashlib
 from .js_snippet import load_js_script
-from .config import DOWNLOAD_PAGE_TIMEOUT
+from .config import (
+    DOWNLOAD_PAGE_TIMEOUT,
+    PAGE_POOL_MAX_USES,
+    PAGE_RESET_TIMEOUT,
+    CONTEXT_CACHE_SIZE,
+    CONTEXT_IDLE_TTL,
+)
 from .async_configs import BrowserConfig, CrawlerRunConfig
 from .utils import get_chromium_path
 
@@ -554,6 +562,360 @@ async def clone_runtime_state(
     return dst
 
 
+@dataclass
+class PagePoolStats:
+    hits: int = 0  # crawls served by a warm page
+    misses: int = 0  # crawls that had to open a page
+    resets: int = 0
+    recycled: int = 0  # closed after max_uses crawls
+    discarded: int = 0  # closed because crashed, unresettable or surplus
+
+
+class _PooledPage:
+    __slots__ = ("page", "uses", "crashed", "viewport", "listeners", "init_scripts", "headers_set", "dirty")
+
+    def __init__(self, page):
+        self.page = page
+        self.uses = 0
+        self.crashed = False
+        self.viewport = page.viewport_size
+        self.listeners = {}
+        self.init_scripts = []
+        self.headers_set = False
+        self.dirty = False
+
+
+class PagePool:
+    """
+    Warm pages of one browser context, lent to one crawl at a time.
+
+    Opening a page costs a renderer and closing it a teardown, so instead of
+    ``new_page()``/``close()`` per crawl a returned page is reset in the
+    background and lent again:
+
+    - listeners added since the page was opened are removed,
+    - page routes, init scripts and extra headers are dropped,
+    - it navigates to about:blank (which also proves the renderer is alive),
+    - its viewport is restored.
+
+    A page that crashed, closed, cannot be reset within ``reset_timeout`` ms,
+    or has served ``max_uses`` crawls is closed instead. At most ``max_size``
+    pages are kept idle.
+
+    Args:
+        context: The BrowserContext pages are opened in.
+        max_size: Idle pages kept.
+        max_uses: Crawls a page serves before it is replaced.
+        reset_timeout: Milliseconds a reset may take.
+    """
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        max_size: int,
+        max_uses: int = PAGE_POOL_MAX_USES,
+        reset_timeout: float = PAGE_RESET_TIMEOUT,
+    ):
+        self.context = context
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.reset_timeout = reset_timeout
+        self.stats = PagePoolStats()
+        self._idle = deque()
+        self._leased: Dict[object, _PooledPage] = {}
+        self._resetting = set()
+        self._closed = False
+
+    async def acquire(self):
+        """A page for one crawl, warm if one is idle"""
+        while self._idle:
+            entry = self._idle.pop()  # most recently used first
+            if entry.crashed or entry.page.is_closed():
+                self.stats.discarded += 1
+                continue
+            self.stats.hits += 1
+            return self._lend(entry)
+
+        self.stats.misses += 1
+        entry = _PooledPage(await self.context.new_page())
+        self._track(entry)
+        return self._lend(entry)
+
+    def _lend(self, entry: _PooledPage):
+        entry.uses += 1
+        self._leased[entry.page] = entry
+        return entry.page
+
+    def _track(self, entry: _PooledPage):
+        """Record what a fresh page looks like, so a reset can return to it"""
+        page = entry.page
+
+        def on_crash(_):
+            entry.crashed = True
+
+        page.on("crash", on_crash)
+        emitter = page._impl_obj
+        entry.listeners = {event: list(emitter.listeners(event)) for event in emitter.event_names()}
+
+        # Init scripts and page headers cannot be listed later, so note them
+        # as they are added
+        add_init_script = page.add_init_script
+        set_extra_http_headers = page.set_extra_http_headers
+
+        async def tracked_add_init_script(*args, **kwargs):
+            disposable = await add_init_script(*args, **kwargs)
+            if hasattr(disposable, "dispose"):
+                entry.init_scripts.append(disposable)
+            else:  # Playwright versions whose init scripts cannot be removed
+                entry.dirty = True
+            return disposable
+
+        async def tracked_set_extra_http_headers(headers):
+            entry.headers_set = True
+            return await set_extra_http_headers(headers)
+
+        page.add_init_script = tracked_add_init_script
+        page.set_extra_http_headers = tracked_set_extra_http_headers
+
+    def owns(self, page) -> bool:
+        return page in self._leased
+
+    def release(self, page) -> bool:
+        """
+        Take a page back after its crawl. It is reset in the background.
+
+        Returns:
+            bool: False if the page was not lent by this pool.
+        """
+        entry = self._leased.pop(page, None)
+        if entry is None:
+            return False
+        task = asyncio.create_task(self._recycle(entry))
+        self._resetting.add(task)
+        task.add_done_callback(self._resetting.discard)
+        return True
+
+    async def _recycle(self, entry: _PooledPage):
+        page = entry.page
+        if entry.uses >= self.max_uses:
+            self.stats.recycled += 1
+        elif self._closed or entry.crashed or entry.dirty or page.is_closed() or len(self._idle) >= self.max_size:
+            self.stats.discarded += 1
+        else:
+            try:
+                await asyncio.wait_for(self._reset(entry), self.reset_timeout / 1000)
+            except Exception:
+                self.stats.discarded += 1
+            else:
+                self.stats.resets += 1
+                # Resets overlap, so the pool may have filled up meanwhile
+                if not (self._closed or entry.crashed) and len(self._idle) < self.max_size:
+                    self._idle.append(entry)
+                    return
+                self.stats.discarded += 1
+        try:
+            await page.close()
+        except Exception:
+            pass  # already gone with its context or browser
+
+    async def _reset(self, entry: _PooledPage):
+        page = entry.page
+        emitter = page._impl_obj
+        for event in list(emitter.event_names()):
+            keep = entry.listeners.get(event, ())
+            for listener in emitter.listeners(event):
+                if listener not in keep:
+                    emitter.remove_listener(event, listener)
+        if emitter._routes:
+            await page.unroute_all(behavior="ignoreErrors")
+        while entry.init_scripts:
+            await entry.init_scripts.pop().dispose()
+        if entry.headers_set:
+            await page.set_extra_http_headers({})
+            entry.headers_set = False
+        await page.goto("about:blank")
+        if entry.viewport and page.viewport_size != entry.viewport:
+            await page.set_viewport_size(entry.viewport)
+
+    def get_stats(self) -> Dict[str, float]:
+        stats = asdict(self.stats)
+        lent = self.stats.hits + self.stats.misses
+        stats["hit_rate"] = self.stats.hits / lent if lent else 0.0
+        stats["idle"] = len(self._idle)
+        stats["leased"] = len(self._leased)
+        return stats
+
+    async def close(self):
+        """Close the idle pages; pages still lent are closed when returned"""
+        self._closed = True
+        if self._resetting:
+            await asyncio.gather(*self._resetting, return_exceptions=True)
+        while self._idle:
+            try:
+                await self._idle.pop().page.close()
+            except Exception:
+                pass
+
+
+@dataclass
+class ContextCacheStats:
+    hits: int = 0  # crawls that found their context open
+    misses: int = 0  # crawls that had to create one
+    evicted: int = 0  # retired to stay within max_size
+    expired: int = 0  # retired after idle_ttl seconds unused
+
+
+class _CachedContext:
+    __slots__ = ("signature", "context", "refs", "last_used", "pool", "closed")
+
+    def __init__(self, signature: str, context: BrowserContext):
+        self.signature = signature
+        self.context = context
+        self.refs = 0
+        self.last_used = time.monotonic()
+        self.pool: Optional[PagePool] = None
+        self.closed = False
+
+
+class ContextCache:
+    """
+    Browser contexts keyed by config signature, bounded and evicted least
+    recently used first.
+
+    Every page opened in a context holds a reference to it until the page is
+    handed back or closed. When the cache grows past ``max_size`` the least
+    recently used context (an idle one if there is any) is retired: later
+    crawls with its signature get a fresh context, and the retired one is
+    closed, together with its page pool, as soon as its last page is done.
+    Contexts unused for ``idle_ttl`` seconds are retired the same way. A
+    context closed from outside is dropped from the cache.
+
+    Args:
+        max_size: Contexts kept open at once, 0 for no limit.
+        idle_ttl: Seconds an unused context is kept, 0 to keep it forever.
+        logger: Logger for errors while closing contexts.
+    """
+
+    def __init__(self, max_size: int = CONTEXT_CACHE_SIZE, idle_ttl: float = CONTEXT_IDLE_TTL, logger=None):
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self.logger = logger
+        self.stats = ContextCacheStats()
+        self._entries: "OrderedDict[str, _CachedContext]" = OrderedDict()
+        self._retired = set()
+        self._closing = set()
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def entries(self) -> List[_CachedContext]:
+        """Open contexts, least recently used first"""
+        return list(self._entries.values())
+
+    async def acquire(self, signature: str, create) -> _CachedContext:
+        """
+        Take a reference to the context for `signature`, creating it with the
+        `create` coroutine function if it is not open. Hand it back with release().
+        """
+        async with self._lock:
+            self._expire()
+            entry = self._entries.get(signature)
+            if entry is not None:
+                self._entries.move_to_end(signature)
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+                entry = _CachedContext(signature, await create())
+                entry.context.once("close", lambda _: self._on_closed(entry))
+                self._entries[signature] = entry
+            entry.refs += 1
+            entry.last_used = time.monotonic()
+            self._evict()
+            return entry
+
+    def release(self, entry: _CachedContext):
+        """Drop a reference; a retired context closes with its last one"""
+        entry.refs -= 1
+        entry.last_used = time.monotonic()
+        if entry.refs <= 0 and entry in self._retired:
+            self._retired.discard(entry)
+            self._spawn(self._close(entry))
+
+    def _expire(self):
+        if self.idle_ttl <= 0:
+            return
+        cutoff = time.monotonic() - self.idle_ttl
+        for entry in [e for e in self._entries.values() if e.refs <= 0 and e.last_used < cutoff]:
+            self.stats.expired += 1
+            self._retire(entry)
+
+    def _evict(self):
+        while self.max_size > 0 and len(self._entries) > self.max_size:
+            # Prefer a context nobody is using; otherwise the oldest one is
+            # retired and closes once its pages drain
+            victim = next((e for e in self._entries.values() if e.refs <= 0), None)
+            self.stats.evicted += 1
+            self._retire(victim or next(iter(self._entries.values())))
+
+    def _retire(self, entry: _CachedContext):
+        del self._entries[entry.signature]
+        if entry.refs <= 0:
+            self._spawn(self._close(entry))
+        else:
+            self._retired.add(entry)
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close(self, entry: _CachedContext):
+        if entry.closed:
+            return
+        entry.closed = True
+        if entry.pool is not None:
+            await entry.pool.close()
+        try:
+            await entry.context.close()
+        except Exception as e:
+            if self.logger:
+                self.logger.error(
+                    message="Error closing context: {error}",
+                    tag="ERROR",
+                    params={"error": str(e)},
+                )
+
+    def _on_closed(self, entry: _CachedContext):
+        """The context was closed, by us or from outside (e.g. kill_session)"""
+        if entry.closed:
+            return
+        entry.closed = True
+        if self._entries.get(entry.signature) is entry:
+            del self._entries[entry.signature]
+        self._retired.discard(entry)
+        if entry.pool is not None:
+            self._spawn(entry.pool.close())
+
+    def get_stats(self) -> Dict[str, float]:
+        stats = asdict(self.stats)
+        lookups = self.stats.hits + self.stats.misses
+        stats["hit_rate"] = self.stats.hits / lookups if lookups else 0.0
+        stats["open"] = len(self._entries)
+        stats["retired"] = len(self._retired)
+        stats["in_use"] = sum(entry.refs for entry in self._entries.values())
+        return stats
+
+    async def close(self):
+        """Close every context, including retired ones still in use"""
+        entries = list(self._entries.values()) + list(self._retired)
+        self._entries.clear()
+        self._retired.clear()
+        for entry in entries:
+            await self._close(entry)
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
 
 class BrowserManager:
     """
@@ -568,6 +930,9 @@ class BrowserManager:
         playwright (Playwright): The Playwright instance
         sessions (dict): Dictionary to store session information
         session_ttl (int): Session timeout in seconds
+        context_cache (ContextCache): Open contexts by config signature, with their page pools
+        contexts_by_config (dict): Open contexts by config signature
+        page_pools (dict): PagePool per context signature, for crawls without a session
     """
 
     _playwright_instance = None
@@ -604,9 +969,17 @@ class BrowserManager:
         self.sessions = {}
         self.session_ttl = 1800  # 30 minutes
 
-        # Keep track of contexts by a "config signature," so each unique config reuses a single context
-        self.contexts_by_config = {}
-        self._contexts_lock = asyncio.Lock()
+        # Keep track of contexts by a "config signature," so each unique config reuses a single context.
+        # The cache is bounded; each page holds its context open until it is returned or closed.
+        self.context_cache = ContextCache(
+            max_size=self.config.context_cache_size,
+            idle_ttl=self.config.context_idle_ttl,
+            logger=self.logger,
+        )
+        self._page_contexts: Dict[object, _CachedContext] = {}
+
+        # The pool each lent page came from
+        self._page_owners: Dict[object, PagePool] = {}
         
         # Serialize context.new_page() across concurrent tasks to avoid races
         # when using a shared persistent context (context.pages may be empty
@@ -971,41 +1344,38 @@ class BrowserManager:
                 await context.route(f"**/*.{ext}", lambda route: route.abort())
         return context
 
+    # CrawlerRunConfig fields that shape a browser context: read by
+    # create_browser_context and setup_context, or (user agent) applied to the
+    # browser config by the crawler strategy right before get_page
+    _CONTEXT_CONFIG_FIELDS = (
+        "proxy_config",
+        "locale",
+        "timezone_id",
+        "geolocation",
+        "override_navigator",
+        "simulate_user",
+        "magic",
+        "user_agent",
+        "user_agent_mode",
+        "user_agent_generator_config",
+    )
+
     def _make_config_signature(self, crawlerRunConfig: CrawlerRunConfig) -> str:
         """
-        Converts the crawlerRunConfig into a dict, excludes ephemeral fields,
-        then returns a hash of the sorted JSON. This yields a stable signature
-        that identifies configurations requiring a unique browser context.
+        Returns a hash of the crawlerRunConfig fields that affect browser-level
+        setup. Configs that differ only in per-crawl settings (extraction, wait
+        conditions, js_code, ...) share a context, and only these few fields are
+        read instead of serializing the whole config on every get_page.
         """
-        import json
-
-        config_dict = crawlerRunConfig.__dict__.copy()
-        # Exclude items that do not affect browser-level setup.
-        # Expand or adjust as needed, e.g. chunking_strategy is purely for data extraction, not for browser config.
-        ephemeral_keys = [
-            "session_id",
-            "js_code",
-            "scraping_strategy",
-            "extraction_strategy",
-            "chunking_strategy",
-            "cache_mode",
-            "content_filter",
-            "semaphore_count",
-            "url"
-        ]
-        
-        # Do NOT exclude locale, timezone_id, or geolocation as these DO affect browser context
-        # and should cause a new context to be created if they change
-        
-        for key in ephemeral_keys:
-            if key in config_dict:
-                del config_dict[key]
-        # Convert to canonical JSON string
-        signature_json = json.dumps(config_dict, sort_keys=True, default=str)
-
-        # Hash the JSON so we get a compact, unique string
-        signature_hash = hashlib.sha256(signature_json.encode("utf-8")).hexdigest()
-        return signature_hash
+        values = []
+        for key in self._CONTEXT_CONFIG_FIELDS:
+            value = getattr(crawlerRunConfig, key, None)
+            if isinstance(value, dict):
+                value = sorted(value.items())
+            elif hasattr(value, "__dict__"):  # ProxyConfig, GeolocationConfig
+                value = sorted(vars(value).items())
+            values.append(value)
+        return hashlib.sha256(repr(values).encode("utf-8")).hexdigest()
 
     async def get_page(self, crawlerRunConfig: CrawlerRunConfig):
         """
@@ -1056,17 +1426,34 @@ class BrowserManager:
             # Otherwise, check if we have an existing context for this config
             config_signature = self._make_config_signature(crawlerRunConfig)
 
-            async with self._contexts_lock:
-                if config_signature in self.contexts_by_config:
-                    context = self.contexts_by_config[config_signature]
+            async def create_context():
+                context = await self.create_browser_context(crawlerRunConfig)
+                await self.setup_context(context, crawlerRunConfig)
+                return context
+
+            entry = await self.context_cache.acquire(config_signature, create_context)
+            context = entry.context
+            try:
+                if crawlerRunConfig.session_id or self.config.page_pool_size <= 0:
+                    # Create a new page from the chosen context
+                    page = await context.new_page()
                 else:
-                    # Create and setup a new context
-                    context = await self.create_browser_context(crawlerRunConfig)
-                    await self.setup_context(context, crawlerRunConfig)
-                    self.contexts_by_config[config_signature] = context
+                    # Borrow a warm page; the crawler hands it back with release_page
+                    if entry.pool is None:
+                        entry.pool = PagePool(
+                            context,
+                            max_size=self.config.page_pool_size,
+                            max_uses=self.config.page_pool_max_uses,
+                        )
+                    page = await entry.pool.acquire()
+                    self._page_owners[page] = entry.pool
+            except Exception:
+                self.context_cache.release(entry)
+                raise
 
-            # Create a new page from the chosen context
-            page = await context.new_page()
+            # The page keeps its context from being evicted until it is returned or closed
+            self._page_contexts[page] = entry
+            page.once("close", lambda _: self._release_context(page))
 
         # If a session_id is specified, store this session so we can reuse later
         if crawlerRunConfig.session_id:
@@ -1074,6 +1461,55 @@ class BrowserManager:
 
         return page, context
 
+    def is_pooled(self, page) -> bool:
+        """Whether `page` was lent by a page pool and must go back through release_page"""
+        return page in self._page_owners
+
+    async def release_page(self, page) -> bool:
+        """
+        Return a pooled page after its crawl, to be reset and reused.
+
+        Returns:
+            bool: False if the page is not pooled (the caller should close it).
+        """
+        pool = self._page_owners.pop(page, None)
+        released = pool is not None and pool.release(page)
+        self._release_context(page)
+        return released
+
+    def _release_context(self, page):
+        entry = self._page_contexts.pop(page, None)
+        if entry is not None:
+            self.context_cache.release(entry)
+
+    @property
+    def contexts_by_config(self) -> Dict[str, BrowserContext]:
+        """Open contexts by config signature, least recently used first"""
+        return {entry.signature: entry.context for entry in self.context_cache.entries()}
+
+    @property
+    def page_pools(self) -> Dict[str, PagePool]:
+        """Page pools of the open contexts by config signature"""
+        return {
+            entry.signature: entry.pool
+            for entry in self.context_cache.entries()
+            if entry.pool is not None
+        }
+
+    def get_context_cache_stats(self) -> Dict[str, float]:
+        """Context cache counters: hits, misses, evicted and expired contexts, hit rate"""
+        return self.context_cache.get_stats()
+
+    def get_page_pool_stats(self) -> Dict[str, float]:
+        """Page pool counters summed over all contexts, with the overall hit rate"""
+        totals = {}
+        for pool in self.page_pools.values():
+            for key, value in pool.get_stats().items():
+                totals[key] = totals.get(key, 0) + value
+        lent = totals.get("hits", 0) + totals.get("misses", 0)
+        totals["hit_rate"] = totals.get("hits", 0) / lent if lent else 0.0
+        return totals
+
     async def kill_session(self, session_id: str):
         """
         Kill a browser session and clean up resources.
@@ -1111,17 +1547,10 @@ class BrowserManager:
         for session_id in session_ids:
             await self.kill_session(session_id)
 
-        # Now close all contexts we created. This reclaims memory from ephemeral contexts.
-        for ctx in self.contexts_by_config.values():
-            try:
-                await ctx.close()
-            except Exception as e:
-                self.logger.error(
-                    message="Error closing context: {error}",
-                    tag="ERROR",
-                    params={"error": str(e)}
-                )
-        self.contexts_by_config.clear()
+        # Now close all contexts we created, with their page pools. This reclaims memory from ephemeral contexts.
+        await self.context_cache.close()
+        self._page_owners.clear()
+        self._page_contexts.clear()
 
         if self.browser:
             await self.browser.close()
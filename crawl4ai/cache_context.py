@@ -1,4 +1,6 @@
 from enum import Enum
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
 
 
 class CacheMode(Enum):
@@ -92,6 +94,55 @@ class CacheContext:
         return self._url_display
 
 
+def parse_cache_headers(headers: Optional[Dict[str, str]], now: float) -> Dict:
+    """
+    Extract freshness information and validators from HTTP response headers.
+
+    Cache-Control ``max-age`` (minus ``Age``) takes precedence over ``Expires``;
+    ``no-cache`` and an unparsable ``Expires`` make the response stale at once.
+
+    Args:
+        headers (dict): Response headers, any key case.
+        now (float): Time the response was received (epoch seconds).
+
+    Returns:
+        dict: ``expires_at`` (epoch seconds or None when the server gave no
+        freshness information), ``etag``, ``last_modified`` and ``no_store``.
+    """
+    headers = {k.lower(): v for k, v in (headers or {}).items()}
+    info = {
+        "expires_at": None,
+        "etag": headers.get("etag"),
+        "last_modified": headers.get("last-modified"),
+        "no_store": False,
+    }
+
+    directives = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip().strip('"')
+
+    if "no-store" in directives:
+        info["no_store"] = True
+    if "no-cache" in directives:
+        info["expires_at"] = now
+        return info
+    if "max-age" in directives:
+        try:
+            age = float(headers.get("age", 0) or 0)
+            info["expires_at"] = now + max(0.0, float(directives["max-age"]) - age)
+            return info
+        except ValueError:
+            pass
+    if "expires" in headers:
+        try:
+            info["expires_at"] = parsedate_to_datetime(headers["expires"]).timestamp()
+        except (TypeError, ValueError):
+            info["expires_at"] = now
+    return info
+
+
 def _legacy_to_cache_mode(
     disable_cache: bool = False,
     bypass_cache: bool = False,
@@ -1373,6 +1373,117 @@ def config_set_cmd(key: str, value: str):
         
     console.print(f"[green]Successfully set[/green] [cyan]{key}[/cyan] = [green]{display_value}[/green]")
 
+def parse_size(value: str) -> int:
+    """Parse a size such as "500MB" or "10GB" into bytes"""
+    units = {"": 1, "B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3, "TB": 1024 ** 4}
+    value = value.strip().upper()
+    number = value.rstrip("KMGTB")
+    unit = value[len(number):]
+    if unit not in units:
+        raise click.BadParameter(f"Unknown size unit in '{value}'")
+    try:
+        return int(float(number) * units[unit])
+    except ValueError:
+        raise click.BadParameter(f"Invalid size '{value}'")
+
+def parse_duration(value: str) -> float:
+    """Parse a duration such as "90s", "12h" or "7d" into seconds"""
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+    value = value.strip().lower()
+    unit = value[-1] if value and value[-1] in units else "s"
+    try:
+        return float(value.rstrip("smhdw")) * units[unit]
+    except ValueError:
+        raise click.BadParameter(f"Invalid duration '{value}'")
+
+@cli.group("cache")
+def cache_cmd():
+    """Inspect and maintain the local crawl cache
+    
+    Commands to manage the cache database and content store:
+    - stats: Show entries, size and hit rate
+    - compact: Evict old or least recently used entries and remove orphaned files
+    - clear: Delete all cached entries
+    """
+    pass
+
+async def _run_cache_operation(operation):
+    from crawl4ai.async_database import async_db_manager
+    try:
+        await async_db_manager.initialize()
+        return await operation(async_db_manager)
+    finally:
+        await async_db_manager.cleanup()
+
+@cache_cmd.command("stats")
+def cache_stats_cmd():
+    """Show cache statistics"""
+    from crawl4ai.async_database import DB_PATH
+
+    async def _stats(db):
+        return await db.aget_cache_stats()
+
+    stats = anyio.run(_run_cache_operation, _stats)
+    if not stats:
+        raise click.ClickException("Could not read cache statistics")
+
+    def _age(timestamp):
+        return humanize.naturaltime(time.time() - timestamp) if timestamp else "-"
+
+    table = Table(title="Crawl4AI Cache", show_header=True, header_style="bold cyan", border_style="blue")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green")
+    table.add_row("Entries", str(stats["entries"]))
+    table.add_row("Expired entries", str(stats["expired_entries"]))
+    table.add_row("Content size", humanize.naturalsize(stats["content_size"]))
+    table.add_row("Size on disk", humanize.naturalsize(get_directory_size(os.path.dirname(DB_PATH))))
+    table.add_row("Oldest entry", _age(stats["oldest_entry"]))
+    table.add_row("Newest entry", _age(stats["newest_entry"]))
+    table.add_row("Hits / misses", f"{stats['hits']} / {stats['misses']}")
+    table.add_row("Hit rate", f"{stats['hit_rate']:.1%}")
+    console.print(table)
+
+@cache_cmd.command("compact")
+@click.option("--max-size", help="Keep at most this much content, e.g. 500MB or 10GB")
+@click.option("--max-entries", type=int, help="Keep at most this many entries")
+@click.option("--max-age", help="Remove entries cached longer ago than this, e.g. 12h or 7d")
+@click.option("--gc/--no-gc", default=True, help="Remove content files no longer referenced (default: on)")
+def cache_compact_cmd(max_size: Optional[str], max_entries: Optional[int], max_age: Optional[str], gc: bool):
+    """Evict cache entries and remove orphaned content files"""
+    limits = {
+        "max_size": parse_size(max_size) if max_size else None,
+        "max_entries": max_entries,
+        "max_age": parse_duration(max_age) if max_age else None,
+    }
+
+    async def _compact(db):
+        return await db.aevict(gc=gc, **limits)
+
+    stats = anyio.run(_run_cache_operation, _compact)
+    console.print(f"[green]Expired {stats['expired']} and evicted {stats['evicted']} entries[/green]")
+    if gc:
+        console.print(
+            f"[green]Removed {stats.get('files_removed', 0)} orphaned files "
+            f"({humanize.naturalsize(stats.get('bytes_freed', 0))})[/green]"
+        )
+
+@cache_cmd.command("clear")
+@click.option("--yes", "-y", is_flag=True, help="Do not ask for confirmation")
+def cache_clear_cmd(yes: bool):
+    """Delete all cached entries and their content files"""
+    if not yes and not Confirm.ask("[yellow]Delete all cached entries?[/yellow]"):
+        return
+
+    async def _clear(db):
+        await db.aclear_db()
+        return await db.agc_content(grace_period=0)
+
+    stats = anyio.run(_run_cache_operation, _clear)
+    console.print(
+        f"[green]Cache cleared, removed {stats['files_removed']} files "
+        f"({humanize.naturalsize(stats['bytes_freed'])})[/green]"
+    )
+
 @cli.command("profiles")
 def profiles_cmd():
     """Manage browser profiles interactively
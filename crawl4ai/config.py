@@ -38,6 +38,16 @@ PROVIDER_MODELS_PREFIXES = {
     "deepseek": os.getenv("DEEPSEEK_API_KEY"),
 }
 
+# Shared LLM client (see async_llm.AsyncLLMClient)
+LLM_MAX_CONCURRENCY = 8  # Requests in flight across the process
+LLM_MAX_ATTEMPTS = 3  # Attempts per request when rate limited
+LLM_BACKOFF_BASE_DELAY = 2  # Seconds, doubled on each retry
+LLM_BACKOFF_MAX_DELAY = 60
+# LLM response cache (see llm_cache.LLMResponseCache)
+LLM_CACHE_TTL = 30 * 24 * 3600  # Seconds
+LLM_CACHE_MAX_ENTRIES = 100_000
+LLM_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
 # Chunk token threshold
 CHUNK_TOKEN_THRESHOLD = 2**11  # 2048 tokens
 OVERLAP_RATE = 0.1
@@ -102,6 +112,19 @@ SCREENSHOT_HEIGHT_TRESHOLD = 10000
 PAGE_TIMEOUT = 60000
 DOWNLOAD_PAGE_TIMEOUT = 60000
 
+# Warm pages kept per browser context (0: a new page per crawl, closed afterwards),
+# and crawls a pooled page serves before it is replaced
+PAGE_POOL_SIZE = 0
+PAGE_POOL_MAX_USES = 50
+PAGE_RESET_TIMEOUT = 5000  # ms to reset a page between crawls before giving up on it
+
+# Browser contexts kept open at once (0 for no limit), and seconds an unused one survives
+CONTEXT_CACHE_SIZE = 8
+CONTEXT_IDLE_TTL = 300
+
+# Link head results a crawler keeps in memory for link previews
+LINK_PREVIEW_CACHE_SIZE = 10000
+
 # Global user settings with descriptions and default values
 USER_SETTINGS = {
     "DEFAULT_LLM_PROVIDER": {
@@ -1,6 +1,7 @@
 import inspect
 import re
 import time
+import asyncio
 from bs4 import BeautifulSoup, Tag
 from typing import List, Tuple, Dict, Optional
 from rank_bm25 import BM25Okapi
@@ -9,10 +10,9 @@ from bs4 import NavigableString, Comment
 
 from .utils import (
     clean_tokens,
-    perform_completion_with_backoff,
+    aperform_completion_with_backoff,
     escape_json_string,
     sanitize_html,
-    get_home_folder,
     extract_xml_data,
     merge_chunks,
 )
@@ -23,10 +23,8 @@ import math
 from snowballstemmer import stemmer
 from .models import TokenUsage
 from .prompts import PROMPT_FILTER_CONTENT
-import json
-import hashlib
-from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
+from .async_llm import get_llm_client
+from .cache_context import CacheMode
 from .async_logger import AsyncLogger, LogLevel, LogColor
 
 
@@ -796,6 +794,8 @@ class LLMContentFilter(RelevantContentFilter):
         word_token_rate (float): Word token rate for chunking (default: 0.2).
         verbose (bool): Enable verbose logging (default: False).
         logger (AsyncLogger): Custom logger for LLM operations (optional).
+        ignore_cache (bool): Skip the shared LLM response cache unless
+            llm_config.cache_mode says otherwise (default: True).
     """
     _UNWANTED_PROPS = {
         'provider' : 'Instead, use llm_config=LLMConfig(provider="...")',
@@ -874,11 +874,6 @@ class LLMContentFilter(RelevantContentFilter):
         
         super().__setattr__(name, value)  
         
-    def _get_cache_key(self, html: str, instruction: str) -> str:
-        """Generate a unique cache key based on HTML and instruction"""
-        content = f"{html}{instruction}"
-        return hashlib.md5(content.encode()).hexdigest()
-
     def _merge_chunks(self, text: str) -> List[str]:
         """Split text into chunks with overlap using char or word mode."""
         ov = int(self.chunk_token_threshold * self.overlap_rate)
@@ -891,6 +886,10 @@ class LLMContentFilter(RelevantContentFilter):
         return sections
 
     def filter_content(self, html: str, ignore_cache: bool = True) -> List[str]:
+        """Blocking wrapper around ``afilter_content``; the LLM requests run on the shared LLM client loop"""
+        return get_llm_client().run_sync(self.afilter_content(html, ignore_cache))
+
+    async def afilter_content(self, html: str, ignore_cache: bool = True) -> List[str]:
         if not html or not isinstance(html, str):
             return []
 
@@ -902,32 +901,11 @@ class LLMContentFilter(RelevantContentFilter):
                 colors={"provider": LogColor.CYAN},
             )
 
-        # Cache handling
-        cache_dir = Path(get_home_folder()) / "llm_cache" / "content_filter"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_key = self._get_cache_key(html, self.instruction or "")
-        cache_file = cache_dir / f"{cache_key}.json"
-
-        # if ignore_cache == None:
-        ignore_cache = self.ignore_cache
-
-        if not ignore_cache and cache_file.exists():
-            if self.logger:
-                self.logger.info("Found  cached markdown result", tag="CACHE")
-            try:
-                with cache_file.open("r") as f:
-                    cached_data = json.load(f)
-                    usage = TokenUsage(**cached_data["usage"])
-                    self.usages.append(usage)
-                    self.total_usage.completion_tokens += usage.completion_tokens
-                    self.total_usage.prompt_tokens += usage.prompt_tokens
-                    self.total_usage.total_tokens += usage.total_tokens
-                    return cached_data["blocks"]
-            except Exception as e:
-                if self.logger:
-                    self.logger.error(
-                        f"LLM markdown: Cache read error: {str(e)}", tag="CACHE"
-                    )
+        # Chunk responses go through the shared LLM response cache; an
+        # explicit LLMConfig.cache_mode wins over ignore_cache
+        cache_mode = self.llm_config.cache_mode or (
+            CacheMode.BYPASS if self.ignore_cache else CacheMode.ENABLED
+        )
 
         # Split into chunks
         html_chunks = self._merge_chunks(html)
@@ -941,103 +919,92 @@ class LLMContentFilter(RelevantContentFilter):
 
         start_time = time.time()
 
-        # Process chunks in parallel
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = []
-            for i, chunk in enumerate(html_chunks):
-                if self.logger:
-                    self.logger.debug(
-                        "LLM markdown: Processing chunk {chunk_num}/{total_chunks}",
-                        tag="CHUNK",
-                        params={"chunk_num": i + 1, "total_chunks": len(html_chunks)},
-                    )
+        # Process chunks concurrently; the shared client bounds requests in flight
+        async def _proceed_with_chunk(i: int, chunk: str):
+            prompt_variables = {
+                "HTML": escape_json_string(sanitize_html(chunk)),
+                "REQUEST": self.instruction
+                or "Convert this HTML into clean, relevant markdown, removing any noise or irrelevant content.",
+            }
 
-                prompt_variables = {
-                    "HTML": escape_json_string(sanitize_html(chunk)),
-                    "REQUEST": self.instruction
-                    or "Convert this HTML into clean, relevant markdown, removing any noise or irrelevant content.",
-                }
-
-                prompt = PROMPT_FILTER_CONTENT
-                for var, value in prompt_variables.items():
-                    prompt = prompt.replace("{" + var + "}", value)
-
-                def _proceed_with_chunk(
-                    provider: str,
-                    prompt: str,
-                    api_token: str,
-                    base_url: Optional[str] = None,
-                    extra_args: Dict = {},
-                ) -> List[str]:
-                    if self.logger:
-                        self.logger.info(
-                            "LLM Markdown: Processing chunk {chunk_num}",
-                            tag="CHUNK",
-                            params={"chunk_num": i + 1},
-                        )
-                    return perform_completion_with_backoff(
-                        provider,
-                        prompt,
-                        api_token,
-                        base_url=base_url,
-                        extra_args=extra_args,
-                    )
+            prompt = PROMPT_FILTER_CONTENT
+            for var, value in prompt_variables.items():
+                prompt = prompt.replace("{" + var + "}", value)
 
-                future = executor.submit(
-                    _proceed_with_chunk,
-                    self.llm_config.provider,
-                    prompt,
-                    self.llm_config.api_token,
-                    self.llm_config.base_url,
-                    self.extra_args,
+            if self.logger:
+                self.logger.info(
+                    "LLM Markdown: Processing chunk {chunk_num}",
+                    tag="CHUNK",
+                    params={"chunk_num": i + 1},
                 )
-                futures.append((i, future))
-
-            # Collect results in order
-            ordered_results = []
-            for i, future in sorted(futures):
-                try:
-                    response = future.result()
-
-                    # Track usage
-                    usage = TokenUsage(
-                        completion_tokens=response.usage.completion_tokens,
-                        prompt_tokens=response.usage.prompt_tokens,
-                        total_tokens=response.usage.total_tokens,
-                        completion_tokens_details=(
-                            response.usage.completion_tokens_details.__dict__
-                            if response.usage.completion_tokens_details
-                            else {}
-                        ),
-                        prompt_tokens_details=(
-                            response.usage.prompt_tokens_details.__dict__
-                            if response.usage.prompt_tokens_details
-                            else {}
-                        ),
-                    )
-                    self.usages.append(usage)
-                    self.total_usage.completion_tokens += usage.completion_tokens
-                    self.total_usage.prompt_tokens += usage.prompt_tokens
-                    self.total_usage.total_tokens += usage.total_tokens
-
-                    blocks = extract_xml_data(
-                        ["content"], response.choices[0].message.content
-                    )["content"]
-                    if blocks:
-                        ordered_results.append(blocks)
-                        if self.logger:
-                            self.logger.success(
-                                "LLM markdown: Successfully processed chunk {chunk_num}",
-                                tag="CHUNK",
-                                params={"chunk_num": i + 1},
-                            )
-                except Exception as e:
+            return await aperform_completion_with_backoff(
+                self.llm_config.provider,
+                prompt,
+                self.llm_config.api_token,
+                base_url=self.llm_config.base_url,
+                extra_args=self.extra_args,
+                tokens_per_minute=self.llm_config.tokens_per_minute,
+                cache_mode=cache_mode,
+            )
+
+        if self.logger:
+            for i in range(len(html_chunks)):
+                self.logger.debug(
+                    "LLM markdown: Processing chunk {chunk_num}/{total_chunks}",
+                    tag="CHUNK",
+                    params={"chunk_num": i + 1, "total_chunks": len(html_chunks)},
+                )
+        responses = await asyncio.gather(
+            *(_proceed_with_chunk(i, chunk) for i, chunk in enumerate(html_chunks)),
+            return_exceptions=True,
+        )
+
+        # Collect results in order
+        ordered_results = []
+        for i, response in enumerate(responses):
+            try:
+                if isinstance(response, BaseException):
+                    raise response
+
+                # Track usage
+                usage = TokenUsage(
+                    completion_tokens=response.usage.completion_tokens,
+                    prompt_tokens=response.usage.prompt_tokens,
+                    total_tokens=response.usage.total_tokens,
+                    completion_tokens_details=(
+                        response.usage.completion_tokens_details.__dict__
+                        if response.usage.completion_tokens_details
+                        else {}
+                    ),
+                    prompt_tokens_details=(
+                        response.usage.prompt_tokens_details.__dict__
+                        if response.usage.prompt_tokens_details
+                        else {}
+                    ),
+                )
+                self.usages.append(usage)
+                self.total_usage.completion_tokens += usage.completion_tokens
+                self.total_usage.prompt_tokens += usage.prompt_tokens
+                self.total_usage.total_tokens += usage.total_tokens
+
+                blocks = extract_xml_data(
+                    ["content"], response.choices[0].message.content
+                )["content"]
+                if blocks:
+                    ordered_results.append(blocks)
                     if self.logger:
-                        self.logger.error(
-                            "LLM markdown: Error processing chunk {chunk_num}: {error}",
+                        self.logger.success(
+                            "LLM markdown: Successfully processed chunk {chunk_num}",
                             tag="CHUNK",
-                            params={"chunk_num": i + 1, "error": str(e)},
+                            params={"chunk_num": i + 1},
                         )
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(
+                        "LLM markdown: Error processing chunk {chunk_num}: {error}",
+                        tag="CHUNK",
+                        params={"chunk_num": i + 1, "error": str(e)},
+                    )
 
         end_time = time.time()
         if self.logger:
@@ -1050,13 +1017,6 @@ class LLMContentFilter(RelevantContentFilter):
 
         result = ordered_results if ordered_results else []
 
-        # Cache the final result
-        cache_data = {"blocks": result, "usage": self.total_usage.__dict__}
-        with cache_file.open("w") as f:
-            json.dump(cache_data, f)
-            if self.logger:
-                self.logger.info("Cached results for future use", tag="CACHE")
-
         return result
 
     def show_usage(self) -> None:
@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from bs4 import BeautifulSoup
 import asyncio
+import concurrent.futures
+from types import SimpleNamespace
 import requests
 from .config import (
     MIN_WORD_THRESHOLD,
@@ -196,7 +198,49 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
         Returns:
             ScrapingResult: A structured result containing the scraped content.
         """
-        return await asyncio.to_thread(self.scrap, url, html, **kwargs)
+        # Link previews are network I/O: await them here rather than in the thread
+        link_preview_config = kwargs.pop("link_preview_config", None)
+        result = await asyncio.to_thread(self.scrap, url, html, **kwargs)
+        if link_preview_config is not None:
+            from .link_preview import LinkPreview
+
+            config = SimpleNamespace(
+                link_preview_config=link_preview_config,
+                score_links=kwargs.get("score_links", False),
+            )
+            try:
+                async with LinkPreview(self.logger) as extractor:
+                    result.links = await extractor.extract_link_heads(result.links, config)
+            except Exception as e:
+                self._log("error", f"Error during link head extraction: {str(e)}", tag="LINK_EXTRACT")
+        return result
+
+    def _preview_links_blocking(self, links: Dict[str, Any], link_preview_config, score_links: bool) -> Dict[str, Any]:
+        """
+        Link previews for callers of the synchronous scrap(). The crawler does
+        not come through here: it previews links on its own event loop with a
+        LinkPreview shared by all its pages (AsyncWebCrawler.aprocess_html).
+        """
+        from .link_preview import LinkPreview
+
+        config = SimpleNamespace(link_preview_config=link_preview_config, score_links=score_links)
+
+        async def preview():
+            async with LinkPreview(self.logger) as extractor:
+                return await extractor.preview_links(links, config)
+
+        try:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(preview())
+            # Called from inside an event loop: it cannot be blocked on, use a thread
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(asyncio.run, preview()).result()
+        except Exception as e:
+            self._log("error", f"Error during link head extraction: {str(e)}", tag="LINK_EXTRACT")
+            # Continue with original links if head extraction fails
+            return links
 
     def process_element(self, url, element: lhtml.HtmlElement, **kwargs) -> Dict[str, Any]:
         """
@@ -600,8 +644,13 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
             return None
 
         success = True
+        # Parsed document shared with the other processing stages, if any
+        html_document = kwargs.pop("html_document", None)
         try:
-            doc = lhtml.document_fromstring(html)
+            if html_document is not None and html_document.html is html:
+                doc = html_document.mutable_tree()
+            else:
+                doc = lhtml.document_fromstring(html)
             # Match BeautifulSoup's behavior of using body or full doc
             # body = doc.xpath('//body')[0] if doc.xpath('//body') else doc
             body = doc
@@ -782,68 +831,9 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
             # Extract head content for links if configured
             link_preview_config = kwargs.get("link_preview_config")
             if link_preview_config is not None:
-                try:
-                    import asyncio
-                    from .link_preview import LinkPreview
-                    from .models import Links, Link
-                    
-                    verbose = link_preview_config.verbose
-                    
-                    if verbose:
-                        self._log("info", "Starting link head extraction for {internal} internal and {external} external links",
-                                  params={"internal": len(links["internal"]), "external": len(links["external"])}, tag="LINK_EXTRACT")
-                    
-                    # Convert dict links to Link objects
-                    internal_links = [Link(**link_data) for link_data in links["internal"]]
-                    external_links = [Link(**link_data) for link_data in links["external"]]
-                    links_obj = Links(internal=internal_links, external=external_links)
-                    
-                    # Create a config object for LinkPreview
-                    class TempCrawlerRunConfig:
-                        def __init__(self, link_config, score_links):
-                            self.link_preview_config = link_config
-                            self.score_links = score_links
-                    
-                    config = TempCrawlerRunConfig(link_preview_config, kwargs.get("score_links", False))
-                    
-                    # Extract head content (run async operation in sync context)
-                    async def extract_links():
-                        async with LinkPreview(self.logger) as extractor:
-                            return await extractor.extract_link_heads(links_obj, config)
-                    
-                    # Run the async operation
-                    try:
-                        # Check if we're already in an async context
-                        loop = asyncio.get_running_loop()
-                        # If we're in an async context, we need to run in a thread
-                        import concurrent.futures
-                        with concurrent.futures.ThreadPoolExecutor() as executor:
-                            future = executor.submit(asyncio.run, extract_links())
-                            updated_links = future.result()
-                    except RuntimeError:
-                        # No running loop, we can use asyncio.run directly
-                        updated_links = asyncio.run(extract_links())
-                    
-                    # Convert back to dict format
-                    links["internal"] = [link.dict() for link in updated_links.internal]
-                    links["external"] = [link.dict() for link in updated_links.external]
-                    
-                    if verbose:
-                        successful_internal = len([l for l in updated_links.internal if l.head_extraction_status == "valid"])
-                        successful_external = len([l for l in updated_links.external if l.head_extraction_status == "valid"])
-                        self._log("info", "Link head extraction completed: {internal_success}/{internal_total} internal, {external_success}/{external_total} external",
-                                  params={
-                                      "internal_success": successful_internal,
-                                      "internal_total": len(updated_links.internal),
-                                      "external_success": successful_external,
-                                      "external_total": len(updated_links.external)
-                                  }, tag="LINK_EXTRACT")
-                    else:
-                        self._log("info", "Link head extraction completed successfully", tag="LINK_EXTRACT")
-                        
-                except Exception as e:
-                    self._log("error", f"Error during link head extraction: {str(e)}", tag="LINK_EXTRACT")
-                    # Continue with original links if head extraction fails
+                links = self._preview_links_blocking(
+                    links, link_preview_config, kwargs.get("score_links", False)
+                )
             
             return {
                 "cleaned_html": cleaned_html,
@@ -0,0 +1,291 @@
+import os
+import re
+import gzip
+import time
+import uuid
+import asyncio
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from .utils import ensure_content_dirs, generate_content_hash
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+
+class ContentStore:
+    """
+    Content-addressed, compressed blob store backing the crawl cache.
+
+    Each blob is keyed by the xxhash of its uncompressed text, so identical
+    content is stored once. The reference returned by ``store`` is what goes
+    into the ``crawled_data`` row and fully describes how to read the blob:
+
+    - ``<hash>``                      legacy uncompressed file
+    - ``<hash>.zst`` / ``<hash>.gz``  compressed file
+    - ``<hash>.zst@<segment>:<offset>:<length>``  blob packed into a segment file
+
+    Packing (``pack_threshold > 0``) appends compressed blobs smaller than the
+    threshold to per-process segment files under ``<content dir>/segments``
+    instead of creating one file each.
+
+    Args:
+        base_path: Directory holding the content directories (next to the db).
+        compression: "zstd", "gzip", "none" or "auto" (zstd if installed, else gzip).
+        compression_level: Codec level; None uses the codec default.
+        pack_threshold: Compressed size in bytes under which blobs are packed.
+            0 disables packing.
+        segment_max_bytes: Size at which a segment file is rotated.
+    """
+
+    EXTENSIONS = {"zstd": ".zst", "gzip": ".gz", "none": ""}
+    BLOB_NAME = re.compile(r"^[0-9a-f]{16}(\.(zst|gz))?$")
+
+    def __init__(
+        self,
+        base_path: str,
+        compression: str = "auto",
+        compression_level: Optional[int] = None,
+        pack_threshold: int = 0,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+    ):
+        if compression == "auto":
+            compression = "zstd" if HAS_ZSTD else "gzip"
+        if compression not in self.EXTENSIONS:
+            raise ValueError(f"Unknown compression: {compression}")
+        if compression == "zstd" and not HAS_ZSTD:
+            raise ImportError(
+                "zstd compression requires the 'zstandard' package: pip install zstandard"
+            )
+
+        self.base_path = base_path
+        self.content_paths = ensure_content_dirs(base_path)
+        self.compression = compression
+        self.compression_level = compression_level
+        self.pack_threshold = pack_threshold
+        self.segment_max_bytes = segment_max_bytes
+
+        self._lock = threading.Lock()
+        # content_type -> (segment name, current size)
+        self._segments: Dict[str, Tuple[str, int]] = {}
+        # (content_type, hash) -> reference of blobs packed by this process
+        self._packed: Dict[Tuple[str, str], str] = {}
+
+    # ------------------------------------------------------------------
+    # Codecs
+    # ------------------------------------------------------------------
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == "zstd":
+            level = self.compression_level or 3
+            return zstandard.ZstdCompressor(level=level).compress(data)
+        if self.compression == "gzip":
+            level = self.compression_level or 6
+            return gzip.compress(data, compresslevel=level, mtime=0)
+        return data
+
+    @staticmethod
+    def _decompress(data: bytes, extension: str) -> bytes:
+        if extension == ".zst":
+            if not HAS_ZSTD:
+                raise ImportError(
+                    "Cached content is zstd-compressed, install 'zstandard' to read it"
+                )
+            return zstandard.ZstdDecompressor().decompress(data)
+        if extension == ".gz":
+            return gzip.decompress(data)
+        return data
+
+    @staticmethod
+    def parse_ref(ref: str) -> Tuple[str, str, Optional[Tuple[str, int, int]]]:
+        """Split a reference into (hash, extension, (segment, offset, length) or None)"""
+        location = None
+        if "@" in ref:
+            ref, packed = ref.split("@", 1)
+            segment, offset, length = packed.rsplit(":", 2)
+            location = (segment, int(offset), int(length))
+        content_hash, dot, extension = ref.partition(".")
+        return content_hash, f"{dot}{extension}", location
+
+    def segment_path(self, content_type: str, segment: str) -> str:
+        return os.path.join(self.content_paths[content_type], "segments", segment)
+
+    # ------------------------------------------------------------------
+    # Sync API (runs in executor threads, or directly for lazy fields)
+    # ------------------------------------------------------------------
+    def store_sync(self, content: str, content_type: str) -> str:
+        """Store content and return its reference ("" for empty content)"""
+        if not content:
+            return ""
+
+        content_hash = generate_content_hash(content)
+        extension = self.EXTENSIONS[self.compression]
+        file_path = os.path.join(
+            self.content_paths[content_type], content_hash + extension
+        )
+        # Only write if the blob doesn't exist yet
+        if os.path.exists(file_path):
+            try:
+                # Refresh mtime so garbage collection's grace period applies
+                os.utime(file_path)
+            except OSError:
+                pass
+            else:
+                return content_hash + extension
+        packed_ref = self._packed.get((content_type, content_hash))
+        if packed_ref:
+            return packed_ref
+
+        data = self._compress(content.encode("utf-8"))
+        if self.pack_threshold and len(data) < self.pack_threshold:
+            return self._append_to_segment(content_type, content_hash + extension, data)
+
+        # Write-then-rename so concurrent readers never see a partial file
+        tmp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, file_path)
+        return content_hash + extension
+
+    def _append_to_segment(self, content_type: str, name: str, data: bytes) -> str:
+        with self._lock:
+            segment, size = self._segments.get(content_type, (None, 0))
+            if segment is None or size + len(data) > self.segment_max_bytes:
+                # Segments are per process so appends never interleave
+                segment, size = f"{os.getpid()}-{uuid.uuid4().hex[:12]}.pack", 0
+                os.makedirs(
+                    os.path.dirname(self.segment_path(content_type, segment)),
+                    exist_ok=True,
+                )
+            with open(self.segment_path(content_type, segment), "ab") as f:
+                f.write(data)
+            self._segments[content_type] = (segment, size + len(data))
+
+            ref = f"{name}@{segment}:{size}:{len(data)}"
+            if len(self._packed) > 100_000:
+                self._packed.clear()
+            self._packed[(content_type, name.partition(".")[0])] = ref
+            return ref
+
+    def load_sync(self, ref: str, content_type: str) -> Optional[str]:
+        """Load content by reference, None if it is missing"""
+        if not ref:
+            return None
+        content_hash, extension, location = self.parse_ref(ref)
+        if location:
+            segment, offset, length = location
+            with open(self.segment_path(content_type, segment), "rb") as f:
+                f.seek(offset)
+                data = f.read(length)
+        else:
+            with open(
+                os.path.join(self.content_paths[content_type], content_hash + extension),
+                "rb",
+            ) as f:
+                data = f.read()
+        return self._decompress(data, extension).decode("utf-8")
+
+    def exists(self, ref: str, content_type: str) -> bool:
+        """Whether the blob behind a reference is on disk (a stat, no read)"""
+        if not ref:
+            return False
+        content_hash, extension, location = self.parse_ref(ref)
+        try:
+            if location:
+                segment, offset, length = location
+                return os.stat(self.segment_path(content_type, segment)).st_size >= offset + length
+            return os.path.isfile(
+                os.path.join(self.content_paths[content_type], content_hash + extension)
+            )
+        except OSError:
+            return False
+
+    def collect_garbage(
+        self, live_refs: Dict[str, Iterable[str]], grace_period: float = 3600.0
+    ) -> Dict[str, int]:
+        """
+        Delete blobs and segments no longer referenced by any cache row.
+
+        Files younger than ``grace_period`` seconds are kept, so blobs written
+        by a concurrent crawl before its row is committed survive. Segments
+        this process is still appending to are never removed.
+
+        Args:
+            live_refs: content_type -> references still in use.
+            grace_period: Minimum age in seconds of a file before removal.
+
+        Returns:
+            dict: ``files_removed`` and ``bytes_freed``.
+        """
+        # Several content types share a directory (screenshot/screenshots)
+        live_by_dir: Dict[str, Tuple[set, set]] = {}
+        for content_type, path in self.content_paths.items():
+            live_by_dir.setdefault(path, (set(), set()))
+        for content_type, refs in live_refs.items():
+            names, segments = live_by_dir[self.content_paths[content_type]]
+            for ref in refs:
+                if not ref:
+                    continue
+                content_hash, extension, location = self.parse_ref(ref)
+                if location:
+                    segments.add(location[0])
+                else:
+                    names.add(content_hash + extension)
+
+        with self._lock:
+            active = {segment for segment, _ in self._segments.values()}
+
+        cutoff = time.time() - grace_period
+        stats = {"files_removed": 0, "bytes_freed": 0}
+
+        def _remove(path: str):
+            try:
+                stat = os.stat(path)
+                if stat.st_mtime > cutoff:
+                    return
+                os.remove(path)
+            except OSError:
+                return
+            stats["files_removed"] += 1
+            stats["bytes_freed"] += stat.st_size
+
+        for directory, (names, segments) in live_by_dir.items():
+            for entry in os.scandir(directory):
+                if not entry.is_file():
+                    continue
+                if entry.name.endswith(".tmp"):
+                    # Left behind by an interrupted write
+                    _remove(entry.path)
+                elif self.BLOB_NAME.match(entry.name) and entry.name not in names:
+                    _remove(entry.path)
+
+            segment_dir = os.path.join(directory, "segments")
+            if os.path.isdir(segment_dir):
+                for entry in os.scandir(segment_dir):
+                    if (
+                        entry.name.endswith(".pack")
+                        and entry.name not in segments
+                        and entry.name not in active
+                    ):
+                        _remove(entry.path)
+
+        with self._lock:
+            self._packed.clear()
+        return stats
+
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+    async def store(self, content: str, content_type: str) -> str:
+        if not content:
+            return ""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.store_sync, content, content_type)
+
+    async def load(self, ref: str, content_type: str) -> Optional[str]:
+        if not ref:
+            return None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.load_sync, ref, content_type)
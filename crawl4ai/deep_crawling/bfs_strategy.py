@@ -1,5 +1,7 @@
 # bfs_deep_crawl_strategy.py
 import asyncio
+import heapq
+import itertools
 import logging
 from datetime import datetime
 from typing import AsyncGenerator, Optional, Set, Dict, List, Tuple
@@ -42,6 +44,8 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         self.stats = TraversalStats(start_time=datetime.now())
         self._cancel_event = asyncio.Event()
         self._pages_crawled = 0
+        # URLs queued or in flight that will count toward max_pages
+        self._pages_pending = 0
 
     async def can_process_url(self, url: str, depth: int) -> bool:
         """
@@ -85,7 +89,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
             return
 
         # If we've reached the max pages limit, don't discover new links
-        remaining_capacity = self.max_pages - self._pages_crawled
+        remaining_capacity = self.max_pages - self._pages_crawled - self._pages_pending
         if remaining_capacity <= 0:
             self.logger.info(f"Max pages limit ({self.max_pages}) reached, stopping link discovery")
             return
@@ -139,57 +143,85 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
             next_level.append((url, source_url))
             depths[url] = next_depth
 
-    async def _arun_batch(
+    async def _arun_pipelined(
         self,
         start_url: str,
         crawler: AsyncWebCrawler,
         config: CrawlerRunConfig,
-    ) -> List[CrawlResult]:
+    ) -> AsyncGenerator[CrawlResult, None]:
         """
-        Batch (non-streaming) mode:
-        Processes one BFS level at a time, then yields all the results.
+        Crawls the whole traversal through a single streaming arun_many call.
+
+        The frontier is a heap ordered by (depth, discovery order) that feeds
+        the dispatcher lazily, so links found on a finished page are crawled
+        as soon as a slot frees up instead of waiting for the rest of its
+        level. Shallower URLs always leave the frontier first, which keeps
+        the BFS ordering, except that a page may start while slower pages of
+        the previous level are still in flight. Parent and depth are looked
+        up in dicts keyed by URL.
         """
-        visited: Set[str] = set()
-        # current_level holds tuples: (url, parent_url)
-        current_level: List[Tuple[str, Optional[str]]] = [(start_url, None)]
+        visited: Set[str] = {start_url}
+        # frontier holds tuples: (depth, discovery order, url)
+        frontier: List[Tuple[int, int, str]] = [(0, 0, start_url)]
+        parents: Dict[str, Optional[str]] = {start_url: None}
         depths: Dict[str, int] = {start_url: 0}
+        order = itertools.count(1)
+        in_flight = 0
+
+        async def feed() -> AsyncGenerator[Optional[str], None]:
+            nonlocal in_flight
+            while not self._cancel_event.is_set() and self._pages_crawled < self.max_pages:
+                if frontier:
+                    _, _, url = heapq.heappop(frontier)
+                    in_flight += 1
+                    yield url
+                elif in_flight:
+                    # Pages in flight may still add links; nothing to hand out yet
+                    yield None
+                else:
+                    return
+
+        stream_config = config.clone(deep_crawl_strategy=None, stream=True)
+        stream_gen = await crawler.arun_many(urls=feed(), config=stream_config)
+
+        async for result in stream_gen:
+            in_flight -= 1
+            url = result.url
+            depth = depths.pop(url, 0)
+            result.metadata = result.metadata or {}
+            result.metadata["depth"] = depth
+            result.metadata["parent_url"] = parents.pop(url, None)
+
+            # Only discover links from successful crawls
+            if result.success:
+                self._pages_crawled += 1
+                # Queued and in-flight URLs already hold part of the page budget
+                self._pages_pending = len(frontier) + in_flight
+                next_level: List[Tuple[str, Optional[str]]] = []
+                await self.link_discovery(result, url, depth, visited, next_level, depths)
+                for next_url, parent_url in next_level:
+                    parents[next_url] = parent_url
+                    heapq.heappush(frontier, (depths[next_url], next(order), next_url))
+
+            yield result
 
-        results: List[CrawlResult] = []
-
-        while current_level and not self._cancel_event.is_set():
-            # Check if we've already reached max_pages before starting a new level
             if self._pages_crawled >= self.max_pages:
                 self.logger.info(f"Max pages limit ({self.max_pages}) reached, stopping crawl")
                 break
-            
-            next_level: List[Tuple[str, Optional[str]]] = []
-            urls = [url for url, _ in current_level]
 
-            # Clone the config to disable deep crawling recursion and enforce batch mode.
-            batch_config = config.clone(deep_crawl_strategy=None, stream=False)
-            batch_results = await crawler.arun_many(urls=urls, config=batch_config)
-            
-            # Update pages crawled counter - count only successful crawls
-            successful_results = [r for r in batch_results if r.success]
-            self._pages_crawled += len(successful_results)
-            
-            for result in batch_results:
-                url = result.url
-                depth = depths.get(url, 0)
-                result.metadata = result.metadata or {}
-                result.metadata["depth"] = depth
-                parent_url = next((parent for (u, parent) in current_level if u == url), None)
-                result.metadata["parent_url"] = parent_url
-                results.append(result)
-                
-                # Only discover links from successful crawls
-                if result.success:
-                    # Link discovery will handle the max pages limit internally
-                    await self.link_discovery(result, url, depth, visited, next_level, depths)
-
-            current_level = next_level
+        self._pages_pending = 0
 
-        return results
+    async def _arun_batch(
+        self,
+        start_url: str,
+        crawler: AsyncWebCrawler,
+        config: CrawlerRunConfig,
+    ) -> List[CrawlResult]:
+        """
+        Batch (non-streaming) mode:
+        Runs the pipelined traversal and returns all the results at the end.
+        """
+        return [result async for result in self._arun_pipelined(start_url, crawler, config)]
 
     async def _arun_stream(
         self,
@@ -199,52 +231,10 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
     ) -> AsyncGenerator[CrawlResult, None]:
         """
         Streaming mode:
-        Processes one BFS level at a time and yields results immediately as they arrive.
+        Runs the pipelined traversal and yields results immediately as they arrive.
         """
-        visited: Set[str] = set()
-        current_level: List[Tuple[str, Optional[str]]] = [(start_url, None)]
-        depths: Dict[str, int] = {start_url: 0}
-
-        while current_level and not self._cancel_event.is_set():
-            next_level: List[Tuple[str, Optional[str]]] = []
-            urls = [url for url, _ in current_level]
-            visited.update(urls)
-
-            stream_config = config.clone(deep_crawl_strategy=None, stream=True)
-            stream_gen = await crawler.arun_many(urls=urls, config=stream_config)
-            
-            # Keep track of processed results for this batch
-            results_count = 0
-            async for result in stream_gen:
-                url = result.url
-                depth = depths.get(url, 0)
-                result.metadata = result.metadata or {}
-                result.metadata["depth"] = depth
-                parent_url = next((parent for (u, parent) in current_level if u == url), None)
-                result.metadata["parent_url"] = parent_url
-                
-                # Count only successful crawls
-                if result.success:
-                    self._pages_crawled += 1
-                    # Check if we've reached the limit during batch processing
-                    if self._pages_crawled >= self.max_pages:
-                        self.logger.info(f"Max pages limit ({self.max_pages}) reached during batch, stopping crawl")
-                        break  # Exit the generator
-                
-                results_count += 1
-                yield result
-                
-                # Only discover links from successful crawls
-                if result.success:
-                    # Link discovery will handle the max pages limit internally
-                    await self.link_discovery(result, url, depth, visited, next_level, depths)
-            
-            # If we didn't get results back (e.g. due to errors), avoid getting stuck in an infinite loop
-            # by considering these URLs as visited but not counting them toward the max_pages limit
-            if results_count == 0 and urls:
-                self.logger.warning(f"No results returned for {len(urls)} URLs, marking as visited")
-                
-            current_level = next_level
+        async for result in self._arun_pipelined(start_url, crawler, config):
+            yield result
 
     async def shutdown(self) -> None:
         """
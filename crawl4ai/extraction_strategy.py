@@ -4,6 +4,7 @@ from typing import Any, List, Dict, Optional, Tuple, Pattern, Union
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 import time
+import asyncio
 from enum import IntFlag, auto
 
 from .prompts import PROMPT_EXTRACT_BLOCKS, PROMPT_EXTRACT_BLOCKS_WITH_INSTRUCTION, PROMPT_EXTRACT_SCHEMA_WITH_INSTRUCTION, JSON_SCHEMA_BUILDER_XPATH, PROMPT_EXTRACT_INFERRED_SCHEMA
@@ -20,6 +21,7 @@ from .utils import (
     sanitize_html,
     escape_json_string,
     perform_completion_with_backoff,
+    aperform_completion_with_backoff,
     extract_xml_data,
     split_and_parse_json_objects,
     sanitize_input_encode,
@@ -38,8 +40,10 @@ from .model_loader import (
 )
 
 from .types import LLMConfig, create_llm_config
+from .async_llm import get_llm_client
+from .schema_plan import SchemaPlan, SchemaPlanError, basic_css_to_xpath
+from .html_document import HTMLDocument
 
-from functools import partial
 import numpy as np
 import re
 from bs4 import BeautifulSoup
@@ -94,6 +98,20 @@ class ExtractionStrategy(ABC):
                 extracted_content.extend(future.result())
         return extracted_content
 
+    async def arun(self, url: str, sections: List[str], *q, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Async version of ``run``, which it calls in a worker thread by default.
+
+        Strategies that mostly wait on I/O (LLM calls) override it; the crawler
+        then awaits it on the event loop instead of holding a processing worker.
+        """
+        return await asyncio.to_thread(self.run, url, sections, *q, **kwargs)
+
+    @property
+    def has_async_run(self) -> bool:
+        """Whether this strategy overrides ``arun``"""
+        return type(self).arun is not ExtractionStrategy.arun
+
 
 class NoExtractionStrategy(ExtractionStrategy):
     """
@@ -588,6 +606,15 @@ class LLMExtractionStrategy(ExtractionStrategy):
         """
         Extract meaningful blocks or chunks from the given HTML using an LLM.
 
+        Blocking wrapper around ``aextract``; the request itself runs on the
+        shared LLM client loop.
+        """
+        return get_llm_client().run_sync(self.aextract(url, ix, html))
+
+    async def aextract(self, url: str, ix: int, html: str) -> List[Dict[str, Any]]:
+        """
+        Extract meaningful blocks or chunks from the given HTML using an LLM.
+
         How it works:
         1. Construct a prompt with variables.
         2. Make a request to the LLM using the prompt.
@@ -628,13 +655,15 @@ class LLMExtractionStrategy(ExtractionStrategy):
             )
 
         try:
-            response = perform_completion_with_backoff(
+            response = await aperform_completion_with_backoff(
                 self.llm_config.provider,
                 prompt_with_variables,
                 self.llm_config.api_token,
                 base_url=self.llm_config.base_url,
                 json_response=self.force_json_response,
                 extra_args=self.extra_args,
+                tokens_per_minute=self.llm_config.tokens_per_minute,
+                cache_mode=self.llm_config.cache_mode,
             )  # , json_response=self.extract_type == "schema")
             # Track usage
             usage = TokenUsage(
@@ -725,7 +754,7 @@ class LLMExtractionStrategy(ExtractionStrategy):
 
     def run(self, url: str, sections: List[str]) -> List[Dict[str, Any]]:
         """
-        Process sections sequentially with a delay for rate limiting issues, specifically for LLMExtractionStrategy.
+        Process sections with the LLM, blocking the calling thread.
 
         Args:
             url: The URL of the webpage.
@@ -734,6 +763,21 @@ class LLMExtractionStrategy(ExtractionStrategy):
         Returns:
             A list of extracted blocks or chunks.
         """
+        return get_llm_client().run_sync(self.arun(url, sections))
+
+    async def arun(self, url: str, sections: List[str]) -> List[Dict[str, Any]]:
+        """
+        Process sections concurrently through the shared LLM client, which
+        bounds requests in flight and tokens per minute. Groq models are
+        still called one section at a time, 500 ms apart.
+
+        Args:
+            url: The URL of the webpage.
+            sections: List of sections (strings) to process.
+
+        Returns:
+            A list of extracted blocks or chunks, in section order.
+        """
 
         merged_sections = self._merge(
             sections,
@@ -744,39 +788,33 @@ class LLMExtractionStrategy(ExtractionStrategy):
         if self.llm_config.provider.startswith("groq/"):
             # Sequential processing with a delay
             for ix, section in enumerate(merged_sections):
-                extract_func = partial(self.extract, url)
                 extracted_content.extend(
-                    extract_func(ix, sanitize_input_encode(section))
+                    await self.aextract(url, ix, sanitize_input_encode(section))
                 )
-                time.sleep(0.5)  # 500 ms delay between each processing
+                await asyncio.sleep(0.5)  # 500 ms delay between each processing
         else:
-            # Parallel processing using ThreadPoolExecutor
-            # extract_func = partial(self.extract, url)
-            # for ix, section in enumerate(merged_sections):
-            #     extracted_content.append(extract_func(ix, section))
-
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                extract_func = partial(self.extract, url)
-                futures = [
-                    executor.submit(extract_func, ix, sanitize_input_encode(section))
+            results = await asyncio.gather(
+                *(
+                    self.aextract(url, ix, sanitize_input_encode(section))
                     for ix, section in enumerate(merged_sections)
-                ]
-
-                for future in as_completed(futures):
-                    try:
-                        extracted_content.extend(future.result())
-                    except Exception as e:
-                        if self.verbose:
-                            print(f"Error in thread execution: {e}")
-                        # Add error information to extracted_content
-                        extracted_content.append(
-                            {
-                                "index": 0,
-                                "error": True,
-                                "tags": ["error"],
-                                "content": str(e),
-                            }
-                        )
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    if self.verbose:
+                        print(f"Error in LLM extraction task: {result}")
+                    # Add error information to extracted_content
+                    extracted_content.append(
+                        {
+                            "index": 0,
+                            "error": True,
+                            "tags": ["error"],
+                            "content": str(result),
+                        }
+                    )
+                else:
+                    extracted_content.extend(result)
 
         return extracted_content
 
@@ -811,13 +849,20 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
     3. Extracts data hierarchically, supporting nested fields and lists.
     4. Handles computed fields with expressions or functions.
 
+    The built-in strategies compile the schema once into a `SchemaPlan`
+    (precompiled XPath selectors and field extractors) and run that on every
+    page; the methods below interpret the schema when it cannot be compiled,
+    when `compiled=False` is passed, or when a subclass overrides them.
+
     Attributes:
         DEL (str): Delimiter used to combine HTML sections. Defaults to '\n'.
         schema (Dict[str, Any]): The schema defining the extraction rules.
         verbose (bool): Enables verbose logging for debugging purposes.
+        compiled (bool): Use the compiled plan when possible. Defaults to True.
 
     Methods:
         extract(url, html_content, *q, **kwargs): Extracts structured data from HTML content.
+        extract_many(html_contents): Extracts structured data from many pages.
         _extract_item(element, fields): Extracts fields from a single element.
         _extract_single_field(element, field): Extracts a single field based on its type.
         _apply_transform(value, transform): Applies a transformation to a value.
@@ -835,6 +880,16 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
 
     DEL = "\n"
 
+    # The SchemaPlan selector type reproducing a strategy, None if there is none
+    PLAN_SELECTOR_TYPE: Optional[str] = None
+    # Methods whose override means the plan would not reproduce a subclass
+    _PLAN_HOOKS = (
+        "_parse_html", "_parse_document", "_get_base_elements", "_get_elements",
+        "_extract_field", "_extract_single_field", "_extract_list_item", "_extract_item",
+        "_apply_transform", "_compute_field", "_get_element_text", "_get_element_html",
+        "_get_element_attribute", "_css_to_xpath", "_basic_css_to_xpath",
+    )
+
     def __init__(self, schema: Dict[str, Any], **kwargs):
         """
         Initialize the JSON element extraction strategy with a schema.
@@ -845,6 +900,32 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
         super().__init__(**kwargs)
         self.schema = schema
         self.verbose = kwargs.get("verbose", False)
+        self.compiled = kwargs.get("compiled", True)
+        self._plan = None
+        self._plan_schema = None
+
+    @property
+    def plan(self) -> Optional[SchemaPlan]:
+        """
+        The schema compiled into a SchemaPlan, built on first use and again if
+        `schema` is replaced. None if compilation is off or not possible.
+        """
+        if self._plan_schema is not self.schema:
+            self._plan_schema, self._plan = self.schema, None
+            if self.compiled and self._plan_reproduces_strategy():
+                try:
+                    self._plan = SchemaPlan(self.schema, self.PLAN_SELECTOR_TYPE, verbose=self.verbose)
+                except SchemaPlanError as e:
+                    if self.verbose:
+                        print(f"Interpreting the schema, it does not compile: {e}")
+        return self._plan
+
+    def _plan_reproduces_strategy(self) -> bool:
+        strategy = type(self)
+        owner = next(cls for cls in strategy.__mro__ if "PLAN_SELECTOR_TYPE" in vars(cls))
+        return owner.PLAN_SELECTOR_TYPE is not None and all(
+            getattr(strategy, hook, None) is getattr(owner, hook, None) for hook in self._PLAN_HOOKS
+        )
 
     def extract(
         self, url: str, html_content: str, *q, **kwargs
@@ -867,7 +948,11 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
             List[Dict[str, Any]]: A list of extracted items, each represented as a dictionary.
         """
 
-        parsed_html = self._parse_html(html_content)
+        plan = self.plan
+        if plan is not None:
+            return plan.extract(html_content, html_document=kwargs.get("html_document"))
+
+        parsed_html = self._parse_document(html_content, kwargs.get("html_document"))
         base_elements = self._get_base_elements(
             parsed_html, self.schema["baseSelector"]
         )
@@ -891,11 +976,41 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
 
         return results
 
+    def extract_many(
+        self, html_contents: List[str], max_workers: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Extract structured data from many pages with one compiled plan.
+
+        Args:
+            html_contents (List[str]): The pages, as HTML strings or HTMLDocuments.
+            max_workers (Optional[int]): Extract on this many threads.
+
+        Returns:
+            List[List[Dict[str, Any]]]: The extracted items of each page, in order.
+        """
+        plan = self.plan
+        if plan is not None:
+            return plan.extract_many(html_contents, max_workers=max_workers)
+        return [
+            self.extract(None, page.html, html_document=page)
+            if isinstance(page, HTMLDocument)
+            else self.extract(None, page)
+            for page in html_contents
+        ]
+
     @abstractmethod
     def _parse_html(self, html_content: str):
         """Parse HTML content into appropriate format"""
         pass
 
+    def _parse_document(self, html_content: str, html_document=None):
+        """
+        Parse HTML content, or reuse the page's shared lxml tree
+        (an ``HTMLDocument``) in strategies whose parse it matches.
+        """
+        return self._parse_html(html_content)
+
     @abstractmethod
     def _get_base_elements(self, parsed_html, selector: str):
         """Get all base elements using the selector"""
@@ -1216,6 +1331,8 @@ class JsonCssExtractionStrategy(JsonElementExtractionStrategy):
         _get_element_attribute(element, attribute): Retrieves an attribute value from a BeautifulSoup element.
     """
 
+    PLAN_SELECTOR_TYPE = "css"
+
     def __init__(self, schema: Dict[str, Any], **kwargs):
         kwargs["input_format"] = "html"  # Force HTML input
         super().__init__(schema, **kwargs)
@@ -1242,23 +1359,21 @@ class JsonCssExtractionStrategy(JsonElementExtractionStrategy):
         return element.get(attribute)
 
 class JsonLxmlExtractionStrategy(JsonElementExtractionStrategy):
+    PLAN_SELECTOR_TYPE = "lxml"
+
     def __init__(self, schema: Dict[str, Any], **kwargs):
         kwargs["input_format"] = "html"
         super().__init__(schema, **kwargs)
         self._selector_cache = {}
         self._xpath_cache = {}
-        self._result_cache = {}
         
         # Control selector optimization strategy
-        self.use_caching = kwargs.get("use_caching", True)
         self.optimize_common_patterns = kwargs.get("optimize_common_patterns", True)
         
         # Load lxml dependencies once
         from lxml import etree, html
-        from lxml.cssselect import CSSSelector
         self.etree = etree
         self.html_parser = html
-        self.CSSSelector = CSSSelector
     
     def _parse_html(self, html_content: str):
         """Parse HTML content with error recovery"""
@@ -1309,7 +1424,8 @@ class JsonLxmlExtractionStrategy(JsonElementExtractionStrategy):
         
         try:
             # Attempt to compile the CSS selector
-            compiled = self.CSSSelector(selector_str)
+            from lxml.cssselect import CSSSelector
+            compiled = CSSSelector(selector_str)
             xpath = compiled.path
             
             # Store XPath for later use
@@ -1317,17 +1433,6 @@ class JsonLxmlExtractionStrategy(JsonElementExtractionStrategy):
             
             # Create the wrapper function that implements the selection strategy
             def selector_func(element, context_sensitive=True):
-                cache_key = None
-                
-                # Use result caching if enabled
-                if self.use_caching:
-                    # Create a cache key based on element and selector
-                    element_id = element.get('id', '') or str(hash(element))
-                    cache_key = f"{element_id}::{selector_str}"
-                    
-                    if cache_key in self._result_cache:
-                        return self._result_cache[cache_key]
-                
                 results = []
                 try:
                     # Strategy 1: Direct CSS selector application (fastest)
@@ -1358,10 +1463,6 @@ class JsonLxmlExtractionStrategy(JsonElementExtractionStrategy):
                                 if tag_match:
                                     tag_name = tag_match.group(1)
                                     results = element.xpath(f".//{tag_name}")
-                    
-                    # Cache results if caching is enabled
-                    if self.use_caching and cache_key:
-                        self._result_cache[cache_key] = results
                         
                 except Exception as e:
                     if self.verbose:
@@ -1509,8 +1610,8 @@ class JsonLxmlExtractionStrategy(JsonElementExtractionStrategy):
             
     def _clear_caches(self):
         """Clear caches to free memory"""
-        if self.use_caching:
-            self._result_cache.clear()
+        self._selector_cache.clear()
+        self._xpath_cache.clear()
 
 class JsonLxmlExtractionStrategy_naive(JsonElementExtractionStrategy):
     def __init__(self, schema: Dict[str, Any], **kwargs):
@@ -1632,6 +1733,8 @@ class JsonXPathExtractionStrategy(JsonElementExtractionStrategy):
         _get_element_attribute(element, attribute): Retrieves an attribute value from an lxml element.
     """
 
+    PLAN_SELECTOR_TYPE = "xpath"
+
     def __init__(self, schema: Dict[str, Any], **kwargs):
         kwargs["input_format"] = "html"  # Force HTML input
         super().__init__(schema, **kwargs)
@@ -1639,6 +1742,16 @@ class JsonXPathExtractionStrategy(JsonElementExtractionStrategy):
     def _parse_html(self, html_content: str):
         return html.fromstring(html_content)
 
+    def _parse_document(self, html_content: str, html_document=None):
+        # For whole documents html.fromstring builds the same tree as the shared one
+        if (
+            html_document is not None
+            and html_document.html == html_content
+            and html_document.is_full_document
+        ):
+            return html_document.tree
+        return self._parse_html(html_content)
+
     def _get_base_elements(self, parsed_html, selector: str):
         return parsed_html.xpath(selector)
 
@@ -1650,13 +1763,7 @@ class JsonXPathExtractionStrategy(JsonElementExtractionStrategy):
 
     def _basic_css_to_xpath(self, css_selector: str) -> str:
         """Basic CSS to XPath conversion for common cases"""
-        if " > " in css_selector:
-            parts = css_selector.split(" > ")
-            return "//" + "/".join(parts)
-        if " " in css_selector:
-            parts = css_selector.split(" ")
-            return "//" + "//".join(parts)
-        return "//" + css_selector
+        return basic_css_to_xpath(css_selector)
 
     def _get_elements(self, element, selector: str):
         xpath = self._css_to_xpath(selector)
@@ -8,6 +8,8 @@ import urllib.parse as urlparse
 from textwrap import wrap
 from typing import Dict, List, Optional, Tuple, Union
 
+from lxml import etree
+
 from . import config
 from ._typing import OutCallback
 from .elements import AnchorElement, ListElement
@@ -1168,3 +1170,139 @@ class CustomHTML2Text(HTML2Text):
     #         self.preserved_content.append(data)
     #         return
     #     super().handle_data(data, entity_char)
+
+
+class LXMLHTML2Text(CustomHTML2Text):
+    """
+    CustomHTML2Text driven by an lxml tree instead of html.parser.
+
+    ``handle_tree`` walks the tree and replays the start tag, end tag and text
+    events html.parser reports for the serialized tree, so the Markdown is the
+    same without tokenizing the HTML in Python. Text is split around the
+    characters a serializer writes as ``&amp;``, ``&lt;`` and ``&gt;``, since
+    html.parser reports each of those entities separately. Other entity
+    references cannot be replayed from a parsed tree; documents containing
+    them should go through ``handle``.
+
+    The output indexes of ``[`` and ``![`` link starts are collected in
+    ``link_starts`` as they are written, and the output parts of the last
+    document are kept in ``last_parts``, for building citations without
+    scanning the Markdown.
+    """
+
+    VOID_ELEMENTS = frozenset(
+        [
+            "area", "base", "br", "col", "embed", "hr", "img", "input",
+            "link", "meta", "param", "source", "track", "wbr",
+        ]
+    )
+    RAW_TEXT_ELEMENTS = frozenset(html.parser.HTMLParser.CDATA_CONTENT_ELEMENTS)
+    # Tags handle_tag does more for than the bookkeeping in handle_inert_tag
+    HANDLED_TAGS = frozenset(
+        [
+            "a", "abbr", "b", "blockquote", "body", "br", "code", "dd", "del",
+            "div", "dl", "dt", "em", "head", "hr", "i", "img", "kbd", "li", "ol",
+            "p", "pre", "q", "s", "script", "strike", "strong", "style", "sub",
+            "sup", "table", "td", "th", "tr", "tt", "u", "ul",
+        ]
+        + ["h%d" % n for n in range(1, 10)]
+    )
+    ENTITY_CHARS = re.compile(r"([&<>])")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.link_starts: List[int] = []
+        self.last_parts: List[str] = []
+
+    def handle(self, data: str) -> str:
+        self.link_starts = []
+        return super().handle(data)
+
+    def handle_tree(self, root, skip_root: bool = False) -> str:
+        """
+        Convert an lxml tree to Markdown.
+
+        Args:
+            root: Element to convert.
+            skip_root: Convert only the content of ``root``, as when it is the
+                body the parser wrapped around a fragment.
+        """
+        self.start = True
+        self.link_starts = []
+        handle_tag = self.handle_tag
+        handle_inert_tag = self.handle_inert_tag
+        handle_text = self.handle_text
+        void = self.VOID_ELEMENTS
+        raw_text = self.RAW_TEXT_ELEMENTS
+        # Callbacks, preserved tags and Google Docs styles need every tag
+        handled = (
+            self.HANDLED_TAGS
+            if self.tag_callback is None
+            and not self.preserve_tags
+            and not self.google_doc
+            else None
+        )
+
+        events = ("start", "end", "comment", "pi")
+        for event, element in etree.iterwalk(root, events=events):
+            if event == "start":
+                if not (skip_root and element is root):
+                    tag = element.tag
+                    if handled is None or tag in handled:
+                        handle_tag(tag, dict(element.attrib), True)
+                    else:
+                        handle_inert_tag(tag, True)
+                if element.text:
+                    handle_text(element.text, element.tag in raw_text)
+                continue
+            if event == "end":
+                tag = element.tag
+                if tag not in void and not (skip_root and element is root):
+                    if handled is None or tag in handled:
+                        handle_tag(tag, {}, False)
+                    else:
+                        handle_inert_tag(tag, False)
+                if element is root:
+                    break
+            # Comments and processing instructions only contribute their tail
+            if element.tail:
+                handle_text(element.tail)
+
+        markdown = self.optwrap(self.finish())
+        if self.pad_tables:
+            return pad_tables_in_text(markdown)
+        return markdown
+
+    def handle_inert_tag(self, tag: str, start: bool) -> None:
+        """What handle_tag does for a tag outside HANDLED_TAGS"""
+        self.current_tag = tag
+        if start and self.maybe_automatic_link is not None:
+            # first thing inside the anchor tag is another tag
+            self.o("[")
+            self.maybe_automatic_link = None
+            self.empty_link = False
+        self.lastWasList = False
+
+    def handle_text(self, text: str, raw: bool = False) -> None:
+        if raw or not ("&" in text or "<" in text or ">" in text):
+            self.handle_data(text)
+            return
+        for part in self.ENTITY_CHARS.split(text):
+            if part:
+                self.handle_data(part, len(part) == 1 and part in "&<>")
+
+    def o(
+        self, data: str, puredata: bool = False, force: Union[bool, str] = False
+    ) -> None:
+        if data == "[" or data[:2] == "![":
+            count = len(self.outtextlist)
+            super().o(data, puredata, force)
+            if len(self.outtextlist) > count and self.outtextlist[-1] == data:
+                self.link_starts.append(len(self.outtextlist) - 1)
+        else:
+            super().o(data, puredata, force)
+
+    def finish(self) -> str:
+        self.last_parts = self.outtextlist
+        return super().finish()
+
@@ -0,0 +1,74 @@
+import re
+import copy
+from typing import Optional
+
+from lxml import html as lhtml
+
+from .utils import preprocess_html_for_schema
+
+# Same test lxml.html.fromstring uses to tell documents from fragments
+FULL_DOCUMENT = re.compile(r"^\s*<(?:html|!doctype)", re.I)
+
+
+def fit_html_for(html: str) -> str:
+    """CrawlResult.fit_html of a page: its HTML reduced for schema generation"""
+    return preprocess_html_for_schema(html_content=html, text_threshold=500, max_size=300_000)
+
+
+class HTMLDocument:
+    """
+    One page's HTML, parsed at most once with lxml and shared by the
+    processing stages (scraping, extraction).
+
+    Read-only stages use ``tree``. Stages that modify the tree ask for
+    ``mutable_tree()``: while ``retain`` is set, later stages still need the
+    pristine tree and they get a copy (much cheaper than a parse); otherwise
+    the tree itself is handed over and a later ``tree`` access parses again.
+
+    ``fit_html`` is only computed when a stage asks for it, from the HTML
+    string (see ``fit_html_for``) rather than the shared tree: it needs its
+    own parser settings.
+
+    Args:
+        html: The page HTML.
+        retain: Whether ``mutable_tree`` must keep the shared tree intact.
+    """
+
+    def __init__(self, html: str, retain: bool = True):
+        self.html = html
+        self.retain = retain
+        self.parse_count = 0
+        self._tree = None
+        self._fit_html: Optional[str] = None
+
+    @property
+    def is_full_document(self) -> bool:
+        """True if lxml.html.fromstring would parse this as a whole document"""
+        return bool(FULL_DOCUMENT.match(self.html))
+
+    @property
+    def tree(self):
+        """The shared lxml document; callers must not modify it"""
+        if self._tree is None:
+            self._tree = lhtml.document_fromstring(self.html)
+            self.parse_count += 1
+        return self._tree
+
+    def mutable_tree(self):
+        """A tree the caller may modify freely"""
+        if self.retain:
+            return copy.deepcopy(self.tree)
+        tree = self.tree
+        self._tree = None
+        return tree
+
+    @property
+    def has_fit_html(self) -> bool:
+        return self._fit_html is not None
+
+    @property
+    def fit_html(self) -> str:
+        """The page reduced for schema generation, see preprocess_html_for_schema"""
+        if self._fit_html is None:
+            self._fit_html = fit_html_for(self.html)
+        return self._fit_html
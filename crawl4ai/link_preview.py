@@ -7,12 +7,21 @@ efficient parallel processing and caching infrastructure.
 
 import asyncio
 import fnmatch
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Any
 from .async_logger import AsyncLogger
 from .async_url_seeder import AsyncUrlSeeder
 from .async_configs import SeedingConfig, CrawlerRunConfig
 from .models import Links, Link
 from .utils import calculate_total_score
+from .config import LINK_PREVIEW_CACHE_SIZE
+
+
+@dataclass
+class LinkPreviewStats:
+    fetched: int = 0  # heads requested from the network or the seeder cache
+    reused: int = 0  # heads answered by an earlier or concurrent page of the crawl
 
 
 class LinkPreview:
@@ -25,18 +34,27 @@ class LinkPreview:
     - Caching for performance
     - BM25 relevance scoring
     - Memory-safe processing for large link sets
+
+    One instance is meant to serve a whole crawl: its seeder keeps a single
+    HTTP client, and each URL's head is fetched once, however many pages
+    link to it (pages asking concurrently wait for the same fetch). The last
+    ``cache_size`` heads are kept in memory on top of the seeder's disk cache.
     """
     
-    def __init__(self, logger: Optional[AsyncLogger] = None):
+    def __init__(self, logger: Optional[AsyncLogger] = None, cache_size: int = LINK_PREVIEW_CACHE_SIZE):
         """
         Initialize the LinkPreview.
         
         Args:
             logger: Optional logger instance for recording events
+            cache_size: Head results kept in memory for reuse
         """
         self.logger = logger
         self.seeder: Optional[AsyncUrlSeeder] = None
         self._owns_seeder = False
+        self.cache_size = cache_size
+        self.stats = LinkPreviewStats()
+        self._heads: "OrderedDict[str, asyncio.Future]" = OrderedDict()
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -60,6 +78,7 @@ class LinkPreview:
             await self.seeder.__aexit__(None, None, None)
             self.seeder = None
             self._owns_seeder = False
+        self._heads.clear()
     
     def _log(self, level: str, message: str, tag: str = "LINK_EXTRACT", **kwargs):
         """Helper method to safely log messages."""
@@ -108,6 +127,56 @@ class LinkPreview:
                   params={"success": len([r for r in head_results if r.get("status") == "valid"])})
         
         return updated_links
+
+    async def preview_links(
+        self,
+        links: Dict[str, List[Dict[str, Any]]],
+        config: CrawlerRunConfig
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        extract_link_heads for the links dict of a scraping result.
+        
+        Args:
+            links: {"internal": [...], "external": [...]} link dicts
+            config: CrawlerRunConfig with link_preview_config settings
+            
+        Returns:
+            The links dict with head data attached
+        """
+        verbose = config.link_preview_config.verbose
+        internal = links.get("internal", [])
+        external = links.get("external", [])
+        if verbose:
+            self._log("info", "Starting link head extraction for {internal} internal and {external} external links",
+                      params={"internal": len(internal), "external": len(external)})
+        
+        links_obj = Links(
+            internal=[Link(**link_data) for link_data in internal],
+            external=[Link(**link_data) for link_data in external],
+        )
+        updated_links = await self.extract_link_heads(links_obj, config)
+        
+        if verbose:
+            self._log("info", "Link head extraction completed: {internal_success}/{internal_total} internal, {external_success}/{external_total} external",
+                      params={
+                          "internal_success": len([l for l in updated_links.internal if l.head_extraction_status == "valid"]),
+                          "internal_total": len(updated_links.internal),
+                          "external_success": len([l for l in updated_links.external if l.head_extraction_status == "valid"]),
+                          "external_total": len(updated_links.external)
+                      })
+        
+        return {
+            **links,
+            "internal": [link.model_dump() for link in updated_links.internal],
+            "external": [link.model_dump() for link in updated_links.external],
+        }
+
+    def get_stats(self) -> Dict[str, float]:
+        stats = asdict(self.stats)
+        requested = self.stats.fetched + self.stats.reused
+        stats["reuse_rate"] = self.stats.reused / requested if requested else 0.0
+        stats["cached"] = len(self._heads)
+        return stats
     
     def _filter_links(self, links: Links, link_config: Dict[str, Any]) -> List[str]:
         """
@@ -196,82 +265,86 @@ class LinkPreview:
             self._log("info", "Starting batch processing: {total} links with {concurrency} concurrent workers",
                       params={"total": len(urls), "concurrency": concurrency})
         
-        # Create SeedingConfig for URLSeeder
+        entries = await self._head_entries(urls, link_config)
+        # Copies: scoring and merging write into them, the cached entries are shared
+        results = [
+            {**entry, "head_data": dict(entry.get("head_data") or {})}
+            for entry in entries if entry is not None
+        ]
+        
+        # Scores depend on this page's links and query, so they are not cached
         seeding_config = SeedingConfig(
             extract_head=True,
             concurrency=concurrency,
-            hits_per_sec=getattr(link_config, 'hits_per_sec', None),
             query=link_config.query,
             score_threshold=link_config.score_threshold,
             scoring_method="bm25" if link_config.query else None,
             verbose=verbose
         )
+        results = await self.seeder.rank_head_results(results, seeding_config)
         
-        # Use URLSeeder's extract_head_for_urls method with progress tracking
         if verbose:
-            # Create a wrapper to track progress
-            results = await self._extract_with_progress(urls, seeding_config, link_config)
-        else:
-            results = await self.seeder.extract_head_for_urls(
-                urls=urls,
-                config=seeding_config,
-                concurrency=concurrency,
-                timeout=link_config.timeout
-            )
+            successful = len([r for r in results if r.get("status") == "valid"])
+            self._log("info", "Batch processing completed: {completed}/{total} processed, {successful} successful, {failed} failed",
+                      params={
+                          "completed": len(results),
+                          "total": len(urls),
+                          "successful": successful,
+                          "failed": len(results) - successful
+                      })
         
         return results
     
-    async def _extract_with_progress(
-        self, 
-        urls: List[str], 
-        seeding_config: SeedingConfig, 
+    async def _head_entries(
+        self,
+        urls: List[str],
         link_config: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Extract head content with progress reporting."""
-        
-        total_urls = len(urls)
-        concurrency = link_config.concurrency
-        batch_size = max(1, total_urls // 10)  # Report progress every 10%
-        
-        # Process URLs and track progress
-        completed = 0
-        successful = 0
-        failed = 0
-        
-        # Create a custom progress tracking version
-        # We'll modify URLSeeder's method to include progress callbacks
-        
-        # For now, let's use the existing method and report at the end
-        # In a production version, we would modify URLSeeder to accept progress callbacks
-        
-        self._log("info", "Processing links in batches...")
-        
-        # Use existing method
-        results = await self.seeder.extract_head_for_urls(
-            urls=urls,
-            config=seeding_config,
-            concurrency=concurrency,
-            timeout=link_config.timeout
-        )
-        
-        # Count results
-        for result in results:
-            completed += 1
-            if result.get("status") == "valid":
-                successful += 1
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Head entries for `urls`, fetching only those no earlier or concurrent call asked for"""
+        loop = asyncio.get_running_loop()
+        futures = []
+        owned: Dict[str, asyncio.Future] = {}
+        for url in urls:
+            future = self._heads.get(url)
+            if future is None:
+                future = self._heads[url] = owned[url] = loop.create_future()
+                self.stats.fetched += 1
             else:
-                failed += 1
-        
-        # Final progress report
-        self._log("info", "Batch processing completed: {completed}/{total} processed, {successful} successful, {failed} failed",
-                  params={
-                      "completed": completed,
-                      "total": total_urls,
-                      "successful": successful,
-                      "failed": failed
-                  })
-        
-        return results
+                self._heads.move_to_end(url)
+                self.stats.reused += 1
+            futures.append(future)
+        
+        if owned:
+            try:
+                fetched = await self.seeder.fetch_heads(
+                    list(owned),
+                    concurrency=link_config.concurrency,
+                    timeout=link_config.timeout,
+                    hits_per_sec=getattr(link_config, 'hits_per_sec', None),
+                )
+            except BaseException as e:
+                # Pages waiting on these heads get a failed entry; a later page retries
+                for url, future in owned.items():
+                    if self._heads.get(url) is future:
+                        del self._heads[url]
+                    future.set_result({"url": url, "status": "failed", "head_data": {}, "error": str(e)})
+                raise
+            for url, future in owned.items():
+                entry = fetched.get(url)
+                future.set_result(entry)
+                if entry is not None and entry.get("status") == "failed" and self._heads.get(url) is future:
+                    del self._heads[url]  # worth another try
+            self._trim()
+        
+        # Shielded: a cancelled page must not cancel a fetch other pages wait on
+        return list(await asyncio.gather(*(asyncio.shield(future) for future in futures)))
+    
+    def _trim(self):
+        while len(self._heads) > self.cache_size:
+            url, future = next(iter(self._heads.items()))
+            if not future.done():
+                break
+            del self._heads[url]
     
     def _merge_head_data(
         self, 
@@ -0,0 +1,184 @@
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Optional, Union
+
+from .config import LLM_CACHE_TTL, LLM_CACHE_MAX_ENTRIES, LLM_CACHE_MAX_BYTES
+from .utils import get_home_folder
+
+# Request arguments that do not change the answer
+_UNKEYED_ARGS = {"api_key", "api_token", "base_url", "api_base", "timeout", "max_retries"}
+
+
+@dataclass
+class LLMCacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+
+class LLMResponseCache:
+    """
+    Content-addressed store of LLM responses, shared by all LLM strategies.
+
+    An entry is keyed by the SHA-256 of the provider, the full prompt (prompt
+    template, chunk and schema/instruction as sent) and the arguments that
+    shape the answer, so an unchanged chunk maps to the same entry on every
+    recrawl. Entries live in one SQLite table, expire after ``ttl`` seconds
+    and are evicted least recently used first once the store holds more than
+    ``max_entries`` entries or ``max_bytes`` of responses.
+
+    Args:
+        path: Database file, defaults to ``~/.crawl4ai/llm_cache/responses.db``.
+        ttl: Seconds an entry stays valid, None for no expiry.
+        max_entries: Entry limit, None for no limit.
+        max_bytes: Size limit for stored responses, None for no limit.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        ttl: Optional[float] = LLM_CACHE_TTL,
+        max_entries: Optional[int] = LLM_CACHE_MAX_ENTRIES,
+        max_bytes: Optional[int] = LLM_CACHE_MAX_BYTES,
+    ):
+        if path is None:
+            path = Path(get_home_folder()) / "llm_cache" / "responses.db"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = LLMCacheStats()
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL
+                ) WITHOUT ROWID
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_responses_accessed ON llm_responses (accessed)"
+            )
+        self._entries, self._bytes = self._totals()
+
+    @staticmethod
+    def make_key(provider: str, prompt: str, json_response: bool = False,
+                 extra_args: Optional[Dict[str, Any]] = None) -> str:
+        args = {k: v for k, v in (extra_args or {}).items() if k not in _UNKEYED_ARGS}
+        material = json.dumps(
+            [provider, json_response, args, hashlib.sha256(prompt.encode("utf-8")).hexdigest()],
+            sort_keys=True, default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _totals(self):
+        entries, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses"
+        ).fetchone()
+        return entries, size
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The cached response for `key`, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT response, created FROM llm_responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row and (self.ttl is None or row[1] > now - self.ttl):
+                    with self._conn:
+                        self._conn.execute(
+                            "UPDATE llm_responses SET accessed = ? WHERE key = ?", (now, key)
+                        )
+                    self.stats.hits += 1
+                    return json.loads(row[0])
+            except (sqlite3.Error, json.JSONDecodeError):
+                pass  # a broken entry only costs an LLM call
+            self.stats.misses += 1
+            return None
+
+    def set(self, key: str, provider: str, response: Dict[str, Any]) -> None:
+        data = json.dumps(response, separators=(",", ":"), default=str)
+        now = time.time()
+        with self._lock:
+            try:
+                with self._conn:
+                    old = self._conn.execute(
+                        "SELECT size FROM llm_responses WHERE key = ?", (key,)
+                    ).fetchone()
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO llm_responses "
+                        "(key, provider, response, size, created, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, provider, data, len(data), now, now),
+                    )
+                self.stats.writes += 1
+                self._entries += 0 if old else 1
+                self._bytes += len(data) - (old[0] if old else 0)
+                if self._over_limits():
+                    self._evict()
+            except sqlite3.Error:
+                pass
+
+    def _over_limits(self, slack: float = 1.0) -> bool:
+        return bool(
+            (self.max_entries and self._entries > self.max_entries * slack)
+            or (self.max_bytes and self._bytes > self.max_bytes * slack)
+        )
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones down to 90% of the limits"""
+        with self._conn:
+            if self.ttl is not None:
+                cur = self._conn.execute(
+                    "DELETE FROM llm_responses WHERE created <= ?", (time.time() - self.ttl,)
+                )
+                self.stats.evictions += cur.rowcount
+            # Other processes may share the file: start from the real totals
+            self._entries, self._bytes = self._totals()
+            if not self._over_limits(0.9):
+                return
+            doomed = []
+            entries, size = self._entries, self._bytes
+            for key, entry_size in self._conn.execute(
+                "SELECT key, size FROM llm_responses ORDER BY accessed"
+            ):
+                if not (
+                    (self.max_entries and entries > self.max_entries * 0.9)
+                    or (self.max_bytes and size > self.max_bytes * 0.9)
+                ):
+                    break
+                doomed.append((key,))
+                entries -= 1
+                size -= entry_size
+            self._conn.executemany("DELETE FROM llm_responses WHERE key = ?", doomed)
+            self.stats.evictions += len(doomed)
+            self._entries, self._bytes = entries, size
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._entries = self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = asdict(self.stats)
+        stats["entries"] = self._entries
+        stats["bytes"] = self._bytes
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
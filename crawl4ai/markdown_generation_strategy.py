@@ -1,15 +1,21 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, Tuple
 from .models import MarkdownGenerationResult
-from .html2text import CustomHTML2Text
+from .html2text import CustomHTML2Text, LXMLHTML2Text
+from .html_document import FULL_DOCUMENT
 # from .types import RelevantContentFilter
 from .content_filter_strategy import RelevantContentFilter
 import re
+from itertools import accumulate
 from urllib.parse import urljoin
+from lxml import etree
 
 # Pre-compile the regex pattern
 LINK_PATTERN = re.compile(r'!?\[([^\]]+)\]\(([^)]+?)(?:\s+"([^"]*)")?\)')
 
+# Entity references html.parser would decode differently from lxml
+UNREPLAYABLE_ENTITY = re.compile(r"&(?!(?:amp|lt|gt|quot);)[#a-zA-Z]")
+
 
 def fast_urljoin(base: str, url: str) -> str:
     """Fast URL joining for common cases."""
@@ -71,6 +77,8 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
         MarkdownGenerationResult: Result containing raw markdown, fit markdown, fit HTML, and references markdown.
     """
 
+    html2text_class = CustomHTML2Text
+
     def __init__(
         self,
         content_filter: Optional[RelevantContentFilter] = None,
@@ -100,13 +108,17 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
         Returns:
             Tuple[str, str]: Converted markdown and references markdown.
         """
+        return self._cite_links(markdown, LINK_PATTERN.finditer(markdown), base_url)
+
+    def _cite_links(self, markdown: str, matches, base_url: str = "") -> Tuple[str, str]:
+        """Replace the given LINK_PATTERN matches, in order, with citations."""
         link_map = {}
         url_cache = {}  # Cache for URL joins
         parts = []
         last_end = 0
         counter = 1
 
-        for match in LINK_PATTERN.finditer(markdown):
+        for match in matches:
             parts.append(markdown[last_end : match.start()])
             text, url, title = match.groups()
 
@@ -145,6 +157,16 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
 
         return converted_text, "".join(references)
 
+    def _html_to_markdown(self, h: CustomHTML2Text, html: str) -> str:
+        """Convert HTML with an html2text_class converter."""
+        return h.handle(html)
+
+    def _markdown_citations(
+        self, h: CustomHTML2Text, raw_markdown: str, base_url: str = ""
+    ) -> Tuple[str, str]:
+        """Citations for the raw markdown produced by the last _html_to_markdown call."""
+        return self.convert_links_to_citations(raw_markdown, base_url)
+
     def generate_markdown(
         self,
         input_html: str,
@@ -177,7 +199,7 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
         """
         try:
             # Initialize HTML2Text with default options for better conversion
-            h = CustomHTML2Text(baseurl=base_url)
+            h = self.html2text_class(baseurl=base_url)
             default_options = {
                 "body_width": 0,  # Disable text wrapping
                 "ignore_emphasis": False,
@@ -207,7 +229,7 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
 
             # Generate raw markdown
             try:
-                raw_markdown = h.handle(input_html)
+                raw_markdown = self._html_to_markdown(h, input_html)
             except Exception as e:
                 raw_markdown = f"Error converting HTML to markdown: {str(e)}"
 
@@ -221,7 +243,7 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
                     (
                         markdown_with_citations,
                         references_markdown,
-                    ) = self.convert_links_to_citations(raw_markdown, base_url)
+                    ) = self._markdown_citations(h, raw_markdown, base_url)
                 except Exception as e:
                     markdown_with_citations = raw_markdown
                     references_markdown = f"Error generating citations: {str(e)}"
@@ -236,7 +258,7 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
                     filtered_html = "\n".join(
                         "<div>{}</div>".format(s) for s in filtered_html
                     )
-                    fit_markdown = h.handle(filtered_html)
+                    fit_markdown = self._html_to_markdown(h, filtered_html)
                 except Exception as e:
                     fit_markdown = f"Error generating fit markdown: {str(e)}"
                     filtered_html = ""
@@ -258,3 +280,76 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
                 fit_markdown="",
                 fit_html="",
             )
+
+
+class LXMLMarkdownGenerator(DefaultMarkdownGenerator):
+    """
+    Markdown generator that converts an lxml tree instead of feeding the HTML
+    through html.parser.
+
+    How it works:
+    1. Parse the input HTML with lxml and walk the tree with LXMLHTML2Text,
+       which replays the parser events into the same converter
+       DefaultMarkdownGenerator uses.
+    2. Build citations from the link positions recorded during the walk.
+    3. Generate fit markdown the same way if a content filter is provided.
+    4. Return MarkdownGenerationResult.
+
+    For serialized trees, which is what cleaned_html and fit_html are, the
+    output is the same as DefaultMarkdownGenerator's. Input containing entity
+    references other than &amp;, &lt;, &gt; and &quot; (usually raw_html) is
+    converted with html.parser, as html2text maps some of them to ASCII.
+    Citations only differ for link-like text the converter did not write as a
+    link, such as ``[x](y)`` inside code, which is left as it is.
+
+    Args:
+        content_filter (Optional[RelevantContentFilter]): Content filter for generating fit markdown.
+        options (Optional[Dict[str, Any]]): Additional options for markdown generation. Defaults to None.
+        content_source (str): Source of content to generate markdown from. Options: "cleaned_html", "raw_html", "fit_html". Defaults to "cleaned_html".
+
+    Returns:
+        MarkdownGenerationResult: Result containing raw markdown, fit markdown, fit HTML, and references markdown.
+    """
+
+    html2text_class = LXMLHTML2Text
+
+    def _html_to_markdown(self, h: LXMLHTML2Text, html: str) -> str:
+        if UNREPLAYABLE_ENTITY.search(html):
+            return h.handle(html)
+        if FULL_DOCUMENT.match(html):
+            return h.handle_tree(etree.HTML(html))
+        # Wrap fragments in a body so lxml does not put leading text in a <p>
+        root = etree.HTML(f"<html><body>{html}</body></html>")
+        return h.handle_tree(root.find("body"), skip_root=True)
+
+    def _markdown_citations(
+        self, h: LXMLHTML2Text, raw_markdown: str, base_url: str = ""
+    ) -> Tuple[str, str]:
+        parts = h.last_parts
+        if not parts or h.body_width or h.pad_tables:
+            # Wrapping and table padding move the recorded link positions
+            return self.convert_links_to_citations(raw_markdown, base_url)
+
+        markdown = "".join(parts)
+        offsets = [0, *accumulate(map(len, parts))]
+
+        def matches():
+            last_end = 0
+            for index in h.link_starts:
+                part = parts[index]
+                # "[" parts can be taken back when a header opens inside a link
+                if part != "[" and not part.startswith("!["):
+                    continue
+                if offsets[index] < last_end:
+                    continue
+                match = LINK_PATTERN.match(markdown, offsets[index])
+                if match:
+                    last_end = match.end()
+                    yield match
+
+        converted, references = self._cite_links(markdown, matches(), base_url)
+        nbsp = "\xa0" if h.unicode_snob else " "
+        converted = converted.replace("&nbsp_place_holder;", nbsp).replace("    ```", "```")
+        references = references.replace("&nbsp_place_holder;", nbsp)
+        return converted, references
+
@@ -1,4 +1,5 @@
 import os
+import re
 import asyncio
 from pathlib import Path
 import aiosqlite
@@ -8,10 +9,13 @@ import aiofiles
 import shutil
 from datetime import datetime
 from .async_logger import AsyncLogger, LogLevel
+from .content_store import ContentStore
 
 # Initialize logger
 logger = AsyncLogger(log_level=LogLevel.DEBUG, verbose=True)
 
+CONTENT_REF_PATTERN = re.compile(r"^[0-9a-f]{16}(\.(zst|gz))?(@[\w.-]+:\d+:\d+)?$")
+
 # logging.basicConfig(level=logging.INFO)
 # logger = logging.getLogger(__name__)
 
@@ -46,6 +50,9 @@ class DatabaseMigration:
     async def _store_content(self, content: str, content_type: str) -> str:
         if not content:
             return ""
+        # Already a content store reference (hash, hash.zst, hash.gz@segment...)
+        if CONTENT_REF_PATTERN.match(content):
+            return content
 
         content_hash = self._generate_content_hash(content)
         file_path = os.path.join(self.content_paths[content_type], content_hash)
@@ -133,6 +140,86 @@ class DatabaseMigration:
             raise e
 
 
+class ContentStoreMigration:
+    """Rewrite legacy uncompressed content files into the compressed ContentStore"""
+
+    # crawled_data column -> content type
+    CONTENT_COLUMNS = {
+        "html": "html",
+        "cleaned_html": "cleaned",
+        "markdown": "markdown",
+        "extracted_content": "extracted",
+        "screenshot": "screenshots",
+    }
+
+    def __init__(self, db_path: str, compression: str = "auto", pack_threshold: int = 0):
+        self.db_path = db_path
+        self.store = ContentStore(
+            os.path.dirname(db_path),
+            compression=compression,
+            pack_threshold=pack_threshold,
+        )
+
+    async def migrate(self, batch_size: int = 500):
+        """Compress every legacy blob still referenced by a bare hash"""
+        logger.info("Compressing cached content...", tag="INIT")
+        migrated = {}  # (content_type, legacy ref) -> new ref
+        legacy_files = set()
+        updated_rows = 0
+
+        async with aiosqlite.connect(self.db_path) as db:
+            columns = ", ".join(self.CONTENT_COLUMNS)
+            async with db.execute(f"SELECT url, {columns} FROM crawled_data") as cursor:
+                rows = await cursor.fetchall()
+
+            for i, row in enumerate(rows, 1):
+                url, refs = row[0], row[1:]
+                updates = {}
+                for (column, content_type), ref in zip(self.CONTENT_COLUMNS.items(), refs):
+                    # Compressed and packed references always carry an extension
+                    if not ref or "." in ref:
+                        continue
+                    key = (content_type, ref)
+                    if key not in migrated:
+                        legacy_path = os.path.join(self.store.content_paths[content_type], ref)
+                        if not os.path.exists(legacy_path):
+                            continue
+                        async with aiofiles.open(legacy_path, "r", encoding="utf-8") as f:
+                            content = await f.read()
+                        migrated[key] = await self.store.store(content, content_type)
+                        legacy_files.add(legacy_path)
+                    updates[column] = migrated[key]
+
+                if updates:
+                    assignments = ", ".join(f"{column} = ?" for column in updates)
+                    await db.execute(
+                        f"UPDATE crawled_data SET {assignments} WHERE url = ?",
+                        (*updates.values(), url),
+                    )
+                    updated_rows += 1
+
+                if i % batch_size == 0:
+                    await db.commit()
+                    logger.info(f"Compressed content of {i} records...", tag="INIT")
+            await db.commit()
+
+        # Rows now point at the compressed copies
+        freed = 0
+        for legacy_path in legacy_files:
+            try:
+                freed += os.path.getsize(legacy_path)
+                os.remove(legacy_path)
+            except OSError:
+                pass
+
+        logger.success(
+            f"Content compression completed. {updated_rows} records updated, "
+            f"{len(legacy_files)} files rewritten ({freed / (1024 * 1024):.1f} MB of legacy files removed).",
+            tag="COMPLETE",
+        )
+        return updated_rows
+
+
 async def backup_database(db_path: str) -> str:
     """Create backup of existing database"""
     if not os.path.exists(db_path):
@@ -177,6 +264,27 @@ async def run_migration(db_path: Optional[str] = None):
     await migration.migrate_database()
 
 
+async def run_content_compression(
+    db_path: Optional[str] = None, compression: str = "auto", pack_threshold: int = 0
+):
+    """Compress legacy content files of an existing cache in place"""
+    if db_path is None:
+        db_path = os.path.join(Path.home(), ".crawl4ai", "crawl4ai.db")
+
+    if not os.path.exists(db_path):
+        logger.info("No existing database found. Skipping compression.", tag="INIT")
+        return
+
+    backup_path = await backup_database(db_path)
+    if not backup_path:
+        return
+
+    migration = ContentStoreMigration(
+        db_path, compression=compression, pack_threshold=pack_threshold
+    )
+    await migration.migrate()
+
+
 def main():
     """CLI entry point for migration"""
     import argparse
@@ -185,9 +293,31 @@ def main():
         description="Migrate Crawl4AI database to file-based storage"
     )
     parser.add_argument("--db-path", help="Custom database path")
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Compress legacy uncompressed content files of the cache",
+    )
+    parser.add_argument(
+        "--compression",
+        default="auto",
+        choices=["auto", "zstd", "gzip"],
+        help="Codec used with --compress (auto: zstd if installed, else gzip)",
+    )
+    parser.add_argument(
+        "--pack-threshold",
+        type=int,
+        default=0,
+        help="With --compress, pack blobs smaller than this many bytes into segment files",
+    )
     args = parser.parse_args()
 
-    asyncio.run(run_migration(args.db_path))
+    if args.compress:
+        asyncio.run(
+            run_content_compression(args.db_path, args.compression, args.pack_threshold)
+        )
+    else:
+        asyncio.run(run_migration(args.db_path))
 
 
 if __name__ == "__main__":
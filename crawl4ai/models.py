@@ -1,3 +1,4 @@
+import asyncio
 from pydantic import BaseModel, HttpUrl, PrivateAttr, Field
 from typing import List, Dict, Optional, Callable, Awaitable, Union, Any
 from typing import AsyncGenerator
@@ -17,6 +18,9 @@ class DomainState:
     last_request_time: float = 0
     current_delay: float = 0
     fail_count: int = 0
+    in_flight: int = 0
+    tokens: Optional[float] = None  # Token bucket level, None until first use
+    last_refill: float = 0
 
 
 @dataclass
@@ -125,7 +129,12 @@ class MarkdownGenerationResult(BaseModel):
 
     def __str__(self):
         return self.raw_markdown
-    
+
+
+# Heavy CrawlResult fields that may be loaded (from the cache) or computed
+# (fit_html) on first access
+LAZY_RESULT_FIELDS = frozenset({"html", "cleaned_html", "screenshot", "fit_html"})
+
 class CrawlResult(BaseModel):
     url: str
     html: str
@@ -140,6 +149,8 @@ class CrawlResult(BaseModel):
     pdf: Optional[bytes] = None
     mhtml: Optional[str] = None
     _markdown: Optional[MarkdownGenerationResult] = PrivateAttr(default=None)
+    _lazy_fields: Dict[str, Callable[[], Any]] = PrivateAttr(default_factory=dict)
+    _lazy_checks: Dict[str, Callable[[], bool]] = PrivateAttr(default_factory=dict)
     extracted_content: Optional[str] = None
     metadata: Optional[dict] = None
     error_message: Optional[str] = None
@@ -151,6 +162,7 @@ class CrawlResult(BaseModel):
     redirected_url: Optional[str] = None
     network_requests: Optional[List[Dict[str, Any]]] = None
     console_messages: Optional[List[Dict[str, Any]]] = None
+    revalidated: bool = False  # Served from cache after a 304 Not Modified
     tables: List[Dict] = Field(default_factory=list)  # NEW – [{headers,rows,caption,summary}]
 
     class Config:
@@ -252,11 +264,76 @@ class CrawlResult(BaseModel):
         serialized despite being stored in a private attribute. If the serialization
         requirements change, this is where you would update the logic.
         """
+        self.load_lazy_fields()
         result = super().model_dump(*args, **kwargs)
         if self._markdown is not None:
             result["markdown"] = self._markdown.model_dump() 
         return result
 
+    # Lazy fields: the cache hands out results whose html/cleaned_html/screenshot
+    # are only read from disk when first accessed, and fit_html is only
+    # computed when first accessed. The first access runs the loader right
+    # there, which for cached fields means blocking file reads and
+    # decompression; code running on an event loop can load them in a
+    # thread first with `await result.aload_lazy_fields()`.
+
+    def set_lazy_field(
+        self,
+        name: str,
+        loader: Callable[[], Any],
+        exists: Optional[Callable[[], bool]] = None,
+    ):
+        """
+        Defer a heavy field until it is accessed; `loader` returns its value.
+        `exists` cheaply tells whether the loader will find anything, see
+        has_content.
+        """
+        if name not in LAZY_RESULT_FIELDS:
+            raise ValueError(f"'{name}' can not be loaded lazily")
+        self._lazy_fields[name] = loader
+        if exists is not None:
+            self._lazy_checks[name] = exists
+        else:
+            self._lazy_checks.pop(name, None)
+
+    def has_content(self, name: str) -> bool:
+        """Whether a field is non-empty, without loading a deferred value."""
+        if name in self._lazy_fields:
+            exists = self._lazy_checks.get(name)
+            return exists() if exists else True
+        return bool(getattr(self, name))
+
+    def load_lazy_fields(self):
+        """Materialize every deferred field."""
+        for name in list(self._lazy_fields):
+            getattr(self, name)
+
+    async def aload_lazy_fields(self):
+        """Materialize every deferred field in a worker thread."""
+        if self._lazy_fields:
+            await asyncio.to_thread(self.load_lazy_fields)
+
+    def __getattribute__(self, name):
+        if name in LAZY_RESULT_FIELDS:
+            private = object.__getattribute__(self, "__pydantic_private__")
+            lazy = private.get("_lazy_fields") if private else None
+            if lazy and name in lazy:
+                private["_lazy_checks"].pop(name, None)
+                object.__getattribute__(self, "__dict__")[name] = lazy.pop(name)()
+        return super().__getattribute__(name)
+
+    def __setattr__(self, name, value):
+        if name in LAZY_RESULT_FIELDS:
+            self._lazy_fields.pop(name, None)
+            self._lazy_checks.pop(name, None)
+        super().__setattr__(name, value)
+
+    def __copy__(self):
+        copied = super().__copy__()
+        copied._lazy_fields = dict(self._lazy_fields)
+        copied._lazy_checks = dict(self._lazy_checks)
+        return copied
+
 class StringCompatibleMarkdown(str):
     """A string subclass that also provides access to MarkdownGenerationResult attributes"""
     def __new__(cls, markdown_result):
@@ -321,6 +398,7 @@ class AsyncCrawlResponse(BaseModel):
     redirected_url: Optional[str] = None
     network_requests: Optional[List[Dict[str, Any]]] = None
     console_messages: Optional[List[Dict[str, Any]]] = None
+    not_modified: bool = False  # 304 answer to a conditional request
 
     class Config:
         arbitrary_types_allowed = True
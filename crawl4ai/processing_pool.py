@@ -0,0 +1,126 @@
+import os
+import time
+import asyncio
+import multiprocessing
+from dataclasses import dataclass, asdict
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+@dataclass
+class ProcessingStats:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    peak_in_flight: int = 0
+    # Time callers spent waiting for a free slot (backpressure)
+    total_wait_time: float = 0.0
+    total_run_time: float = 0.0
+
+
+class ProcessingPool:
+    """
+    Runs CPU-bound page processing (scraping, markdown generation, extraction)
+    off the event loop.
+
+    Modes:
+    - "thread": ThreadPoolExecutor. lxml releases the GIL while parsing, so
+      this already spreads work over several cores and needs no pickling.
+    - "process": ProcessPoolExecutor (spawn context). Full parallelism; the
+      function and its arguments must be picklable.
+    - "inline": run on the event loop, as before. Useful for debugging.
+
+    At most ``max_in_flight`` jobs are submitted at any time; further callers
+    wait for a slot, so fast fetches cannot pile up unbounded parse work.
+
+    Args:
+        mode: "thread", "process" or "inline".
+        max_workers: Executor size, defaults to the number of CPUs (max 8).
+        max_in_flight: Submitted job limit, defaults to ``2 * max_workers``.
+        executor: Use this executor instead of creating one. It is not shut
+            down by ``shutdown``.
+    """
+
+    MODES = ("thread", "process", "inline")
+
+    def __init__(
+        self,
+        mode: str = "thread",
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown processing mode: {mode}")
+        self.mode = mode
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.max_in_flight = max_in_flight or 2 * self.max_workers
+        self.stats = ProcessingStats()
+
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._in_flight = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def is_process_pool(self) -> bool:
+        return self.mode == "process"
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="crawl4ai-processing",
+                )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Semaphores bind to the loop they are first used on
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._loop = loop
+        return self._semaphore
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` in the pool and return its result"""
+        if self.mode == "inline":
+            return fn(*args)
+
+        semaphore = self._get_semaphore()
+        t0 = time.perf_counter()
+        async with semaphore:
+            t1 = time.perf_counter()
+            self.stats.total_wait_time += t1 - t0
+            self.stats.submitted += 1
+            self._in_flight += 1
+            self.stats.peak_in_flight = max(self.stats.peak_in_flight, self._in_flight)
+            try:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._get_executor(), fn, *args)
+                self.stats.completed += 1
+                return result
+            except BaseException:
+                self.stats.failed += 1
+                raise
+            finally:
+                self._in_flight -= 1
+                self.stats.total_run_time += time.perf_counter() - t1
+
+    def get_stats(self) -> Dict[str, float]:
+        stats = asdict(self.stats)
+        stats["in_flight"] = self._in_flight
+        return stats
+
+    def shutdown(self, wait: bool = True):
+        """Release the executor; the next ``run`` creates a new one"""
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
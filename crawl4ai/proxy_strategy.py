@@ -1,7 +1,11 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from itertools import cycle
+from urllib.parse import urlparse
 import os
+import random
+import time
 
 
 ########### ATTENTION PEOPLE OF EARTH ###########
@@ -131,6 +135,21 @@ class ProxyRotationStrategy(ABC):
         """Add proxy configurations to the strategy"""
         pass
 
+    async def get_proxy_for_url(self, url: str) -> Optional[ProxyConfig]:
+        """Get the proxy to crawl `url` through; by default the next one in rotation"""
+        return await self.get_next_proxy()
+
+    def report_result(
+        self,
+        proxy: ProxyConfig,
+        status_code: Optional[int] = None,
+        latency: Optional[float] = None,
+        error: Optional[str] = None,
+        html: Optional[str] = None,
+    ):
+        """Feedback on a crawl made through `proxy`; ignored unless a strategy scores proxies"""
+        pass
+
 class RoundRobinProxyStrategy:
     """Simple round-robin proxy rotation strategy using ProxyConfig objects"""
 
@@ -156,3 +175,187 @@ class RoundRobinProxyStrategy:
         if not self._proxy_cycle:
             return None
         return next(self._proxy_cycle)
+
+
+@dataclass
+class ProxyHealth:
+    successes: int = 0
+    failures: int = 0  # connection errors, timeouts, empty pages
+    bans: int = 0  # ban status codes or markers
+    latency: Optional[float] = None  # EWMA of crawl time in seconds
+    consecutive_failures: int = 0
+    ejections: int = 0  # in a row, without a success in between
+    ejected_until: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        # Smoothed, so a new proxy starts at 0.5 instead of 0 or 1
+        return (self.successes + 1) / (self.successes + self.failures + self.bans + 2)
+
+
+class HealthAwareProxyStrategy(ProxyRotationStrategy):
+    """
+    Proxy rotation weighted by how well each proxy has been doing.
+
+    Each crawl reports back (``report_result``) and the proxy's success rate
+    and latency EWMA are updated. A proxy is picked at random with weight
+    ``success_rate / (1 + latency / latency_scale)``, so slow or failing
+    proxies get fewer crawls instead of an equal share.
+
+    A status code in ``ban_status_codes`` (or a page containing one of
+    ``ban_markers``, e.g. a captcha vendor's script name) counts as a ban.
+    After ``max_failures`` failures or bans in a row a proxy is ejected for
+    ``eject_seconds``, doubling with each ejection up to ``max_eject_seconds``.
+    Once that has passed it is probed again: one more failure ejects it
+    again, a success restores it. When every proxy is ejected the one that
+    comes back soonest is used, rather than none.
+
+    With ``sticky=True`` every crawl of a domain goes through the same proxy
+    while it stays healthy. The browser context is keyed by the proxy, so a
+    domain keeps one context instead of a new one per rotation.
+
+    Args:
+        proxies: Proxy configurations to rotate through.
+        sticky: Keep one proxy per domain.
+        max_failures: Failures or bans in a row before a proxy is ejected.
+        eject_seconds: First ejection period.
+        max_eject_seconds: Longest ejection period.
+        latency_scale: Seconds of latency that halve a proxy's weight.
+        ewma_alpha: Weight of the newest latency in the average.
+        ban_status_codes: Status codes meaning the target blocked the proxy.
+        ban_markers: Strings in a page meaning the same.
+    """
+
+    def __init__(
+        self,
+        proxies: List[ProxyConfig] = None,
+        sticky: bool = False,
+        max_failures: int = 3,
+        eject_seconds: float = 60.0,
+        max_eject_seconds: float = 1800.0,
+        latency_scale: float = 5.0,
+        ewma_alpha: float = 0.3,
+        ban_status_codes: Sequence[int] = (403, 429),
+        ban_markers: Sequence[str] = (),
+    ):
+        self.sticky = sticky
+        self.max_failures = max_failures
+        self.eject_seconds = eject_seconds
+        self.max_eject_seconds = max_eject_seconds
+        self.latency_scale = latency_scale
+        self.ewma_alpha = ewma_alpha
+        self.ban_status_codes = frozenset(ban_status_codes)
+        self.ban_markers = tuple(ban_markers)
+        self._proxies: List[ProxyConfig] = []
+        self._health: Dict[str, ProxyHealth] = {}
+        self._by_server: Dict[str, ProxyConfig] = {}
+        self._domains: Dict[str, str] = {}  # domain -> server, with sticky
+        if proxies:
+            self.add_proxies(proxies)
+
+    def add_proxies(self, proxies: List[ProxyConfig]):
+        """Add new proxies to the pool; a server already in it is not added twice"""
+        for proxy in proxies:
+            if proxy.server not in self._by_server:
+                self._proxies.append(proxy)
+                self._by_server[proxy.server] = proxy
+                self._health[proxy.server] = ProxyHealth()
+
+    def weight(self, proxy: ProxyConfig) -> float:
+        health = self._health[proxy.server]
+        if health.latency is None:
+            return health.success_rate
+        return health.success_rate / (1 + health.latency / self.latency_scale)
+
+    def _available(self, now: float) -> List[ProxyConfig]:
+        return [p for p in self._proxies if self._health[p.server].ejected_until <= now]
+
+    def _pick(self) -> Optional[ProxyConfig]:
+        if not self._proxies:
+            return None
+        candidates = self._available(time.monotonic())
+        if not candidates:
+            return min(self._proxies, key=lambda p: self._health[p.server].ejected_until)
+        return random.choices(candidates, weights=[self.weight(p) for p in candidates])[0]
+
+    async def get_next_proxy(self) -> Optional[ProxyConfig]:
+        """Get a proxy picked by weighted score among those not ejected"""
+        return self._pick()
+
+    async def get_proxy_for_url(self, url: str) -> Optional[ProxyConfig]:
+        """Get the proxy for `url`: its domain's proxy with sticky, else a weighted pick"""
+        if not self.sticky:
+            return self._pick()
+        domain = (urlparse(url).hostname or url).lower()
+        server = self._domains.get(domain)
+        if server is not None and self._health[server].ejected_until <= time.monotonic():
+            return self._by_server[server]
+        proxy = self._pick()
+        if proxy is not None:
+            self._domains[domain] = proxy.server
+        return proxy
+
+    def report_result(
+        self,
+        proxy: ProxyConfig,
+        status_code: Optional[int] = None,
+        latency: Optional[float] = None,
+        error: Optional[str] = None,
+        html: Optional[str] = None,
+    ):
+        """
+        Record how a crawl through `proxy` went.
+
+        Args:
+            proxy: The proxy the crawl went through.
+            status_code: HTTP status of the page, None if there was none.
+            latency: Seconds the fetch took.
+            error: Error message if the crawl failed.
+            html: The page, checked for ban markers.
+        """
+        health = self._health.get(proxy.server)
+        if health is None:
+            return  # not one of ours (anymore)
+
+        if latency is not None and error is None:
+            health.latency = (
+                latency if health.latency is None
+                else self.ewma_alpha * latency + (1 - self.ewma_alpha) * health.latency
+            )
+
+        if error is not None or status_code is None:
+            health.failures += 1
+        elif status_code in self.ban_status_codes or (
+            html and any(marker in html for marker in self.ban_markers)
+        ):
+            health.bans += 1
+        else:
+            health.successes += 1
+            health.consecutive_failures = 0
+            health.ejections = 0
+            return
+
+        health.consecutive_failures += 1
+        if health.consecutive_failures >= self.max_failures:
+            health.ejected_until = time.monotonic() + min(
+                self.eject_seconds * 2 ** health.ejections, self.max_eject_seconds
+            )
+            health.ejections += 1
+            # On return a single failure ejects it again: that crawl is the probe
+            health.consecutive_failures = self.max_failures - 1
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Health of each proxy by server"""
+        now = time.monotonic()
+        return {
+            server: {
+                "successes": health.successes,
+                "failures": health.failures,
+                "bans": health.bans,
+                "success_rate": health.success_rate,
+                "latency": health.latency,
+                "weight": self.weight(self._by_server[server]),
+                "ejected": health.ejected_until > now,
+            }
+            for server, health in self._health.items()
+        }
@@ -0,0 +1,649 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from bs4.builder import HTMLTreeBuilder
+from lxml import etree
+from lxml import html as lhtml
+
+from .html_document import HTMLDocument
+
+
+class SchemaPlanError(ValueError):
+    """A schema (or one of its selectors) that cannot be compiled"""
+
+
+#################################
+# CSS selectors to XPath 1.0    #
+#################################
+
+_IDENT = r"-?(?:[_a-zA-Z]|[^\x00-\x7f]|\\.)(?:[\w-]|[^\x00-\x7f]|\\.)*"
+_TYPE_RE = re.compile(rf"\*|{_IDENT}")
+_NAME_RE = re.compile(_IDENT)
+_ATTR_RE = re.compile(
+    rf"\[\s*({_IDENT})\s*(?:([~|^$*]?=)\s*({_IDENT}|\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*')\s*([a-zA-Z])?\s*)?\]"
+)
+_NTH_RE = re.compile(r"^([+-]?\d*)n(?:\s*([+-])\s*(\d+))?$")
+_WS_RE = re.compile(r"\s*")
+
+
+def _unescape(value: str) -> str:
+    return re.sub(r"\\(.)", r"\1", value)
+
+
+def xpath_literal(value: str) -> str:
+    """Quote a string for use in an XPath expression"""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+def _split_groups(selector: str) -> List[str]:
+    """Split a selector list on the commas outside brackets, parens and quotes"""
+    groups, depth, quote, start = [], 0, None, 0
+    for i, char in enumerate(selector):
+        if quote:
+            if char == quote and selector[i - 1] != "\\":
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+        elif char == "," and depth == 0:
+            groups.append(selector[start:i])
+            start = i + 1
+    groups.append(selector[start:])
+    return groups
+
+
+def _nth(expression: str, count: str) -> List[str]:
+    """Conditions for :nth-*(an+b), given the XPath counting the preceding siblings"""
+    expression = re.sub(r"\s+", "", expression.lower())
+    if expression == "odd":
+        a, b = 2, 1
+    elif expression == "even":
+        a, b = 2, 0
+    elif re.fullmatch(r"[+-]?\d+", expression):
+        a, b = 0, int(expression)
+    else:
+        match = _NTH_RE.match(expression)
+        if not match:
+            raise SchemaPlanError(f"invalid nth expression {expression!r}")
+        a = {"": 1, "+": 1, "-": -1}.get(match.group(1))
+        a = int(match.group(1)) if a is None else a
+        b = int(match.group(3) or 0) * (-1 if match.group(2) == "-" else 1)
+
+    # position = count + 1 must equal a*n + b for some n >= 0
+    if a == 0:
+        return [f"{count} = {b - 1}"] if b >= 1 else ["false()"]
+    if a > 0:
+        conditions = [f"{count} >= {b - 1}"] if b > 1 else []
+        if a > 1:
+            conditions.append(f"({count} + {1 - b}) mod {a} = 0")
+        return conditions
+    if b < 1:
+        return ["false()"]
+    conditions = [f"{count} <= {b - 1}"]
+    if a < -1:
+        conditions.append(f"({b - 1} - {count}) mod {-a} = 0")
+    return conditions
+
+
+class _CompoundParser:
+    """Parses one compound selector (``div.a#b[c]:first-child``) at a time"""
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        self.pos = 0
+
+    def error(self, message: str):
+        raise SchemaPlanError(f"{message} at position {self.pos} in {self.selector!r}")
+
+    def compound(self):
+        """The node test and conditions of the compound at the cursor, or None"""
+        start, test, conditions = self.pos, "*", []
+        match = _TYPE_RE.match(self.selector, self.pos)
+        if match:
+            test = _unescape(match.group()).lower()
+            self.pos = match.end()
+            if self.selector.startswith("|", self.pos):
+                self.error("namespaces are not supported")
+
+        while self.pos < len(self.selector):
+            char = self.selector[self.pos]
+            if char in "#.":
+                name = _NAME_RE.match(self.selector, self.pos + 1)
+                if not name:
+                    self.error("expected a name")
+                value = _unescape(name.group())
+                self.pos = name.end()
+                if char == "#":
+                    conditions.append(f"@id = {xpath_literal(value)}")
+                else:
+                    conditions.append(
+                        f"contains(concat(' ', normalize-space(@class), ' '), {xpath_literal(f' {value} ')})"
+                    )
+            elif char == "[":
+                conditions.append(self.attribute())
+            elif char == ":":
+                conditions.extend(self.pseudo(test))
+            else:
+                break
+
+        if self.pos == start:
+            return None
+        return test, conditions
+
+    def attribute(self) -> str:
+        match = _ATTR_RE.match(self.selector, self.pos)
+        if not match:
+            self.error("invalid attribute selector")
+        self.pos = match.end()
+        name, operator, value, flag = match.groups()
+        attr = "@" + _unescape(name).lower()
+        if not operator:
+            return attr
+        if flag:
+            self.error("attribute flags are not supported")
+        if value[0] in "\"'":
+            value = value[1:-1]
+        value = _unescape(value)
+        literal = xpath_literal(value)
+        if operator == "=":
+            return f"{attr} = {literal}"
+        if operator == "~=":
+            if not value or any(c.isspace() for c in value):
+                return "false()"
+            return f"contains(concat(' ', normalize-space({attr}), ' '), {xpath_literal(f' {value} ')})"
+        if operator == "|=":
+            return f"({attr} = {literal} or starts-with({attr}, {xpath_literal(value + '-')}))"
+        if not value:
+            return "false()"
+        if operator == "^=":
+            return f"starts-with({attr}, {literal})"
+        if operator == "$=":
+            return f"substring({attr}, string-length({attr}) - {len(value) - 1}) = {literal}"
+        return f"contains({attr}, {literal})"
+
+    def pseudo(self, test: str) -> List[str]:
+        if self.selector.startswith("::", self.pos):
+            self.error("pseudo-elements are not supported")
+        name = _NAME_RE.match(self.selector, self.pos + 1)
+        if not name:
+            self.error("expected a pseudo-class")
+        self.pos = name.end()
+        name = name.group().lower()
+
+        argument = None
+        if self.selector.startswith("(", self.pos):
+            depth, end = 0, self.pos
+            for end in range(self.pos, len(self.selector)):
+                depth += {"(": 1, ")": -1}.get(self.selector[end], 0)
+                if depth == 0:
+                    break
+            if depth:
+                self.error("unbalanced parenthesis")
+            argument = self.selector[self.pos + 1:end].strip()
+            self.pos = end + 1
+
+        of_type = "*"
+        if name.endswith("of-type"):
+            if test == "*":
+                self.error(f":{name} needs an element name")
+            of_type = test
+        before, after = f"count(preceding-sibling::{of_type})", f"count(following-sibling::{of_type})"
+
+        if argument is None:
+            if name in ("first-child", "first-of-type"):
+                return [f"not(preceding-sibling::{of_type})"]
+            if name in ("last-child", "last-of-type"):
+                return [f"not(following-sibling::{of_type})"]
+            if name in ("only-child", "only-of-type"):
+                return [f"not(preceding-sibling::{of_type})", f"not(following-sibling::{of_type})"]
+            if name == "empty":
+                return ["not(*)", "not(text())"]
+            if name == "root":
+                return ["not(parent::*)"]
+        elif name in ("nth-child", "nth-of-type"):
+            return _nth(argument, before)
+        elif name in ("nth-last-child", "nth-last-of-type"):
+            return _nth(argument, after)
+        elif name == "not":
+            inner = _CompoundParser(argument)
+            parsed = inner.compound()
+            if parsed is None or inner.pos != len(argument):
+                self.error(f"unsupported :not({argument})")
+            inner_test, inner_conditions = parsed
+            if inner_test != "*":
+                inner_conditions.insert(0, f"self::{inner_test}")
+            return [f"not({' and '.join(inner_conditions) or 'true()'})"]
+        self.error(f"unsupported pseudo-class :{name}")
+
+
+def _translate(selector: str, prefix: str) -> str:
+    parser = _CompoundParser(selector.strip())
+    steps, combinator = [], None
+    while True:
+        parsed = parser.compound()
+        if parsed is None:
+            parser.error("expected a selector")
+        test, conditions = parsed
+        predicate = "".join(f"[{condition}]" for condition in conditions)
+        if combinator is None:
+            steps.append(f"{prefix}{test}{predicate}")
+        elif combinator == " ":
+            steps.append(f"/descendant::{test}{predicate}")
+        elif combinator == ">":
+            steps.append(f"/{test}{predicate}")
+        elif combinator == "~":
+            steps.append(f"/following-sibling::{test}{predicate}")
+        else:
+            self_test = f"[self::{test}]" if test != "*" else ""
+            steps.append(f"/following-sibling::*[1]{self_test}{predicate}")
+
+        whitespace = _WS_RE.match(parser.selector, parser.pos)
+        parser.pos = whitespace.end()
+        if parser.pos == len(parser.selector):
+            return "".join(steps)
+        char = parser.selector[parser.pos]
+        if char in ">+~":
+            combinator = char
+            parser.pos = _WS_RE.match(parser.selector, parser.pos + 1).end()
+        elif whitespace.group():
+            combinator = " "
+        else:
+            parser.error(f"unexpected {char!r}")
+
+
+def css_to_xpath(selector: str, prefix: str = "descendant-or-self::") -> str:
+    """
+    Translate a CSS selector (list) to XPath 1.0.
+
+    Covers element, id, class and attribute selectors, all combinators and the
+    structural pseudo-classes (``:nth-child()``, ``:first-of-type``, ``:not()``
+    of a compound, ...). Anything else raises SchemaPlanError.
+
+    Args:
+        selector: The CSS selector.
+        prefix: Axis the first step of each selector starts from.
+    """
+    return " | ".join(_translate(group, prefix) for group in _split_groups(selector))
+
+
+def _compile_css(selector: str, prefix: str) -> etree.XPath:
+    try:
+        xpath = css_to_xpath(selector, prefix)
+    except SchemaPlanError as error:
+        # cssselect, when installed, knows a few more selectors
+        try:
+            from cssselect import HTMLTranslator
+            xpath = HTMLTranslator().css_to_xpath(selector, prefix=prefix)
+        except Exception:
+            raise error from None
+    return etree.XPath(xpath)
+
+
+#################################
+# How each strategy reads pages #
+#################################
+
+# BeautifulSoup keeps script, style, template and ruby annotation strings apart
+# from the text of the tags around them
+_STRING_CONTAINERS = ("rt", "rp", "style", "script", "template")
+_CONTAINER = " or ".join(f"self::{tag}" for tag in _STRING_CONTAINERS)
+_PLAIN_STRINGS = etree.XPath(f"descendant::text()[not(ancestor::*[{_CONTAINER}])]")
+_CONTAINER_STRINGS = {
+    tag: etree.XPath(f"descendant::text()[ancestor::*[{_CONTAINER}][1][self::{tag}]]")
+    for tag in _STRING_CONTAINERS
+}
+_CDATA_LIST_ATTRIBUTES = HTMLTreeBuilder.DEFAULT_CDATA_LIST_ATTRIBUTES
+_ALL_TEXT = etree.XPath(".//text()")
+
+
+class _Flavor:
+    """Parsing, selector translation and element reading of one strategy"""
+
+    def parse(self, html_content: str, html_document: Optional[HTMLDocument] = None):
+        if html_document is not None and html_document.html == html_content:
+            return html_document.tree
+        try:
+            return lhtml.document_fromstring(html_content)
+        except etree.ParserError:  # empty document
+            return None
+        except ValueError:  # unicode string with an encoding declaration
+            return lhtml.document_fromstring(html_content.encode("utf-8"))
+
+    def base_selector(self, selector: str) -> etree.XPath:
+        return _compile_css(selector, "descendant-or-self::")
+
+    def field_selector(self, selector: str) -> etree.XPath:
+        return _compile_css(selector, "descendant::")
+
+    @staticmethod
+    def attribute(element, name: str):
+        return element.get(name)
+
+
+class _CssFlavor(_Flavor):
+    """JsonCssExtractionStrategy: BeautifulSoup's view of text and attributes"""
+
+    @staticmethod
+    def text(element) -> str:
+        strings = (_CONTAINER_STRINGS.get(element.tag) or _PLAIN_STRINGS)(element)
+        return "".join(string.strip() for string in strings)
+
+    @staticmethod
+    def html(element) -> str:
+        return etree.tostring(element, encoding="unicode", method="html", with_tail=False)
+
+    @staticmethod
+    def attribute(element, name: str):
+        value = element.get(name)
+        if value is not None and (
+            name in _CDATA_LIST_ATTRIBUTES["*"]
+            or name in _CDATA_LIST_ATTRIBUTES.get(element.tag, ())
+        ):
+            return value.split()
+        return value
+
+
+class _LxmlFlavor(_Flavor):
+    """JsonLxmlExtractionStrategy: cssselect semantics, space-joined text"""
+
+    def field_selector(self, selector: str) -> etree.XPath:
+        return _compile_css(selector, "descendant-or-self::")
+
+    @staticmethod
+    def text(element) -> str:
+        return " ".join(t.strip() for t in _ALL_TEXT(element) if t.strip())
+
+    @staticmethod
+    def html(element) -> str:
+        return etree.tostring(element, encoding="unicode", method="html")
+
+
+class _XPathFlavor(_Flavor):
+    """JsonXPathExtractionStrategy: XPath selectors, fragments parsed as such"""
+
+    def parse(self, html_content: str, html_document: Optional[HTMLDocument] = None):
+        # For whole documents html.fromstring builds the same tree as the shared one
+        if (
+            html_document is not None
+            and html_document.html == html_content
+            and html_document.is_full_document
+        ):
+            return html_document.tree
+        try:
+            return lhtml.fromstring(html_content)
+        except etree.ParserError:
+            return None
+
+    def base_selector(self, selector: str) -> etree.XPath:
+        return etree.XPath(selector)
+
+    def field_selector(self, selector: str) -> etree.XPath:
+        xpath = basic_css_to_xpath(selector) if "/" not in selector else selector
+        if not xpath.startswith("."):
+            xpath = "." + xpath
+        return etree.XPath(xpath)
+
+    @staticmethod
+    def text(element) -> str:
+        return "".join(_ALL_TEXT(element)).strip()
+
+    @staticmethod
+    def html(element) -> str:
+        return etree.tostring(element, encoding="unicode")
+
+
+def basic_css_to_xpath(css_selector: str) -> str:
+    """Basic CSS to XPath conversion for common cases"""
+    if " > " in css_selector:
+        parts = css_selector.split(" > ")
+        return "//" + "/".join(parts)
+    if " " in css_selector:
+        parts = css_selector.split(" ")
+        return "//" + "//".join(parts)
+    return "//" + css_selector
+
+
+FLAVORS = {"css": _CssFlavor(), "lxml": _LxmlFlavor(), "xpath": _XPathFlavor()}
+
+_TRANSFORMS = {
+    "lowercase": lambda value: value.lower(),
+    "uppercase": lambda value: value.upper(),
+    "strip": lambda value: value.strip(),
+}
+
+
+class SchemaPlan:
+    """
+    A JSON extraction schema compiled once into plain Python callables.
+
+    Every selector becomes a precompiled ``lxml.etree.XPath``, every field an
+    extractor closure with its reader, regex and transform bound, and computed
+    expressions are compiled to code objects. A plan holds no per-page state,
+    so one plan serves any number of pages and threads; it pickles as its
+    schema and recompiles on the other side.
+
+    ``selector_type`` picks the strategy whose results the plan reproduces:
+    "css" (JsonCssExtractionStrategy, BeautifulSoup's text and attribute
+    conventions; ``html`` fields are serialized by lxml), "lxml"
+    (JsonLxmlExtractionStrategy) or "xpath" (JsonXPathExtractionStrategy).
+
+    Args:
+        schema: The extraction schema.
+        selector_type: "css", "lxml" or "xpath".
+        verbose: Print field errors, like the strategies do.
+
+    Raises:
+        SchemaPlanError: If a selector, pattern or expression does not compile,
+            or the schema is malformed.
+    """
+
+    def __init__(self, schema: Dict[str, Any], selector_type: str = "css", verbose: bool = False):
+        if selector_type not in FLAVORS:
+            raise ValueError(f"Unknown selector type {selector_type!r}, expected one of {list(FLAVORS)}")
+        self.schema = schema
+        self.selector_type = selector_type
+        self.verbose = verbose
+        self._flavor = FLAVORS[selector_type]
+        try:
+            self._base = self._selector(schema["baseSelector"], base=True)
+            self._base_fields = [
+                (field["name"], self._single_field(field)) for field in schema.get("baseFields", [])
+            ]
+            self._fields = self._item(schema["fields"])
+        except (KeyError, TypeError, AttributeError) as e:
+            raise SchemaPlanError(f"Malformed schema: {e!r}") from None
+
+    def __reduce__(self):
+        return SchemaPlan, (self.schema, self.selector_type, self.verbose)
+
+    def _selector(self, selector: str, base: bool = False) -> etree.XPath:
+        try:
+            if base:
+                return self._flavor.base_selector(selector)
+            return self._flavor.field_selector(selector)
+        except (SchemaPlanError, etree.XPathSyntaxError) as e:
+            raise SchemaPlanError(f"Cannot compile selector {selector!r}: {e}") from None
+
+    def _reader(self, field) -> Callable[[Any], Any]:
+        kind = field["type"]
+        if kind == "text":
+            return self._flavor.text
+        if kind == "html":
+            return self._flavor.html
+        if kind == "attribute":
+            attribute, read = field.get("attribute"), self._flavor.attribute
+            return lambda element: read(element, attribute)
+        if kind == "regex":
+            try:
+                pattern = re.compile(field["pattern"])
+            except re.error as e:
+                raise SchemaPlanError(f"Cannot compile pattern of field {field['name']!r}: {e}") from None
+            text = self._flavor.text
+
+            def read_regex(element):
+                match = pattern.search(text(element))
+                return match.group(1) if match else None
+
+            return read_regex
+        return lambda element: None
+
+    def _single_field(self, field) -> Callable[[Any], Any]:
+        select = self._selector(field["selector"]) if "selector" in field else None
+        read = self._reader(field)
+        transform = _TRANSFORMS.get(field["transform"], lambda value: value) if "transform" in field else None
+        default = field.get("default")
+
+        def extract(element):
+            if select is not None:
+                selected = select(element)
+                if not selected:
+                    return default
+                element = selected[0]
+            value = read(element)
+            if transform is not None:
+                value = transform(value)
+            return value if value is not None else default
+
+        return extract
+
+    def _list_item(self, fields) -> Callable[[Any], Dict[str, Any]]:
+        extractors = [(field["name"], self._single_field(field)) for field in fields]
+
+        def extract(element):
+            item = {}
+            for name, extractor in extractors:
+                value = extractor(element)
+                if value is not None:
+                    item[name] = value
+            return item
+
+        return extract
+
+    def _field(self, field) -> Callable[[Any], Any]:
+        kind, name, default = field["type"], field["name"], field.get("default")
+        if kind in ("nested", "list", "nested_list"):
+            select = self._selector(field["selector"])
+            item = self._list_item(field["fields"]) if kind == "list" else self._item(field["fields"])
+            if kind == "nested":
+                def extract(element):
+                    selected = select(element)
+                    return item(selected[0]) if selected else {}
+            else:
+                def extract(element):
+                    return [item(el) for el in select(element)]
+        else:
+            extract = self._single_field(field)
+
+        verbose = self.verbose
+
+        def guarded(element):
+            try:
+                return extract(element)
+            except Exception as e:
+                if verbose:
+                    print(f"Error extracting field {name}: {str(e)}")
+                return default
+
+        return guarded
+
+    def _computed(self, field) -> Callable[[Dict[str, Any]], Any]:
+        name, default, verbose = field["name"], field.get("default"), self.verbose
+        if "expression" in field:
+            try:
+                code = compile(field["expression"], f"<field {name}>", "eval")
+            except SyntaxError as e:
+                raise SchemaPlanError(f"Cannot compile expression of field {name!r}: {e}") from None
+            compute = lambda item: eval(code, {}, item)  # noqa: E731
+        elif "function" in field:
+            compute = field["function"]
+        else:
+            return lambda item: None
+
+        def guarded(item):
+            try:
+                return compute(item)
+            except Exception as e:
+                if verbose:
+                    print(f"Error computing field {name}: {str(e)}")
+                return default
+
+        return guarded
+
+    def _item(self, fields) -> Callable[[Any], Dict[str, Any]]:
+        steps = [
+            (field["name"], field["type"] == "computed",
+             self._computed(field) if field["type"] == "computed" else self._field(field))
+            for field in fields
+        ]
+
+        def extract(element):
+            item = {}
+            for name, computed, extractor in steps:
+                value = extractor(item) if computed else extractor(element)
+                if value is not None:
+                    item[name] = value
+            return item
+
+        return extract
+
+    def extract(
+        self, html_content: str, html_document: Optional[HTMLDocument] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract the items of one page.
+
+        Args:
+            html_content: The page HTML.
+            html_document: The page's shared parse, reused when it matches.
+
+        Returns:
+            List[Dict[str, Any]]: One dict per base element with any field.
+        """
+        root = self._flavor.parse(html_content, html_document)
+        if root is None:
+            return []
+        results = []
+        for element in self._base(root):
+            item = {}
+            for name, extractor in self._base_fields:
+                value = extractor(element)
+                if value is not None:
+                    item[name] = value
+            item.update(self._fields(element))
+            if item:
+                results.append(item)
+        return results
+
+    def extract_many(
+        self,
+        documents: Iterable[Union[str, HTMLDocument]],
+        max_workers: Optional[int] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Apply the plan to many pages.
+
+        Args:
+            documents: HTML strings or HTMLDocuments (whose trees are reused).
+            max_workers: Extract on this many threads; lxml parses without
+                the GIL, so this helps most on large pages.
+
+        Returns:
+            List[List[Dict[str, Any]]]: The items of each page, in order.
+        """
+        def extract(document):
+            if isinstance(document, HTMLDocument):
+                return self.extract(document.html, html_document=document)
+            return self.extract(document)
+
+        if max_workers and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                return list(pool.map(extract, documents))
+        return [extract(document) for document in documents]
@@ -11,10 +11,10 @@ from lxml import etree
 import re
 import json
 from .types import LLMConfig, create_llm_config
-from .utils import perform_completion_with_backoff, sanitize_html
+from .utils import aperform_completion_with_backoff, sanitize_html
+from .async_llm import get_llm_client
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import time
+import asyncio
 import tiktoken
 
 
@@ -733,6 +733,15 @@ Your output must conform to the following JSON schema (OpenAPI 3.0 format):
     def extract_tables(self, element: etree.Element, **kwargs) -> List[Dict[str, Any]]:
         """
         Extract tables from HTML using LLM.
+
+        Blocking wrapper around ``aextract_tables``; the LLM requests run on
+        the shared LLM client loop.
+        """
+        return get_llm_client().run_sync(self.aextract_tables(element, **kwargs))
+
+    async def aextract_tables(self, element: etree.Element, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Extract tables from HTML using LLM.
         
         Args:
             element: The HTML element to search for tables
@@ -770,7 +779,7 @@ Your output must conform to the following JSON schema (OpenAPI 3.0 format):
         if self.enable_chunking and self._needs_chunking(html_content):
             if self.verbose:
                 self._log("info", "Content exceeds token threshold, using chunked extraction")
-            return self._extract_with_chunking(html_content)
+            return await self._extract_with_chunking(html_content)
         
         # Single extraction for small content
         # Prepare the prompt
@@ -789,13 +798,15 @@ Return only a JSON array of extracted tables following the specified format."""
                     self._log("info", f"Retry attempt {attempt}/{self.max_tries} for table extraction")
                 
                 # Call LLM with the extraction prompt
-                response = perform_completion_with_backoff(
+                response = await aperform_completion_with_backoff(
                     provider=self.llm_config.provider,
                     prompt_with_variables=self.TABLE_EXTRACTION_PROMPT + "\n\n" + user_prompt + "\n\n MAKE SURE TO EXTRACT ALL DATA, DO NOT LEAVE ANYTHING FOR BRAVITY, YOUR GOAL IS TO RETURN ALL, NO MATTER HOW LONG IS DATA",
                     api_token=self.llm_config.api_token,
                     base_url=self.llm_config.base_url,
                     json_response=True,
-                    extra_args=self.extra_args
+                    extra_args=self.extra_args,
+                    tokens_per_minute=self.llm_config.tokens_per_minute,
+                    cache_mode=self.llm_config.cache_mode,
                 )
                 
                 # Parse the response
@@ -880,8 +891,7 @@ Return only a JSON array of extracted tables following the specified format."""
                 # For unexpected errors, retry if we have attempts left
                 if attempt < self.max_tries:
                     # Add a small delay before retry for rate limiting
-                    import time
-                    time.sleep(1)
+                    await asyncio.sleep(1)
                     continue
                 else:
                     return []
@@ -1082,7 +1092,7 @@ Return only a JSON array of extracted tables following the specified format."""
         # In production, you'd want more sophisticated rebalancing
         return chunks
     
-    def _process_chunk(self, chunk_html: str, chunk_index: int, total_chunks: int, has_headers: bool = True) -> Dict[str, Any]:
+    async def _process_chunk(self, chunk_html: str, chunk_index: int, total_chunks: int, has_headers: bool = True) -> Dict[str, Any]:
         """
         Process a single chunk with the LLM.
         """
@@ -1110,13 +1120,15 @@ Return only a JSON array of extracted tables following the specified format."""
                 if self.verbose and attempt > 1:
                     self._log("info", f"Retry attempt {attempt}/{self.max_tries} for chunk {chunk_index + 1}")
                 
-                response = perform_completion_with_backoff(
+                response = await aperform_completion_with_backoff(
                     provider=self.llm_config.provider,
                     prompt_with_variables=self.TABLE_EXTRACTION_PROMPT + "\n\n" + chunk_prompt,
                     api_token=self.llm_config.api_token,
                     base_url=self.llm_config.base_url,
                     json_response=True,
-                    extra_args=self.extra_args
+                    extra_args=self.extra_args,
+                    tokens_per_minute=self.llm_config.tokens_per_minute,
+                    cache_mode=self.llm_config.cache_mode,
                 )
                 
                 if response and response.choices:
@@ -1162,7 +1174,7 @@ Return only a JSON array of extracted tables following the specified format."""
                     self._log("error", f"Error processing chunk {chunk_index + 1}: {str(e)}")
                 
                 if attempt < self.max_tries:
-                    time.sleep(1)
+                    await asyncio.sleep(1)
                     continue
                 else:
                     return {'chunk_index': chunk_index, 'table': None, 'error': str(e)}
@@ -1205,7 +1217,7 @@ Return only a JSON array of extracted tables following the specified format."""
         
         return [merged_table]
     
-    def _extract_with_chunking(self, html_content: str) -> List[Dict[str, Any]]:
+    async def _extract_with_chunking(self, html_content: str) -> List[Dict[str, Any]]:
         """
         Extract tables using chunking and parallel processing.
         """
@@ -1222,33 +1234,33 @@ Return only a JSON array of extracted tables following the specified format."""
             # No need for parallel processing
             if self.verbose:
                 self._log("info", "Processing as single chunk (no parallelization needed)")
-            result = self._process_chunk(chunks[0], 0, 1, has_headers)
+            result = await self._process_chunk(chunks[0], 0, 1, has_headers)
             return [result['table']] if result.get('table') else []
         
         # Process chunks in parallel
         if self.verbose:
             self._log("info", f"Processing {len(chunks)} chunks in parallel (max workers: {self.max_parallel_chunks})")
         
-        chunk_results = []
-        with ThreadPoolExecutor(max_workers=self.max_parallel_chunks) as executor:
-            # Submit all chunks for processing
-            futures = {
-                executor.submit(self._process_chunk, chunk, i, len(chunks), has_headers): i
-                for i, chunk in enumerate(chunks)
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(futures):
-                chunk_index = futures[future]
+        semaphore = asyncio.Semaphore(self.max_parallel_chunks)
+
+        async def process(chunk: str, chunk_index: int) -> Dict[str, Any]:
+            async with semaphore:
                 try:
-                    result = future.result(timeout=60)  # 60 second timeout per chunk
+                    # 60 second timeout per chunk
+                    result = await asyncio.wait_for(
+                        self._process_chunk(chunk, chunk_index, len(chunks), has_headers), timeout=60
+                    )
                     if self.verbose:
                         self._log("info", f"Chunk {chunk_index + 1}/{len(chunks)} completed successfully")
-                    chunk_results.append(result)
+                    return result
                 except Exception as e:
                     if self.verbose:
                         self._log("error", f"Chunk {chunk_index + 1}/{len(chunks)} processing failed: {str(e)}")
-                    chunk_results.append({'chunk_index': chunk_index, 'table': None, 'error': str(e)})
+                    return {'chunk_index': chunk_index, 'table': None, 'error': str(e)}
+
+        chunk_results = list(await asyncio.gather(
+            *(process(chunk, i) for i, chunk in enumerate(chunks))
+        ))
         
         if self.verbose:
             self._log("info", f"All chunks processed, merging results...")
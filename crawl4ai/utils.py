@@ -39,7 +39,7 @@ from . import __version__
 from typing import Sequence
 
 from itertools import chain
-from collections import deque
+from collections import deque, OrderedDict
 import psutil
 import numpy as np
 
@@ -249,15 +249,36 @@ class VersionManager:
 
 
 class RobotsParser:
+    """
+    Checks URLs against robots.txt, caching the rules per domain.
+
+    Compiled rules are kept in an in-memory LRU of ``max_domains`` entries, so
+    most checks need neither SQLite nor parsing. On a miss the SQLite cache is
+    read in a worker thread, and stale or missing rules are fetched over one
+    shared HTTP session. Concurrent checks for the same domain share a single
+    load. Domains whose robots.txt cannot be fetched are allowed, and remembered
+    in memory for at most ``ERROR_TTL`` seconds.
+
+    Call ``close`` to release the HTTP session.
+    """
+
     # Default 7 days cache TTL
     CACHE_TTL = 7 * 24 * 60 * 60
+    # How long a failed robots.txt fetch is remembered in memory
+    ERROR_TTL = 5 * 60
+    MAX_DOMAINS = 10_000
 
-    def __init__(self, cache_dir=None, cache_ttl=None):
+    def __init__(self, cache_dir=None, cache_ttl=None, max_domains=None):
         self.cache_dir = cache_dir or os.path.join(get_home_folder(), ".crawl4ai", "robots")
         self.cache_ttl = cache_ttl or self.CACHE_TTL
+        self.max_domains = max_domains or self.MAX_DOMAINS
         os.makedirs(self.cache_dir, exist_ok=True)
         self.db_path = os.path.join(self.cache_dir, "robots_cache.db")
         self._init_db()
+        # domain -> (compiled rules or None to allow everything, expiry time)
+        self._rules: "OrderedDict[str, tuple]" = OrderedDict()
+        self._loading: Dict[str, asyncio.Future] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
 
     def _init_db(self):
         # Use WAL mode for better concurrency and performance
@@ -273,21 +294,15 @@ class RobotsParser:
             """)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_domain ON robots_cache(domain)")
 
-    def _get_cached_rules(self, domain: str) -> tuple[str, bool]:
-        """Get cached rules. Returns (rules, is_fresh)"""
+    def _get_cached_entry(self, domain: str) -> tuple[Optional[str], int]:
+        """Get cached rules and their fetch time, (None, 0) if not cached"""
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.execute(
-                "SELECT rules, fetch_time, hash FROM robots_cache WHERE domain = ?", 
+                "SELECT rules, fetch_time FROM robots_cache WHERE domain = ?",
                 (domain,)
             )
             result = cursor.fetchone()
-            
-            if not result:
-                return None, False
-                
-            rules, fetch_time, _ = result
-            # Check if cache is still fresh based on TTL
-            return rules, (time.time() - fetch_time) < self.cache_ttl
+            return (result[0], result[1]) if result else (None, 0)
 
     def _cache_rules(self, domain: str, content: str):
         """Cache robots.txt content with hash for change detection"""
@@ -300,7 +315,7 @@ class RobotsParser:
             )
             result = cursor.fetchone()
             
-            # Only update if hash changed or no previous entry
+            # Only rewrite the rules if hash changed or no previous entry
             if not result or result[0] != hash_val:
                 conn.execute(
                     """INSERT OR REPLACE INTO robots_cache 
@@ -308,6 +323,75 @@ class RobotsParser:
                        VALUES (?, ?, ?, ?)""",
                     (domain, content, int(time.time()), hash_val)
                 )
+            else:
+                conn.execute(
+                    "UPDATE robots_cache SET fetch_time = ? WHERE domain = ?",
+                    (int(time.time()), domain)
+                )
+
+    @staticmethod
+    def _compile(rules: str) -> Optional[RobotFileParser]:
+        """Parse rules once; None means everything is allowed"""
+        if not rules:
+            return None
+        parser = RobotFileParser()
+        parser.parse(rules.splitlines())
+        # If parser can't read rules, allow access
+        return parser if parser.mtime() else None
+
+    def _remember(self, domain: str, parser: Optional[RobotFileParser], expires: float):
+        self._rules[domain] = (parser, expires)
+        self._rules.move_to_end(domain)
+        while len(self._rules) > self.max_domains:
+            self._rules.popitem(last=False)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def _fetch_rules(self, robots_url: str) -> Optional[str]:
+        """robots.txt text, or None if it could not be fetched"""
+        try:
+            async with self._get_session().get(robots_url, timeout=2, ssl=False) as response:
+                if response.status == 200:
+                    return await response.text()
+        except Exception as _ex:
+            # On any error (timeout, connection failed, etc), allow access
+            pass
+        return None
+
+    async def _load(self, domain: str, scheme: str) -> Optional[RobotFileParser]:
+        """Compiled rules for a domain, from SQLite or robots.txt"""
+        rules, fetch_time = await asyncio.to_thread(self._get_cached_entry, domain)
+
+        # If rules not found or stale, fetch new ones
+        if rules is None or time.time() - fetch_time >= self.cache_ttl:
+            # Ensure we use the same scheme as the input URL
+            rules = await self._fetch_rules(f"{scheme}://{domain}/robots.txt")
+            if rules is None:
+                self._remember(domain, None, time.time() + min(self.ERROR_TTL, self.cache_ttl))
+                return None
+            await asyncio.to_thread(self._cache_rules, domain, rules)
+            fetch_time = time.time()
+
+        parser = self._compile(rules)
+        self._remember(domain, parser, fetch_time + self.cache_ttl)
+        return parser
+
+    async def _get_rules(self, domain: str, scheme: str) -> Optional[RobotFileParser]:
+        entry = self._rules.get(domain)
+        if entry is not None and entry[1] > time.time():
+            self._rules.move_to_end(domain)
+            return entry[0]
+
+        # Single flight: concurrent checks for a domain wait for one load
+        loading = self._loading.get(domain)
+        if loading is None:
+            loading = asyncio.ensure_future(self._load(domain, scheme))
+            self._loading[domain] = loading
+            loading.add_done_callback(lambda _: self._loading.pop(domain, None))
+        return await asyncio.shield(loading)
 
     async def can_fetch(self, url: str, user_agent: str = "*") -> bool:
         """
@@ -329,51 +413,36 @@ class RobotsParser:
         except Exception as _ex:
             return True
 
-        # Fast path - check cache first
-        rules, is_fresh = self._get_cached_rules(domain)
-        
-        # If rules not found or stale, fetch new ones
-        if not is_fresh:
-            try:
-                # Ensure we use the same scheme as the input URL
-                scheme = parsed.scheme or 'http'
-                robots_url = f"{scheme}://{domain}/robots.txt"
-                
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(robots_url, timeout=2, ssl=False) as response:
-                        if response.status == 200:
-                            rules = await response.text()
-                            self._cache_rules(domain, rules)
-                        else:
-                            return True
-            except Exception as _ex:
-                # On any error (timeout, connection failed, etc), allow access
-                return True
-
-        if not rules:
+        try:
+            parser = await self._get_rules(domain, parsed.scheme or "http")
+        except Exception as _ex:
             return True
 
-        # Create parser for this check
-        parser = RobotFileParser() 
-        parser.parse(rules.splitlines())
-        
-        # If parser can't read rules, allow access
-        if not parser.mtime():
+        if parser is None:
             return True
-            
         return parser.can_fetch(user_agent, url)
 
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     def clear_cache(self):
         """Clear all cached robots.txt entries"""
+        self._rules.clear()
         with sqlite3.connect(self.db_path) as conn:
             conn.execute("DELETE FROM robots_cache")
 
     def clear_expired(self):
         """Remove only expired entries from cache"""
+        now = time.time()
+        for domain in [d for d, (_, expires) in self._rules.items() if expires <= now]:
+            del self._rules[domain]
         with sqlite3.connect(self.db_path) as conn:
-            expire_time = int(time.time()) - self.cache_ttl
+            expire_time = int(now) - self.cache_ttl
             conn.execute("DELETE FROM robots_cache WHERE fetch_time < ?", (expire_time,))
-      
+
 
 class InvalidCSSSelectorError(Exception):
     pass
@@ -1750,8 +1819,10 @@ def perform_completion_with_backoff(
     Perform an API completion request with exponential backoff.
 
     How it works:
-    1. Sends a completion request to the API.
-    2. Retries on rate-limit errors with exponential delays.
+    1. Sends the request through the process-wide ``AsyncLLMClient``, which
+       limits concurrency and per-provider tokens per minute.
+    2. Retries on rate-limit errors with exponential delays, on the client's
+       event loop, so only the calling thread waits.
     3. Returns the API response or an error after all retries.
 
     Args:
@@ -1760,64 +1831,60 @@ def perform_completion_with_backoff(
         api_token (str): The API token for authentication.
         json_response (bool): Whether to request a JSON response. Defaults to False.
         base_url (Optional[str]): The base URL for the API. Defaults to None.
-        **kwargs: Additional arguments for the API request.
+        **kwargs: Additional arguments for the API request (``extra_args``,
+            ``tokens_per_minute``, ``cache_mode`` for the LLM response cache).
 
     Returns:
         dict: The API response or an error message after all retries.
-    """
 
-    from litellm import completion
-    from litellm.exceptions import RateLimitError
+    Use ``aperform_completion_with_backoff`` from async code.
+    """
+    from .async_llm import get_llm_client
 
-    max_attempts = 3
-    base_delay = 2  # Base delay in seconds, you can adjust this based on your needs
+    return get_llm_client().run_sync(
+        aperform_completion_with_backoff(
+            provider, prompt_with_variables, api_token,
+            json_response=json_response, base_url=base_url, **kwargs,
+        )
+    )
 
-    extra_args = {"temperature": 0.01, "api_key": api_token, "base_url": base_url}
-    if json_response:
-        extra_args["response_format"] = {"type": "json_object"}
 
-    if kwargs.get("extra_args"):
-        extra_args.update(kwargs["extra_args"])
+async def aperform_completion_with_backoff(
+    provider,
+    prompt_with_variables,
+    api_token,
+    json_response=False,
+    base_url=None,
+    **kwargs,
+):
+    """
+    Async version of ``perform_completion_with_backoff``; never blocks the
+    caller's event loop.
+    """
+    from litellm.exceptions import RateLimitError
+    from .async_llm import get_llm_client
 
-    for attempt in range(max_attempts):
-        try:
-            response = completion(
-                model=provider,
-                messages=[{"role": "user", "content": prompt_with_variables}],
-                **extra_args,
-            )
-            return response  # Return the successful response
-        except RateLimitError as e:
-            print("Rate limit error:", str(e))
-
-            # Check if we have exhausted our max attempts
-            if attempt < max_attempts - 1:
-                # Calculate the delay and wait
-                delay = base_delay * (2**attempt)  # Exponential backoff formula
-                print(f"Waiting for {delay} seconds before retrying...")
-                time.sleep(delay)
-            else:
-                # Return an error response after exhausting all retries
-                return [
-                    {
-                        "index": 0,
-                        "tags": ["error"],
-                        "content": ["Rate limit error. Please try again later."],
-                    }
-                ]
-        except Exception as e:
-            raise e  # Raise any other exceptions immediately
-            # print("Error during completion request:", str(e))
-            # error_message = e.message
-            # return [
-            #     {
-            #         "index": 0,
-            #         "tags": ["error"],
-            #         "content": [
-            #             f"Error during LLM completion request. {error_message}"
-            #         ],
-            #     }
-            # ]
+    try:
+        return await get_llm_client().acomplete(
+            provider,
+            prompt_with_variables,
+            api_token,
+            json_response=json_response,
+            base_url=base_url,
+            extra_args=kwargs.get("extra_args"),
+            tokens_per_minute=kwargs.get("tokens_per_minute"),
+            cache_mode=kwargs.get("cache_mode"),
+        )
+    except RateLimitError as e:
+        print("Rate limit error:", str(e))
+        # Return an error response after exhausting all retries
+        return [
+            {
+                "index": 0,
+                "tags": ["error"],
+                "content": ["Rate limit error. Please try again later."],
+            }
+        ]
 
 
 def extract_blocks(url, html, provider=DEFAULT_PROVIDER, api_token=None, base_url=None):
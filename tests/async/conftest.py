@@ -0,0 +1,49 @@
+import os
+import sys
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+import crawl4ai.async_webcrawler as async_webcrawler_module
+from crawl4ai.async_database import AsyncDatabaseManager
+from crawl4ai.models import CrawlResult, MarkdownGenerationResult
+
+
+@pytest.fixture
+def make_manager(tmp_path):
+    """Factory for cache managers on a database in tmp_path, skipping version migrations"""
+
+    def factory(**kwargs) -> AsyncDatabaseManager:
+        manager = AsyncDatabaseManager(db_path=str(tmp_path / "crawl4ai.db"), **kwargs)
+        manager.version_manager.needs_update = lambda: False
+        return manager
+
+    return factory
+
+
+@pytest.fixture
+def db_manager(make_manager, monkeypatch):
+    """A cache manager the crawler uses in place of the global one"""
+    manager = make_manager()
+    monkeypatch.setattr(async_webcrawler_module, "async_db_manager", manager)
+    return manager
+
+
+@pytest.fixture
+def cache_result():
+    """Factory for successful results ready to be cached"""
+
+    def factory(url: str, html: str = None, markdown: str = "hello", **fields) -> CrawlResult:
+        return CrawlResult(
+            url=url,
+            html=f"<html>{url}</html>" if html is None else html,
+            success=True,
+            markdown=MarkdownGenerationResult(
+                raw_markdown=markdown, markdown_with_citations=markdown, references_markdown=""
+            ),
+            **fields,
+        )
+
+    return factory
@@ -0,0 +1,108 @@
+import os
+import sys
+import random
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai.adaptive_crawler import AdaptiveConfig, CrawlState, StatisticalStrategy
+from crawl4ai.models import Link
+
+VOCAB = [f"term{i:03d}" for i in range(300)]
+
+
+class Markdown:
+    def __init__(self, content):
+        self.raw_markdown = content
+
+
+class Result:
+    def __init__(self, url, content):
+        self.url = url
+        self.markdown = Markdown(content)
+        self.links = {}
+        self.metadata = {}
+
+
+def make_docs(count, seed=0):
+    rng = random.Random(seed)
+    docs = []
+    for i in range(count):
+        words = rng.sample(VOCAB, rng.randint(5, 60)) if i % 7 else []  # some empty pages
+        docs.append(Result(f"https://example.com/{i}", " ".join(words) + " ok!"))
+    return docs
+
+
+def pairwise_consistency(strategy, docs):
+    # The original all-pairs definition
+    overlaps = []
+    for i in range(len(docs)):
+        for j in range(i + 1, len(docs)):
+            a = set(strategy._get_document_terms(docs[i]))
+            b = set(strategy._get_document_terms(docs[j]))
+            if a and b:
+                overlaps.append(len(a & b) / len(a | b))
+    return sum(overlaps) / len(overlaps) if overlaps else 0.0
+
+
+async def grow(strategy, state, docs, batch=3):
+    for i in range(0, len(docs), batch):
+        state.knowledge_base.extend(docs[i:i + batch])
+        await strategy.update_state(state, docs[i:i + batch])
+
+
+@pytest.mark.asyncio
+async def test_incremental_consistency_matches_pairwise():
+    strategy = StatisticalStrategy()
+    state = CrawlState(query="term001 term002")
+    docs = make_docs(40)
+    for i in range(0, len(docs), 5):
+        await grow(strategy, state, docs[i:i + 5])
+        expected = pairwise_consistency(strategy, state.knowledge_base)
+        assert strategy._calculate_consistency(state) == pytest.approx(expected, abs=1e-12)
+
+
+@pytest.mark.asyncio
+async def test_old_saves_are_rebuilt(tmp_path):
+    strategy = StatisticalStrategy()
+    state = CrawlState(query="term001")
+    docs = make_docs(20, seed=1)
+    await grow(strategy, state, docs)
+    expected = strategy._calculate_consistency(state)
+
+    # Round trip keeps the accumulators
+    state.save(tmp_path / "state.json")
+    loaded = CrawlState.load(tmp_path / "state.json")
+    assert strategy._calculate_consistency(loaded) == pytest.approx(expected)
+
+    # A save without them is rebuilt from the knowledge base, and then
+    # kept up to date again
+    loaded.document_term_counts = []
+    loaded.consistency_overlap_sum = loaded.consistency_pairs = 0
+    more = make_docs(30, seed=2)[20:]
+    await grow(strategy, loaded, more)
+    reference = pairwise_consistency(strategy, docs + more)
+    assert strategy._calculate_consistency(loaded) == pytest.approx(reference, abs=1e-12)
+    assert len(loaded.document_term_counts) == 30
+
+
+@pytest.mark.asyncio
+async def test_rank_links_scores():
+    strategy = StatisticalStrategy()
+    state = CrawlState(query="term001 term002")
+    await grow(strategy, state, [Result("https://example.com/a", "term001 term005 term006")])
+    state.pending_links = [
+        Link(href="https://example.com/known", text="term005 term006"),
+        Link(href="https://example.com/new", text="term001 term002 term200 term201"),
+        Link(href="https://example.com/a", text="term001"),  # already crawled
+    ]
+    state.crawled_urls.add("https://example.com/a")
+    ranked = await strategy.rank_links(state, AdaptiveConfig())
+
+    assert [link.href for link, _ in ranked] == ["https://example.com/new", "https://example.com/known"]
+    assert strategy._calculate_novelty(state.pending_links[1], state) == 0.75
+    assert strategy._calculate_novelty(state.pending_links[0], state) == 0.0
+    # Membership checks must not grow the term table
+    assert "term200" not in state.term_frequencies
@@ -0,0 +1,54 @@
+import os
+import sys
+import asyncio
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_dispatcher import AgingTaskQueue
+
+
+def item(url, retry_count, enqueue_time):
+    return (retry_count, (url, f"id-{url}", retry_count, enqueue_time))
+
+
+def test_fresh_tasks_follow_retry_count_then_fifo():
+    queue = AgingTaskQueue(fairness_timeout=100)
+    queue.put_nowait(item("retried", 2, 10.0))
+    queue.put_nowait(item("a", 0, 11.0))
+    queue.put_nowait(item("b", 0, 12.0))
+    queue.put_nowait(item("once", 1, 13.0))
+
+    order = [queue.get_nowait(now=20.0)[1][0] for _ in range(4)]
+    assert order == ["a", "b", "once", "retried"]
+    assert queue.empty()
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+
+
+def test_aged_tasks_jump_ahead_oldest_first():
+    queue = AgingTaskQueue(fairness_timeout=100)
+    queue.put_nowait(item("old-retry", 3, 0.0))
+    queue.put_nowait(item("older-retry", 5, -10.0))
+    queue.put_nowait(item("fresh", 0, 90.0))
+
+    score, payload = queue.get_nowait(now=150.0)
+    assert payload[0] == "older-retry" and score == -160.0
+    assert queue.get_nowait(now=150.0)[1][0] == "old-retry"
+    # Not aged yet: plain retry-count ordering
+    assert queue.get_nowait(now=150.0) == (0, ("fresh", "id-fresh", 0, 90.0))
+
+
+def test_stats_track_waits_incrementally():
+    queue = AgingTaskQueue(fairness_timeout=100)
+    for i in range(4):
+        queue.put_nowait(item(str(i), 0, 10.0 * i))
+    assert queue.stats(now=40.0) == (4, 40.0, 25.0)
+
+    queue.get_nowait(now=40.0)
+    count, highest, avg = queue.stats(now=40.0)
+    assert (count, highest) == (3, 30.0)
+    assert avg == pytest.approx(20.0)
+    assert len(queue) == 3
@@ -0,0 +1,208 @@
+import os
+import sys
+import json
+import time
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from aiohttp import web
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
+from crawl4ai import LLMConfig, LLMExtractionStrategy, LLMContentFilter
+from crawl4ai.async_llm import AsyncLLMClient, set_llm_client
+from crawl4ai.llm_cache import LLMResponseCache
+from crawl4ai.cache_context import CacheMode
+from crawl4ai.async_webcrawler import process_html
+from crawl4ai.async_configs import CrawlerRunConfig
+
+
+@asynccontextmanager
+async def serve_completions(delay=0.0, rate_limited=0, content="<blocks>[]</blocks>", total_tokens=10):
+    """OpenAI-compatible chat completion endpoint"""
+    state = {"active": 0, "peak": 0, "requests": [], "rate_limited": rate_limited}
+
+    async def complete(request):
+        body = await request.json()
+        state["requests"].append((time.monotonic(), body))
+        if state["rate_limited"]:
+            state["rate_limited"] -= 1
+            return web.json_response({"error": {"message": "slow down", "type": "rate_limit"}}, status=429)
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            state["active"] -= 1
+        return web.json_response({
+            "id": "mock", "object": "chat.completion", "created": 0, "model": body["model"],
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": total_tokens - 1, "completion_tokens": 1, "total_tokens": total_tokens},
+        })
+
+    app = web.Application()
+    app.router.add_post("/chat/completions", complete)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}", state
+    finally:
+        await runner.cleanup()
+
+
+@pytest.fixture
+def client():
+    client = AsyncLLMClient(max_concurrency=2, base_delay=0.05)
+    previous = set_llm_client(client)
+    yield client
+    set_llm_client(previous)
+    client.close()
+
+
+async def ticking(until):
+    """Count event loop ticks while `until` runs, to show the loop stays free"""
+    ticks = 0
+    task = asyncio.ensure_future(until)
+    while not task.done():
+        await asyncio.sleep(0.01)
+        ticks += 1
+    return await task, ticks
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_limited_process_wide(client):
+    async with serve_completions(delay=0.2) as (base, state):
+        calls = [client.acomplete("openai/mock", "hi", "key", base_url=base) for _ in range(4)]
+        # sync callers from worker threads share the same limit
+        calls += [asyncio.to_thread(client.complete, "openai/mock", "hi", "key", base_url=base)
+                  for _ in range(2)]
+        (responses, ticks) = await ticking(asyncio.gather(*calls))
+
+    assert len(responses) == 6
+    assert state["peak"] == 2
+    assert client.get_stats()["peak_in_flight"] == 2
+    assert ticks > 20  # ~0.6 s of requests, loop free throughout
+
+
+@pytest.mark.asyncio
+async def test_rate_limits_are_retried_without_blocking(client):
+    async with serve_completions(rate_limited=2) as (base, state):
+        response, ticks = await ticking(client.acomplete("openai/mock", "hi", "key", base_url=base))
+
+    assert response.choices[0].message.content == "<blocks>[]</blocks>"
+    assert len(state["requests"]) == 3
+    assert client.stats.retries == 2
+    assert ticks >= 3  # backoff of 25-50 ms then 50-100 ms
+
+
+@pytest.mark.asyncio
+async def test_token_budget_settles_with_reported_usage(client):
+    # 12000 tokens/min = 200 tokens/s; the first call reports far more than
+    # it reserved, so the second waits for the debt to refill
+    async with serve_completions(total_tokens=12100) as (base, state):
+        client.set_token_budget("openai/mock", 12000)
+        await client.acomplete("openai/mock", "hi", "key", base_url=base)
+        await client.acomplete("openai/mock", "hi", "key", base_url=base)
+        await client.acomplete("openai/other", "hi", "key", base_url=base)
+
+    (first, _), (second, _), (other, _) = state["requests"]
+    assert 0.4 < second - first < 1.5
+    assert other - second < 0.3  # other providers have their own budget
+
+
+@pytest.mark.asyncio
+async def test_llm_strategies_use_the_client(client):
+    blocks = json.dumps([{"index": 0, "tags": [], "content": ["ok"]}])
+    async with serve_completions(delay=0.1, content=f"<blocks>{blocks}</blocks><content>clean</content>") as (base, state):
+        llm_config = LLMConfig(provider="openai/mock", api_token="key", base_url=base)
+        strategy = LLMExtractionStrategy(llm_config=llm_config, chunk_token_threshold=5, overlap_rate=0)
+        sections = ["one two three four five six", "seven eight nine ten eleven twelve"]
+
+        extracted, ticks = await ticking(strategy.arun("https://example.com", sections))
+        calls = len(state["requests"])
+        assert calls > 1
+        assert [block["content"] for block in extracted] == [["ok"]] * calls
+        assert strategy.total_usage.total_tokens == 10 * calls
+        assert ticks > 5
+
+        # the blocking API still works from a worker thread
+        assert len(await asyncio.to_thread(strategy.run, "https://example.com", sections)) == calls
+
+        content_filter = LLMContentFilter(llm_config=llm_config, chunk_token_threshold=3, overlap_rate=0)
+        filtered = await asyncio.to_thread(content_filter.filter_content, "<p>a b c d e f</p>")
+        assert len(filtered) > 1 and set(filtered) == {"clean"}
+        assert state["peak"] == 2
+
+
+def test_process_html_defers_llm_extraction():
+    strategy = LLMExtractionStrategy(llm_config=LLMConfig(provider="openai/mock", api_token="key"))
+    config = CrawlerRunConfig(extraction_strategy=strategy)
+    html = "<html><body><p>Hello world, this is a page.</p></body></html>"
+
+    fields = process_html("https://example.com", html, None, config, None, None, defer_extraction=True)
+    assert fields["extracted_content"] is None
+    assert "Hello world" in " ".join(fields["extraction_sections"])
+
+
+@pytest.mark.asyncio
+async def test_response_cache_skips_seen_chunks(tmp_path):
+    cache = LLMResponseCache(tmp_path / "responses.db")
+    client = AsyncLLMClient(base_delay=0.05, response_cache=cache)
+    previous = set_llm_client(client)
+    try:
+        blocks = json.dumps([{"index": 0, "tags": [], "content": ["ok"]}])
+        async with serve_completions(content=f"<blocks>{blocks}</blocks>") as (base, state):
+            llm_config = LLMConfig(provider="openai/mock", api_token="key", base_url=base,
+                                   cache_mode=CacheMode.ENABLED)
+            strategy = LLMExtractionStrategy(llm_config=llm_config)
+            first = await strategy.arun("https://example.com", ["same chunk"])
+            assert len(state["requests"]) == 1
+
+            # a recrawl, even by another strategy instance, costs nothing
+            again = LLMExtractionStrategy(llm_config=llm_config)
+            assert await again.arun("https://example.com", ["same chunk"]) == first
+            assert len(state["requests"]) == 1
+            assert again.total_usage.total_tokens == 0
+
+            # a different chunk, schema or model is a different entry
+            await again.arun("https://example.com", ["other chunk"])
+            await LLMExtractionStrategy(llm_config=llm_config, schema={"type": "object"}).arun(
+                "https://example.com", ["same chunk"])
+            await client.acomplete("openai/mock2", "hi", "key", base_url=base, cache_mode=CacheMode.ENABLED)
+            await client.acomplete("openai/mock2", "hi", "key", base_url=base, cache_mode=CacheMode.WRITE_ONLY)
+            assert len(state["requests"]) == 5
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["entries"] == 4
+    finally:
+        set_llm_client(previous)
+        client.close()
+
+
+def test_response_cache_expires_and_evicts(tmp_path):
+    cache = LLMResponseCache(tmp_path / "responses.db", ttl=None, max_entries=10)
+    for i in range(10):
+        cache.set(f"key{i:02d}", "p", {"i": i})
+    cache.get("key00")  # keep it warm
+    cache.set("key10", "p", {"i": 10})
+    cache.set("key11", "p", {"i": 11})
+
+    # over the limit: least recently used entries go, down to 90%
+    stats = cache.get_stats()
+    assert stats["entries"] == 10 and stats["evictions"] == 2
+    assert cache.get("key00") == {"i": 0}
+    assert cache.get("key01") is None and cache.get("key02") is None
+    assert cache.get("key03") == {"i": 3}
+
+    # reopening sees the same store
+    assert LLMResponseCache(tmp_path / "responses.db").get("key11") == {"i": 11}
+    expired = LLMResponseCache(tmp_path / "responses.db", ttl=0)
+    assert expired.get("key11") is None
+    assert expired.get_stats()["misses"] == 1
@@ -0,0 +1,75 @@
+import os
+import sys
+import json
+import threading
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_logger import AsyncLogger, AsyncFileLogger, LogLevel
+
+
+def test_file_lines_are_written_by_the_writer_thread(tmp_path, monkeypatch):
+    log_file = tmp_path / "crawl.log"
+    logger = AsyncLogger(log_file=str(log_file), verbose=False)
+    writers = set()
+    format_line = logger._format_line
+    monkeypatch.setattr(logger, "_format_line", lambda *a: writers.add(threading.current_thread()) or format_line(*a))
+
+    logger.url_status("https://example.com/a%20b", success=True, timing=1.5)
+    logger.info("Done with {count} pages", tag="COMPLETE", params={"count": 2})
+    logger.flush()
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert "https://example.com/a b " in lines[0] and lines[0].rstrip().endswith("| ✓ | ⏱: 1.50s")
+    assert lines[1].rstrip().endswith("Done with 2 pages") and "[COMPLETE]" in lines[1]
+    assert writers and threading.current_thread() not in writers
+
+
+def test_json_lines(tmp_path):
+    log_file = tmp_path / "crawl.jsonl"
+    logger = AsyncLogger(log_file=str(log_file), verbose=False, json_lines=True)
+    logger.error_status("https://example.com/x", error="timeout", tag="FETCH")
+    logger.warning("Retry [{n}]", params={"n": 3})
+    logger.flush()
+
+    first, second = (json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines())
+    assert first["level"] == "error" and first["tag"] == "FETCH"
+    assert first["params"]["error"] == "timeout" and "example.com/x" in first["message"]
+    assert second["message"] == "Retry [3]" and second["params"] == {"n": 3}
+    assert "time" in second
+
+
+def test_unconsumed_messages_are_not_formatted(tmp_path, monkeypatch):
+    calls = []
+    quiet = AsyncLogger(verbose=False)
+    monkeypatch.setattr(quiet, "_format_line", lambda *a: calls.append(a))
+    quiet.info("{missing} is never formatted")
+    quiet.url_status("https://example.com", success=True, timing=0.1)
+
+    log_file = tmp_path / "filtered.log"
+    filtered = AsyncLogger(log_file=str(log_file), log_level=LogLevel.WARNING, verbose=False)
+    filtered.debug("below the level")
+    filtered.flush()
+    assert not calls and not log_file.exists()
+
+    # Forced console output still gets through
+    quiet.info("forced", force_verbose=True)
+    assert len(calls) == 1
+
+
+def test_file_logger_and_broken_templates(tmp_path):
+    log_file = tmp_path / "file.log"
+    logger = AsyncFileLogger(str(log_file))
+    for i in range(500):
+        logger.info(f"line {i}")
+    broken = AsyncLogger(log_file=str(log_file), verbose=False)
+    broken.info("{missing}", params={"other": 1})  # dropped by the writer, not raised here
+    logger.info("last")
+    logger.flush()
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 501
+    assert lines[0].endswith("[INFO] [INFO] line 0") and lines[-1].endswith("last")
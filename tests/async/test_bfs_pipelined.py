@@ -0,0 +1,115 @@
+import os
+import sys
+import time
+import asyncio
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+import crawl4ai.async_webcrawler as async_webcrawler_module
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode
+from crawl4ai.async_dispatcher import RateLimiter
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+from crawl4ai.deep_crawling import BFSDeepCrawlStrategy
+from crawl4ai.models import AsyncCrawlResponse
+
+ROOT = "https://example.com/"
+
+
+class TreeSiteStrategy(AsyncCrawlerStrategy):
+    """Serves a tree of pages where every page links to ``fanout`` children."""
+
+    def __init__(self, fanout: int = 3, slow: dict = None):
+        self.fanout = fanout
+        self.slow = slow or {}
+        self.started = {}
+        self.finished = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def crawl(self, url: str, **kwargs) -> AsyncCrawlResponse:
+        self.started[url] = time.perf_counter()
+        await asyncio.sleep(self.slow.get(url, 0.01))
+        self.finished[url] = time.perf_counter()
+        base = url.rstrip("/")
+        links = "".join(
+            f'<a href="{base}/{i}">child {i}</a>' for i in range(self.fanout)
+        )
+        return AsyncCrawlResponse(
+            html=f"<html><body><p>{url}</p>{links}</body></html>",
+            response_headers={},
+            status_code=200,
+        )
+
+
+@pytest.fixture(autouse=True)
+def no_politeness_delay(monkeypatch):
+    # Every page lives on one domain; skip the default 1-3 s delay between hits
+    def rate_limiter(**kwargs):
+        kwargs["base_delay"] = (0, 0)
+        return RateLimiter(**kwargs)
+
+    monkeypatch.setattr(async_webcrawler_module, "RateLimiter", rate_limiter)
+
+
+def make_config(stream: bool, **kwargs) -> CrawlerRunConfig:
+    return CrawlerRunConfig(
+        cache_mode=CacheMode.BYPASS,
+        deep_crawl_strategy=BFSDeepCrawlStrategy(**kwargs),
+        stream=stream,
+        verbose=False,
+    )
+
+
+async def run(crawler, config):
+    results = await crawler.arun(ROOT, config=config)
+    if config.stream:
+        results = [result async for result in results]
+    return results
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_bfs_records_depth_and_parent(stream):
+    strategy = TreeSiteStrategy(fanout=2)
+    async with AsyncWebCrawler(crawler_strategy=strategy) as crawler:
+        results = await run(crawler, make_config(stream, max_depth=2))
+
+    by_url = {result.url: result for result in results}
+    assert len(by_url) == len(results) == 1 + 2 + 4
+    assert by_url[ROOT].metadata == {"depth": 0, "parent_url": None}
+    assert by_url["https://example.com/1"].metadata["parent_url"] == ROOT
+    assert by_url["https://example.com/1/0"].metadata["depth"] == 2
+    assert by_url["https://example.com/1/0"].metadata["parent_url"] == "https://example.com/1"
+    # Shallower pages always leave the frontier first
+    depths = [result.metadata["depth"] for result in sorted(results, key=lambda r: strategy.started[r.url])]
+    assert depths == sorted(depths)
+
+
+@pytest.mark.asyncio
+async def test_next_depth_starts_before_slow_page_finishes():
+    slow_url = "https://example.com/0"
+    strategy = TreeSiteStrategy(fanout=3, slow={slow_url: 0.5})
+    async with AsyncWebCrawler(crawler_strategy=strategy) as crawler:
+        results = await run(crawler, make_config(False, max_depth=2))
+
+    assert len(results) == 1 + 3 + 9
+    # Children of the fast siblings did not wait for the rest of their level
+    assert strategy.started["https://example.com/1/0"] < strategy.finished[slow_url]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_max_pages_counts_queued_urls(stream):
+    strategy = TreeSiteStrategy(fanout=4)
+    async with AsyncWebCrawler(crawler_strategy=strategy) as crawler:
+        results = await run(crawler, make_config(stream, max_depth=3, max_pages=6))
+
+    assert len(results) == 6
+    assert len(strategy.started) == 6
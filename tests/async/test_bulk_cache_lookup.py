@@ -0,0 +1,142 @@
+import os
+import sys
+import asyncio
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode, MemoryAdaptiveDispatcher
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+from crawl4ai.models import AsyncCrawlResponse
+
+
+class RecordingStrategy(AsyncCrawlerStrategy):
+    """Serves a static page and records which URLs actually got fetched."""
+
+    def __init__(self, delays=None):
+        self.crawled = []
+        self.delays = delays or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def crawl(self, url: str, **kwargs) -> AsyncCrawlResponse:
+        self.crawled.append(url)
+        await asyncio.sleep(self.delays.get(url, 0))
+        return AsyncCrawlResponse(
+            html=f"<html><body><p>fresh {url}</p></body></html>",
+            response_headers={},
+            status_code=200,
+        )
+
+
+def cached_page(cache_result, url: str):
+    return cache_result(url, html=f"<p>cached {url}</p>", markdown=f"cached {url}")
+
+
+@pytest.mark.asyncio
+async def test_aget_cached_urls_chunks(db_manager, cache_result):
+    urls = [f"https://example.com/{i}" for i in range(25)]
+    for url in urls:
+        await db_manager.acache_url(cached_page(cache_result, url))
+
+    cached = await db_manager.aget_cached_urls(urls + ["https://example.com/missing"], chunk_size=10)
+    assert set(cached) == set(urls)
+    assert cached[urls[3]].html == f"<p>cached {urls[3]}</p>"
+    await db_manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_arun_many_skips_dispatcher_for_cache_hits(db_manager, cache_result):
+    cached_urls = ["https://example.com/a", "https://example.com/b"]
+    for url in cached_urls:
+        await db_manager.acache_url(cached_page(cache_result, url))
+
+    strategy = RecordingStrategy()
+    async with AsyncWebCrawler(crawler_strategy=strategy) as crawler:
+        results = await crawler.arun_many(
+            cached_urls + ["https://example.com/c"],
+            config=CrawlerRunConfig(cache_mode=CacheMode.ENABLED),
+        )
+
+    assert strategy.crawled == ["https://example.com/c"]
+    assert {r.url for r in results} == set(cached_urls + ["https://example.com/c"])
+    assert all(r.success and r.dispatch_result for r in results)
+    await db_manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_arun_many_keeps_input_order_with_partial_hits(db_manager, cache_result):
+    urls = [f"https://example.com/{i}" for i in range(6)] + ["https://example.com/0"]
+    for url in (urls[1], urls[3], urls[4]):
+        await db_manager.acache_url(cached_page(cache_result, url))
+
+    # Later misses finish first
+    strategy = RecordingStrategy(delays={urls[0]: 0.3, urls[2]: 0.2, urls[5]: 0.0})
+    async with AsyncWebCrawler(crawler_strategy=strategy) as crawler:
+        results = await crawler.arun_many(
+            urls,
+            config=CrawlerRunConfig(cache_mode=CacheMode.ENABLED),
+            dispatcher=MemoryAdaptiveDispatcher(rate_limiter=None),
+        )
+
+    assert [r.url for r in results] == urls
+    assert [("cached" in r.html) for r in results] == [False, True, False, True, True, False, False]
+    await db_manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_arun_many_stream_and_bypass(db_manager, cache_result):
+    await db_manager.acache_url(cached_page(cache_result, "https://example.com/a"))
+
+    strategy = RecordingStrategy()
+    async with AsyncWebCrawler(crawler_strategy=strategy) as crawler:
+        stream = await crawler.arun_many(
+            ["https://example.com/a"],
+            config=CrawlerRunConfig(cache_mode=CacheMode.ENABLED, stream=True),
+        )
+        streamed = [result async for result in stream]
+        assert [r.url for r in streamed] == ["https://example.com/a"]
+        assert strategy.crawled == []
+
+        # Bypass never consults the cache
+        await crawler.arun_many(
+            ["https://example.com/a"],
+            config=CrawlerRunConfig(cache_mode=CacheMode.BYPASS),
+        )
+        assert strategy.crawled == ["https://example.com/a"]
+    await db_manager.cleanup()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_arun_many_looks_up_misses_once(db_manager, cache_result, monkeypatch, stream):
+    await db_manager.acache_url(cached_page(cache_result, "https://example.com/a"))
+    single_lookups = []
+    aget_cache_entry = db_manager.aget_cache_entry
+
+    async def counting_lookup(url):
+        single_lookups.append(url)
+        return await aget_cache_entry(url)
+
+    monkeypatch.setattr(db_manager, "aget_cache_entry", counting_lookup)
+    urls = ["https://example.com/a", "https://example.com/b", "https://example.com/c"]
+    strategy = RecordingStrategy()
+    async with AsyncWebCrawler(crawler_strategy=strategy) as crawler:
+        config = CrawlerRunConfig(cache_mode=CacheMode.ENABLED, stream=stream)
+        results = await crawler.arun_many(urls, config=config)
+        if stream:
+            results = [result async for result in results]
+        assert sorted(strategy.crawled) == urls[1:]
+        assert len(results) == 3 and single_lookups == []
+
+        # Outside arun_many, arun looks the URL up itself and finds the new entry
+        await crawler.arun("https://example.com/b", config=config)
+        assert single_lookups == ["https://example.com/b"]
+        assert sorted(strategy.crawled) == urls[1:]
+    await db_manager.cleanup()
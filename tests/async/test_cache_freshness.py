@@ -0,0 +1,96 @@
+import os
+import sys
+import time
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_database import CacheEntry
+from crawl4ai.cache_context import parse_cache_headers
+
+
+def test_parse_cache_headers():
+    now = 1_000_000.0
+    info = parse_cache_headers(
+        {"Cache-Control": "public, max-age=600", "Age": "100", "ETag": '"abc"'}, now
+    )
+    assert info["expires_at"] == now + 500
+    assert info["etag"] == '"abc"'
+    assert not info["no_store"]
+
+    info = parse_cache_headers({"cache-control": "no-cache, no-store"}, now)
+    assert info["expires_at"] == now and info["no_store"]
+
+    info = parse_cache_headers({"Expires": "Thu, 01 Jan 1970 00:00:00 GMT"}, now)
+    assert info["expires_at"] == 0
+    assert parse_cache_headers({"Expires": "garbage"}, now)["expires_at"] == now
+    assert parse_cache_headers(None, now)["expires_at"] is None
+
+
+def test_entry_freshness():
+    now = time.time()
+    entry = CacheEntry(result=None, cached_at=now - 100, expires_at=now - 10)
+    assert entry.is_fresh()
+    assert entry.is_fresh(max_age=200)
+    assert not entry.is_fresh(max_age=50)
+    assert not entry.is_fresh(respect_headers=True)
+    # Rows cached before ages were tracked are stale once a max age applies
+    assert not CacheEntry(result=None).is_fresh(max_age=10)
+
+
+@pytest.mark.asyncio
+async def test_freshness_and_access_tracking(make_manager, cache_result):
+    manager = make_manager(compression="gzip")
+    await manager.acache_url(
+        cache_result("https://a.com", response_headers={"Cache-Control": "max-age=0", "ETag": '"v1"'})
+    )
+    await manager.acache_url(
+        cache_result("https://b.com", response_headers={"Cache-Control": "no-store"}), respect_headers=True
+    )
+
+    entry = await manager.aget_cache_entry("https://a.com")
+    assert entry.etag == '"v1"' and entry.cached_at is not None
+    assert await manager.aget_cached_url("https://a.com") is not None
+    assert await manager.aget_cached_url("https://a.com", respect_headers=True) is None
+    assert await manager.aget_cache_entry("https://b.com") is None
+
+    manager.record_access("https://a.com", hit=True)
+    manager.record_access("https://b.com", hit=False)
+    stats = await manager.aget_cache_stats()
+    assert stats["entries"] == 1
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["hit_rate"] == 0.5
+    assert stats["expired_entries"] == 1
+    await manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_and_content_gc(make_manager, cache_result):
+    manager = make_manager(compression="gzip")
+    for name in "abc":
+        await manager.acache_url(cache_result(f"https://{name}.com", html=f"<html>{name * 1000}</html>"))
+        await manager.flush()
+        time.sleep(0.01)
+    # Touching "a" makes "b" the least recently used entry
+    manager.record_access("https://a.com", hit=True)
+
+    stats = await manager.aevict(max_entries=2, gc=False)
+    assert stats["evicted"] == 1
+    assert await manager.aget_cache_entry("https://b.com") is None
+    assert await manager.aget_cache_entry("https://a.com") is not None
+
+    html_dir = manager.content_paths["html"]
+    assert len(os.listdir(html_dir)) == 3
+    gc_stats = await manager.agc_content(grace_period=0)
+    assert gc_stats["files_removed"] == 1
+    assert len(os.listdir(html_dir)) == 2
+
+    entry = await manager.aget_cache_entry("https://c.com")
+    assert entry.result.html == "<html>" + "c" * 1000 + "</html>"
+
+    stats = await manager.aevict(max_size=0, gc=False)
+    assert stats["evicted"] == 2
+    assert await manager.aget_total_count() == 0
+    await manager.cleanup()
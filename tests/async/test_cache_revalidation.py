@@ -0,0 +1,83 @@
+import os
+import sys
+import pytest
+from contextlib import asynccontextmanager
+from aiohttp import web
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+
+ETAG = '"page-v1"'
+
+
+@asynccontextmanager
+async def serve_page():
+    requests = []
+
+    async def page(request):
+        requests.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304, headers={"ETag": ETAG})
+        return web.Response(
+            text="<html><body><h1>Unchanged page</h1></body></html>",
+            content_type="text/html",
+            headers={"ETag": ETAG, "Cache-Control": "max-age=0"},
+        )
+
+    app = web.Application()
+    app.router.add_get("/page", page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}/page", requests
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_revalidated_with_304(db_manager):
+    config = CrawlerRunConfig(cache_mode=CacheMode.ENABLED, respect_cache_headers=True)
+
+    async with serve_page() as (url, requests), AsyncWebCrawler(
+        crawler_strategy=AsyncHTTPCrawlerStrategy()
+    ) as crawler:
+        first = await crawler.arun(url, config=config)
+        assert first.success and not first.revalidated
+        assert "If-None-Match" not in requests[0]
+
+        second = await crawler.arun(url, config=config)
+        assert requests[1]["If-None-Match"] == ETAG
+        assert second.success and second.revalidated
+        assert "Unchanged page" in second.html
+        assert "Unchanged page" in second.markdown.raw_markdown
+
+    entry = await db_manager.aget_cache_entry(url)
+    assert entry.etag == ETAG
+    await db_manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_read_only_revalidation_leaves_the_cache_alone(db_manager):
+    async with serve_page() as (url, requests), AsyncWebCrawler(
+        crawler_strategy=AsyncHTTPCrawlerStrategy()
+    ) as crawler:
+        await crawler.arun(url, config=CrawlerRunConfig(cache_mode=CacheMode.ENABLED))
+        before = await db_manager.aget_cache_entry(url)
+
+        result = await crawler.arun(
+            url, config=CrawlerRunConfig(cache_mode=CacheMode.READ_ONLY, respect_cache_headers=True)
+        )
+        assert requests[1]["If-None-Match"] == ETAG
+        assert result.success and result.revalidated
+        assert "Unchanged page" in result.html
+
+    after = await db_manager.aget_cache_entry(url)
+    assert (after.cached_at, after.expires_at) == (before.cached_at, before.expires_at)
+    await db_manager.cleanup()
@@ -0,0 +1,116 @@
+import os
+import sys
+import sqlite3
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai.content_store import ContentStore
+from crawl4ai.migrations import ContentStoreMigration
+from crawl4ai.utils import generate_content_hash
+
+
+# Fields of a cached page that go to the content store
+PAGE = {
+    "html": "<html>" + "x" * 5000 + "</html>",
+    "cleaned_html": "<p>hello</p>",
+    "screenshot": "c2NyZWVu",
+}
+
+
+def test_store_roundtrip_gzip_and_packing(tmp_path):
+    store = ContentStore(str(tmp_path), compression="gzip", pack_threshold=1024)
+    big = "<html>" + os.urandom(20_000).hex() + "</html>"
+    small = "tiny page"
+
+    big_ref = store.store_sync(big, "html")
+    assert big_ref == generate_content_hash(big) + ".gz"
+    assert os.path.getsize(os.path.join(store.content_paths["html"], big_ref)) < len(big)
+
+    small_ref = store.store_sync(small, "html")
+    assert "@" in small_ref
+    # Deduplicated within the process
+    assert store.store_sync(small, "html") == small_ref
+
+    assert store.load_sync(big_ref, "html") == big
+    assert store.load_sync(small_ref, "html") == small
+    assert store.store_sync("", "html") == ""
+    assert store.exists(big_ref, "html") and store.exists(small_ref, "html")
+    assert not store.exists(big_ref.replace(".gz", ".zst"), "html")
+    assert not store.exists(small_ref.replace(small_ref.rsplit(":", 1)[1], "999999"), "html")
+
+
+@pytest.mark.asyncio
+async def test_cached_result_fields_load_lazily(make_manager, cache_result):
+    manager = make_manager(compression="gzip")
+    await manager.acache_url(cache_result("https://example.com", **PAGE))
+
+    cached = await manager.aget_cached_url("https://example.com")
+    assert set(cached._lazy_fields) == {"html", "cleaned_html", "screenshot"}
+    assert cached.has_content("html")
+
+    assert cached.html.startswith("<html>xxx")
+    assert "html" not in cached._lazy_fields
+    assert cached.model_dump()["screenshot"] == "c2NyZWVu"
+    assert cached._lazy_fields == {}
+    assert cached.markdown.raw_markdown == "hello"
+    await manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_missing_blob_is_not_content(tmp_path, db_manager, cache_result):
+    from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode
+    from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+    from crawl4ai.models import AsyncCrawlResponse
+
+    class FreshStrategy(AsyncCrawlerStrategy):
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *args):
+            pass
+
+        async def crawl(self, url, **kwargs):
+            return AsyncCrawlResponse(html="<html><body><p>fresh</p></body></html>", response_headers={}, status_code=200)
+
+    manager = db_manager
+    await manager.acache_url(cache_result("https://example.com", **PAGE))
+    cached = await manager.aget_cached_url("https://example.com")
+    for entry in os.scandir(manager.content_paths["html"]):
+        if entry.is_file():
+            os.remove(entry.path)
+    assert not cached.has_content("html") and cached.has_content("cleaned_html")
+
+    # The crawler refetches instead of serving an empty page
+    async with AsyncWebCrawler(crawler_strategy=FreshStrategy(), base_directory=str(tmp_path)) as crawler:
+        result = await crawler.arun("https://example.com", config=CrawlerRunConfig(cache_mode=CacheMode.ENABLED))
+    assert "fresh" in result.html
+
+    cached = await manager.aget_cached_url("https://example.com")
+    await cached.aload_lazy_fields()
+    assert cached._lazy_fields == {} and "fresh" in cached.html
+    await manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_legacy_files_are_migrated(tmp_path, make_manager, cache_result):
+    manager = make_manager(compression="none")
+    await manager.acache_url(cache_result("https://example.com", **PAGE))
+    await manager.cleanup()
+
+    db_path = str(tmp_path / "crawl4ai.db")
+    legacy_ref = sqlite3.connect(db_path).execute("SELECT html FROM crawled_data").fetchone()[0]
+    assert "." not in legacy_ref
+
+    updated = await ContentStoreMigration(db_path, compression="gzip").migrate()
+    assert updated == 1
+    new_ref = sqlite3.connect(db_path).execute("SELECT html FROM crawled_data").fetchone()[0]
+    assert new_ref == legacy_ref + ".gz"
+    assert not os.path.exists(os.path.join(manager.content_paths["html"], legacy_ref))
+
+    manager = make_manager()
+    cached = await manager.aget_cached_url("https://example.com")
+    assert cached.html.startswith("<html>xxx")
+    await manager.cleanup()
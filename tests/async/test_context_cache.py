@@ -0,0 +1,99 @@
+import os
+import sys
+import asyncio
+import pytest
+from pyee.asyncio import AsyncIOEventEmitter
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai import BrowserConfig, CrawlerRunConfig, ProxyConfig
+from crawl4ai.browser_manager import BrowserManager, ContextCache
+
+
+class FakeContext(AsyncIOEventEmitter):
+    """Just enough of a BrowserContext for the cache"""
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+        self.emit("close", self)
+
+
+def factory(name):
+    async def create():
+        return FakeContext(name)
+    return create
+
+
+async def settle(cache: ContextCache):
+    await asyncio.sleep(0)
+    await asyncio.gather(*cache._closing)
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_waits_for_pages_to_drain():
+    cache = ContextCache(max_size=2, idle_ttl=0)
+    a = await cache.acquire("a", factory("a"))
+    b = await cache.acquire("b", factory("b"))
+    cache.release(b)
+    assert (await cache.acquire("a", factory("x"))).context is a.context  # hit, a is now most recent
+    cache.release(a)
+
+    c = await cache.acquire("c", factory("c"))  # b is idle and least recently used
+    await settle(cache)
+    assert b.context.closed and [e.signature for e in cache.entries()] == ["a", "c"]
+
+    # Everything busy: the oldest is retired, and only closes when its last page is done
+    d = await cache.acquire("d", factory("d"))
+    await settle(cache)
+    assert [e.signature for e in cache.entries()] == ["c", "d"]
+    assert not a.context.closed and cache.get_stats()["retired"] == 1
+    cache.release(a)
+    assert not a.context.closed  # still one page on it
+    cache.release(a)
+    await settle(cache)
+    assert a.context.closed
+
+    # A retired signature gets a fresh context
+    assert (await cache.acquire("a", factory("a2"))).context.name == "a2"
+    stats = cache.get_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 5 and stats["evicted"] == 3
+    await cache.close()
+    assert c.context.closed and d.context.closed
+
+
+@pytest.mark.asyncio
+async def test_idle_contexts_expire_and_outside_closes_are_dropped():
+    cache = ContextCache(max_size=0, idle_ttl=0.05)
+    idle = await cache.acquire("idle", factory("idle"))
+    busy = await cache.acquire("busy", factory("busy"))
+    cache.release(idle)
+    await asyncio.sleep(0.1)
+
+    await cache.acquire("new", factory("new"))
+    await settle(cache)
+    assert idle.context.closed and not busy.context.closed
+    assert cache.get_stats()["expired"] == 1
+
+    await busy.context.close()  # e.g. kill_session
+    assert [e.signature for e in cache.entries()] == ["new"]
+    await cache.close()
+
+
+def test_signature_only_depends_on_context_settings():
+    manager = BrowserManager(BrowserConfig())
+    base = manager._make_config_signature(CrawlerRunConfig())
+    assert manager._make_config_signature(CrawlerRunConfig(word_count_threshold=50, js_code="1")) == base
+    assert manager._make_config_signature(CrawlerRunConfig(locale="fr-FR")) != base
+
+    proxied = CrawlerRunConfig(proxy_config=ProxyConfig(server="http://1.2.3.4:8080"))
+    same = CrawlerRunConfig(proxy_config=ProxyConfig(server="http://1.2.3.4:8080"))
+    other = CrawlerRunConfig(proxy_config=ProxyConfig(server="http://5.6.7.8:8080"))
+    assert manager._make_config_signature(proxied) == manager._make_config_signature(same)
+    assert manager._make_config_signature(proxied) != manager._make_config_signature(other)
@@ -0,0 +1,148 @@
+import os
+import sys
+import json
+import random
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai.adaptive_crawler import CrawlState, KnowledgeDocument, StatisticalStrategy
+from crawl4ai.models import Link
+
+VOCAB = [f"term{i:03d}" for i in range(200)]
+
+
+class Markdown:
+    def __init__(self, content):
+        self.raw_markdown = content
+
+
+class Result:
+    def __init__(self, url, content, links=None):
+        self.url = url
+        self.markdown = Markdown(content)
+        self.links = links or {}
+        self.metadata = {"title": url}
+        self.success = True
+
+
+def make_docs(start, count, seed=0):
+    rng = random.Random(seed)
+    return [
+        Result(
+            f"https://example.com/{i}",
+            " ".join(rng.sample(VOCAB, rng.randint(5, 40))),
+            {"internal": [{"href": f"https://example.com/{i + 1}"}]},
+        )
+        for i in range(start, start + count)
+    ]
+
+
+async def grow(strategy, state, docs):
+    state.add_documents(docs)
+    for doc in docs:
+        state.crawled_urls.add(doc.url)
+    state.add_links([Link(href=f"{doc.url}/next", text="more") for doc in docs])
+    state.discard_crawled_links()
+    await strategy.update_state(state, docs)
+    await strategy.calculate_confidence(state)
+
+
+def comparable(state):
+    return {
+        "crawled": state.crawled_urls,
+        "docs": [(d.url, d.markdown.raw_markdown, d.links, d.metadata) for d in state.knowledge_base],
+        "pending": [l.href for l in state.pending_links],
+        "tf": dict(state.term_frequencies),
+        "df": dict(state.document_frequencies),
+        "postings": {t: list(v) for t, v in state.documents_with_terms.items() if len(v)},
+        "total": state.total_documents,
+        "counts": state.document_term_counts,
+        "overlap": (state.consistency_overlap_sum, state.consistency_pairs),
+        "history": (state.new_terms_history, state.crawl_order),
+        "metrics": state.metrics,
+    }
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_append_and_replay(tmp_path):
+    strategy = StatisticalStrategy()
+    state = CrawlState(query="term001 term002")
+    path = tmp_path / "state.jsonl"
+
+    sizes = []
+    for step in range(4):
+        await grow(strategy, state, make_docs(step * 5, 5, seed=step))
+        state.checkpoint(path)
+        sizes.append(path.stat().st_size)
+        assert comparable(CrawlState.load(path)) == comparable(state)
+
+    # one header, one base record, then one delta per checkpoint
+    lines = path.read_text().splitlines()
+    assert len(lines) == 5
+    assert [json.loads(line)["base"] for line in lines[1:]] == [True, False, False, False]
+    # deltas stay small: content lives in the store, only hashes are journaled
+    assert sizes[3] - sizes[2] < sizes[0]
+    journal = path.read_text()
+    assert not any(d.markdown.raw_markdown in journal for d in state.knowledge_base)
+
+
+@pytest.mark.asyncio
+async def test_resume_keeps_appending(tmp_path):
+    strategy = StatisticalStrategy()
+    path = tmp_path / "state.jsonl"
+    state = CrawlState(query="term001")
+    await grow(strategy, state, make_docs(0, 6))
+    state.checkpoint(path)
+
+    resumed = CrawlState.load(path)
+    await grow(strategy, resumed, make_docs(6, 6, seed=3))
+    resumed.checkpoint(path)
+    assert len(path.read_text().splitlines()) == 3
+
+    # same statistics as a crawl that never stopped
+    await grow(strategy, state, make_docs(6, 6, seed=3))
+    assert comparable(CrawlState.load(path)) == comparable(state)
+    assert strategy._calculate_consistency(resumed) == pytest.approx(strategy._calculate_consistency(state))
+
+    # a torn final write falls back to the previous checkpoint
+    with open(path, "a") as f:
+        f.write('{"base": false, "docs": [')
+    assert CrawlState.load(path).total_documents == 12
+
+
+@pytest.mark.asyncio
+async def test_content_is_loaded_lazily(tmp_path):
+    state = CrawlState()
+    state.add_documents(make_docs(0, 3))
+    state.checkpoint(tmp_path / "state.jsonl")
+
+    loaded = CrawlState.load(tmp_path / "state.jsonl")
+    doc = loaded.knowledge_base[1]
+    assert isinstance(doc, KnowledgeDocument)
+    assert doc._payload is None and doc.content_hash
+    assert doc.markdown.raw_markdown == state.knowledge_base[1].markdown.raw_markdown
+    assert doc.links == {"internal": [{"href": "https://example.com/2"}]}
+    # identical content is stored once
+    loaded.add_documents([Result("https://example.com/copy", doc.markdown.raw_markdown,
+                                 doc.links)])
+    loaded.checkpoint(tmp_path / "state.jsonl")
+    assert loaded.knowledge_base[-1].content_hash == doc.content_hash
+    # payloads are compressed blobs of the cache's content store
+    markdown_dir = CrawlState.default_content_dir(tmp_path / "state.jsonl") / "markdown_content"
+    assert sorted(os.listdir(markdown_dir)) == sorted(d.content_hash for d in state.knowledge_base)
+
+
+@pytest.mark.asyncio
+async def test_legacy_snapshot_loads_and_migrates(tmp_path):
+    strategy = StatisticalStrategy()
+    state = CrawlState(query="term001")
+    await grow(strategy, state, make_docs(0, 8))
+    state.save(tmp_path / "old.json")
+
+    loaded = CrawlState.load(tmp_path / "old.json")
+    assert comparable(loaded) == comparable(state)
+    loaded.checkpoint(tmp_path / "new.jsonl")
+    assert comparable(CrawlState.load(tmp_path / "new.jsonl")) == comparable(state)
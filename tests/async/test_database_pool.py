@@ -0,0 +1,121 @@
+import os
+import sys
+import asyncio
+import subprocess
+import textwrap
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+
+@pytest.mark.asyncio
+async def test_write_behind_batches_and_coalesces(make_manager, cache_result):
+    manager = make_manager(write_flush_interval=10)
+
+    for i in range(20):
+        await manager.acache_url(cache_result(f"https://example.com/{i}"))
+    # Same url twice only keeps the latest row
+    await manager.acache_url(cache_result("https://example.com/0", html="<p>new</p>"))
+
+    stats = manager.get_stats()
+    assert stats["pending_writes"] == 20
+    assert stats["writes_coalesced"] == 1
+
+    assert await manager.aget_total_count() == 20
+    stats = manager.get_stats()
+    assert stats["pending_writes"] == 0
+    assert stats["rows_committed"] == 20
+    assert stats["batches_committed"] == 1
+
+    cached = await manager.aget_cached_url("https://example.com/0")
+    assert cached.html == "<p>new</p>"
+    await manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_read_your_writes_and_connection_reuse(make_manager, cache_result):
+    manager = make_manager(pool_size=2, write_flush_interval=10)
+    await manager.acache_url(cache_result("https://example.com/a"))
+
+    # Pending row is flushed before the lookup
+    cached = await manager.aget_cached_url("https://example.com/a")
+    assert cached is not None and cached.html == "<html>https://example.com/a</html>"
+
+    results = await asyncio.gather(
+        *[manager.aget_cached_url("https://example.com/a") for _ in range(10)]
+    )
+    assert all(r is not None for r in results)
+    assert manager.get_stats()["open_readers"] <= 2
+    await manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_backpressure_flushes_full_queue(make_manager, cache_result):
+    manager = make_manager(write_batch_size=4, max_pending_writes=8, write_flush_interval=10)
+    for i in range(8):
+        await manager.acache_url(cache_result(f"https://example.com/{i}"))
+
+    stats = manager.get_stats()
+    assert stats["pending_writes"] == 0
+    assert stats["batches_committed"] == 2
+    await manager.cleanup()
+
+
+def test_pending_writes_flushed_when_loop_closes(make_manager, cache_result):
+    manager = make_manager(write_flush_interval=10)
+
+    async def write():
+        await manager.acache_url(cache_result("https://example.com/late"))
+
+    asyncio.run(write())
+    assert manager.get_stats()["rows_committed"] == 1
+
+    async def read():
+        return await manager.aget_cached_url("https://example.com/late")
+
+    assert asyncio.run(read()) is not None
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_stays_queued(make_manager, cache_result):
+    manager = make_manager(write_flush_interval=10)
+    await manager.acache_url(cache_result("https://example.com/a"))
+    await manager.acache_url(cache_result("https://example.com/b"))
+
+    execute = manager.execute_with_retry
+
+    async def locked(operation, write=False):
+        raise RuntimeError("database is locked")
+
+    manager.execute_with_retry = locked
+    await manager.flush()
+    stats = manager.get_stats()
+    assert stats["failed_batches"] == 1 and stats["pending_writes"] == 2
+
+    manager.execute_with_retry = execute
+    assert await manager.aget_total_count() == 2
+    assert manager.get_stats()["pending_writes"] == 0
+    await manager.cleanup()
+
+
+def test_interpreter_exits_without_cleanup(tmp_path):
+    script = textwrap.dedent(f"""
+        import asyncio, sys
+        sys.path.insert(0, {parent_dir!r})
+        from crawl4ai.async_database import AsyncDatabaseManager
+
+        manager = AsyncDatabaseManager(db_path={str(tmp_path / "crawl4ai.db")!r})
+        manager.version_manager.needs_update = lambda: False
+
+        async def main():
+            await manager.aget_total_count()
+            # No cleanup(): pooled connections are still open
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(main())
+        print("done")
+    """)
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=60)
+    assert completed.returncode == 0 and "done" in completed.stdout
@@ -0,0 +1,94 @@
+import os
+import sys
+import time
+import asyncio
+import pytest
+from urllib.parse import urlparse
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+from crawl4ai.async_dispatcher import MemoryAdaptiveDispatcher, RateLimiter
+from crawl4ai.models import AsyncCrawlResponse
+
+
+class DomainTrackingStrategy(AsyncCrawlerStrategy):
+    """Records start order and peak concurrency per domain."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.started = []
+        self.in_flight = {}
+        self.peak = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def crawl(self, url: str, **kwargs) -> AsyncCrawlResponse:
+        domain = urlparse(url).netloc
+        self.started.append(url)
+        self.in_flight[domain] = self.in_flight.get(domain, 0) + 1
+        self.peak[domain] = max(self.peak.get(domain, 0), self.in_flight[domain])
+        await asyncio.sleep(self.delay)
+        self.in_flight[domain] -= 1
+        return AsyncCrawlResponse(html=f"<p>{url}</p>", response_headers={}, status_code=200)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_requests():
+    limiter = RateLimiter(base_delay=(0, 0), requests_per_second=20, burst=2)
+    url = "https://example.com/page"
+
+    start = time.perf_counter()
+    for _ in range(6):
+        await limiter.wait_if_needed(url)
+        limiter.release(url)
+    # Two requests ride the burst, the other four wait 1/20 s each
+    assert time.perf_counter() - start >= 0.18
+    assert not limiter.is_ready(url)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_per_domain():
+    limiter = RateLimiter(base_delay=(0, 0), max_concurrent_per_domain=2)
+    active = peak = 0
+
+    async def request(url):
+        nonlocal active, peak
+        await limiter.wait_if_needed(url)
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        limiter.release(url)
+
+    await asyncio.gather(*[request("https://example.com/x") for _ in range(6)])
+    assert peak == 2
+    assert limiter.domains["example.com"].in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_skips_throttled_domains():
+    strategy = DomainTrackingStrategy()
+    dispatcher = MemoryAdaptiveDispatcher(
+        max_session_permit=4,
+        rate_limiter=RateLimiter(base_delay=(0, 0), max_concurrent_per_domain=1),
+    )
+    urls = [f"https://busy.com/{i}" for i in range(4)] + [
+        f"https://quiet{i}.com/" for i in range(3)
+    ]
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, verbose=False)
+
+    async with AsyncWebCrawler(crawler_strategy=strategy) as crawler:
+        results = await crawler.arun_many(urls, config=config, dispatcher=dispatcher)
+
+    assert all(result.success for result in results)
+    assert strategy.peak["busy.com"] == 1
+    # The other domains ran alongside the first busy.com request
+    assert set(strategy.started[:4]) == {urls[0]} | set(urls[4:])
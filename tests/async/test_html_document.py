@@ -0,0 +1,117 @@
+import os
+import sys
+import pytest
+from lxml import html as lhtml
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode, DefaultMarkdownGenerator
+from crawl4ai.async_webcrawler import process_html
+from crawl4ai.extraction_strategy import JsonXPathExtractionStrategy
+from crawl4ai.html_document import HTMLDocument, fit_html_for
+from crawl4ai.utils import preprocess_html_for_schema
+
+HTML = """<!DOCTYPE html>
+<html><head><title>Shop</title><script>var x = 1;</script></head>
+<body>
+  <!-- listing -->
+  <div class="product"><h2>Alpha</h2><span class="price">$1</span></div>
+  <div class="product"><h2>Beta</h2><span class="price">$2</span></div>
+  <p>""" + "Some descriptive text. " * 20 + """</p>
+</body></html>"""
+
+SCHEMA = {
+    "name": "products",
+    "baseSelector": "//div[@class='product']",
+    "fields": [
+        {"name": "name", "selector": ".//h2", "type": "text"},
+        {"name": "price", "selector": ".//span[@class='price']", "type": "text"},
+    ],
+}
+
+
+@pytest.fixture
+def parse_counter(monkeypatch):
+    """Counts every full lxml.html parse, including those behind html.fromstring"""
+    calls = []
+    original = lhtml.document_fromstring
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(lhtml, "document_fromstring", counting)
+    return calls
+
+
+def test_mutable_tree_copies_only_while_retained():
+    document = HTMLDocument(HTML)
+    copy = document.mutable_tree()
+    copy.body.clear()
+    assert document.tree.xpath("//h2/text()") == ["Alpha", "Beta"]
+
+    document.retain = False
+    assert document.mutable_tree() is not document.tree
+    assert document.parse_count == 2
+
+
+FRAGMENT = """<div class="card">
+  <ul>
+    <li class="item">One</li>
+    <li class="item">Two</li>
+  </ul>
+</div>"""
+
+
+@pytest.mark.parametrize("html", [HTML, FRAGMENT])
+def test_fit_html_matches_preprocess_html_for_schema(html):
+    document = HTMLDocument(html)
+    assert not document.has_fit_html
+    assert document.fit_html == preprocess_html_for_schema(html, text_threshold=500, max_size=300_000)
+    assert document.has_fit_html
+
+
+def test_process_html_parses_the_page_once(parse_counter):
+    config = CrawlerRunConfig(
+        cache_mode=CacheMode.BYPASS,
+        extraction_strategy=JsonXPathExtractionStrategy(SCHEMA),
+    )
+    result = process_html("https://example.com", HTML, None, config, None, None)
+
+    assert '"Alpha"' in result["extracted_content"]
+    assert "Alpha" in result["markdown"].raw_markdown
+    # Nothing asked for fit_html, so it was never computed
+    assert result["fit_html"] is None
+    assert len(parse_counter) == 1
+
+
+def test_fit_html_markdown_source(parse_counter):
+    config = CrawlerRunConfig(
+        cache_mode=CacheMode.BYPASS,
+        markdown_generator=DefaultMarkdownGenerator(content_source="fit_html"),
+    )
+    result = process_html("https://example.com", HTML, None, config, None, None)
+
+    assert "Beta" in result["markdown"].raw_markdown
+    assert "var x" not in result["markdown"].raw_markdown
+    # fit_html keeps its own parser settings, so it does not share the tree
+    assert len(parse_counter) == 2
+    assert result["fit_html"] == fit_html_for(HTML)
+
+
+@pytest.mark.asyncio
+async def test_crawl_result_computes_fit_html_on_access(tmp_path):
+    crawler = AsyncWebCrawler(base_directory=str(tmp_path))
+    try:
+        for html in (HTML, FRAGMENT):
+            result = await crawler.aprocess_html(
+                "https://example.com", html, "", CrawlerRunConfig(cache_mode=CacheMode.BYPASS),
+                None, None, verbose=False,
+            )
+            assert "fit_html" in result._lazy_fields
+            assert result.fit_html == preprocess_html_for_schema(html, text_threshold=500, max_size=300_000)
+            assert result.model_dump()["fit_html"] == result.fit_html
+    finally:
+        await crawler.close()
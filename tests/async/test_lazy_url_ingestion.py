@@ -0,0 +1,110 @@
+import os
+import sys
+import asyncio
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+from crawl4ai.async_dispatcher import MemoryAdaptiveDispatcher, SemaphoreDispatcher, UrlSource
+from crawl4ai.models import AsyncCrawlResponse
+
+
+class CountingStrategy(AsyncCrawlerStrategy):
+    """Serves a static page and tracks how far fetching lags behind the input."""
+
+    def __init__(self):
+        self.pulled = 0
+        self.crawled = 0
+        self.max_backlog = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def crawl(self, url: str, **kwargs) -> AsyncCrawlResponse:
+        await asyncio.sleep(0.001)
+        self.crawled += 1
+        return AsyncCrawlResponse(
+            html=f"<html><body><p>{url}</p></body></html>",
+            response_headers={},
+            status_code=200,
+        )
+
+    def urls(self, count: int):
+        for i in range(count):
+            self.pulled += 1
+            self.max_backlog = max(self.max_backlog, self.pulled - self.crawled)
+            yield f"https://example.com/{i}"
+
+    async def aurls(self, count: int):
+        for url in self.urls(count):
+            yield url
+
+
+@pytest.mark.asyncio
+async def test_url_source_accepts_sync_and_async_iterables():
+    async def agen():
+        for i in range(3):
+            yield str(i)
+
+    for urls in (["0", "1", "2"], iter(["0", "1", "2"]), agen()):
+        source = UrlSource(urls)
+        assert await source.take(2) == ["0", "1"]
+        assert await source.take(2) == ["2"]
+        assert source.exhausted and source.pulled == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_memory_adaptive_dispatcher_pulls_lazily(stream):
+    strategy = CountingStrategy()
+    dispatcher = MemoryAdaptiveDispatcher(max_session_permit=3, url_lookahead=4)
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, stream=stream, verbose=False)
+
+    async with AsyncWebCrawler(crawler_strategy=strategy) as crawler:
+        results = await crawler.arun_many(strategy.aurls(40), config=config, dispatcher=dispatcher)
+        if stream:
+            results = [result async for result in results]
+
+    assert len(results) == 40 and all(result.success for result in results)
+    # Running tasks plus the look-ahead window, never the whole input
+    assert strategy.max_backlog <= 3 + 4 + 1
+
+
+@pytest.mark.asyncio
+async def test_semaphore_dispatcher_keeps_input_order():
+    strategy = CountingStrategy()
+    dispatcher = SemaphoreDispatcher(semaphore_count=2, url_lookahead=2)
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, verbose=False)
+
+    async with AsyncWebCrawler(crawler_strategy=strategy) as crawler:
+        results = await crawler.arun_many(strategy.urls(20), config=config, dispatcher=dispatcher)
+
+    assert [result.url for result in results] == [f"https://example.com/{i}" for i in range(20)]
+    assert strategy.max_backlog <= 2 + 2 + 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("dispatcher_cls", [MemoryAdaptiveDispatcher, SemaphoreDispatcher])
+async def test_dispatchers_wait_for_a_producer_that_is_not_ready(dispatcher_cls):
+    async def frontier():
+        yield None  # nothing ready yet, the source is not exhausted
+        await asyncio.sleep(0.05)
+        for i in range(3):
+            yield f"https://example.com/{i}"
+
+    source = UrlSource(frontier())
+    assert await source.take(5) == [] and not source.exhausted
+
+    strategy = CountingStrategy()
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, verbose=False)
+    async with AsyncWebCrawler(crawler_strategy=strategy) as crawler:
+        results = await crawler.arun_many(frontier(), config=config, dispatcher=dispatcher_cls())
+
+    assert sorted(result.url for result in results) == [f"https://example.com/{i}" for i in range(3)]
@@ -0,0 +1,94 @@
+import os
+import sys
+import asyncio
+import pytest
+from aiohttp import web
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, LinkPreviewConfig
+
+
+async def serve_heads():
+    hits = {}
+
+    async def article(request):
+        name = request.match_info["name"]
+        hits[name] = hits.get(name, 0) + 1
+        await asyncio.sleep(0.05)  # long enough for concurrent pages to overlap
+        return web.Response(
+            text=f"<html><head><title>Article {name}</title>"
+                 f"<meta name='description' content='About {name}'></head><body></body></html>",
+            content_type="text/html",
+        )
+
+    app = web.Application()
+    app.router.add_get("/article/{name}", article)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}", hits
+
+
+def page_linking(base, names):
+    links = "".join(f'<a href="{base}/article/{name}">Read about {name}</a>' for name in names)
+    return f"<html><body><main><p>{'Some text here. ' * 20}</p>{links}</main></body></html>"
+
+
+@pytest.mark.asyncio
+async def test_pages_of_a_crawl_share_link_heads(tmp_path):
+    runner, base, hits = await serve_heads()
+    crawler = AsyncWebCrawler(base_directory=str(tmp_path))
+    try:
+        config = CrawlerRunConfig(link_preview_config=LinkPreviewConfig(include_internal=True, include_external=True))
+        pages = [
+            page_linking(base, ["alpha", "beta", "gamma"]),
+            page_linking(base, ["beta", "gamma", "delta"]),
+            page_linking(base, ["alpha", "delta"]),
+        ]
+        results = await asyncio.gather(*(
+            crawler.aprocess_html(f"{base}/page{i}", html, "", config, None, None, verbose=False)
+            for i, html in enumerate(pages)
+        ))
+
+        for result in results:
+            links = result.links["internal"] + result.links["external"]
+            assert len(links) == 3 - (result is results[2])
+            for link in links:
+                name = link["href"].rsplit("/", 1)[1]
+                assert link["head_extraction_status"] == "valid"
+                assert link["head_data"]["title"] == f"Article {name}"
+        assert hits == {"alpha": 1, "beta": 1, "gamma": 1, "delta": 1}
+
+        stats = crawler.link_preview.get_stats()
+        assert stats["fetched"] == 4 and stats["reused"] == 4
+
+        # A later page is answered from memory
+        again = await crawler.aprocess_html(f"{base}/page9", pages[0], "", config, None, None, verbose=False)
+        first = (again.links["internal"] + again.links["external"])[0]
+        assert first["head_data"]["title"] == "Article alpha"
+        assert hits["alpha"] == 1
+    finally:
+        await crawler.close()
+        await runner.cleanup()
+    assert crawler.link_preview is None
+
+
+@pytest.mark.asyncio
+async def test_pages_without_link_preview_fetch_nothing(tmp_path):
+    runner, base, hits = await serve_heads()
+    crawler = AsyncWebCrawler(base_directory=str(tmp_path))
+    try:
+        result = await crawler.aprocess_html(
+            f"{base}/page", page_linking(base, ["alpha"]), "", CrawlerRunConfig(), None, None, verbose=False
+        )
+        links = result.links["internal"] + result.links["external"]
+        assert links and links[0]["head_data"] is None
+        assert not hits and crawler.link_preview is None
+    finally:
+        await crawler.close()
+        await runner.cleanup()
@@ -0,0 +1,130 @@
+import os
+import sys
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai import DefaultMarkdownGenerator, LXMLMarkdownGenerator, LXMLWebScrapingStrategy
+from crawl4ai.content_filter_strategy import PruningContentFilter
+
+__location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
+
+BASE_URL = "https://example.com/docs/page"
+
+FIELDS = [
+    "raw_markdown",
+    "markdown_with_citations",
+    "references_markdown",
+    "fit_markdown",
+    "fit_html",
+]
+
+# Golden output is whatever DefaultMarkdownGenerator produces for the same input
+CASES = {
+    "emphasis": "<p>plain <b>bold</b> and <i>it</i>alic, <strong>AT&amp;T</strong></p>",
+    "bare_text": "text first <b>x</b> tail",
+    "headers_and_links": "<h2><a href='/a'>Head link</a></h2><a href='/b'><h3>H in a</h3></a>",
+    "lists": (
+        "<ul><li>one<ul><li>nested</li></ul></li><li>two</li></ul>"
+        "<ol start='3'><li>a</li><li>b</li></ol>"
+    ),
+    "table": (
+        "<table><tr><th>A</th><th>B</th></tr>"
+        "<tr><td><a href='/c'>1</a></td><td>2 &lt; 3</td></tr></table>"
+    ),
+    "pre": "<pre><code>fn main() {\n    let v = a &amp;&amp; b;\n}\n</code></pre><p>after</p>",
+    "inline_code": "<p>Inline <code>a &amp;&amp; b</code>, <kbd>Ctrl</kbd> and <a href='/l'><code>linked</code></a></p>",
+    "blockquote": "<blockquote><p>quote<br>line</p></blockquote><hr><p>c</p>",
+    "link_kinds": (
+        "<a href='https://x.com/a_(b)'>paren url</a> <a href='javascript:void(0)'>js</a> "
+        "<a href='#frag'>frag</a> <a href='mailto:a@b.c'>mail</a> "
+        "<a href='/t' title='The title'>text</a> <a href='/t'>again</a> "
+        "<a href='https://e.com'>https://e.com</a> <a href='/x'></a><a>no href</a>"
+    ),
+    "images": (
+        "<a href='/img'><img src='/i.png' alt='Alt'></a> <img src='/j.png'> "
+        "<img src='k.png' alt='K'>"
+    ),
+    "whitespace": "<div><p>nbsp\xa0raw <em>\xa0spaced\xa0</em></p>\n\n<p>b</p></div>",
+    "definitions": "<dl><dt>Term</dt><dd>Def</dd><dt>T2</dt><dd>D2</dd></dl>",
+    "inline_tags": (
+        "<p>x<sup>2</sup> H<sub>2</sub>O <del>gone</del> <q>quoted</q> "
+        "<abbr title='HyperText'>HTML</abbr> <span>inert</span></p>"
+    ),
+    "comments_and_scripts": (
+        "<p>a<!-- comment -->b<!---->c</p>"
+        "<script>var x = '<b>' && y;</script><style>p{color:red}</style>"
+    ),
+    "named_entities": "<p>It&rsquo;s &copy; 2024&nbsp;&mdash; <b>&#169;</b></p>",
+    "full_document": (
+        "<!DOCTYPE html><html><head><title>T</title></head>"
+        "<body><h1>Title</h1><p>Body <a href='/x'>link</a></p></body></html>"
+    ),
+}
+
+OPTIONS = {
+    "default": None,
+    "ignore_links": {"ignore_links": True},
+    "reference_links": {"inline_links": False},
+    "preserve_tags": {"preserve_tags": ["table"]},
+    "protect_links": {"protect_links": True, "ignore_images": True},
+}
+
+
+def generate(generator_class, html, **kwargs):
+    options = kwargs.pop("options", None)
+    return generator_class(options=options, **kwargs).generate_markdown(
+        html, base_url=BASE_URL
+    )
+
+
+def assert_same_output(html, **kwargs):
+    expected = generate(DefaultMarkdownGenerator, html, **dict(kwargs))
+    actual = generate(LXMLMarkdownGenerator, html, **dict(kwargs))
+    for field in FIELDS:
+        assert getattr(actual, field) == getattr(expected, field), field
+
+
+@pytest.mark.parametrize("options", OPTIONS.values(), ids=OPTIONS.keys())
+@pytest.mark.parametrize("html", CASES.values(), ids=CASES.keys())
+def test_matches_default_generator(html, options):
+    assert_same_output(html, options=options)
+
+
+@pytest.fixture(scope="module")
+def wikipedia_html():
+    with open(os.path.join(__location__, "sample_wikipedia.html"), encoding="utf-8") as f:
+        raw_html = f.read()
+    result = LXMLWebScrapingStrategy().scrap("https://en.wikipedia.org/wiki/Sample", raw_html)
+    return raw_html, result.cleaned_html
+
+
+def test_matches_default_generator_on_page(wikipedia_html):
+    raw_html, cleaned_html = wikipedia_html
+    for html in (cleaned_html, raw_html):
+        assert_same_output(html, content_filter=PruningContentFilter())
+
+
+def test_citations_come_from_written_links():
+    html = "<pre><code>println!(\"[x](y)\");</code></pre><p><a href='/z'>z</a></p>"
+    result = generate(LXMLMarkdownGenerator, html)
+
+    # Link syntax inside code is not a link, only <a> is cited
+    assert '[x](y)' in result.markdown_with_citations
+    assert "z⟨1⟩" in result.markdown_with_citations
+    assert result.references_markdown == (
+        "\n\n## References\n\n⟨1⟩ https://example.com/z: z\n"
+    )
+
+
+def test_tree_walk_skips_html_parser(monkeypatch):
+    from crawl4ai.html2text import LXMLHTML2Text
+
+    def no_feed(self, data):
+        raise AssertionError("html.parser used")
+
+    monkeypatch.setattr(LXMLHTML2Text, "feed", no_feed)
+    result = generate(LXMLMarkdownGenerator, CASES["headers_and_links"])
+    assert "## [Head link](https://example.com/a)" in result.raw_markdown
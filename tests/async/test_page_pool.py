@@ -0,0 +1,254 @@
+import os
+import sys
+import asyncio
+import pytest
+from aiohttp import web
+from pyee.asyncio import AsyncIOEventEmitter
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
+from crawl4ai.browser_manager import BrowserManager, PagePool
+
+
+def chromium_available() -> bool:
+    try:
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as playwright:
+            return os.path.exists(playwright.chromium.executable_path)
+    except Exception:
+        return False
+
+
+requires_browser = pytest.mark.skipif(
+    not chromium_available(), reason="Playwright Chromium is not installed"
+)
+
+
+async def serve_pages():
+    async def page(request):
+        name = request.match_info["name"]
+        return web.Response(
+            text=f"<html><body><h1>Page {name}</h1><p>{'content ' * 50}</p></body></html>",
+            content_type="text/html",
+        )
+
+    app = web.Application()
+    app.router.add_get("/{name}", page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def settle(pool: PagePool):
+    await asyncio.gather(*pool._resetting)
+
+
+class FakeDisposable:
+    def __init__(self, page):
+        self.page = page
+
+    async def dispose(self):
+        self.page.init_scripts -= 1
+
+
+class FakeImpl(AsyncIOEventEmitter):
+    def __init__(self):
+        super().__init__()
+        self._routes = []
+
+
+class FakePage:
+    """Just enough of a Playwright Page for the pool"""
+
+    def __init__(self):
+        self._impl_obj = FakeImpl()
+        self.viewport_size = {"width": 1080, "height": 600}
+        self.url = "about:blank"
+        self.closed = False
+        self.init_scripts = 0
+        self.headers = None
+
+    def on(self, event, listener):
+        self._impl_obj.on(event, listener)
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+    async def add_init_script(self, script):
+        self.init_scripts += 1
+        return FakeDisposable(self)
+
+    async def set_extra_http_headers(self, headers):
+        self.headers = headers
+
+    async def unroute_all(self, behavior=None):
+        self._impl_obj._routes = []
+
+    async def goto(self, url):
+        self.url = url
+
+    async def set_viewport_size(self, viewport):
+        self.viewport_size = viewport
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        self.pages.append(FakePage())
+        return self.pages[-1]
+
+
+@pytest.mark.asyncio
+async def test_pool_resets_pages_between_crawls():
+    context = FakeContext()
+    pool = PagePool(context, max_size=2, max_uses=3)
+    page = await pool.acquire()
+
+    page.on("console", lambda msg: None)
+    page._impl_obj._routes.append("**/*")
+    await page.add_init_script("window.__leftover = 1")
+    await page.set_extra_http_headers({"X-Crawl": "1"})
+    await page.set_viewport_size({"width": 300, "height": 200})
+    await page.goto("https://example.com")
+    assert pool.release(page)
+    await settle(pool)
+
+    assert page.url == "about:blank" and page.viewport_size == {"width": 1080, "height": 600}
+    assert not page._impl_obj.listeners("console") and page._impl_obj.listeners("crash")
+    assert not page._impl_obj._routes and page.init_scripts == 0 and page.headers == {}
+
+    # Reused until max_uses, then closed
+    for _ in range(2):
+        assert await pool.acquire() is page
+        pool.release(page)
+        await settle(pool)
+    assert page.closed and len(context.pages) == 1
+    stats = pool.get_stats()
+    assert stats["hits"] == 2 and stats["misses"] == 1 and stats["resets"] == 2 and stats["recycled"] == 1
+    assert not pool.release(FakePage())
+
+
+@pytest.mark.asyncio
+async def test_pool_drops_crashed_and_surplus_pages():
+    context = FakeContext()
+    pool = PagePool(context, max_size=1)
+    first, second = await pool.acquire(), await pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    await settle(pool)
+    assert pool.get_stats()["idle"] == 1 and sum(p.closed for p in context.pages) == 1
+
+    warm = await pool.acquire()
+    warm._impl_obj.emit("crash", warm)
+    pool.release(warm)
+    await settle(pool)
+    assert warm.closed and pool.get_stats()["idle"] == 0
+
+    page = await pool.acquire()
+    pool.release(page)
+    await settle(pool)
+    await pool.close()
+    assert page.closed
+    assert pool.get_stats()["discarded"] == 2
+
+
+@requires_browser
+@pytest.mark.asyncio
+async def test_pages_are_reset_and_reused():
+    runner, base = await serve_pages()
+    manager = BrowserManager(BrowserConfig(headless=True, page_pool_size=2, page_pool_max_uses=3))
+    await manager.start()
+    try:
+        config = CrawlerRunConfig(url=f"{base}/a")
+        page, _ = await manager.get_page(config)
+        pool = next(iter(manager.page_pools.values()))
+        viewport = page.viewport_size
+
+        # Leave behind what a crawl or hook may add
+        page.on("console", lambda msg: None)
+        await page.route("**/*", lambda route: route.continue_())
+        await page.add_init_script("window.__leftover = 1")
+        await page.set_extra_http_headers({"X-Crawl": "1"})
+        await page.set_viewport_size({"width": 300, "height": 200})
+        await page.goto(f"{base}/a")
+
+        assert await manager.release_page(page)
+        await settle(pool)
+
+        again, _ = await manager.get_page(config)
+        assert again is page
+        assert page.url == "about:blank"
+        assert page.viewport_size == viewport
+        assert not page._impl_obj.listeners("console")
+        assert not page._impl_obj._routes
+        await page.goto(f"{base}/b")
+        assert await page.evaluate("window.__leftover") is None
+
+        # Third use is the last one
+        await manager.release_page(again)
+        await settle(pool)
+        third, _ = await manager.get_page(config)
+        assert third is page
+        await manager.release_page(third)
+        await settle(pool)
+        assert page.is_closed()
+
+        stats = manager.get_page_pool_stats()
+        assert stats["hits"] == 2 and stats["misses"] == 1 and stats["recycled"] == 1
+    finally:
+        await manager.close()
+        await runner.cleanup()
+
+
+@requires_browser
+@pytest.mark.asyncio
+async def test_crawls_share_warm_pages():
+    runner, base = await serve_pages()
+    try:
+        async with AsyncWebCrawler(config=BrowserConfig(headless=True, page_pool_size=4, verbose=False)) as crawler:
+            config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS)
+            results = await crawler.arun_many([f"{base}/{i}" for i in range(12)], config=config)
+            assert all(result.success for result in results)
+            assert all(f"Page {result.url.rsplit('/', 1)[1]}<" in result.html for result in results)
+
+            manager = crawler.crawler_strategy.browser_manager
+            stats = manager.get_page_pool_stats()
+            assert stats["hits"] + stats["misses"] == 12
+            assert stats["hits"] > 0 and stats["leased"] == 0
+    finally:
+        await runner.cleanup()
+
+
+def test_pool_is_off_by_default():
+    assert BrowserConfig().page_pool_size == 0
+    assert BrowserConfig.from_kwargs({}).page_pool_size == 0
+    assert BrowserConfig.from_kwargs({"page_pool_size": 4}).page_pool_size == 4
+
+
+@requires_browser
+@pytest.mark.asyncio
+async def test_sessions_and_disabled_pool_open_their_own_pages():
+    manager = BrowserManager(BrowserConfig(headless=True))
+    await manager.start()
+    try:
+        page, _ = await manager.get_page(CrawlerRunConfig())
+        assert not manager.is_pooled(page) and not manager.page_pools
+        assert not await manager.release_page(page)
+
+        manager.config.page_pool_size = 2
+        session_page, _ = await manager.get_page(CrawlerRunConfig(session_id="s"))
+        assert not manager.is_pooled(session_page)
+    finally:
+        await manager.close()
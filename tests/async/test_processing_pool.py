@@ -0,0 +1,74 @@
+import os
+import sys
+import time
+import asyncio
+import threading
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+from crawl4ai.async_webcrawler import process_html, process_html_in_worker
+from crawl4ai.models import AsyncCrawlResponse
+from crawl4ai.processing_pool import ProcessingPool
+
+HTML = "<html><body><h1>Title</h1><p>" + "Some paragraph text. " * 50 + "</p></body></html>"
+
+
+class StaticStrategy(AsyncCrawlerStrategy):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def crawl(self, url: str, **kwargs) -> AsyncCrawlResponse:
+        return AsyncCrawlResponse(html=HTML, response_headers={}, status_code=200)
+
+
+@pytest.mark.asyncio
+async def test_pool_bounds_in_flight_work():
+    pool = ProcessingPool(mode="thread", max_workers=2, max_in_flight=3)
+    main_thread = threading.get_ident()
+
+    def work(i):
+        time.sleep(0.02)
+        return i, threading.get_ident()
+
+    results = await asyncio.gather(*[pool.run(work, i) for i in range(12)])
+    assert [i for i, _ in results] == list(range(12))
+    assert all(thread != main_thread for _, thread in results)
+
+    stats = pool.get_stats()
+    assert stats["completed"] == 12
+    assert stats["peak_in_flight"] <= 3
+    assert stats["in_flight"] == 0
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_inline_and_thread_pools_produce_same_result():
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS)
+    markdowns = []
+    for mode in ("inline", "thread"):
+        async with AsyncWebCrawler(
+            crawler_strategy=StaticStrategy(), processing_pool=ProcessingPool(mode=mode)
+        ) as crawler:
+            result = await crawler.arun("https://example.com", config=config)
+            assert result.success
+            markdowns.append(result.markdown.raw_markdown)
+    assert markdowns[0] == markdowns[1]
+    assert "Title" in markdowns[0]
+
+
+def test_worker_entry_point_uses_serialized_config():
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS)
+    direct = process_html("https://example.com", HTML, None, config, None, None)
+    worker = process_html_in_worker(
+        "https://example.com", HTML, None, config.dump(), None, None, {}
+    )
+    assert worker["markdown"].raw_markdown == direct["markdown"].raw_markdown
+    assert worker["cleaned_html"] == direct["cleaned_html"]
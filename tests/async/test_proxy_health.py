@@ -0,0 +1,145 @@
+import os
+import sys
+import time
+import random
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode, ProxyConfig, HealthAwareProxyStrategy
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+from crawl4ai.models import AsyncCrawlResponse
+
+GOOD, SLOW, BANNED = (ProxyConfig(server=f"http://10.0.0.{i}:8080") for i in (1, 2, 3))
+
+
+def test_picks_favour_fast_healthy_proxies():
+    random.seed(7)
+    strategy = HealthAwareProxyStrategy([GOOD, SLOW, BANNED], max_failures=100)
+    for _ in range(20):
+        strategy.report_result(GOOD, status_code=200, latency=0.5)
+        strategy.report_result(SLOW, status_code=200, latency=20)
+        strategy.report_result(BANNED, status_code=429, latency=0.5)
+
+    stats = strategy.get_stats()
+    assert stats[GOOD.server]["weight"] > 4 * stats[SLOW.server]["weight"]
+    assert stats[BANNED.server]["bans"] == 20 and stats[BANNED.server]["success_rate"] < 0.1
+
+    picks = [strategy._pick().server for _ in range(2000)]
+    assert picks.count(GOOD.server) > picks.count(SLOW.server) > 0
+    assert picks.count(GOOD.server) > 5 * picks.count(BANNED.server)
+
+
+def test_failing_proxy_is_ejected_and_reprobed(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    strategy = HealthAwareProxyStrategy([GOOD, BANNED], max_failures=2, eject_seconds=10)
+
+    strategy.report_result(BANNED, error="net::ERR_PROXY_CONNECTION_FAILED")
+    strategy.report_result(BANNED, status_code=403)
+    assert strategy.get_stats()[BANNED.server]["ejected"]
+    assert {strategy._pick().server for _ in range(50)} == {GOOD.server}
+
+    # Back after the ejection; one more failure ejects it for twice as long
+    now[0] += 11
+    assert not strategy.get_stats()[BANNED.server]["ejected"]
+    strategy.report_result(BANNED, status_code=429)
+    now[0] += 11
+    assert strategy.get_stats()[BANNED.server]["ejected"]
+    now[0] += 10
+    strategy.report_result(BANNED, status_code=200, latency=1)  # probe succeeds
+    strategy.report_result(BANNED, status_code=403)
+    assert not strategy.get_stats()[BANNED.server]["ejected"]
+
+    # With every proxy ejected, the one back soonest is still used
+    strategy.report_result(BANNED, error="timeout")
+    now[0] += 1
+    for _ in range(2):
+        strategy.report_result(GOOD, error="timeout")
+    assert strategy._pick() is BANNED
+
+
+@pytest.mark.asyncio
+async def test_sticky_domains_keep_their_proxy_until_it_is_ejected():
+    strategy = HealthAwareProxyStrategy([GOOD, SLOW, BANNED], sticky=True, max_failures=1)
+    first = await strategy.get_proxy_for_url("https://shop.example.com/a")
+    picks = [await strategy.get_proxy_for_url(f"https://shop.example.com/{i}") for i in range(20)]
+    assert all(proxy is first for proxy in picks)
+    strategy.report_result(first, status_code=403)
+    assert await strategy.get_proxy_for_url("https://shop.example.com/b") is not first
+
+
+class ScriptedStrategy(AsyncCrawlerStrategy):
+    """Answers as the proxy in the config would"""
+
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def crawl(self, url, config=None, **kwargs):
+        outcome = self.outcomes[config.proxy_config.server]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return AsyncCrawlResponse(html="<html><body><p>hi</p></body></html>", response_headers={}, status_code=outcome)
+
+
+@pytest.mark.asyncio
+async def test_crawls_report_to_the_strategy(tmp_path):
+    random.seed(7)  # picks are weighted random
+    strategy = HealthAwareProxyStrategy([GOOD, SLOW, BANNED], max_failures=2)
+    outcomes = {GOOD.server: 200, SLOW.server: RuntimeError("proxy down"), BANNED.server: 403}
+    crawler = AsyncWebCrawler(crawler_strategy=ScriptedStrategy(outcomes), base_directory=str(tmp_path))
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, proxy_rotation_strategy=strategy)
+    async with crawler:
+        results = [await crawler.arun(f"https://example.com/{i}", config=config) for i in range(30)]
+
+    stats = strategy.get_stats()
+    assert sum(s["successes"] + s["failures"] + s["bans"] for s in stats.values()) == 30
+    assert stats[SLOW.server]["failures"] >= 2 and stats[SLOW.server]["ejected"]
+    assert stats[BANNED.server]["bans"] >= 2 and stats[BANNED.server]["ejected"]
+    assert all(result.success for result in results[-5:])
+    assert config.proxy_config is None  # the shared config is left alone
+
+
+class RevalidatingStrategy(AsyncCrawlerStrategy):
+    """Answers conditional requests with 304 Not Modified"""
+
+    supports_conditional_requests = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def crawl(self, url, config=None, cache_validators=None, **kwargs):
+        if cache_validators:
+            return AsyncCrawlResponse(html="", response_headers={"ETag": '"v1"'}, status_code=304, not_modified=True)
+        return AsyncCrawlResponse(
+            html="<html><body><p>hi</p></body></html>",
+            response_headers={"ETag": '"v1"', "Cache-Control": "max-age=0"},
+            status_code=200,
+        )
+
+
+@pytest.mark.asyncio
+async def test_revalidated_crawls_credit_the_proxy(tmp_path, db_manager):
+    strategy = HealthAwareProxyStrategy([GOOD])
+    config = CrawlerRunConfig(
+        cache_mode=CacheMode.ENABLED, respect_cache_headers=True, proxy_rotation_strategy=strategy
+    )
+    async with AsyncWebCrawler(crawler_strategy=RevalidatingStrategy(), base_directory=str(tmp_path)) as crawler:
+        await crawler.arun("https://example.com/page", config=config)
+        result = await crawler.arun("https://example.com/page", config=config)
+
+    assert result.revalidated
+    stats = strategy.get_stats()[GOOD.server]
+    assert stats["successes"] == 2 and stats["latency"] is not None
+    await db_manager.cleanup()
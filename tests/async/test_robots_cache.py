@@ -0,0 +1,118 @@
+import os
+import sys
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from aiohttp import web
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai.utils import RobotsParser
+
+ROBOTS_TXT = "User-agent: *\nDisallow: /private/\nAllow: /public/\n"
+
+
+@asynccontextmanager
+async def serve_robots(status=200, delay=0.0):
+    requests = []
+
+    async def robots(request):
+        requests.append(request.path)
+        await asyncio.sleep(delay)
+        return web.Response(text=ROBOTS_TXT, status=status)
+
+    app = web.Application()
+    app.router.add_get("/robots.txt", robots)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}", requests
+    finally:
+        await runner.cleanup()
+
+
+@pytest.fixture
+def count_db_reads(monkeypatch):
+    reads = []
+    original = RobotsParser._get_cached_entry
+
+    def counting(self, domain):
+        reads.append(domain)
+        return original(self, domain)
+
+    monkeypatch.setattr(RobotsParser, "_get_cached_entry", counting)
+    return reads
+
+
+@pytest.mark.asyncio
+async def test_concurrent_checks_fetch_once(tmp_path, count_db_reads):
+    parser = RobotsParser(cache_dir=str(tmp_path))
+    async with serve_robots(delay=0.2) as (base, requests):
+        urls = [f"{base}/public/{i}" for i in range(20)] + [f"{base}/private/{i}" for i in range(20)]
+        results = await asyncio.gather(*(parser.can_fetch(url, "bot") for url in urls))
+
+        assert results == [True] * 20 + [False] * 20
+        assert requests == ["/robots.txt"]
+        assert len(count_db_reads) == 1
+
+        # Later checks use the compiled rules in memory
+        assert not await parser.can_fetch(f"{base}/private/again", "bot")
+        assert len(count_db_reads) == 1
+    await parser.close()
+
+
+@pytest.mark.asyncio
+async def test_rules_persist_across_instances(tmp_path):
+    async with serve_robots() as (base, requests):
+        first = RobotsParser(cache_dir=str(tmp_path))
+        assert not await first.can_fetch(f"{base}/private/x", "bot")
+        await first.close()
+
+        second = RobotsParser(cache_dir=str(tmp_path))
+        assert not await second.can_fetch(f"{base}/private/x", "bot")
+        assert await second.can_fetch(f"{base}/public/x", "bot")
+        assert len(requests) == 1
+        await second.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_rules_are_refetched(tmp_path):
+    async with serve_robots() as (base, requests):
+        parser = RobotsParser(cache_dir=str(tmp_path), cache_ttl=1)
+        await parser.can_fetch(f"{base}/public/x", "bot")
+        await asyncio.sleep(1.1)
+        assert not await parser.can_fetch(f"{base}/private/x", "bot")
+        assert len(requests) == 2
+        await parser.close()
+
+
+@pytest.mark.asyncio
+async def test_missing_robots_is_remembered(tmp_path):
+    async with serve_robots(status=404) as (base, requests):
+        parser = RobotsParser(cache_dir=str(tmp_path))
+        assert await parser.can_fetch(f"{base}/private/x", "bot")
+        assert await parser.can_fetch(f"{base}/private/y", "bot")
+        assert len(requests) == 1
+        await parser.close()
+
+
+@pytest.mark.asyncio
+async def test_lru_is_bounded(tmp_path, count_db_reads):
+    parser = RobotsParser(cache_dir=str(tmp_path), max_domains=2)
+    async with serve_robots() as (base, _):
+        port = base.rsplit(":", 1)[1]
+        hosts = [f"http://127.0.0.1:{port}", f"http://localhost:{port}", f"http://[::1]:{port}"]
+        for host in hosts:
+            await parser.can_fetch(f"{host}/public/x", "bot")
+        assert len(parser._rules) == 2
+        assert f"127.0.0.1:{port}" not in parser._rules
+
+        # The evicted domain comes back from SQLite
+        await parser.can_fetch(f"{hosts[0]}/public/x", "bot")
+        assert count_db_reads.count(f"127.0.0.1:{port}") == 2
+    await parser.close()
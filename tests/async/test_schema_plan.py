@@ -0,0 +1,151 @@
+import os
+import sys
+import pickle
+import pytest
+from lxml import html as lhtml
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai.extraction_strategy import (
+    JsonCssExtractionStrategy,
+    JsonLxmlExtractionStrategy,
+    JsonXPathExtractionStrategy,
+)
+from crawl4ai.html_document import HTMLDocument
+from crawl4ai.schema_plan import SchemaPlan, SchemaPlanError, css_to_xpath
+
+HTML = """<html><head><title>Shop</title><style>.a {}</style></head><body>
+<div id="list" class="listing">
+  <div class="product featured" data-id="1"><h2 class="title"> Alpha <span>Pro</span></h2>
+    <span class="price">$10.50</span><a href="/a" class="link ext" lang="en-US">More</a>
+    <ul class="tags"><li>red</li><li class="hot">blue</li><li>green</li></ul>
+    <script>var x = 1;</script><p>Desc &amp; more</p></div>
+  <div class="product" data-id="2"><h2 class="title">Beta</h2><span class="price">$7</span>
+    <ul class="tags"><li>x</li></ul><p></p><div class="spec"><b>w</b> 3kg</div></div>
+  <div class="product sold-out" data-id="3"><h2>Gamma</h2>
+    <table><tr><td>1</td><td>2</td><td><i>3</i></td></tr><tr><td>4</td><td>5</td><td>6</td></tr></table></div>
+</div></body></html>"""
+
+SELECTORS = [
+    "h2", "h2.title", "a[href^='/']", "a[href$=a]", "a[class~=ext]", "a[lang|=en]",
+    "ul li:nth-child(2)", "li:first-child", "li:last-child", "li:nth-child(odd)",
+    "li:nth-child(-n+2)", "li:not(.hot)", "ul > li", "h2 + span", "h2 ~ a",
+    "td:nth-child(3) i", "tr:nth-of-type(2) td:nth-last-child(1)", "*[data-id]",
+    "h2 span, .price", "li:only-child", "p:empty",
+]
+
+SCHEMA = {
+    "name": "products",
+    "baseSelector": "div.product",
+    "baseFields": [{"name": "id", "type": "attribute", "attribute": "data-id"}],
+    "fields": [
+        *({"name": f"text{i}", "selector": s, "type": "text"} for i, s in enumerate(SELECTORS)),
+        *({"name": f"class{i}", "selector": s, "type": "attribute", "attribute": "class"}
+          for i, s in enumerate(SELECTORS)),
+        {"name": "price", "selector": ".price", "type": "regex", "pattern": r"\$(\d+(?:\.\d+)?)"},
+        {"name": "upper", "selector": "h2", "type": "text", "transform": "uppercase"},
+        {"name": "tags", "selector": "ul.tags li", "type": "list",
+         "fields": [{"name": "tag", "type": "text"}]},
+        {"name": "spec", "selector": "div.spec", "type": "nested",
+         "fields": [{"name": "unit", "selector": "b", "type": "text"}, {"name": "all", "type": "text"}]},
+        {"name": "rows", "selector": "tr", "type": "nested_list",
+         "fields": [{"name": "first", "selector": "td", "type": "text"},
+                    {"name": "shout", "type": "computed", "expression": "first + '!'"}]},
+        {"name": "missing", "selector": ".nope", "type": "text", "default": "n/a"},
+        {"name": "broken", "selector": ".nope", "type": "attribute", "attribute": "x",
+         "transform": "lowercase", "default": "fallback"},
+    ],
+}
+
+
+def test_css_plan_matches_beautifulsoup():
+    compiled = JsonCssExtractionStrategy(SCHEMA)
+    interpreted = JsonCssExtractionStrategy(SCHEMA, compiled=False)
+    assert compiled.plan is not None and interpreted.plan is None
+
+    results = compiled.extract(None, HTML)
+    assert results == interpreted.extract(None, HTML)
+    assert [item["id"] for item in results] == ["1", "2", "3"]
+    assert results[0]["class0"] == ["title"]  # BeautifulSoup's multi-valued class
+    assert results[0]["text6"] == "blue" and results[0]["tags"][2] == {"tag": "green"}
+    assert results[1]["spec"] == {"unit": "w", "all": "w3kg"}
+
+
+def test_xpath_plan_matches_interpreter():
+    schema = {
+        "name": "products",
+        "baseSelector": "//div[contains(@class, 'product')]",
+        "fields": [
+            {"name": "name", "selector": "h2", "type": "text"},
+            {"name": "price", "selector": ".//span[@class='price']", "type": "text"},
+            {"name": "heading", "selector": "h2", "type": "html"},
+            {"name": "tags", "selector": "ul li", "type": "list", "fields": [{"name": "tag", "type": "text"}]},
+        ],
+    }
+    compiled = JsonXPathExtractionStrategy(schema)
+    interpreted = JsonXPathExtractionStrategy(schema, compiled=False)
+    for page in (HTML, '<div class="product"><h2>Solo</h2></div>'):  # document and fragment
+        assert compiled.extract(None, page) == interpreted.extract(None, page)
+
+
+def test_lxml_strategy_runs_without_cssselect():
+    results = JsonLxmlExtractionStrategy(SCHEMA).extract(None, HTML)
+    assert results[0]["text0"] == "Alpha Pro"
+    assert results[0]["class0"] == "title"
+    assert results[2]["rows"][1] == {"first": "4", "shout": "4!"}
+
+
+@pytest.mark.parametrize("selector, expected", [
+    ("div.a > p", "descendant-or-self::div[contains(concat(' ', normalize-space(@class), ' '), ' a ')]/p"),
+    ("a + b", "descendant-or-self::a/following-sibling::*[1][self::b]"),
+    ("li:nth-child(2n+1)", "descendant-or-self::li[(count(preceding-sibling::*) + 0) mod 2 = 0]"),
+    ("[title=\"it's\"]", "descendant-or-self::*[@title = \"it's\"]"),
+])
+def test_css_to_xpath(selector, expected):
+    assert css_to_xpath(selector) == expected
+
+
+@pytest.mark.parametrize("selector", ["a:hover", "p::text", "a[href=x i]", "div:has(p)", "a >"])
+def test_unsupported_selectors_fall_back(selector):
+    with pytest.raises(SchemaPlanError):
+        css_to_xpath(selector)
+    schema = {"name": "x", "baseSelector": "div.product", "fields": [{"name": "t", "selector": selector, "type": "text"}]}
+    strategy = JsonCssExtractionStrategy(schema)
+    assert strategy.plan is None
+    assert strategy.extract(None, HTML) == []  # interpreted, as before
+
+
+def test_subclass_overrides_use_the_interpreter():
+    class Shouting(JsonCssExtractionStrategy):
+        def _get_element_text(self, element) -> str:
+            return element.get_text(strip=True).upper()
+
+    assert Shouting(SCHEMA).plan is None
+    assert Shouting(SCHEMA).extract(None, HTML)[1]["text0"] == "BETA"
+
+
+def test_plan_is_reused_across_pages_and_pickles():
+    plan = SchemaPlan(SCHEMA, "css")
+    pages = [HTML.replace("Alpha", f"Alpha{i}") for i in range(5)]
+    batch = plan.extract_many(pages + [HTMLDocument(pages[0])], max_workers=3)
+    assert [items[0]["text0"] for items in batch] == [f"Alpha{i}Pro" for i in range(5)] + ["Alpha0Pro"]
+    assert batch[0] == plan.extract(pages[0])
+
+    clone = pickle.loads(pickle.dumps(JsonCssExtractionStrategy(SCHEMA)))
+    assert clone.plan is not None and clone.extract(None, pages[1]) == batch[1]
+
+
+def test_plan_reuses_the_shared_tree(monkeypatch):
+    document = HTMLDocument(HTML)
+    tree = document.tree
+    monkeypatch.setattr(lhtml, "document_fromstring", None)  # a second parse would fail
+    results = JsonCssExtractionStrategy(SCHEMA).extract(None, HTML, html_document=document)
+    assert document.tree is tree and document.parse_count == 1
+    assert len(results) == 3
+
+
+def test_empty_page():
+    assert SchemaPlan(SCHEMA, "css").extract("") == []
+    assert SchemaPlan({"baseSelector": "//div", "fields": []}, "xpath").extract("   ") == []
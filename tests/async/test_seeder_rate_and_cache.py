@@ -0,0 +1,111 @@
+import os
+import sys
+import time
+import pytest
+import httpx
+from contextlib import asynccontextmanager
+from aiohttp import web
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai import AsyncUrlSeeder, SeedingConfig
+from crawl4ai.async_url_seeder import SeederCacheStore
+
+
+@asynccontextmanager
+async def serve_pages():
+    hits = []
+
+    async def page(request):
+        hits.append((request.path, time.monotonic()))
+        return web.Response(
+            text=f"<html><head><title>{request.path}</title></head><body></body></html>",
+            content_type="text/html",
+        )
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}", hits
+    finally:
+        await runner.cleanup()
+
+
+def make_seeder(tmp_path):
+    return AsyncUrlSeeder(client=httpx.AsyncClient(), base_directory=str(tmp_path),
+                          cache_root=str(tmp_path / "cache"))
+
+
+@pytest.mark.asyncio
+async def test_hits_per_sec_is_a_rate(tmp_path):
+    seeder = make_seeder(tmp_path)
+    async with serve_pages() as (base, hits):
+        urls = [f"{base}/page{i}" for i in range(11)]
+        config = SeedingConfig(hits_per_sec=20)
+        results = await seeder.extract_head_for_urls(urls, config, concurrency=50)
+
+    assert len(results) == 11
+    times = sorted(t for _, t in hits)
+    # 50 workers, but one request per 50 ms: 10 gaps take at least ~0.5 s
+    assert times[-1] - times[0] >= 0.45
+    await seeder.client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_skip_network_and_rate_limit(tmp_path, monkeypatch):
+    selects = []
+    original = SeederCacheStore._select
+
+    def counting(self, kind, urls):
+        selects.append(len(urls))
+        return original(self, kind, urls)
+
+    monkeypatch.setattr(SeederCacheStore, "_select", counting)
+
+    async with serve_pages() as (base, hits):
+        urls = [f"{base}/page{i}" for i in range(40)]
+        seeder = make_seeder(tmp_path)
+        await seeder.extract_head_for_urls(urls, SeedingConfig(hits_per_sec=None), concurrency=10)
+        await seeder.close()
+        await seeder.client.aclose()
+        assert len(hits) == 40
+
+        # a new seeder on the same cache root answers from the store, in one lookup
+        selects.clear()
+        seeder = make_seeder(tmp_path)
+        started = time.monotonic()
+        results = await seeder.extract_head_for_urls(urls, SeedingConfig(hits_per_sec=1), concurrency=10)
+        assert time.monotonic() - started < 1
+        assert len(hits) == 40
+        assert selects == [40]
+        assert {r["head_data"]["title"] for r in results} == {f"/page{i}" for i in range(40)}
+        await seeder.client.aclose()
+
+    # one database instead of a file per URL
+    assert set(os.listdir(tmp_path / "cache")) <= {
+        "seeder_cache.db", "seeder_cache.db-wal", "seeder_cache.db-shm"}
+
+
+@pytest.mark.asyncio
+async def test_store_batches_writes_and_expires(tmp_path):
+    store = SeederCacheStore(tmp_path / "store.db", ttl=1)
+    await store.set("live", "https://a.com/", {"status": "valid"})
+
+    # pending writes are visible before they are committed
+    assert await store.get("live", "https://a.com/") == {"status": "valid"}
+    assert SeederCacheStore(tmp_path / "store.db", ttl=1)._select("live", ["https://a.com/"]) == {}
+
+    await store.flush()
+    other = SeederCacheStore(tmp_path / "store.db", ttl=1)
+    assert await other.get("live", "https://a.com/") == {"status": "valid"}
+    assert await other.get("head", "https://a.com/") is None
+
+    time.sleep(1.1)
+    assert await other.get("live", "https://a.com/") is None
@@ -0,0 +1,143 @@
+import os
+import sys
+import gzip
+import pytest
+import httpx
+from contextlib import asynccontextmanager
+from aiohttp import web
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(parent_dir)
+
+from crawl4ai import AsyncUrlSeeder, SeedingConfig
+from crawl4ai.async_url_seeder import _SitemapStream, _parse_lastmod
+
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def urlset(entries, ns=NS):
+    body = "".join(
+        "<url><loc>{}</loc>{}</url>".format(
+            loc, "".join(f"<{k}>{v}</{k}>" for k, v in fields.items())
+        )
+        for loc, fields in entries
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset {ns}>{body}</urlset>'
+
+
+@asynccontextmanager
+async def serve_sitemaps(tmp_path):
+    requests = []
+    pages = {}
+
+    async def handler(request):
+        requests.append(request.path)
+        if request.path not in pages:
+            return web.Response(status=404)
+        return web.Response(body=pages[request.path], content_type="application/xml")
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    host = f"127.0.0.1:{port}"
+    base = f"http://{host}"
+
+    pages["/sitemap.xml"] = (
+        f'<?xml version="1.0"?><sitemapindex {NS}>'
+        f"<sitemap><loc>{base}/news.xml.gz</loc><lastmod>2030-01-01T00:00:00Z</lastmod></sitemap>"
+        f"<sitemap><loc>{base}/archive.xml</loc><lastmod>2019-05-01</lastmod></sitemap>"
+        "</sitemapindex>"
+    ).encode()
+    pages["/news.xml.gz"] = gzip.compress(urlset([
+        (f"{base}/news/new", {"lastmod": "2030-01-02T10:00:00+00:00", "changefreq": "daily", "priority": "0.9"}),
+        (f"{base}/news/old", {"lastmod": "2020-01-01"}),
+        (f"{base}/news/undated", {}),
+    ]).encode())
+    # no namespace, still a sitemap
+    pages["/archive.xml"] = urlset([(f"{base}/archive/a", {"lastmod": "2019-01-01"})], ns="").encode()
+
+    seeder = AsyncUrlSeeder(client=httpx.AsyncClient(), base_directory=str(tmp_path),
+                            cache_root=str(tmp_path / "cache"))
+    seeder.index_id = "test"  # skip the Common Crawl lookup
+    try:
+        yield seeder, host, requests
+    finally:
+        await seeder.client.aclose()
+        await runner.cleanup()
+
+
+def by_url(results):
+    return {r["url"].rsplit("/", 2)[-2] + "/" + r["url"].rsplit("/", 1)[-1]: r for r in results}
+
+
+@pytest.mark.asyncio
+async def test_sitemap_records_carry_metadata(tmp_path):
+    async with serve_sitemaps(tmp_path) as (seeder, host, _):
+        results = by_url(await seeder.urls(host, SeedingConfig(source="sitemap", concurrency=4)))
+
+    assert set(results) == {"news/new", "news/old", "news/undated", "archive/a"}
+    new = results["news/new"]
+    assert new["status"] == "unknown"
+    assert new["lastmod"] == "2030-01-02T10:00:00+00:00"
+    assert new["changefreq"] == "daily"
+    assert new["priority"] == 0.9
+    assert results["news/undated"]["lastmod"] is None
+
+
+@pytest.mark.asyncio
+async def test_modified_since_skips_old_urls_and_sitemaps(tmp_path):
+    async with serve_sitemaps(tmp_path) as (seeder, host, requests):
+        config = SeedingConfig(source="sitemap", concurrency=4, modified_since="2025-01-01")
+        results = by_url(await seeder.urls(host, config))
+
+        # undated URLs are kept, the stale sub-sitemap is never downloaded
+        assert set(results) == {"news/new", "news/undated"}
+        assert "/archive.xml" not in requests
+
+
+@pytest.mark.asyncio
+async def test_last_run_and_cache(tmp_path):
+    async with serve_sitemaps(tmp_path) as (seeder, host, requests):
+        config = SeedingConfig(source="sitemap", concurrency=4, modified_since="last_run")
+        # no previous run: everything is new
+        assert len(await seeder.urls(host, config)) == 4
+
+        # the second run only sees what changed since the first one started
+        results = by_url(await seeder.urls(host, config))
+        assert set(results) == {"news/new", "news/undated"}
+
+        # a full run is cached with its metadata and served from disk
+        await seeder.urls(host, SeedingConfig(source="sitemap", concurrency=4))
+        fetched = len(requests)
+        results = by_url(await seeder.urls(host, SeedingConfig(source="sitemap", concurrency=4)))
+        assert len(requests) == fetched
+        assert results["news/new"]["priority"] == 0.9
+
+
+def test_stream_keeps_tree_empty():
+    data = gzip.compress(urlset(
+        [(f"https://example.com/{i}", {"lastmod": "2024-01-01"}) for i in range(500)]
+    ).encode())
+    stream = _SitemapStream()
+    records = []
+    for i in range(0, len(data), 7):
+        records += stream.feed(data[i:i + 7])
+        assert stream._root is None or len(stream._root) <= 1
+    records += stream.close()
+
+    assert [rec["url"] for _, rec in records] == [f"https://example.com/{i}" for i in range(500)]
+    assert {kind for kind, _ in records} == {"url"}
+
+
+def test_parse_lastmod():
+    assert _parse_lastmod("1970-01-02") == 86400
+    assert _parse_lastmod("1970-01-01T01:00:00Z") == 3600
+    assert _parse_lastmod("1970-01-01T02:00:00+01:00") == 3600
+    assert _parse_lastmod("1970-02") == 31 * 86400
+    assert _parse_lastmod(12.5) == 12.5
+    assert _parse_lastmod("yesterday") is None
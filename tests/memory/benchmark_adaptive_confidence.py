@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for StatisticalStrategy's confidence and link ranking.
+
+Grows a knowledge base of synthetic pages (Zipf-distributed vocabulary) and,
+at a few sizes, times calculate_confidence, update_state for the latest page,
+and rank_links over a fixed set of pending links. With the incremental
+statistics these should stay near-flat as the knowledge base grows; the
+original all-pairs consistency is timed alongside for comparison, up to
+--reference-max pages.
+
+Usage:
+    python tests/memory/benchmark_adaptive_confidence.py
+    python tests/memory/benchmark_adaptive_confidence.py --pages 4000 --words 800
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from crawl4ai.adaptive_crawler import AdaptiveConfig, CrawlState, StatisticalStrategy
+from crawl4ai.models import Link
+
+
+class Markdown:
+    def __init__(self, content):
+        self.raw_markdown = content
+
+
+class Page:
+    def __init__(self, url, content):
+        self.url = url
+        self.markdown = Markdown(content)
+
+
+def make_pages(count, words, vocab_size, seed=0):
+    rng = random.Random(seed)
+    vocab = [f"word{i}" for i in range(vocab_size)]
+    weights = [1 / (rank + 1) for rank in range(vocab_size)]
+    return [
+        Page(f"https://example.com/{i}", " ".join(rng.choices(vocab, weights, k=words)))
+        for i in range(count)
+    ]
+
+
+def all_pairs_consistency(strategy, docs):
+    """The original O(n²) definition"""
+    term_sets = [set(strategy._get_document_terms(doc)) for doc in docs]
+    overlaps = [
+        len(a & b) / len(a | b)
+        for i, a in enumerate(term_sets)
+        for b in term_sets[i + 1:]
+        if a and b
+    ]
+    return sum(overlaps) / len(overlaps) if overlaps else 0.0
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    if asyncio.iscoroutine(result):
+        result = asyncio.get_event_loop().run_until_complete(result)
+    return (time.perf_counter() - t0) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark adaptive confidence scaling")
+    parser.add_argument("--pages", type=int, default=2000, help="Final knowledge base size")
+    parser.add_argument("--words", type=int, default=400, help="Words per page")
+    parser.add_argument("--vocab", type=int, default=20000, help="Vocabulary size")
+    parser.add_argument("--links", type=int, default=1000, help="Pending links to rank")
+    parser.add_argument("--reference-max", type=int, default=250,
+                        help="Largest size to time the all-pairs reference at")
+    args = parser.parse_args()
+
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    strategy = StatisticalStrategy()
+    config = AdaptiveConfig()
+    pages = make_pages(args.pages, args.words, args.vocab)
+    state = CrawlState(query="word1 word10 word100")
+    state.pending_links = [
+        Link(href=f"https://example.com/link{i}", text=f"word{i % 97} word{i} word{i * 7}")
+        for i in range(args.links)
+    ]
+
+    checkpoints = sorted({n for n in (50, 100, 250, 500, 1000, 2000, 4000, args.pages) if n <= args.pages})
+    print(f"{args.words} words/page, {args.vocab} word vocabulary, {args.links} pending links\n")
+    print(f"{'pages':>6} | {'confidence':>10} | {'update':>8} | {'rank_links':>10} | {'all-pairs':>10} | same")
+    print("-" * 64)
+
+    size = 0
+    for n in checkpoints:
+        update_ms = 0.0
+        for page in pages[size:n]:
+            state.knowledge_base.append(page)
+            update_ms, _ = timed(strategy.update_state, state, [page])  # keeps the last one
+        size = n
+
+        confidence_ms, _ = timed(strategy.calculate_confidence, state)
+        rank_ms, _ = timed(strategy.rank_links, state, config)
+
+        reference, same = "-", ""
+        if n <= args.reference_max:
+            reference_ms, value = timed(all_pairs_consistency, strategy, state.knowledge_base)
+            reference = f"{reference_ms:>7.1f} ms"
+            same = str(abs(value - state.metrics["consistency"]) < 1e-9)
+        print(
+            f"{n:>6} | {confidence_ms:>7.2f} ms | {update_ms:>5.1f} ms | "
+            f"{rank_ms:>7.1f} ms | {reference:>10} | {same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
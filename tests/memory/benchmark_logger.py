@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-call cost of AsyncLogger.
+
+Times url_status() as the crawler calls it, seen from the caller: the old
+synchronous file path (format, open, append, close on every message), the
+queued file path in text and JSON-lines form, a logger nobody listens to,
+and console output to /dev/null printed by the caller or by the writer
+thread. The drain column is how long flush() then waits for the writer.
+
+Usage:
+    python tests/memory/benchmark_logger.py
+    python tests/memory/benchmark_logger.py --calls 50000
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+from datetime import datetime
+
+from rich.console import Console
+from rich.text import Text
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from crawl4ai.async_logger import AsyncLogger
+
+
+class SyncFileLogger(AsyncLogger):
+    """The previous behaviour: format and append to the file on the caller"""
+
+    def _log(self, level, message, tag, params=None, colors=None, boxes=None, base_color=None, **kwargs):
+        if level.value < self.log_level.value:
+            return
+        log_line = self._format_line(level, message, tag, params, colors, boxes, base_color)
+        if self.verbose or kwargs.get("force_verbose", False):
+            self.console.print(log_line)
+        if self.log_file:
+            plain_text = Text.from_markup(log_line).plain
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                f.write(f"[{timestamp}] {plain_text}\n")
+
+
+def run(logger, calls):
+    t0 = time.perf_counter()
+    for i in range(calls):
+        logger.url_status(f"https://example.com/page/{i}?q=a%20b", success=i % 7 != 0, timing=i / 1000)
+    call_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    logger.flush(timeout=None)
+    return call_s, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark AsyncLogger per-call cost")
+    parser.add_argument("--calls", type=int, default=20000, help="Messages per case")
+    args = parser.parse_args()
+
+    devnull = open(os.devnull, "w")
+    with tempfile.TemporaryDirectory() as tmp:
+        def log_file(name):
+            return os.path.join(tmp, name)
+
+        cases = [
+            ("sync file (before)", SyncFileLogger(log_file=log_file("sync.log"), verbose=False)),
+            ("queued file", AsyncLogger(log_file=log_file("text.log"), verbose=False)),
+            ("queued json lines", AsyncLogger(log_file=log_file("log.jsonl"), verbose=False, json_lines=True)),
+            ("no consumer", AsyncLogger(verbose=False)),
+            ("console", AsyncLogger()),
+            ("background console", AsyncLogger(background_console=True)),
+        ]
+        print(f"{args.calls} url_status calls per case\n")
+        print(f"{'case':>20} | {'per call':>10} | {'drain':>9}")
+        print("-" * 46)
+        for name, logger in cases:
+            logger.console = Console(file=devnull, force_terminal=True)
+            call_s, drain_s = run(logger, args.calls)
+            print(f"{name:>20} | {call_s / args.calls * 1e6:>7.2f} us | {drain_s * 1000:>6.1f} ms")
+    devnull.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for the markdown generators.
+
+Converts the cleaned HTML of one or more pages with DefaultMarkdownGenerator
+(html.parser) and LXMLMarkdownGenerator (lxml tree walk), and reports the
+time per page and throughput of each, with and without citations. The outputs
+are compared too, so a speedup never comes from converting differently.
+
+Usage:
+    python tests/memory/benchmark_markdown_generator.py --repeat 10
+    python tests/memory/benchmark_markdown_generator.py page1.html page2.html
+"""
+
+import os
+import sys
+import time
+import argparse
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from crawl4ai import DefaultMarkdownGenerator, LXMLMarkdownGenerator, LXMLWebScrapingStrategy
+
+SAMPLE_PAGE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "async", "sample_wikipedia.html"
+)
+BASE_URL = "https://example.com/page"
+
+
+def load_pages(paths):
+    pages = []
+    for path in paths:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            raw_html = f.read()
+        pages.append(LXMLWebScrapingStrategy().scrap(BASE_URL, raw_html).cleaned_html)
+    return pages
+
+
+def bench(generator, pages, repeat: int, citations: bool):
+    results = []
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        results = [
+            generator.generate_markdown(html, base_url=BASE_URL, citations=citations)
+            for html in pages
+        ]
+    return (time.perf_counter() - t0) / repeat, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark markdown generators")
+    parser.add_argument("pages", nargs="*", default=[SAMPLE_PAGE], help="HTML files to convert")
+    parser.add_argument("--repeat", type=int, default=5, help="Conversions of every page per generator")
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages)
+    size_mb = sum(len(html.encode()) for html in pages) / 1e6
+    print(f"{len(pages)} page(s), {size_mb:.2f} MB of cleaned HTML\n")
+
+    print(f"{'citations':>9} | {'html.parser':>12} | {'lxml walk':>12} | {'speedup':>7} | {'lxml MB/s':>9} | same output")
+    print("-" * 76)
+    for citations in (False, True):
+        default_time, default_results = bench(DefaultMarkdownGenerator(), pages, args.repeat, citations)
+        lxml_time, lxml_results = bench(LXMLMarkdownGenerator(), pages, args.repeat, citations)
+        same = all(
+            a.raw_markdown == b.raw_markdown
+            and a.markdown_with_citations == b.markdown_with_citations
+            and a.references_markdown == b.references_markdown
+            for a, b in zip(default_results, lxml_results)
+        )
+        print(
+            f"{str(citations):>9} | {default_time * 1000:>9.1f} ms | {lxml_time * 1000:>9.1f} ms | "
+            f"{default_time / lxml_time:>6.2f}x | {size_mb / lxml_time:>9.2f} | {same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark compiled schema plans against the interpreted JSON strategies.
+
+Generates synthetic listing pages and extracts them with a schema using the
+common field types (text, attribute, regex with transform, list, nested,
+computed). For each strategy it times the interpreted path (compiled=False),
+the compiled plan page by page, and the plan's batch API, and checks that
+all of them return the same items. The lxml strategy's interpreted path
+needs cssselect and is skipped without it.
+
+Usage:
+    python tests/memory/benchmark_schema_extraction.py
+    python tests/memory/benchmark_schema_extraction.py --pages 200 --items 100 --workers 4
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from crawl4ai.extraction_strategy import (
+    JsonCssExtractionStrategy,
+    JsonLxmlExtractionStrategy,
+    JsonXPathExtractionStrategy,
+)
+
+CSS_SCHEMA = {
+    "name": "products",
+    "baseSelector": "div.product",
+    "baseFields": [{"name": "sku", "type": "attribute", "attribute": "data-sku"}],
+    "fields": [
+        {"name": "title", "selector": "h2.title", "type": "text"},
+        {"name": "url", "selector": "a.link", "type": "attribute", "attribute": "href"},
+        {"name": "price", "selector": "span.price", "type": "regex", "pattern": r"\$([\d.]+)"},
+        {"name": "brand", "selector": ".meta .brand", "type": "text", "transform": "lowercase"},
+        {"name": "tags", "selector": "ul.tags > li", "type": "list", "fields": [{"name": "tag", "type": "text"}]},
+        {"name": "rating", "selector": "div.rating", "type": "nested", "fields": [
+            {"name": "stars", "selector": "span.stars", "type": "text"},
+            {"name": "count", "selector": "span.count", "type": "text"},
+        ]},
+        {"name": "label", "type": "computed", "expression": "title + ' (' + sku + ')'", "default": ""},
+    ],
+}
+
+XPATH_SCHEMA = {
+    "name": "products",
+    "baseSelector": "//div[contains(concat(' ', normalize-space(@class), ' '), ' product ')]",
+    "baseFields": [{"name": "sku", "type": "attribute", "attribute": "data-sku"}],
+    "fields": [
+        {"name": "title", "selector": ".//h2[@class='title']", "type": "text"},
+        {"name": "url", "selector": ".//a[@class='link']", "type": "attribute", "attribute": "href"},
+        {"name": "price", "selector": ".//span[@class='price']", "type": "regex", "pattern": r"\$([\d.]+)"},
+        {"name": "brand", "selector": ".//span[@class='brand']", "type": "text", "transform": "lowercase"},
+        {"name": "tags", "selector": ".//ul[@class='tags']/li", "type": "list", "fields": [{"name": "tag", "type": "text"}]},
+        {"name": "rating", "selector": ".//div[@class='rating']", "type": "nested", "fields": [
+            {"name": "stars", "selector": ".//span[@class='stars']", "type": "text"},
+            {"name": "count", "selector": ".//span[@class='count']", "type": "text"},
+        ]},
+        {"name": "label", "type": "computed", "expression": "title + ' (' + sku + ')'", "default": ""},
+    ],
+}
+
+
+def make_page(items, rng):
+    products = []
+    for i in range(items):
+        tags = "".join(f"<li>tag{rng.randint(0, 50)}</li>" for _ in range(rng.randint(1, 4)))
+        products.append(
+            f'<div class="product card" data-sku="SKU{i:05d}">'
+            f'<h2 class="title">Product {i}</h2><a class="link" href="/p/{i}">view</a>'
+            f'<span class="price">${rng.uniform(1, 500):.2f}</span>'
+            f'<div class="meta"><span class="brand">Brand{rng.randint(0, 20)}</span></div>'
+            f'<ul class="tags">{tags}</ul>'
+            f'<div class="rating"><span class="stars">{rng.randint(1, 5)}</span>'
+            f'<span class="count">{rng.randint(0, 999)}</span></div></div>'
+        )
+    return (
+        "<!DOCTYPE html><html><head><title>Listing</title></head><body>"
+        '<nav><a href="/">Home</a></nav><main>' + "".join(products) + "</main></body></html>"
+    )
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - t0) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compiled schema extraction")
+    parser.add_argument("--pages", type=int, default=50, help="Pages to extract")
+    parser.add_argument("--items", type=int, default=50, help="Products per page")
+    parser.add_argument("--workers", type=int, default=4, help="Threads for the batch run")
+    args = parser.parse_args()
+
+    try:
+        import cssselect  # noqa: F401
+        has_cssselect = True
+    except ImportError:
+        has_cssselect = False
+
+    rng = random.Random(0)
+    pages = [make_page(args.items, rng) for _ in range(args.pages)]
+    strategies = [
+        ("JsonCss", JsonCssExtractionStrategy, CSS_SCHEMA),
+        ("JsonLxml", JsonLxmlExtractionStrategy, CSS_SCHEMA),
+        ("JsonXPath", JsonXPathExtractionStrategy, XPATH_SCHEMA),
+    ]
+
+    print(f"{args.pages} pages x {args.items} items, per-page times\n")
+    print(f"{'strategy':>10} | {'interpreted':>11} | {'compiled':>9} | {'batch':>9} | "
+          f"{'batch x' + str(args.workers):>9} | {'speedup':>7} | same")
+    print("-" * 80)
+
+    for name, cls, schema in strategies:
+        compiled = cls(schema)
+        plan_ms, expected = timed(lambda: [compiled.extract(None, page) for page in pages])
+        batch_ms, batch = timed(lambda: compiled.extract_many(pages))
+        threaded_ms, threaded = timed(lambda: compiled.extract_many(pages, max_workers=args.workers))
+        same = batch == expected and threaded == expected
+
+        interpreted_ms, speedup = None, "-"
+        if cls is not JsonLxmlExtractionStrategy or has_cssselect:
+            interpreted = cls(schema, compiled=False)
+            interpreted_ms, reference = timed(lambda: [interpreted.extract(None, page) for page in pages])
+            same = same and reference == expected
+            speedup = f"{interpreted_ms / plan_ms:>6.1f}x"
+
+        reference_col = f"{interpreted_ms / args.pages:>8.2f} ms" if interpreted_ms is not None else "-"
+        print(
+            f"{name:>10} | {reference_col:>11} | {plan_ms / args.pages:>6.2f} ms | "
+            f"{batch_ms / args.pages:>6.2f} ms | {threaded_ms / args.pages:>6.2f} ms | "
+            f"{speedup:>7} | {same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the MemoryAdaptiveDispatcher task queue.
+
+Compares the per-tick cost of the old drain-and-refill priority update on an
+asyncio.PriorityQueue with AgingTaskQueue, plus the cost of dequeuing the
+whole backlog, for growing backlog sizes.
+
+Usage:
+    python tests/memory/benchmark_task_queue.py --sizes 1000 10000 100000
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from crawl4ai.async_dispatcher import AgingTaskQueue
+
+FAIRNESS_TIMEOUT = 600.0
+
+
+def priority_score(wait_time: float, retry_count: int) -> float:
+    if wait_time > FAIRNESS_TIMEOUT:
+        return -wait_time
+    return retry_count
+
+
+async def legacy_tick(queue: asyncio.PriorityQueue):
+    """The drain-and-refill update previously run every 0.1 s"""
+    items = []
+    while not queue.empty():
+        _, payload = queue.get_nowait()
+        items.append((priority_score(time.time() - payload[3], payload[2]), payload))
+    items.sort(key=lambda x: x[0])
+    for entry in items:
+        await queue.put(entry)
+
+
+def fill(queue, size: int):
+    now = time.time()
+    for i in range(size):
+        queue.put_nowait((i % 3, (f"https://example.com/{i}", str(i), i % 3, now - (size - i) * 0.01)))
+
+
+async def bench(size: int, ticks: int):
+    legacy = asyncio.PriorityQueue()
+    fill(legacy, size)
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        await legacy_tick(legacy)
+    legacy_tick_ms = (time.perf_counter() - t0) / ticks * 1000
+
+    aging = AgingTaskQueue(FAIRNESS_TIMEOUT)
+    fill(aging, size)
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        aging.stats()
+    aging_tick_ms = (time.perf_counter() - t0) / ticks * 1000
+
+    t0 = time.perf_counter()
+    while not legacy.empty():
+        legacy.get_nowait()
+    legacy_drain = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    while not aging.empty():
+        aging.get_nowait()
+    aging_drain = time.perf_counter() - t0
+
+    return legacy_tick_ms, aging_tick_ms, legacy_drain / size * 1e6, aging_drain / size * 1e6
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark dispatcher task queues")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--ticks", type=int, default=5, help="Priority update ticks per size")
+    args = parser.parse_args()
+
+    print(f"{'backlog':>9} | {'legacy tick':>12} | {'aging tick':>11} | {'legacy get':>11} | {'aging get':>10}")
+    print("-" * 66)
+    for size in args.sizes:
+        legacy_tick_ms, aging_tick_ms, legacy_get_us, aging_get_us = await bench(size, args.ticks)
+        print(
+            f"{size:>9} | {legacy_tick_ms:>9.2f} ms | {aging_tick_ms:>8.4f} ms | "
+            f"{legacy_get_us:>8.2f} us | {aging_get_us:>7.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())